@@ -1,7 +1,7 @@
 import time
 import asyncio
 from pathlib import Path
-from typing import Union, Optional
+from typing import Dict, List, Union, Optional
 
 from PIL import Image, ImageDraw
 from gsuid_core.logger import logger
@@ -9,15 +9,16 @@ from gsuid_core.utils.error_reply import get_error_img
 from gsuid_core.utils.api.mys.models import AbyssBattleAvatar
 
 from ..utils.mys_api import mys_api
+from ..utils.image.render import run_render
 from ..utils.image.convert import convert_img
+from ..utils.image.texture import get_texture
 from ..utils.resource.download_url import download_file
 from ..utils.resource.generate_char_card import create_single_char_card
 from ..utils.resource.RESOURCE_PATH import CHAR_CARD_PATH, CHAR_SIDE_PATH
 from ..utils.image.image_tools import (
     get_color_bg,
-    get_qq_avatar,
     get_talent_pic,
-    draw_pic_with_ring,
+    get_ring_avatar,
 )
 from ..utils.colors import (
     red_color,
@@ -40,8 +41,7 @@ TEXT_PATH = Path(__file__).parent / 'texture2D'
 
 
 async def get_abyss_star_pic(star: int) -> Image.Image:
-    star_pic = Image.open(TEXT_PATH / f'star{star}.png')
-    return star_pic
+    return get_texture(TEXT_PATH / f'star{star}.png', copy=False)
 
 
 async def _draw_abyss_card(
@@ -126,7 +126,6 @@ async def draw_abyss_img(
         char_data = raw_data['avatars']
     else:
         return '没有获取到角色数据'
-    char_temp = {}
 
     # 获取查询者数据
     if floor:
@@ -142,6 +141,25 @@ async def draw_abyss_img(
             return '你还没有挑战本期深渊!\n可以使用[上期深渊]命令查询上期~'
         floors_data = raw_abyss_data['floors'][-1]
 
+    return await run_render(
+        '查询深渊',
+        _draw_abyss_img,
+        qid,
+        uid,
+        raw_abyss_data,
+        char_data,
+        floors_data,
+    )
+
+
+async def _draw_abyss_img(
+    qid: Union[str, int],
+    uid: str,
+    raw_abyss_data: Dict,
+    char_data: List[Dict],
+    floors_data: Dict,
+) -> bytes:
+    char_temp = {}
     if floors_data['levels'][-1]['battles']:
         is_unfull = False
     else:
@@ -155,12 +173,7 @@ async def draw_abyss_img(
     img.paste(abyss_title, (0, 0), abyss_title)
 
     # 获取头像
-    _id = str(qid)
-    if _id.startswith('http'):
-        char_pic = await get_qq_avatar(avatar_url=_id)
-    else:
-        char_pic = await get_qq_avatar(qid=qid)
-    char_pic = await draw_pic_with_ring(char_pic, 320)
+    char_pic = await get_ring_avatar(qid, 320)
 
     img.paste(char_pic, (320, 50), char_pic)
 
@@ -1,22 +1,23 @@
 import re
 
-from .template import all_achi, daily_achi, achi_template, daily_template
+from . import template
+from .template import achi_template, daily_template
 
 
 async def get_daily_achi(task: str) -> str:
     _similarity = 0
     detail = {}
-    if task in daily_achi:
-        detail = daily_achi[task]
+    if task in template.daily_achi:
+        detail = template.daily_achi[task]
     else:
-        for _task in daily_achi:
+        for _task in template.daily_achi:
             __task = ''.join(re.findall('[\u4e00-\u9fa5]', _task))
             __task = __task.replace('每日委托', '').replace('世界任务', '')
             similarity = len(set(__task) & set(task))
             if similarity >= len(__task) / 2:
                 if similarity > _similarity:
                     _similarity = similarity
-                    detail = daily_achi[_task]
+                    detail = template.daily_achi[_task]
                     task = _task
         else:
             if detail == {}:
@@ -35,17 +36,17 @@ async def get_daily_achi(task: str) -> str:
 async def get_achi(achi: str) -> str:
     _similarity = 0
     detail = {}
-    if achi in all_achi:
-        detail = all_achi[achi]
+    if achi in template.all_achi:
+        detail = template.all_achi[achi]
     else:
-        for _achi in all_achi:
+        for _achi in template.all_achi:
             __achi = ''.join(re.findall('[\u4e00-\u9fa5]', _achi))
             __achi = __achi.replace('每日委托', '').replace('世界任务', '')
             similarity = len(set(__achi) & set(achi))
             if similarity >= len(__achi) / 2:
                 if similarity > _similarity:
                     _similarity = similarity
-                    detail = all_achi[_achi]
+                    detail = template.all_achi[_achi]
                     achi = _achi
         else:
             if detail == {}:
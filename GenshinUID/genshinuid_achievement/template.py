@@ -1,12 +1,22 @@
-import json
+from typing import Dict
 from pathlib import Path
+from functools import partial
+
+from ..utils.map.map_bundle import load_json, lazy_getattr
 
 path = Path(__file__).parent
-with open(path / 'all_achi.json', "r", encoding='UTF-8') as f:
-    all_achi = json.load(f)
 
-with open(path / 'daily_achi.json', "r", encoding='UTF-8') as f:
-    daily_achi = json.load(f)
+# 成就数据在首次查询时加载, 见`map_bundle.lazy_getattr`
+all_achi: Dict[str, Dict]
+daily_achi: Dict[str, Dict]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'all_achi': partial(load_json, path / 'all_achi.json'),
+        'daily_achi': partial(load_json, path / 'daily_achi.json'),
+    },
+)
 
 daily_template = '''任务：【{}】
 成就：【{}】
@@ -51,7 +51,7 @@ async def weapon_adv(name):
 
 
 async def char_adv(name: str):
-    name = await alias_to_char_name(name)
+    name = alias_to_char_name(name)
     for char, info in adv_lst.items():
         if name in char:
             im = [f'「{char}」', '-=-=-=-=-=-=-=-=-=-']
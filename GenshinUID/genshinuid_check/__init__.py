@@ -10,7 +10,16 @@ from gsuid_core.utils.database.models import GsUser
 
 from ..utils.mys_api import mys_api
 from .backup_data import data_backup
+from ..utils.image.fetch import get_fetch_stat_text
+from ..utils.image.render import get_render_stat_text
+from ..utils.image.convert import get_encode_stat_text
 from ..genshinuid_map.draw_genshinmap_card import MAP_DATA
+from ..genshinuid_enka.to_data import get_artifacts_queue_size
+from ..utils.image.texture import clear_texture_cache, get_texture_stat_text
+from ..utils.image.render_cache import (
+    clear_render_cache,
+    get_render_cache_text,
+)
 
 sv_data_manger = SV('数据管理', pm=2)
 
@@ -23,12 +32,26 @@ async def daily_refresh_charData():
 @sv_data_manger.on_fullmatch(('gs清除缓存'))
 async def send_backup_msg(bot: Bot, ev: Event):
     await data_backup()
+    clear_texture_cache()
+    clear_render_cache()
     for item in MAP_DATA.glob('*'):
         if item.is_file():
             item.unlink()
     await bot.send('操作成功完成!')
 
 
+@sv_data_manger.on_fullmatch(('gs渲染状态'))
+async def send_render_stat(bot: Bot, ev: Event):
+    im = await get_render_stat_text()
+    im += f'\n当前圣遗物评分队列长度: {get_artifacts_queue_size()}'
+    im += f'\n{get_texture_stat_text()}\n{get_fetch_stat_text()}'
+    im += f'\n{get_render_cache_text()}'
+    encode_stat = get_encode_stat_text()
+    if encode_stat:
+        im += f'\n{encode_stat}'
+    await bot.send(im)
+
+
 @sv_data_manger.on_fullmatch(('校验全部Cookies'))
 async def send_check_cookie(bot: Bot, ev: Event):
     user_list = await GsUser.get_all_user()
@@ -5,16 +5,11 @@ from PIL import Image, ImageDraw
 from gsuid_core.utils.api.mys.models import IndexData
 from gsuid_core.utils.error_reply import get_error_img
 
+from ..utils.map import GS_MAP_PATH
 from ..utils.mys_api import mys_api
 from ..utils.image.convert import convert_img
-from ..utils.map.GS_MAP_PATH import avatarId2Name
 from ..utils.fonts.genshin_fonts import gs_font_30, gs_font_40
-from ..utils.image.image_tools import (
-    draw_bar,
-    get_color_bg,
-    get_qq_avatar,
-    draw_pic_with_ring,
-)
+from ..utils.image.image_tools import draw_bar, get_color_bg, get_ring_avatar
 
 TEXT_PATH = Path(__file__).parent / 'texture2D'
 
@@ -46,7 +41,6 @@ award_data = {
 }
 
 expmax_data = {
-    '获得角色数': len(avatarId2Name) - 2,
     '风神瞳': 66,
     '岩神瞳': 131,
     '雷神瞳': 181,
@@ -92,6 +86,11 @@ async def get_explore_data(
     for i in raw_data['world_explorations']:
         data[i['name']] = i['exploration_percentage']
 
+    # 角色数随版本更新, 绘制时再读取角色表
+    expmax = {
+        '获得角色数': len(GS_MAP_PATH.avatarId2Name) - 2,
+        **expmax_data,
+    }
     percent_data = {}
     value_data = {}
     day: str = str(raw_data['stats']['active_day_number'])
@@ -101,11 +100,11 @@ async def get_explore_data(
     for name in data:
         # 百分比
         p_str = f'{data[name]}'
-        if name in expmax_data:
-            percent = data[name] / expmax_data[name]
+        if name in expmax:
+            percent = data[name] / expmax[name]
             if name != '获得角色数':
                 me_percent += percent
-            value = f'{p_str} / {expmax_data[name]} | {_f(percent * 100)}'
+            value = f'{p_str} / {expmax[name]} | {_f(percent * 100)}'
         else:
             percent = data[name] / 1000
             world_percent += percent
@@ -114,8 +113,8 @@ async def get_explore_data(
         percent_data[name] = percent
         value_data[name] = value
 
-    me_percent = _f(me_percent * 100 / (len(expmax_data) - 1))
-    world_percent = _f(world_percent * 100 / (len(data) - len(expmax_data)))
+    me_percent = _f(me_percent * 100 / len(expmax_data))
+    world_percent = _f(world_percent * 100 / (len(data) - len(expmax)))
 
     return percent_data, value_data, day, me_percent, world_percent
 
@@ -176,12 +175,7 @@ async def draw_base_img(
     percent_data, value_data = data[0], data[1]
 
     # 获取背景图片各项参数
-    _id = str(qid)
-    if _id.startswith('http'):
-        char_pic = await get_qq_avatar(avatar_url=_id)
-    else:
-        char_pic = await get_qq_avatar(qid=qid)
-    char_pic = await draw_pic_with_ring(char_pic, 264)
+    char_pic = await get_ring_avatar(qid, 264)
 
     if mode == '收集':
         title = Image.open(TEXT_PATH / 'collection_title.png')
@@ -52,6 +52,16 @@ CONIFG_DEFAULT: Dict[str, GSC] = {
         '开启后[查询心海]等命令展示图将替换为随机图片',
         False,
     ),
+    'SignWorkers': GsStrConfig(
+        '签到并发数',
+        '全部签到时同时进行签到的用户数量',
+        '4',
+    ),
+    'SignRate': GsStrConfig(
+        '签到频率限制',
+        '全部签到时每分钟最多调用签到接口的次数, 过高容易出现验证码',
+        '4',
+    ),
     'SchedSignin': GsBoolConfig(
         '定时签到',
         '开启后每晚00:30将开始自动签到任务',
@@ -112,4 +122,29 @@ CONIFG_DEFAULT: Dict[str, GSC] = {
         '修改帮助图有多少列',
         '6',
     ),
+    'RenderWorkers': GsStrConfig(
+        '渲染线程数',
+        '用于绘制图片的线程数量, 修改后重启生效',
+        '4',
+    ),
+    'PicFormat': GsStrConfig(
+        '图片格式',
+        '发送图片的编码格式, 可选PNG、JPEG、WEBP',
+        'PNG',
+    ),
+    'PicQuality': GsStrConfig(
+        '图片质量',
+        'JPEG和WEBP格式的图片质量(1-100)',
+        '90',
+    ),
+    'PicMaxSize': GsStrConfig(
+        '图片大小限制',
+        '单张图片的最大KB数, 超出时降低质量或缩小尺寸, 0为不限制',
+        '0',
+    ),
+    'PicOptimize': GsBoolConfig(
+        '图片压缩优化',
+        '开启后图片更小, 但编码耗时更长',
+        False,
+    ),
 }
@@ -27,7 +27,7 @@ async def draw_config_img(bot_id: str) -> Union[bytes, str]:
     based_w = 850
     based_h = 850 + 155 * (len(gsconfig) - 8)
 
-    CI_img = CustomizeImage('', based_w, based_h)
+    CI_img = await CustomizeImage.create('', based_w, based_h)
     img = CI_img.bg_img
     color = CI_img.bg_color
     color_mask = Image.new('RGBA', (based_w, based_h), color)
@@ -97,7 +97,7 @@ async def draw_daily_cost_img(is_force: bool = False) -> Union[str, bytes]:
                     item = Image.open(item_path)
             else:
                 if 'name' in item:
-                    avatar_id = await name_to_avatar_id(item['name'])
+                    avatar_id = name_to_avatar_id(item['name'])
                     item_path = CHAR_PATH / f'{avatar_id}.png'
                 elif 'Boy' in item['icon']:
                     avatar_id = 10000005
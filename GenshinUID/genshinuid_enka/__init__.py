@@ -13,17 +13,19 @@ from gsuid_core.utils.error_reply import UID_HINT
 from .to_data import switch_api
 from .to_card import enka_to_card
 from ..utils.convert import get_uid
+from ..utils.map import GS_MAP_PATH
 from .get_akasha_data import get_rank
 from .start import refresh_player_list
 from .draw_artifacts_lib import draw_lib
 from .draw_rank_list import draw_rank_img
 from ..utils.image.convert import convert_img
-from ..utils.map.GS_MAP_PATH import alias_data
 from .draw_char_rank import draw_cahrcard_list
 from .draw_role_rank import draw_role_rank_img
-from .get_enka_img import draw_enka_img, get_full_char
+from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+from .get_best_artifacts import get_best_artifacts_text
 from ..genshinuid_enka.start import check_artifacts_list
-from ..utils.resource.RESOURCE_PATH import TEMP_PATH, PLAYER_PATH
+from ..utils.image.render_cache import get_reply_cache, bind_reply_cache
+from .get_enka_img import draw_enka_img, get_full_char, draw_contrast_img
 
 sv_enka_admin = SV('面板管理', pm=1)
 sv_enka_config = SV('面板设置', pm=2)
@@ -105,11 +107,10 @@ async def sned_aritifacts_list(bot: Bot, ev: Event):
 @sv_get_original_pic.on_fullmatch(('原图'))
 async def sned_original_pic(bot: Bot, ev: Event):
     if ev.reply:
-        path = TEMP_PATH / f'{ev.reply}.jpg'
-        if path.exists():
-            logger.info('[原图]访问图片: {}'.format(path))
-            with open(path, 'rb') as f:
-                await bot.send(f.read())
+        img = await get_reply_cache(ev.reply)
+        if img is not None:
+            logger.info('[原图]访问图片: {}'.format(ev.reply))
+            await bot.send(img)
 
 
 @sv_enka_config.on_fullmatch('切换api')
@@ -119,7 +120,7 @@ async def send_change_api_info(bot: Bot, ev: Event):
 
 @sv_get_enka.on_prefix('查询')
 async def send_char_info(bot: Bot, ev: Event):
-    im = await _get_char_info(bot, ev, ev.text)
+    im = await _get_char_info(bot, ev, ev.text, True)
     if isinstance(im, str):
         await bot.send(im)
     elif isinstance(im, Tuple):
@@ -129,15 +130,16 @@ async def send_char_info(bot: Bot, ev: Event):
             img = im[0]
         await bot.send(img)
         if im[1]:
-            with open(TEMP_PATH / f'{ev.msg_id}.jpg', 'wb') as f:
-                f.write(im[1])
+            await bind_reply_cache(ev.msg_id, im[1])
     elif im is None:
         return
     else:
         await bot.send('发生未知错误')
 
 
-async def _get_char_info(bot: Bot, ev: Event, text: str):
+async def _get_char_info(
+    bot: Bot, ev: Event, text: str, use_cache: bool = False
+):
     # 获取角色名
     msg = ''.join(re.findall('[\u4e00-\u9fa5 ]', text))
     if not msg:
@@ -149,7 +151,7 @@ async def _get_char_info(bot: Bot, ev: Event, text: str):
         return await bot.send(UID_HINT)
     await bot.logger.info('[查询角色面板]uid: {}'.format(uid))
 
-    im = await draw_enka_img(msg, uid, ev.image)
+    im = await draw_enka_img(msg, uid, ev.image, use_cache)
     return im
 
 
@@ -161,28 +163,15 @@ async def contrast_char_info(bot: Bot, ev: Event):
     elif len(contrast_list) >= 4:
         return await bot.send('不支持对比四个及以上的面板...')
 
-    img_list = []
-    max_y = 0
-    for i in contrast_list:
-        im = await _get_char_info(bot, ev, i)
-        if isinstance(im, str):
-            return await bot.send(im)
-        elif isinstance(im, Tuple):
-            data = im[0]
-            if isinstance(data, bytes):
-                return await bot.send('输入了错误的格式...参考格式: 对比面板 公子 公子换可莉圣遗物')
-            elif isinstance(data, str):
-                return await bot.send(data)
-            else:
-                assert isinstance(data, Image.Image)
-                img_list.append(data)
-                max_y = max(max_y, data.size[1])
-
-    base_img = Image.new('RGBA', (950 * len(img_list), max_y))
-    for index, img in enumerate(img_list):
-        base_img.paste(img, (950 * index, 0), img)
-
-    await bot.send(await convert_img(base_img))
+    uid = await get_uid(bot, ev)
+    if uid is None:
+        return await bot.send(UID_HINT)
+    await bot.logger.info('[对比面板]uid: {}'.format(uid))
+
+    im = await draw_contrast_img(uid, contrast_list, ev.image)
+    if isinstance(im, str):
+        return await bot.send(im)
+    await bot.send(await convert_img(im))
 
 
 @sv_get_enka.on_prefix('保存面板')
@@ -200,7 +189,7 @@ async def save_char_info(bot: Bot, ev: Event):
     if bool(re.search(r'\d', save_name)):
         return await bot.send('保存名称内不可存在数字!')
 
-    if save_name in alias_data:
+    if save_name in GS_MAP_PATH.alias_data:
         return await bot.send('保存名称不可为已有角色的名称!')
     else:
         for _fix in [
@@ -219,8 +208,8 @@ async def save_char_info(bot: Bot, ev: Event):
             if _fix in save_name:
                 return await bot.send(f'保存名称不能含有【{_fix}】等保留词...')
 
-        for _name in alias_data:
-            if save_name in alias_data[_name]:
+        for _name in GS_MAP_PATH.alias_data:
+            if save_name in GS_MAP_PATH.alias_data[_name]:
                 return await bot.send('保存名称不可为已有角色的别名!')
         else:
             char_data = await get_full_char(save_char, uid)
@@ -235,6 +224,19 @@ async def save_char_info(bot: Bot, ev: Event):
             return await bot.send(f'保存成功!你可以使用[查询{save_name}]调用该面板!')
 
 
+@sv_get_enka.on_prefix('查找最佳圣遗物')
+async def send_best_artifacts(bot: Bot, ev: Event):
+    msg = ''.join(re.findall('[\u4e00-\u9fa5 0-9]', ev.text)).strip()
+    if not msg:
+        return await bot.send('输入格式错误...参考格式: 查找最佳圣遗物胡桃 4魔女')
+    uid = await get_uid(bot, ev)
+    if uid is None:
+        return await bot.send(UID_HINT)
+    logger.info(f'[查找最佳圣遗物]uid: {uid}, 参数: {msg}')
+    await bot.send('开始查找...可能时间较久, 请勿重复触发!')
+    await bot.send(await get_best_artifacts_text(str(uid), msg))
+
+
 @sv_get_enka.on_command('强制刷新')
 async def send_card_info(bot: Bot, ev: Event):
     uid = await get_uid(bot, ev)
@@ -1,10 +1,13 @@
-import json
+import math
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+from functools import partial, lru_cache
 
 from PIL import Image, ImageDraw
 
+from ...utils.map.map_bundle import load_json
 from ...utils.fonts.genshin_fonts import gs_font_22
+from ...utils.image.texture import get_layer, get_texture
 
 DATA_PATH = Path(__file__).parent
 TEXT_PATH = DATA_PATH / 'texture2D'
@@ -34,13 +37,16 @@ COLOR_MAP = {
     '充能': '#ff5858',
 }
 
-# 引入曲线Map
-with open(DATA_PATH / 'char_curve.json', 'r', encoding='UTF-8') as f:
-    CHAR_CURVE = json.load(f)
 
-# 引入曲线Map
-with open(DATA_PATH / 'curve.json', 'r', encoding='UTF-8') as f:
-    CURVE = json.load(f)
+# 引入曲线Map, 首次绘制时加载
+@lru_cache(maxsize=None)
+def get_char_curve() -> Dict[str, Dict[str, str]]:
+    return load_json(DATA_PATH / 'char_curve.json')
+
+
+@lru_cache(maxsize=None)
+def get_curve() -> Dict[str, List]:
+    return load_json(DATA_PATH / 'curve.json')
 
 
 async def get_weight_temp(prop: dict, attr: str) -> List[float]:
@@ -94,11 +100,60 @@ frame_img = Image.open(TEXT_PATH / 'frame.png')
 point_img = Image.open(TEXT_PATH / 'point.png')
 
 
+def get_curve_color(attr: str) -> str:
+    for m in COLOR_MAP:
+        if m in attr:
+            return COLOR_MAP[m]
+    return '#ffffff'
+
+
+@lru_cache(maxsize=None)
+def get_curve_max(col: str) -> float:
+    return max([0, *get_curve()[col]])
+
+
+@lru_cache(maxsize=256)
+def get_line_points(
+    col: str, X_MAX: float, Y_MAX: float
+) -> Tuple[Tuple[float, float], ...]:
+    '''
+    计算曲线在图中的坐标, 同一角色的面板重复绘制时直接复用
+    '''
+    curve = get_curve()[col][: math.ceil(X_MAX)]
+    x_scale = X_D / X_MAX
+    y_scale = Y_D / Y_MAX
+    return tuple(
+        (x_scale * index + lu_point[0], (Y_D - y_scale * i) + lu_point[1])
+        for index, i in enumerate(curve)
+    )
+
+
+def _draw_curve_base(char_curve: Dict[str, str]) -> Image.Image:
+    img = get_texture(TEXT_PATH / 'curve_bg.png')
+    img_draw = ImageDraw.Draw(img)
+    # 绘制右上角方块和文字
+    for col_index, col in enumerate(char_curve):
+        color = get_curve_color(char_curve[col])
+        img_draw.rectangle(
+            ((710, 65 + col_index * 30), (750, 85 + col_index * 30)),
+            fill=color,
+        )
+        img_draw.text(
+            (762, 75 + col_index * 30),
+            f'{char_curve[col]}',
+            color,
+            gs_font_22,
+            'lm',
+        )
+    return img
+
+
 async def draw_char_curve_data(
     char_name: str, raw_data: dict
 ) -> Tuple[Image.Image, int]:
     # 如果曲线列表里不存在该角色,则返回空白图片
-    if char_name not in CHAR_CURVE or CHAR_CURVE[char_name] == {}:
+    char_curve = get_char_curve().get(char_name)
+    if not char_curve:
         return Image.new('RGBA', (950, 1)), 0
 
     # 获得面板属性
@@ -110,78 +165,46 @@ async def draw_char_curve_data(
     fight_prop['def_green'] = fight_prop['def'] - fight_prop['baseDef']
     fight_prop['hp_green'] = fight_prop['hp'] - fight_prop['baseHp']
 
-    img = Image.open(TEXT_PATH / 'curve_bg.png')
+    # 底图和右上角图例只与角色有关, 按角色缓存
+    img = get_layer(
+        ('curve_bg', char_name), partial(_draw_curve_base, char_curve)
+    )
     img_draw = ImageDraw.Draw(img)
 
     # 初始化X_MAX和Y_MAX值
     X_MAX = 0
     Y_MAX = 0
-    wight_point_dict: dict = {}
-    line_points_dict: dict = {}
-    wight_temp_dict: dict = {}
+    wight_temp_dict: Dict[str, List[float]] = {}
     # 遍历曲线列表,根据函数获得权重
-    for col in CHAR_CURVE[char_name]:
-        wight_temp = await get_weight(fight_prop, CHAR_CURVE[char_name][col])
-        wight_temp_dict[CHAR_CURVE[char_name][col]] = wight_temp
-        # 对单个属性的权重列表进行遍历
-        for i in wight_temp:
-            # 确定X_MAX值
-            if i >= X_MAX:
-                X_MAX = i
-            # 确定Y_MAX值
-            for j in CURVE[col]:
-                if j >= Y_MAX:
-                    Y_MAX = j
+    for col in char_curve:
+        wight_temp = await get_weight(fight_prop, char_curve[col])
+        wight_temp_dict[char_curve[col]] = wight_temp
+        if wight_temp:
+            X_MAX = max(X_MAX, *wight_temp)
+            Y_MAX = max(Y_MAX, get_curve_max(col))
 
     # 增加Y_MAX和X_MAX的值
     X_MAX = X_MAX + 15
     Y_MAX = Y_MAX + 0.002
 
     # 遍历曲线列表,COL为列名,这一步拿到所有曲线的点,和所有权重的点
-    for col_index, col in enumerate(CHAR_CURVE[char_name]):
-        line_points = []
-        # 确定颜色
-        for m in COLOR_MAP:
-            if m in CHAR_CURVE[char_name][col]:
-                color = COLOR_MAP[m]
-                break
-        else:
-            color = '#ffffff'
-
-        for index, i in enumerate(CURVE[col]):
-            if index >= X_MAX:
-                break
-            x, y = (X_D / X_MAX) * index + lu_point[0], (
-                Y_D - (Y_D / Y_MAX) * i
-            ) + lu_point[1]
-            line_points.append((x, y))
+    wight_point_dict: dict = {}
+    line_points_dict: dict = {}
+    for col in char_curve:
+        color = get_curve_color(char_curve[col])
+        line_points = get_line_points(col, X_MAX, Y_MAX)
         line_points_dict[color] = line_points
 
-        for wight in wight_temp_dict[CHAR_CURVE[char_name][col]]:
+        for wight in wight_temp_dict[char_curve[col]]:
             w_x = (wight / X_MAX) * X_D + lu_point[0]
             w_y = line_points[int(wight)][1]
-            if CHAR_CURVE[char_name][col] not in wight_point_dict:
-                wight_point_dict[CHAR_CURVE[char_name][col]] = {
+            if char_curve[col] not in wight_point_dict:
+                wight_point_dict[char_curve[col]] = {
                     'color': color,
                     'point': [(w_x, w_y)],
                 }
             else:
-                wight_point_dict[CHAR_CURVE[char_name][col]]['point'].append(
-                    (w_x, w_y)
-                )
-
-        # 绘制右上角方块和文字
-        img_draw.rectangle(
-            ((710, 65 + col_index * 30), (750, 85 + col_index * 30)),
-            fill=color,
-        )
-        img_draw.text(
-            (762, 75 + col_index * 30),
-            f'{CHAR_CURVE[char_name][col]}',
-            color,
-            gs_font_22,
-            'lm',
-        )
+                wight_point_dict[char_curve[col]]['point'].append((w_x, w_y))
 
     # 根据素材画曲线
     for c in line_points_dict:
@@ -2,9 +2,9 @@ from typing import Dict, Tuple
 
 from PIL import Image, ImageDraw
 
+from ..etc import MAP_PATH
 from ..mono.Enemy import Enemy
 from ..mono.Fight import Fight
-from ..etc.MAP_PATH import dmgMap
 from ..mono.Character import Character
 from ..etc.etc import TEXT_PATH, get_char_std
 from ...utils.fonts.genshin_fonts import gs_font_28
@@ -19,11 +19,10 @@ title_color = (255, 255, 100)
 async def get_char_dmg_percent(char: Character) -> Dict:
     enemy = Enemy(char.char_level, char.char_level)
     fight = Fight({char.char_name: char}, enemy)
-    dmg_data = await fight.get_dmg_dict(char.char_name)
-    without_talent = await fight.get_dmg_dict(char.char_name, True)
+    dmg_data, without_talent = await fight.get_dmg_dicts(char.char_name)
     percent = 0
     char.seq_str = '无匹配'
-    if char.char_name in dmgMap:
+    if char.char_name in MAP_PATH.dmgMap:
         std = await get_char_std(char.card_prop, char.char_name)
         if std['skill']:
             value = 0
@@ -1,37 +1,32 @@
-import json
 from decimal import Decimal
 from typing import Dict, Union, Optional
 
-import aiofiles
 from PIL import Image, ImageDraw
 
 from .etc.etc import TEXT_PATH
 from .start import refresh_player_list
 from ..utils.image.convert import convert_img
 from .draw_normal import _get_single_artifact_img
-from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
-from ..utils.image.image_tools import get_qq_avatar, draw_pic_with_ring
+from ..utils.image.image_tools import get_ring_avatar
+from ..utils.player_store import get_player_artifacts
 from ..utils.fonts.genshin_fonts import gs_font_25, gs_font_36, gs_font_38
 
 
 async def get_artifacts_lib_data(uid: str) -> Optional[Dict]:
-    path = PLAYER_PATH / uid / 'artifacts.json'
-    data = None
-    if not path.exists():
-        await refresh_player_list(uid)
+    data = await get_player_artifacts(uid)
+    if data is None:
+        return None
 
-    if path.exists():
-        async with aiofiles.open(path, 'rb') as file:
-            data = json.loads(await file.read())
+    all_list = [x for v in data['data'].values() for x in v]
+    # 圣遗物列表不存在或为旧版本时重新生成
+    if len(all_list) == 0 or 'cv_score' not in all_list[0]:
+        await refresh_player_list(uid)
+        data = await get_player_artifacts(uid)
+        if data is None:
+            return None
         all_list = [x for v in data['data'].values() for x in v]
-
         if len(all_list) == 0:
             return None
-        elif 'cv_score' not in all_list[0]:
-            path.unlink()
-            await refresh_player_list(uid)
-            async with aiofiles.open(path, 'rb') as file:
-                data = json.loads(await file.read())
 
     return data
 
@@ -80,8 +75,7 @@ async def draw_lib(user_id: str, uid: str, num: int) -> Union[bytes, str]:
         return f'[UID{uid}] 圣遗物仓库没有 {num} 页!\n最多为 {all_page} 页!'
 
     bg = Image.open(TEXT_PATH / 'artifacts_lib_bg.png')
-    avatar = await get_qq_avatar(user_id)
-    avatar_img = await draw_pic_with_ring(avatar, 280)
+    avatar_img = await get_ring_avatar(user_id, 280)
 
     bg.paste(avatar_img, (120, 88), avatar_img)
 
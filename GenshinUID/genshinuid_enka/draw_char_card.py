@@ -4,12 +4,12 @@ from PIL import Image, ImageDraw
 
 from .mono.Character import Character
 from .dmg_calc.dmg_calc import draw_dmg_img
+from .etc.etc import get_all_artifacts_value
 from .draw_char_curve import draw_char_curve_card
-from .etc.etc import TEXT_PATH, get_all_artifacts_value
 from ..utils.fonts.genshin_fonts import gs_font_18, gs_font_50
 from .draw_normal import (
-    get_bg_card,
     get_char_img,
+    get_panel_bg,
     get_artifacts_card,
     get_char_card_base,
 )
@@ -33,12 +33,9 @@ async def draw_char_card(
     dmg_img, dmg_len = await draw_dmg_img(char)
     char_img = await get_char_img(char, char_url)
     ex_len = dmg_len * 40 + 765
-    img = await get_bg_card(char.char_element, ex_len, char_img)
-    img.paste(char_img, (0, 0), char_img)
+    img = await get_panel_bg(char.char_element, ex_len, char_img)
     char_info_1 = await get_char_card_base(char)
-    char_info_2 = Image.open(TEXT_PATH / 'char_info_2.png')
     img.paste(char_info_1, (0, 0), char_info_1)
-    img.paste(char_info_2, (0, 1085), char_info_2)
     img.paste(dmg_img, (0, 1820), dmg_img)
     await get_artifacts_card(char, img)
     img_text = ImageDraw.Draw(img)
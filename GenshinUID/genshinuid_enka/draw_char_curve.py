@@ -4,25 +4,25 @@ from PIL import Image, ImageDraw
 
 from .etc.etc import TEXT_PATH
 from .mono.Character import Character
+from ..utils.image.texture import get_texture
 from .curve_calc.curve_calc import draw_char_curve_data
 from ..utils.fonts.genshin_fonts import genshin_font_origin
 from .draw_normal import (
     get_bg_card,
     get_char_img,
-    get_artifacts_card,
     get_char_card_base,
+    get_artifacts_score,
 )
 
 
 async def get_adv_card() -> Image.Image:
-    adv_img = Image.open(TEXT_PATH / 'adv.png')
-    return adv_img
+    return get_texture(TEXT_PATH / 'adv.png', copy=False)
 
 
 async def draw_char_curve_card(
     char: Character, char_url: Optional[str]
 ) -> Image.Image:
-    await get_artifacts_card(char, Image.new('RGB', (1, 1)))
+    await get_artifacts_score(char)
     curve_img, curve_len = await draw_char_curve_data(
         char.char_name, char.card_prop
     )
@@ -1,21 +1,28 @@
 import json
 import asyncio
-from typing import Tuple, Union, Literal
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Tuple, Union, Literal
 
+import aiofiles
+from msgspec import msgpack
 from PIL import Image, ImageDraw
 
 from .mono.Character import Character
+from ..utils.image.render import run_render
 from ..utils.image.convert import convert_img
+from ..utils.player_store import load_player_store
 from .dmg_calc.dmg_calc import get_char_dmg_percent
 from .etc.etc import TEXT_PATH, get_all_artifacts_value
+from ..version import Genshin_version, GenshinUID_version
 from ..utils.map.name_covert import avatar_id_to_char_star
 from ..utils.fonts.genshin_fonts import genshin_font_origin
 from ..utils.resource.RESOURCE_PATH import CHAR_PATH, PLAYER_PATH, WEAPON_PATH
 from ..utils.image.image_tools import (
     get_color_bg,
-    get_qq_avatar,
     get_fetter_pic,
     get_talent_pic,
+    get_ring_avatar,
     draw_pic_with_ring,
     get_weapon_affix_pic,
 )
@@ -56,6 +63,15 @@ gs_font_28 = genshin_font_origin(28)
 gs_font_30 = genshin_font_origin(30)
 gs_font_36 = genshin_font_origin(36)
 
+# 练度统计结果缓存, 以角色数据的md5判断是否需要重新计算
+RANK_CACHE_NAME = 'char_rank_cache.json'
+# 修改练度计算逻辑时增加, 使旧的缓存失效
+RANK_CACHE_VERSION = 1
+# 游戏数据、插件或计算逻辑变化后, 相同的角色数据也会得到不同的md5
+RANK_CACHE_SALT = (
+    f'{Genshin_version}-{GenshinUID_version}-{RANK_CACHE_VERSION}'.encode()
+)
+
 char_rank_title = Image.open(TEXT_PATH / 'char_rank_title.png')
 skill_mask = Image.open(TEXT_PATH / 'skill_mask.png')
 percent_mask = Image.open(TEXT_PATH / 'percent_mask.png')
@@ -66,40 +82,32 @@ async def draw_cahrcard_list(
     uid: str, qid: Union[str, int]
 ) -> Union[str, bytes]:
     uid_fold = PLAYER_PATH / str(uid)
-    char_file_list = uid_fold.glob('*')
-    char_list = []
-    for i in char_file_list:
-        file_name = i.name
-        if '\u4e00' <= file_name[0] <= '\u9fff':
-            char_list.append(file_name.split('.')[0])
-    if not char_list:
+    store = await load_player_store(uid)
+    if store is None or not store['chars']:
         return '你还没有已缓存的角色！\n请先使用【强制刷新】进行刷新！'
+    char_list = list(store['chars'])
 
+    rank_cache = await load_rank_cache(uid_fold)
     char_done_list = []
-    for char_name in char_list:
+    miss_list = []
+    for char_name, raw_data in store['chars'].items():
         temp = {}
-        with open(uid_fold / f'{char_name}.json', 'r', encoding='UTF-8') as f:
-            raw_data = json.load(f)
+        char_hash = hashlib.md5(
+            RANK_CACHE_SALT + msgpack.encode(raw_data)
+        ).hexdigest()
 
         skill_list = raw_data['avatarSkill']
 
         temp['char_name'] = char_name
         temp['fetter'] = raw_data['avatarFetter']
         temp['id'] = raw_data['avatarId']
-        char = Character(raw_data)
-        await char.new()
-        await char.get_fight_prop()
-        await get_char_dmg_percent(char)
-        temp['percent'] = char.percent
-        temp['percent'] = float(temp['percent'])
-        temp['value'] = await get_all_artifacts_value(
-            raw_data,
-            char.baseHp,
-            char.baseAtk,
-            char.baseDef,
-            char_name,
-        )
-        temp['value'] = float('{:.2f}'.format(temp['value']))
+        # 角色数据未变化时直接使用上次的计算结果
+        cache = rank_cache.get(char_name)
+        if cache and cache['hash'] == char_hash:
+            temp['percent'] = cache['percent']
+            temp['value'] = cache['value']
+        else:
+            miss_list.append((temp, raw_data, char_hash))
         temp['avatarElement'] = raw_data['avatarElement']
         temp['a_skill_level'] = skill_list[0]['skillLevel']
         temp['e_skill_level'] = skill_list[1]['skillLevel']
@@ -112,14 +120,35 @@ async def draw_cahrcard_list(
         temp['weapon_star'] = raw_data['weaponInfo']['weaponStar']
         char_done_list.append(temp)
 
+    if miss_list:
+        result_list = await asyncio.gather(
+            *[
+                get_char_rank_value(temp['char_name'], raw_data)
+                for temp, raw_data, _ in miss_list
+            ]
+        )
+        for (temp, _, char_hash), result in zip(miss_list, result_list):
+            temp['percent'], temp['value'] = result
+            rank_cache[temp['char_name']] = {
+                'hash': char_hash,
+                'percent': temp['percent'],
+                'value': temp['value'],
+            }
+        # 移除已不存在的角色
+        rank_cache = {k: v for k, v in rank_cache.items() if k in char_list}
+        await save_rank_cache(uid_fold, rank_cache)
+
     # 排序
     char_done_list.sort(key=lambda x: (-x['percent']))
-    qid = str(qid)
-    if qid.startswith('http'):
-        char_pic = await get_qq_avatar(avatar_url=qid)
-    else:
-        char_pic = await get_qq_avatar(qid=qid)
-    char_pic = await draw_pic_with_ring(char_pic, 320)
+    return await run_render(
+        '练度统计', _draw_cahrcard_list, uid, qid, char_done_list
+    )
+
+
+async def _draw_cahrcard_list(
+    uid: str, qid: Union[str, int], char_done_list: List[Dict]
+) -> bytes:
+    char_pic = await get_ring_avatar(qid, 320)
 
     img = await get_color_bg(950, 540 + 100 * len(char_done_list))
     img.paste(char_rank_title, (0, 0), char_rank_title)
@@ -136,6 +165,45 @@ async def draw_cahrcard_list(
     return res
 
 
+async def get_char_rank_value(
+    char_name: str, raw_data: Dict
+) -> Tuple[float, float]:
+    '''
+    计算单个角色的毕业度和圣遗物词条数
+    '''
+    char = Character(raw_data)
+    await char.new()
+    await char.get_fight_prop()
+    await get_char_dmg_percent(char)
+    percent = float(char.percent)
+    value = await get_all_artifacts_value(
+        raw_data,
+        char.baseHp,
+        char.baseAtk,
+        char.baseDef,
+        char_name,
+    )
+    return percent, float('{:.2f}'.format(value))
+
+
+async def load_rank_cache(uid_fold: Path) -> Dict[str, Dict]:
+    path = uid_fold / RANK_CACHE_NAME
+    if not path.exists():
+        return {}
+    try:
+        async with aiofiles.open(path, 'r', encoding='UTF-8') as f:
+            return json.loads(await f.read())
+    except json.JSONDecodeError:
+        return {}
+
+
+async def save_rank_cache(uid_fold: Path, rank_cache: Dict[str, Dict]):
+    async with aiofiles.open(
+        uid_fold / RANK_CACHE_NAME, 'w', encoding='UTF-8'
+    ) as f:
+        await f.write(json.dumps(rank_cache, ensure_ascii=False))
+
+
 async def get_color(
     type: Literal['skill', 'equip', 'percent'], value: int
 ) -> Tuple[int, int, int]:
@@ -152,7 +220,7 @@ async def draw_single_rank(img: Image.Image, char: dict, index: int):
     char_id = char['id']
     char_rank = Image.open(TEXT_PATH / 'char_rank.png')
     char_pic = Image.open(CHAR_PATH / f'{char_id}.png')
-    char_star = await avatar_id_to_char_star(char_id)
+    char_star = avatar_id_to_char_star(char_id)
     weapon_star = str(char['weapon_star'])
     char_pic = await draw_pic_with_ring(
         char_pic, 82, star_color_map[char_star]
@@ -109,7 +109,7 @@ async def draw_group_dmg_img(
     # 粘贴动作序列
     for index, time in enumerate(dmg_data):
         _data = dmg_data[time]
-        char_id = await name_to_avatar_id(_data['char'])
+        char_id = name_to_avatar_id(_data['char'])
         char_pic = Image.open(CHAR_PATH / f'{char_id}.png')
         char_img = await draw_pic_with_ring(char_pic, 50)
 
@@ -1,15 +1,19 @@
 import math
 import random
 from io import BytesIO
-from typing import Dict, Optional
+from pathlib import Path
+from functools import partial
+from typing import Dict, Tuple, Callable, Optional
 
 import aiofiles
-from httpx import get
 from PIL import Image, ImageDraw, ImageChops
 
+from .etc import MAP_PATH
+from .etc.MAP_PATH import COLOR_MAP
 from .mono.Character import Character
 from ..genshinuid_config.gs_config import gsconfig
-from .etc.MAP_PATH import COLOR_MAP, avatarName2SkillAdd
+from ..utils.image.texture import get_layer, get_texture
+from ..utils.image.fetch import request_url, get_url_bytes
 from ..utils.fonts.genshin_fonts import genshin_font_origin
 from .etc.etc import TEXT_PATH, strLenth, get_artifacts_value
 from ..utils.image.image_tools import (
@@ -33,28 +37,30 @@ ARTIFACTS_POS = {
     '理之冠': (323, 1447),
 }
 PIC_API = gsconfig.get_config('random_pic_API').data
+# 立绘(600x1200)与char_info_2重叠的区域
+CHAR_BAND = (0, 1085, 600, 1200)
+
+
+def get_icon_texture(path: Path) -> Image.Image:
+    return get_texture(path, (50, 50), 'RGBA', Image.Resampling.LANCZOS, False)
 
 
 async def get_char_card_base(char: Character) -> Image.Image:
     card_prop = char.card_prop
-    char_info_1 = Image.open(TEXT_PATH / 'char_info_1.png')
+    char_info_1 = get_texture(TEXT_PATH / 'char_info_1.png')
     # 命座处理
-    lock_img = Image.open(TEXT_PATH / 'icon_lock.png')
+    lock_img = get_texture(TEXT_PATH / 'icon_lock.png', copy=False)
     # holo_img = Image.open(TEXT_PATH / 'holo.png')
     for talent_num in range(0, 6):
         if talent_num + 1 <= len(card_prop['talentList']):
             talent = card_prop['talentList'][talent_num]
             try:
-                talent_img = Image.open(
-                    ICON_PATH / '{}.png'.format(talent['talentIcon'])
-                )
+                talent_path = ICON_PATH / f'{talent["talentIcon"]}.png'
+                talent_img_new = get_icon_texture(talent_path)
             except Exception:
-                talent_img = Image.open(
+                talent_img_new = get_icon_texture(
                     ICON_PATH / 'UI_Talent_S_Kazuha_02.png'
                 )
-            talent_img_new = talent_img.resize(
-                (50, 50), Image.Resampling.LANCZOS
-            ).convert("RGBA")
             for _ in range(2):
                 char_info_1.paste(
                     talent_img_new,
@@ -70,8 +76,8 @@ async def get_char_card_base(char: Character) -> Image.Image:
     e_skill_level = skillList[1]['skillLevel']
     q_skill_level = skillList[-1]['skillLevel']
 
-    if char.char_name in avatarName2SkillAdd:
-        skill_add = avatarName2SkillAdd[char.char_name]
+    if char.char_name in MAP_PATH.avatarName2SkillAdd:
+        skill_add = MAP_PATH.avatarName2SkillAdd[char.char_name]
     else:
         skill_add = ['E', 'Q']
     for skillAdd_index in range(0, 2):
@@ -84,10 +90,9 @@ async def get_char_card_base(char: Character) -> Image.Image:
                 a_skill_level += 3
 
     for skill_num, skill in enumerate(skillList[0:2] + [skillList[-1]]):
-        skill_img = Image.open(ICON_PATH / '{}.png'.format(skill['skillIcon']))
-        skill_img_new = skill_img.resize(
-            (50, 50), Image.Resampling.LANCZOS
-        ).convert("RGBA")
+        skill_img_new = get_icon_texture(
+            ICON_PATH / '{}.png'.format(skill['skillIcon'])
+        )
         char_info_1.paste(
             skill_img_new, (78, 756 + 101 * skill_num), skill_img_new
         )
@@ -347,35 +352,109 @@ async def get_char_card_base(char: Character) -> Image.Image:
     return char_info_1
 
 
-async def get_bg_card(
-    char_element: str, ex_len: int, char_img: Image.Image
-) -> Image.Image:
-    img_w, img_h = 950, 1085 + ex_len
-    overlay = Image.open(TEXT_PATH / 'overlay.png')
+def _make_bg_card(bg_color: Tuple[int, int, int], img_h: int) -> Image.Image:
+    img_w = 950
+    overlay_path = TEXT_PATH / 'overlay.png'
+    overlay = get_texture(overlay_path, copy=False)
     overlay_w, overlay_h = overlay.size
     if overlay_h < img_h:
         new_overlay_h = img_h
         new_overlay_w = math.ceil(new_overlay_h * overlay_w / overlay_h)
-        overlay = overlay.resize(
-            (new_overlay_w, new_overlay_h), Image.Resampling.LANCZOS
-        )
-        overlay = overlay.crop((0, 0, img_w, img_h))
     elif overlay_h > img_h:
         new_overlay_w = img_w
         new_overlay_h = math.ceil(overlay_w / new_overlay_w * overlay_h)
-        overlay = overlay.resize(
-            (new_overlay_w, new_overlay_h), Image.Resampling.LANCZOS
-        )
-        overlay = overlay.crop((0, 0, img_w, img_h))
+    if overlay_h != img_h:
+        # 缩放后的遮罩按尺寸缓存
+        overlay = get_texture(
+            overlay_path,
+            (new_overlay_w, new_overlay_h),
+            resample=Image.Resampling.LANCZOS,
+            copy=False,
+        ).crop((0, 0, img_w, img_h))
+    color_img = Image.new('RGBA', overlay.size, bg_color)
+    return ImageChops.overlay(color_img, overlay)
+
+
+def _get_bg_color(
+    char_element: str, char_img: Image.Image
+) -> Tuple[Tuple[int, int, int], bool]:
+    '''
+    返回背景颜色和是否缓存合成结果
+
+    元素颜色只有几种, 按(颜色, 高度)缓存; 随机图取色的颜色不固定,
+    每次重新合成, 避免占满纹理缓存
+    '''
     if (
         gsconfig.get_config('ColorBG').data
         and gsconfig.get_config('RandomPic').data
     ):
-        bg_color = CustomizeImage.get_bg_color(char_img)
-    else:
-        bg_color = COLOR_MAP[char_element]
-    color_img = Image.new('RGBA', overlay.size, bg_color)
-    return ImageChops.overlay(color_img, overlay)
+        return CustomizeImage.get_thumb_bg_color(char_img), False
+    return COLOR_MAP[char_element], True
+
+
+def _get_bg_layer(
+    key: Tuple,
+    factory: Callable[[], Image.Image],
+    cached: bool,
+    copy: bool = True,
+) -> Image.Image:
+    if cached:
+        return get_layer(key, factory, copy)
+    return factory()
+
+
+def _make_panel_base(bg: Image.Image) -> Image.Image:
+    panel_bg = bg.copy()
+    char_info_2 = get_texture(TEXT_PATH / 'char_info_2.png', copy=False)
+    panel_bg.paste(char_info_2, (0, 1085), char_info_2)
+    return panel_bg
+
+
+async def get_bg_card(
+    char_element: str, ex_len: int, char_img: Image.Image
+) -> Image.Image:
+    img_h = 1085 + ex_len
+    bg_color, cached = _get_bg_color(char_element, char_img)
+    return _get_bg_layer(
+        ('bg_card', bg_color, img_h),
+        partial(_make_bg_card, bg_color, img_h),
+        cached,
+    )
+
+
+async def get_panel_bg(
+    char_element: str, ex_len: int, char_img: Image.Image
+) -> Image.Image:
+    '''
+    合成面板的背景、立绘和char_info_2, 结果与依次粘贴三者相同
+
+    背景和char_info_2预先合成, 立绘下端与char_info_2重叠的部分
+    单独在原背景上合成后再覆盖回去
+    '''
+    img_h = 1085 + ex_len
+    bg_color, cached = _get_bg_color(char_element, char_img)
+    bg = _get_bg_layer(
+        ('bg_card', bg_color, img_h),
+        partial(_make_bg_card, bg_color, img_h),
+        cached,
+        copy=False,
+    )
+    img = _get_bg_layer(
+        ('panel_bg', bg_color, img_h),
+        partial(_make_panel_base, bg),
+        cached,
+    )
+    top = char_img.crop((0, 0, char_img.width, 1085))
+    img.paste(top, (0, 0), top)
+
+    band = bg.crop(CHAR_BAND)
+    bottom = char_img.crop((0, 1085, *char_img.size))
+    band.paste(bottom, (0, 0), bottom)
+    char_info_2 = get_texture(TEXT_PATH / 'char_info_2.png', copy=False)
+    band_info = char_info_2.crop((0, 0, *band.size))
+    band.paste(band_info, (0, 0), band_info)
+    img.paste(band, CHAR_BAND[:2])
+    return img
 
 
 async def get_char_img(
@@ -394,7 +473,7 @@ async def get_char_img(
             async with aiofiles.open(cuch_img, 'rb') as f:
                 char.char_bytes = await f.read()
         else:
-            char_data = get(char_url, follow_redirects=True)
+            char_data = await request_url(char_url)
             if 'application/json' in char_data.headers['Content-Type']:
                 char_url = None
             else:
@@ -404,7 +483,7 @@ async def get_char_img(
     if char_url:
         offset_x, offset_y = 200, 0
         if char.char_bytes is None:
-            char.char_bytes = get(char_url).content
+            char.char_bytes = await get_url_bytes(char_url)
         char_img = Image.open(BytesIO(char.char_bytes)).convert('RGBA')
     else:
         offset_x, offset_y = 200, 0
@@ -442,7 +521,7 @@ async def get_char_img(
             y2 = new_h / 2 + based_new_h / 2 - offset_y / 2
         char_img = bg_img2.crop((x1, y1, x2, y2))  # type: ignore
 
-    char_info_mask = Image.open(TEXT_PATH / 'char_info_mask.png')
+    char_info_mask = get_texture(TEXT_PATH / 'char_info_mask.png', copy=False)
     char_result = Image.new('RGBA', (based_w, based_h), (0, 0, 0, 0))
     char_result.paste(char_img, (0, 0), char_info_mask)
     return char_result
@@ -452,20 +531,20 @@ async def _get_single_artifact_img(aritifact: Dict) -> Image.Image:
     '''
     注意这里的aritifact不是原始的数据, 是带了评分的数据
     '''
-    artifactimg_bg = Image.open(TEXT_PATH / 'char_info_artifacts_bg.png')
-    artifacts_img = Image.open(TEXT_PATH / 'char_info_artifacts.png')
-    artifacts_piece_img = Image.open(
-        REL_PATH / '{}.png'.format(aritifact['aritifactName'])
+    artifactimg_bg = get_texture(TEXT_PATH / 'char_info_artifacts_bg.png')
+    artifacts_img = get_texture(TEXT_PATH / 'char_info_artifacts.png')
+    artifacts_piece_new_img = get_texture(
+        REL_PATH / '{}.png'.format(aritifact['aritifactName']),
+        (90, 90),
+        'RGBA',
+        Image.Resampling.LANCZOS,
+        False,
     )
-    artifacts_piece_new_img = artifacts_piece_img.resize(
-        (90, 90), Image.Resampling.LANCZOS
-    ).convert('RGBA')
 
     artifacts_img.paste(
         artifacts_piece_new_img, (26, 32), artifacts_piece_new_img
     )
-    aritifactStar_img = get_star_png(aritifact['aritifactStar'])
-    aritifactStar_img = aritifactStar_img.resize((90, 23))
+    aritifactStar_img = get_star_png(aritifact['aritifactStar'], (90, 23))
 
     # 圣遗物星星和名称&位置
     artifacts_img.paste(aritifactStar_img, (121, 63), aritifactStar_img)
@@ -655,14 +734,26 @@ async def get_artifact_score_data(aritifact: Dict, char: Character) -> Dict:
     return aritifact
 
 
-async def get_single_artifact_img(
-    aritifact: Dict, char: Character
-) -> Image.Image:
+async def _add_artifact_score(aritifact: Dict, char: Character) -> Dict:
     new_aritifact = await get_artifact_score_data(aritifact, char)
-    img = await _get_single_artifact_img(new_aritifact)
     for i in aritifact['reliquarySubstats']:
         char.artifacts_all_score += i['value_score']
-    return img
+    return new_aritifact
+
+
+async def get_single_artifact_img(
+    aritifact: Dict, char: Character
+) -> Image.Image:
+    new_aritifact = await _add_artifact_score(aritifact, char)
+    return await _get_single_artifact_img(new_aritifact)
+
+
+async def get_artifacts_score(char: Character):
+    '''
+    只计算圣遗物评分, 不绘制圣遗物卡片
+    '''
+    for aritifact in char.card_prop['equipList']:
+        await _add_artifact_score(aritifact, char)
 
 
 async def get_artifacts_card(char: Character, img: Image.Image):
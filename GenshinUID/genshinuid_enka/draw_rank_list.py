@@ -6,9 +6,9 @@ from gsuid_core.utils.image.image_tools import crop_center_img
 
 from .etc.etc import TEXT_PATH
 from .get_akasha_data import _get_rank
+from ..utils.image.image_tools import get_ring_avatar
 from ..utils.map.name_covert import avatar_id_to_name
 from .to_card import draw_char_card, draw_weapon_card
-from ..utils.image.image_tools import get_qq_avatar, draw_pic_with_ring
 from ..utils.fonts.genshin_fonts import (
     gs_font_15,
     gs_font_22,
@@ -36,8 +36,7 @@ async def draw_rank_img(user_id: str, uid: str) -> Union[bytes, str]:
     if isinstance(rank_data, str):
         return rank_data
 
-    user_avatar = await get_qq_avatar(user_id)
-    user_pic = await draw_pic_with_ring(user_avatar, 314)
+    user_pic = await get_ring_avatar(user_id, 314)
     title = Image.open(TITLE_PATH)
     title_draw = ImageDraw.Draw(title)
 
@@ -55,7 +54,7 @@ async def draw_rank_img(user_id: str, uid: str) -> Union[bytes, str]:
         time = raw_data['time']
         data = raw_data['calculations']['fit']
         stats: Dict = data['stats']
-        char_name = await avatar_id_to_name(char)
+        char_name = avatar_id_to_name(char)
         result = '{:.2f}'.format(data['result'])
         rank = data['ranking']
         if isinstance(rank, str):
@@ -3,8 +3,8 @@ from typing import Dict, Tuple, Union
 from PIL import Image, ImageDraw
 from gsuid_core.utils.image.convert import convert_img
 
+from ..utils.map import GS_MAP_PATH
 from ..utils.api.cv.request import _CvApi
-from ..utils.map.GS_MAP_PATH import icon2Name
 from .draw_rank_list import COLOR_MAP, RANK_TEXT
 from ..genshinuid_config.gs_config import gsconfig
 from ..utils.resource.RESOURCE_PATH import REL_PATH, CHAR_PATH
@@ -54,8 +54,8 @@ async def draw_role_rank_img(char_name: str) -> Union[str, bytes]:
         return '未开启排名系统...'
     cv_api = _CvApi()
 
-    char_name = await alias_to_char_name(char_name)
-    char_id = await name_to_avatar_id(char_name)
+    char_name = alias_to_char_name(char_name)
+    char_id = name_to_avatar_id(char_name)
     raw_data = await cv_api.get_sort_list(char_id)
 
     if raw_data is None:
@@ -109,7 +109,9 @@ async def draw_role_rank_img(char_name: str) -> Union[str, bytes]:
             if item['count'] >= 2:
                 url: str = item['icon']
                 icon_name = url.split('/')[-1].split('.')[0]
-                icon_img = Image.open(REL_PATH / f'{icon2Name[icon_name]}.png')
+                rel_name = GS_MAP_PATH.icon2Name[icon_name]
+                icon_path = REL_PATH / f'{rel_name}.png'
+                icon_img = Image.open(icon_path)
                 if item['count'] >= 4:
                     icon_list.clear()
                     icon_list.append(icon_img.resize((64, 64)))
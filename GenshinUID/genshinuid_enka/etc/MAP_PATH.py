@@ -1,7 +1,9 @@
-import json
 from pathlib import Path
+from functools import partial
 from typing import Dict, List, TypedDict
 
+from ...utils.map.map_bundle import load_json, lazy_getattr
+
 EFFECT_PATH = Path(__file__).parents[1] / 'effect'
 
 
@@ -12,30 +14,35 @@ class ActionMAP(TypedDict):
     value: List[str]
 
 
-with open(EFFECT_PATH / 'weapon_effect.json', "r", encoding='UTF-8') as f:
-    weapon_effect_map: Dict[
-        str, Dict[str, Dict[str, Dict[str, str]]]
-    ] = json.load(f)
-
-with open(EFFECT_PATH / 'char_effect.json', "r", encoding='UTF-8') as f:
-    char_effect_map: Dict[
-        str, Dict[str, Dict[str, Dict[str, str]]]
-    ] = json.load(f)
-
-with open(EFFECT_PATH / 'artifact_effect.json', "r", encoding='UTF-8') as f:
-    artifact_effect_map: Dict[str, Dict[str, Dict[str, str]]] = json.load(f)
-
-with open(EFFECT_PATH / 'value_attr.json', 'r', encoding='UTF-8') as f:
-    ATTR_MAP: Dict[str, List[str]] = json.load(f)
-
-with open(EFFECT_PATH / 'char_action.json', 'r', encoding='UTF-8') as f:
-    char_action: Dict[str, Dict[str, ActionMAP]] = json.load(f)
-
-with open(EFFECT_PATH / 'dmg_map.json', 'r', encoding='UTF-8') as f:
-    dmgMap = json.load(f)
-
-with open(EFFECT_PATH / 'skill_add.json', 'r', encoding='UTF-8') as f:
-    avatarName2SkillAdd: Dict[str, List[str]] = json.load(f)
+# 以下数据均在首次访问时加载, 见`map_bundle.lazy_getattr`
+weapon_effect_map: Dict[str, Dict[str, Dict[str, Dict[str, str]]]]
+char_effect_map: Dict[str, Dict[str, Dict[str, Dict[str, str]]]]
+artifact_effect_map: Dict[str, Dict[str, Dict[str, str]]]
+ATTR_MAP: Dict[str, List[str]]
+char_action: Dict[str, Dict[str, ActionMAP]]
+dmgMap: Dict[str, List[Dict]]
+avatarName2SkillAdd: Dict[str, List[str]]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'weapon_effect_map': partial(
+            load_json, EFFECT_PATH / 'weapon_effect.json'
+        ),
+        'char_effect_map': partial(
+            load_json, EFFECT_PATH / 'char_effect.json'
+        ),
+        'artifact_effect_map': partial(
+            load_json, EFFECT_PATH / 'artifact_effect.json'
+        ),
+        'ATTR_MAP': partial(load_json, EFFECT_PATH / 'value_attr.json'),
+        'char_action': partial(load_json, EFFECT_PATH / 'char_action.json'),
+        'dmgMap': partial(load_json, EFFECT_PATH / 'dmg_map.json'),
+        'avatarName2SkillAdd': partial(
+            load_json, EFFECT_PATH / 'skill_add.json'
+        ),
+    },
+)
 
 COLOR_MAP = {
     'Anemo': (0, 145, 137),
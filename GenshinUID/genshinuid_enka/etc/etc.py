@@ -1,6 +1,7 @@
+from typing import Dict
 from pathlib import Path
 
-from .MAP_PATH import ATTR_MAP, dmgMap
+from . import MAP_PATH
 
 R_PATH = Path(__file__).parents[1]
 TEXT_PATH = R_PATH / 'texture2D'
@@ -65,6 +66,7 @@ async def get_artifacts_value(
     baseDef: int,
     charName: str,
 ) -> float:
+    ATTR_MAP = MAP_PATH.ATTR_MAP
     if charName not in ATTR_MAP:
         ATTR_MAP[charName] = ['攻击力', '暴击率', '暴击伤害']
     if subName in ATTR_MAP[charName] and subName in ['血量', '防御力', '攻击力']:
@@ -125,7 +127,7 @@ async def get_first_main(mainName: str) -> str:
     return equipMain
 
 
-async def get_char_std(raw_data: dict, char_name: str) -> dmgMap:
+async def get_char_std(raw_data: dict, char_name: str) -> Dict:
     weaponName = raw_data['weaponInfo']['weaponName']
 
     equipMain = ''
@@ -167,7 +169,7 @@ async def get_char_std(raw_data: dict, char_name: str) -> dmgMap:
             equipMain,
         )
 
-    std_prop = dmgMap[char_name]
+    std_prop = MAP_PATH.dmgMap[char_name]
     seq_temp_a = ''
     seq_temp_w = ''
     for std_seq in std_prop:
@@ -189,6 +191,6 @@ async def get_char_std(raw_data: dict, char_name: str) -> dmgMap:
             std = seq_temp_a
         # 不存在则使用第一个
         else:
-            std = dmgMap[char_name][0]
+            std = MAP_PATH.dmgMap[char_name][0]
 
     return std
@@ -1,7 +1,7 @@
 from typing import List, Literal
 
+from . import MAP_PATH
 from ..etc.base_info import ELEMENT_MAP
-from .MAP_PATH import char_effect_map, weapon_effect_map, artifact_effect_map
 
 
 async def get_buff_list(
@@ -10,6 +10,9 @@ async def get_buff_list(
     with_talent: bool = True,
 ) -> List[str]:
     all_effect: List[str] = []
+    weapon_effect_map = MAP_PATH.weapon_effect_map
+    char_effect_map = MAP_PATH.char_effect_map
+    artifact_effect_map = MAP_PATH.artifact_effect_map
 
     # 获取初始数据
     char_name = raw_data['avatarName']
@@ -36,7 +36,7 @@ async def get_rank(uid: str) -> str:
     for char in rank_data:
         raw_data = rank_data[char]
         data = raw_data['calculations']['fit']
-        char_name = await avatar_id_to_name(char)
+        char_name = avatar_id_to_name(char)
         result = '{:.2f}'.format(data['result'])
         rank = data['ranking']
         if isinstance(rank, str):
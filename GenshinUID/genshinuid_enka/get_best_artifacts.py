@@ -0,0 +1,346 @@
+import re
+import time
+import heapq
+import asyncio
+from typing import Set, Dict, List, Tuple, Union
+
+from gsuid_core.logger import logger
+
+from .etc import MAP_PATH
+from .to_data import get_equip_sets
+from .mono.Character import Character
+from ..genshinuid_config.gs_config import gsconfig
+from .dmg_calc.dmg_calc import get_char_dmg_percent
+from .etc.etc import VALUE_MAP, get_artifacts_value
+from ..utils.player_store import get_player_artifacts
+from .get_enka_img import get_char_data, get_artifacts_repo
+
+PIECE_LIST = ['flower', 'plume', 'sands', 'goblet', 'circlet']
+ELEMENT_NAME = {
+    'Anemo': '风',
+    'Cryo': '冰',
+    'Dendro': '草',
+    'Electro': '雷',
+    'Geo': '岩',
+    'Hydro': '水',
+    'Pyro': '火',
+}
+
+# 按估值保留多少个组合进行真实毕业度计算
+CANDIDATE_NUM = 30
+# 搜索与计算的总时间限制(秒)
+TIME_LIMIT = 30
+
+
+async def get_set_limit(
+    msg: str, char_data: Dict
+) -> Union[Dict[str, int], str]:
+    '''
+    解析套装限制, 例如`4绝缘`或`2追忆2角斗`,
+    未指定时保持角色当前的套装, `任意`则不做限制
+    '''
+    if '任意' in msg:
+        return {}
+    set_limit: Dict[str, int] = {}
+    msg = msg.replace(' ', '')
+    for num, name in re.findall(r'([24])([一-龥]+?)(?=[24]|$)', msg):
+        for set_name in MAP_PATH.artifact_effect_map:
+            if set_name.startswith(name) or name in set_name:
+                set_limit[set_name] = set_limit.get(set_name, 0) + int(num)
+                break
+        else:
+            return f'不存在名为{name}的圣遗物套装...'
+    if sum(set_limit.values()) > 5:
+        return '套装限制的数量超过了五件...'
+    if set_limit or 'equipSets' not in char_data:
+        return set_limit
+
+    equip_sets = char_data['equipSets']
+    if equip_sets['type'] == '4':
+        return {equip_sets['set']: 4}
+    for set_name in equip_sets['set'].split('|'):
+        if set_name:
+            set_limit[set_name] = 2
+    return set_limit
+
+
+def get_dmg_bonus_element(char_data: Dict) -> Set[str]:
+    '''
+    角色有效的伤害加成, 即角色自身的元素,
+    标准配置中使用物理伤害加成空之杯的角色再加上物理
+    '''
+    result = {ELEMENT_NAME.get(char_data['avatarElement'], '')}
+    for std in MAP_PATH.dmgMap.get(char_data['avatarName'], []):
+        seq = std['seq'].split('|')
+        if len(seq) == 3 and seq[-1][1:2] == '物':
+            result.add('物')
+            break
+    return result
+
+
+async def get_artifact_value(
+    artifact: Dict, char_data: Dict
+) -> Dict[str, float]:
+    '''
+    估算单个圣遗物各有效属性的词条数, 用于搜索时的排序与剪枝
+    '''
+    fight_prop = char_data['avatarFightProp']
+    base = (fight_prop['baseAtk'], fight_prop['baseHp'], fight_prop['baseDef'])
+    char_name = char_data['avatarName']
+    bonus_element = get_dmg_bonus_element(char_data)
+
+    result: Dict[str, float] = {}
+    main = artifact['reliquaryMainstat']
+    stat_list = [main] + artifact['reliquarySubstats']
+    for stat in stat_list:
+        name = stat['statName']
+        if '伤害加成' in name:
+            # 有效的伤害加成视为等量的百分比攻击力
+            if name[0] in bonus_element:
+                value = stat['statValue'] / VALUE_MAP['攻击力']
+            else:
+                value = 0
+        elif name in VALUE_MAP or name.replace('百分比', '') in VALUE_MAP:
+            value = await get_artifacts_value(
+                name, stat['statValue'], *base, char_name
+            )
+        else:
+            value = 0
+        if value:
+            result[name] = result.get(name, 0) + value
+    return result
+
+
+async def get_artifact_pool(uid: str) -> Dict[str, List[Dict]]:
+    data = await get_player_artifacts(uid)
+    if data and any(data['data'].values()):
+        return data['data']
+    return await get_artifacts_repo(uid)
+
+
+def _prune_group(
+    artifact_list: List[Tuple[float, Dict[str, float], Dict]]
+) -> List[Tuple[float, Dict[str, float], Dict]]:
+    result = []
+    for index, (score, value, artifact) in enumerate(artifact_list):
+        for _index, (_score, _value, _) in enumerate(artifact_list):
+            if _index == index:
+                continue
+            if all(_value.get(k, 0) >= v for k, v in value.items()) and (
+                _score > score or (_score == score and _index < index)
+            ):
+                break
+        else:
+            result.append((score, value, artifact))
+    return result
+
+
+async def prune_dominated(
+    artifact_list: List[Tuple[float, Dict[str, float], Dict]],
+    deadline: float,
+) -> List[Tuple[float, Dict[str, float], Dict]]:
+    '''
+    同套装同主词条的圣遗物中, 若某件的每个有效属性都不高于另一件,
+    则它不可能出现在更优的组合中, 直接移除
+
+    按(套装, 主词条)分组后逐组比较, 每组之间让出事件循环,
+    超过时间限制时剩余的分组不再剪枝
+    '''
+    group: Dict[Tuple[str, str], List] = {}
+    for item in artifact_list:
+        artifact = item[2]
+        key = (
+            artifact['aritifactSetsName'],
+            artifact['reliquaryMainstat']['statName'],
+        )
+        group.setdefault(key, []).append(item)
+
+    result = []
+    for item_list in group.values():
+        if time.time() > deadline:
+            result.extend(item_list)
+            continue
+        result.extend(_prune_group(item_list))
+        await asyncio.sleep(0)
+    return result
+
+
+async def search_candidate(
+    slot_list: List[List[Tuple[float, Dict[str, float], Dict]]],
+    set_limit: Dict[str, int],
+    deadline: float,
+) -> Tuple[List[Tuple[float, List[Dict]]], bool]:
+    '''
+    分支定界搜索估值最高的若干组合
+
+    上界为已选部件的估值加上剩余每个部位的最高估值,
+    当上界不超过当前第`CANDIDATE_NUM`名时剪枝,
+    同时剪去剩余部位无法满足套装限制的分支
+
+    返回候选组合, 以及搜索是否因超时而中止
+    '''
+    suffix_max = [0.0] * (len(slot_list) + 1)
+    for i in range(len(slot_list) - 1, -1, -1):
+        suffix_max[i] = suffix_max[i + 1] + slot_list[i][0][0]
+
+    heap: List[Tuple[float, int, List[Dict]]] = []
+    stat = {'node': 0, 'prune': 0, 'timeout': False}
+    set_count: Dict[str, int] = {k: 0 for k in set_limit}
+    chosen: List[Dict] = []
+
+    async def dfs(index: int, score: float):
+        if index == len(slot_list):
+            item = (score, stat['node'], list(chosen))
+            if len(heap) < CANDIDATE_NUM:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heappushpop(heap, item)
+            return
+
+        remain = len(slot_list) - index - 1
+        for _score, _, artifact in slot_list[index]:
+            if stat['timeout']:
+                return
+            stat['node'] += 1
+            if stat['node'] % 2000 == 0:
+                if time.time() > deadline:
+                    stat['timeout'] = True
+                    logger.info('[查找最佳圣遗物] 已达到时间限制, 停止搜索!')
+                await asyncio.sleep(0)
+
+            bound = score + _score + suffix_max[index + 1]
+            if len(heap) >= CANDIDATE_NUM and bound <= heap[0][0]:
+                # 同部位已按估值降序, 后续的上界只会更低
+                stat['prune'] += 1
+                break
+
+            set_name = artifact['aritifactSetsName']
+            if set_name in set_count:
+                set_count[set_name] += 1
+            need = sum(
+                max(num - set_count[name], 0)
+                for name, num in set_limit.items()
+            )
+            if need <= remain:
+                chosen.append(artifact)
+                await dfs(index + 1, score + _score)
+                chosen.pop()
+            else:
+                stat['prune'] += 1
+            if set_name in set_count:
+                set_count[set_name] -= 1
+
+    await dfs(0, 0)
+    logger.info(
+        f'[查找最佳圣遗物] 搜索{stat["node"]}个节点, 剪枝{stat["prune"]}次, '
+        f'得到{len(heap)}个候选组合'
+    )
+    candidate_list = [(i[0], i[2]) for i in sorted(heap, reverse=True)]
+    return candidate_list, bool(stat['timeout'])
+
+
+async def get_build_percent(char_data: Dict, equip_list: List[Dict]) -> float:
+    data = dict(char_data)
+    data['equipList'] = equip_list
+    data['equipSets'] = get_equip_sets(equip_list)
+    char = Character(data)
+    if isinstance(await char.new(), str):
+        return 0
+    await char.init_prop()
+    await get_char_dmg_percent(char)
+    return float(char.percent)
+
+
+async def get_best_artifacts(
+    uid: str,
+    msg: str,
+    top_k: int = 3,
+    time_limit: float = TIME_LIMIT,
+) -> Union[List[Dict], str]:
+    '''
+    在圣遗物仓库中查找使角色毕业度最高的组合
+
+    参数:
+        msg: `str`
+            角色名以及可选的套装限制, 例如`胡桃 4魔女`
+    返回:
+        按毕业度降序的前`top_k`个组合,
+        每项包含`percent`, `char_data`
+    '''
+    if gsconfig.get_config('OldPanle').data:
+        return '当前使用旧面板计算, 无法查找最佳圣遗物...'
+
+    msg_list = msg.strip().split(' ', 1)
+    char_data = await get_char_data(uid, msg_list[0], False)
+    if isinstance(char_data, str):
+        return char_data
+    set_limit = await get_set_limit(
+        msg_list[1] if len(msg_list) > 1 else '', char_data
+    )
+    if isinstance(set_limit, str):
+        return set_limit
+
+    start = time.time()
+    deadline = start + time_limit
+    pool = await get_artifact_pool(uid)
+    slot_list = []
+    for piece in PIECE_LIST:
+        artifact_list = []
+        for artifact in pool.get(piece, []):
+            value = await get_artifact_value(artifact, char_data)
+            artifact_list.append((sum(value.values()), value, artifact))
+        if not artifact_list:
+            return '圣遗物仓库中缺少部件...请先使用[刷新圣遗物仓库]!'
+        artifact_list = await prune_dominated(artifact_list, deadline)
+        artifact_list.sort(key=lambda x: -x[0])
+        slot_list.append(artifact_list)
+    logger.info(
+        f'[查找最佳圣遗物] UID{uid}开始搜索, 各部位候选数量: ' f'{[len(i) for i in slot_list]}'
+    )
+
+    candidate_list, timeout = await search_candidate(
+        slot_list, set_limit, deadline
+    )
+    if not candidate_list:
+        if timeout:
+            return '查找超时...圣遗物数量过多, 请尝试指定套装限制!'
+        return '没有满足套装限制的圣遗物组合...'
+
+    result: List[Dict] = []
+    for num, (score, equip_list) in enumerate(candidate_list):
+        if time.time() > deadline and result:
+            logger.info('[查找最佳圣遗物] 已达到时间限制, 提前结束计算!')
+            break
+        percent = await get_build_percent(char_data, equip_list)
+        logger.info(
+            f'[查找最佳圣遗物] UID{uid}第{num + 1}/{len(candidate_list)}'
+            f'个组合, 估值{score:.2f}, 毕业度为{percent}!'
+        )
+        data = dict(char_data)
+        data['equipList'] = equip_list
+        data['equipSets'] = get_equip_sets(equip_list)
+        result.append({'percent': percent, 'char_data': data})
+
+    result.sort(key=lambda x: -x['percent'])
+    logger.info(
+        f'[查找最佳圣遗物] UID{uid}完成, 计算{len(result)}个组合, '
+        f'耗时{time.time() - start:.2f}秒'
+    )
+    return result[:top_k]
+
+
+async def get_best_artifacts_text(uid: str, msg: str, top_k: int = 3) -> str:
+    result = await get_best_artifacts(uid, msg, top_k)
+    if isinstance(result, str):
+        return result
+    char_name = result[0]['char_data']['avatarName']
+    im = [f'UID{uid} {char_name} 最佳圣遗物组合:']
+    for index, build in enumerate(result):
+        im.append(f'【第{index + 1}名】毕业度 {build["percent"]}%')
+        for artifact in build['char_data']['equipList']:
+            main = artifact['reliquaryMainstat']
+            im.append(
+                f'{artifact["aritifactName"]} '
+                f'{main["statName"]}+{main["statValue"]}'
+            )
+    return '\n'.join(im)
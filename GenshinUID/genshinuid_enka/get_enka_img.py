@@ -1,22 +1,42 @@
 import re
 import json
+import asyncio
+from copy import deepcopy
+from contextvars import ContextVar
 from typing import Dict, List, Tuple, Union, Optional
 
 from PIL import Image
 from gsuid_core.logger import logger
 from gsuid_core.utils.error_reply import CHAR_HINT
 
+from ..utils.map import GS_MAP_PATH
 from .to_card import draw_enka_card
+from .mono.FightProp import FightProp
 from .draw_char_card import draw_char_img
+from ..utils.image.render import run_render
+from ..utils.image.convert import convert_img
+from ..utils.image.fetch import get_url_bytes
 from .draw_group_dmg import draw_group_dmg_img
 from .mono.Character import Character, get_char
-from ..utils.map.GS_MAP_PATH import avatarName2Element
+from ..genshinuid_config.gs_config import gsconfig
 from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
 from ..utils.map.name_covert import (
     name_to_avatar_id,
     alias_to_char_name,
     avatarId_to_enName,
 )
+from ..utils.player_store import (
+    PlayerStore,
+    get_player_char,
+    load_player_store,
+    get_player_char_list,
+)
+from ..utils.image.render_cache import (
+    get_render_key,
+    get_render_cache,
+    put_render_cache,
+    put_content_cache,
+)
 
 CHAR_TO_INT = {
     '零': 0,
@@ -29,6 +49,22 @@ CHAR_TO_INT = {
     '满': 6,
 }
 
+# 影响面板绘制和编码结果的设置, 作为面板缓存键的一部分
+PANEL_CONFIG = [
+    'OldPanle',
+    'ColorBG',
+    'RandomPic',
+    'random_pic_API',
+    'PicFormat',
+    'PicQuality',
+    'PicMaxSize',
+]
+
+# 批量构建角色时读取一次的玩家数据, (uid, 玩家数据)
+PLAYER_STORE: 'ContextVar[Optional[Tuple[str, Optional[PlayerStore]]]]' = (
+    ContextVar('PLAYER_STORE', default=None)
+)
+
 WEAPON_TO_INT = {
     '一': 1,
     '二': 2,
@@ -47,14 +83,35 @@ async def get_full_char(raw_mes: str, uid: str) -> Union[str, Dict]:
         char = await get_char(*_args)
         if isinstance(char, str):
             return char
-        return char.card_prop
+        card_prop = dict(char.card_prop)
+        fight_prop = card_prop['avatarFightProp']
+        if isinstance(fight_prop, FightProp):
+            card_prop['avatarFightProp'] = fight_prop.to_dict()
+        return card_prop
     else:
         return _args
 
 
+def get_panel_key(
+    args: Tuple, url: Optional[str], is_curve: bool
+) -> Optional[str]:
+    '''
+    由角色数据, 替换的武器/命座, 立绘和影响绘图的设置计算面板缓存键
+    '''
+    # 随机立绘每次结果不同, 不缓存
+    if url is None and gsconfig.get_config('RandomPic').data:
+        return None
+    config = {i: gsconfig.get_config(i).data for i in PANEL_CONFIG}
+    return get_render_key('char_panel', args, url, is_curve, config)
+
+
 async def draw_enka_img(
-    raw_mes: str, uid: str, url: Optional[str]
-) -> Union[str, Tuple[Union[bytes, Image.Image, str], Optional[bytes]]]:
+    raw_mes: str, uid: str, url: Optional[str], use_cache: bool = False
+) -> Union[str, Tuple[Union[bytes, Image.Image, str], Optional[str]]]:
+    '''
+    返回绘制的图片和原图的缓存键,
+    `use_cache`为True时单个角色面板直接返回编码后的图片并使用面板缓存
+    '''
     # 获取角色名
     msg = ' '.join(re.findall('[\u4e00-\u9fa5]+', raw_mes))
     # msg = raw_mes.strip()
@@ -76,69 +133,139 @@ async def draw_enka_img(
         return sc, None
 
     msg_list = msg.split(' ')
-    char_list = []
-    for msg in msg_list:
-        _args = await get_char_args(msg, uid)
-        if isinstance(_args, str):
-            return _args
-        else:
-            if isinstance(_args[0], str):
-                return _args[0]
-        if is_group:
-            char = await get_char(*_args)
-            char_list.append(char)
-        else:
-            break
-    else:
-        im = await draw_group_dmg_img(uid, char_list)
+    if is_group:
+        char_list = await get_char_list(uid, msg_list)
+        if isinstance(char_list, str):
+            return char_list
+        im = await run_render('队伍伤害', draw_group_dmg_img, uid, char_list)
         if isinstance(im, str):
             return im
         return im, None
 
-    char = await get_char(*_args)
+    _args = await get_char_args(msg_list[0], uid)
+    if isinstance(_args, str):
+        return _args
+    elif isinstance(_args[0], str):
+        return _args[0]
+
+    key = get_panel_key(_args, url, is_curve) if use_cache else None
+    img = await get_render_cache(key) if key else None
+    if img is not None:
+        logger.info('[查询角色] 命中面板缓存,等待发送...')
+        char_bytes = await get_url_bytes(url) if url else None
+    else:
+        char = await get_char(*_args)
+        if isinstance(char, str):
+            logger.info('[查询角色] 绘图失败, 替换的武器不正确!')
+            return char
 
-    if isinstance(char, str):
-        logger.info('[查询角色] 绘图失败, 替换的武器不正确!')
-        return char
+        img, char_bytes = await draw_char_img(char, url, is_curve)
+        if use_cache and isinstance(img, Image.Image):
+            img = await convert_img(img)
+            if key:
+                await put_render_cache(key, img)
+        logger.info('[查询角色] 绘图完成,等待发送...')
 
-    im = await draw_char_img(char, url, is_curve)
-    logger.info('[查询角色] 绘图完成,等待发送...')
-    return im
+    raw_key = await put_content_cache(char_bytes) if char_bytes else None
+    return img, raw_key
+
+
+async def get_char_list(
+    uid: str, msg_list: List[str]
+) -> Union[List[Character], str]:
+    '''
+    只读取一次玩家数据, 解析全部角色后并发构建,
+    任意一个角色出错时返回错误信息
+    '''
+    store = await load_player_store(uid)
+    token = PLAYER_STORE.set((uid, store))
+    try:
+        args_list = []
+        for msg in msg_list:
+            _args = await get_char_args(msg, uid)
+            if isinstance(_args, str):
+                return _args
+            elif isinstance(_args[0], str):
+                return _args[0]
+            args_list.append(_args)
+    finally:
+        PLAYER_STORE.reset(token)
+
+    char_list = await asyncio.gather(*[get_char(*i) for i in args_list])
+    for char in char_list:
+        if isinstance(char, str):
+            return char
+    return char_list
+
+
+async def draw_contrast_img(
+    uid: str, msg_list: List[str], url: Optional[str]
+) -> Union[Image.Image, str]:
+    '''
+    对比面板: 并发构建全部角色后在渲染线程池中并行绘制, 最后拼接为一张图
+    '''
+    name_list: List[str] = []
+    curve_list: List[bool] = []
+    for raw_mes in msg_list:
+        msg = ' '.join(re.findall('[\u4e00-\u9fa5]+', raw_mes))
+        if not msg:
+            continue
+        if '展柜角色' in msg or '队伍' in msg:
+            return '输入了错误的格式...参考格式: 对比面板 公子 公子换可莉圣遗物'
+        curve_list.append('曲线' in msg)
+        name_list.append(msg.replace('成长曲线', '').replace('曲线', ''))
+
+    char_list = await get_char_list(uid, name_list)
+    if isinstance(char_list, str):
+        return char_list
+    res_list = await asyncio.gather(
+        *[
+            run_render('对比面板', draw_char_img, char, url, is_curve)
+            for char, is_curve in zip(char_list, curve_list)
+        ]
+    )
+    img_list = [i[0] for i in res_list]
+    max_y = max([img.size[1] for img in img_list], default=0)
+    base_img = Image.new('RGBA', (950 * len(img_list), max_y))
+    for index, img in enumerate(img_list):
+        base_img.paste(img, (950 * index, 0), img)
+    return base_img
+
+
+async def _get_player_char(uid: str, char_name: str) -> Optional[Dict]:
+    batch = PLAYER_STORE.get()
+    if batch is None or batch[0] != uid:
+        return await get_player_char(uid, char_name)
+    store = batch[1]
+    if store is None or char_name not in store['chars']:
+        return None
+    # 调用方会修改角色数据, 返回副本
+    return deepcopy(store['chars'][char_name])
 
 
 async def get_char_data(
     uid: str, char_name: str, enable_self: bool = True
 ) -> Union[Dict, str]:
-    player_path = PLAYER_PATH / str(uid)
-    SELF_PATH = player_path / 'SELF'
+    SELF_PATH = PLAYER_PATH / str(uid) / 'SELF'
     if '旅行者' in char_name:
         char_name = '旅行者'
     else:
-        char_name = await alias_to_char_name(char_name)
+        char_name = alias_to_char_name(char_name)
 
-    char_path = player_path / f'{char_name}.json'
-    char_self_path = SELF_PATH / f'{char_name}.json'
-
-    if char_path.exists():
-        path = char_path
-    elif enable_self and char_self_path.exists():
-        path = char_self_path
-    else:
-        return CHAR_HINT.format(char_name)
+    char_data = await _get_player_char(uid, char_name)
+    if char_data is not None:
+        return char_data
 
-    with open(path, 'r', encoding='utf8') as fp:
-        char_data = json.load(fp)
-    return char_data
+    char_self_path = SELF_PATH / f'{char_name}.json'
+    if enable_self and char_self_path.exists():
+        with open(char_self_path, 'r', encoding='utf8') as fp:
+            char_data = json.load(fp)
+        return char_data
+    return CHAR_HINT.format(char_name)
 
 
 async def get_showcase(uid: str) -> Union[bytes, str]:
-    player_path = PLAYER_PATH / str(uid)
-    char_file_list = player_path.glob('*')
-    char_list = []
-    for i in char_file_list:
-        file_name = i.name
-        if '\u4e00' <= file_name[0] <= '\u9fff':
-            char_list.append(file_name.split('.')[0])
+    char_list = await get_player_char_list(uid)
     if char_list == []:
         return '您还没有已缓存的角色噢~\n请先使用[强制刷新]命令缓存~'
     img = await draw_enka_card(uid=uid, char_list=char_list)
@@ -230,15 +357,12 @@ async def get_artifacts_repo(uid: str) -> Dict[str, List[Dict]]:
     }
     logger.info(f'[建立圣遗物仓库] UID:{uid}开始...')
     # 开始查找全部角色
-    uid_fold = PLAYER_PATH / str(uid)
-    char_file_list = uid_fold.glob('*')
-    for i in char_file_list:
-        if '\u4e00' <= i.name[0] <= '\u9fff':
-            with open(uid_fold / f'{i.name}', 'r', encoding='UTF-8') as f:
-                raw_data = json.load(f)
-            for equip in raw_data['equipList']:
-                if equip not in artifacts_repo[equip['aritifactSetPiece']]:
-                    artifacts_repo[equip['aritifactSetPiece']].append(equip)
+    store = await load_player_store(uid)
+    char_data_list = store['chars'].values() if store else []
+    for raw_data in char_data_list:
+        for equip in raw_data['equipList']:
+            if equip not in artifacts_repo[equip['aritifactSetPiece']]:
+                artifacts_repo[equip['aritifactSetPiece']].append(equip)
     logger.info(
         f'[建立圣遗物仓库] UID:{uid}完成!共计\
           {len(artifacts_repo["flower"])},\
@@ -253,17 +377,17 @@ async def get_artifacts_repo(uid: str) -> Dict[str, List[Dict]]:
 async def get_fake_char_data(
     char_data: Dict, fake_name: str, uid: str
 ) -> Union[Dict, str]:
-    fake_name = await alias_to_char_name(fake_name)
+    fake_name = alias_to_char_name(fake_name)
     original_data = await get_char_data(uid, fake_name)
     if isinstance(original_data, Dict):
         char_data['weaponInfo'] = original_data['weaponInfo']
         char_data['talentList'] = original_data['talentList']
     char_data['avatarName'] = fake_name
-    char_data['avatarId'] = await name_to_avatar_id(fake_name)
-    en_name = await avatarId_to_enName(char_data['avatarId'])
+    char_data['avatarId'] = name_to_avatar_id(fake_name)
+    en_name = avatarId_to_enName(char_data['avatarId'])
     char_data['avatarEnName'] = en_name
-    if fake_name in avatarName2Element:
-        char_data['avatarElement'] = avatarName2Element[fake_name]
+    if fake_name in GS_MAP_PATH.avatarName2Element:
+        char_data['avatarElement'] = GS_MAP_PATH.avatarName2Element[fake_name]
     else:
         return '要查询的角色不存在...'
     char_data['avatarLevel'] = '90'
@@ -1,5 +1,16 @@
+import asyncio
 from copy import deepcopy
-from typing import Dict, List, Tuple, Optional
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    TypeVar,
+    Callable,
+    Optional,
+    Awaitable,
+)
 
 from httpx import ConnectTimeout
 from gsuid_core.logger import logger
@@ -10,14 +21,21 @@ from gsuid_core.utils.api.minigg.request import (
     get_character_stats,
 )
 
+from ..etc import MAP_PATH
 from .Power import sp_prop
+from .FightProp import FightProp
+from ...utils.map import GS_MAP_PATH
+from ..etc.MAP_PATH import ActionMAP
 from ..etc.beta_weapon import beta_weapons
 from ..etc.get_buff_list import get_buff_list
+from .Effect import Effect, compile_effect_list
 from ...genshinuid_config.gs_config import gsconfig
 from ..etc.status_change import EXTRA_CHAR_LIST, STATUS_CHAR_LIST
-from ..etc.MAP_PATH import ActionMAP, char_action, avatarName2SkillAdd
-from ...utils.map.GS_MAP_PATH import avatarName2Weapon, avatarName2Element
 from ...utils.map.name_covert import name_to_avatar_id, avatar_id_to_char_star
+from ...utils.local_to_minigg import (
+    get_local_char_stats,
+    get_local_weapon_stats,
+)
 from ...utils.ambr_to_minigg import (
     convert_ambr_to_minigg,
     convert_ambr_to_weapon,
@@ -26,11 +44,36 @@ from ..etc.base_info import (
     ATTR_MAP,
     ELEMENT_MAP,
     ICON_ELEMENT,
-    PERCENT_ATTR,
     baseFightProp,
     baseWeaponInfo,
 )
 
+T = TypeVar('T')
+
+# 进行中的网络请求, 同时构建多个角色时相同的请求只发送一次
+PENDING_REQUEST: Dict[Tuple, 'asyncio.Future[Any]'] = {}
+
+
+async def request_once(
+    func: Callable[..., Awaitable[T]], *args, **kwargs
+) -> T:
+    '''
+    复用参数相同且尚未完成的请求, 请求完成后不保留结果
+    '''
+    key = (
+        asyncio.get_running_loop(),
+        func,
+        args,
+        tuple(sorted(kwargs.items())),
+    )
+    task = PENDING_REQUEST.get(key)
+    if task is None:
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        PENDING_REQUEST[key] = task
+        task.add_done_callback(lambda _: PENDING_REQUEST.pop(key, None))
+    # 其中一个调用方被取消时不影响其他等待同一请求的调用方
+    return await asyncio.shield(task)
+
 
 class Character:
     def __init__(self, card_prop: Dict):
@@ -39,11 +82,11 @@ class Character:
         # 无命座效果
         self.without_talent_card = card_prop
         # 战斗数据
-        self.fight_prop: Dict[str, float] = {}
+        self.fight_prop: FightProp = FightProp.from_dict({})
         # 战斗数据
-        self.without_talent_fight: Dict[str, float] = {}
+        self.without_talent_fight: FightProp = self.fight_prop
         # 实时数据
-        self.real_prop: Dict[str, float] = {}
+        self.real_prop: FightProp = self.fight_prop
 
         # 角色等级,名称,元素,武器类型
         self.char_level: int = int(card_prop['avatarLevel'])
@@ -112,10 +155,8 @@ class Character:
         self.baseHp = self.card_prop['avatarFightProp']['baseHp']
         self.baseAtk = self.card_prop['avatarFightProp']['baseAtk']
         self.baseDef = self.card_prop['avatarFightProp']['baseDef']
-        self.rarity = await avatar_id_to_char_star(
-            str(self.card_prop['avatarId'])
-        )
-        self.char_id = await name_to_avatar_id(self.char_name)
+        self.rarity = avatar_id_to_char_star(str(self.card_prop['avatarId']))
+        self.char_id = name_to_avatar_id(self.char_name)
 
     async def get_card_prop(
         self,
@@ -126,39 +167,57 @@ class Character:
         # 创造一个假武器
         if weapon:
             weapon_info = deepcopy(baseWeaponInfo)
-            try:
-                weapon_raw_data = await get_weapon_info(weapon)
-            except ConnectTimeout:
-                weapon_raw_data = -1
-            if isinstance(weapon_raw_data, int) or isinstance(
-                weapon_raw_data, List
-            ):
-                if weapon in beta_weapons:
-                    weapon_id = beta_weapons[weapon]
-                else:
-                    return {}
-                weapon_raw_data = await convert_ambr_to_weapon(weapon_id)
-                if not weapon_raw_data:
-                    return {}
-                else:
-                    weapon_info['weaponStar'] = int(weapon_raw_data['rarity'])
-                    weapon_level_data = weapon_raw_data
-                    weapon_info['weaponLevel'] = 90
-                    weapon_info['promoteLevel'] = 6
-            else:
+            # 优先使用本地突破数据, 本地不存在时才请求网络
+            weapon_raw_data = get_local_weapon_stats(weapon)
+            if weapon_raw_data is not None:
                 weapon_info['weaponStar'] = int(weapon_raw_data['rarity'])
-                if weapon_info['weaponStar'] >= 3:
-                    weapon_level_data = await get_weapon_stats(weapon, 90)
-                    weapon_info['weaponLevel'] = 90
-                    weapon_info['promoteLevel'] = 6
-                else:
-                    weapon_level_data = await get_weapon_stats(weapon, 70)
-                    weapon_info['weaponLevel'] = 70
-                    weapon_info['promoteLevel'] = 4
-                if isinstance(weapon_level_data, int) or isinstance(
-                    weapon_level_data, List
+                weapon_level_data = weapon_raw_data
+                weapon_info['weaponLevel'] = weapon_raw_data['level']
+                weapon_info['promoteLevel'] = weapon_raw_data['ascension']
+            else:
+                try:
+                    weapon_raw_data = await request_once(
+                        get_weapon_info, weapon
+                    )
+                except ConnectTimeout:
+                    weapon_raw_data = -1
+                if isinstance(weapon_raw_data, int) or isinstance(
+                    weapon_raw_data, List
                 ):
-                    return {}
+                    if weapon in beta_weapons:
+                        weapon_id = beta_weapons[weapon]
+                    else:
+                        return {}
+                    weapon_raw_data = await request_once(
+                        convert_ambr_to_weapon, weapon_id
+                    )
+                    if not weapon_raw_data:
+                        return {}
+                    else:
+                        weapon_info['weaponStar'] = int(
+                            weapon_raw_data['rarity']
+                        )
+                        weapon_level_data = weapon_raw_data
+                        weapon_info['weaponLevel'] = 90
+                        weapon_info['promoteLevel'] = 6
+                else:
+                    weapon_info['weaponStar'] = int(weapon_raw_data['rarity'])
+                    if weapon_info['weaponStar'] >= 3:
+                        weapon_level_data = await request_once(
+                            get_weapon_stats, weapon, 90
+                        )
+                        weapon_info['weaponLevel'] = 90
+                        weapon_info['promoteLevel'] = 6
+                    else:
+                        weapon_level_data = await request_once(
+                            get_weapon_stats, weapon, 70
+                        )
+                        weapon_info['weaponLevel'] = 70
+                        weapon_info['promoteLevel'] = 4
+                    if isinstance(weapon_level_data, int) or isinstance(
+                        weapon_level_data, List
+                    ):
+                        return {}
             weapon_info['weaponName'] = weapon_raw_data['name']
             if weapon_affix is None:
                 if weapon_info['weaponStar'] >= 5:
@@ -263,18 +322,32 @@ class Character:
         if char_name == '旅行者':
             char_name_covert = '荧'
 
-        self.char_id = await name_to_avatar_id(char_name_covert)
-        try:
-            char_raw = await get_character_info(name=char_name_covert)
-        except ConnectTimeout:
-            char_raw = -1
-
+        self.char_id = name_to_avatar_id(char_name_covert)
         if not self.char_id and char_name != '旅行者':
             return {}
-        if isinstance(char_raw, int) or isinstance(char_raw, List):
-            char_raw = char_data = await convert_ambr_to_minigg(self.char_id)
-        else:
-            char_data = await get_character_stats(char_name_covert, char_level)
+
+        # 优先使用本地突破数据, 本地不存在时才请求网络
+        char_raw = char_data = get_local_char_stats(
+            self.char_id,
+            char_level,
+            self.card_prop.get('avatarPromoteLevel'),
+        )
+        if char_data is None:
+            try:
+                char_raw = await request_once(
+                    get_character_info, name=char_name_covert
+                )
+            except ConnectTimeout:
+                char_raw = -1
+
+            if isinstance(char_raw, int) or isinstance(char_raw, List):
+                char_raw = char_data = await request_once(
+                    convert_ambr_to_minigg, self.char_id
+                )
+            else:
+                char_data = await request_once(
+                    get_character_stats, char_name_covert, char_level
+                )
 
         if (
             isinstance(char_data, List)
@@ -319,12 +392,16 @@ class Character:
 
     async def get_effect_prop(
         self,
-        prop: dict,
+        prop: Union[Dict, FightProp],
         effect_list: List[str],
         char_name: str,
-    ) -> dict:
+    ) -> FightProp:
         logger.debug(effect_list)
-        if 'A_d' not in prop:
+        if isinstance(prop, FightProp):
+            pass
+        elif 'A_d' in prop:
+            prop = FightProp.from_dict(prop)
+        else:
             for attr in [
                 'shieldBonus',
                 'addDmg',
@@ -348,11 +425,9 @@ class Character:
                 prop['addDef'] = 0
 
             # 给每个技能 分别添加上属性
-            for prop_attr in deepcopy(prop):
-                for prop_limit in ['A', 'B', 'C', 'E', 'Q']:
-                    prop[f'{prop_limit}_{prop_attr}'] = prop[prop_attr]
+            prop = FightProp.from_dict(prop)
 
-            weapon_type = avatarName2Weapon[char_name]
+            weapon_type = GS_MAP_PATH.avatarName2Weapon[char_name]
 
             # 计算角色伤害加成应该使用什么
             for prop_limit in ['A', 'B', 'C', 'E', 'Q']:
@@ -385,122 +460,49 @@ class Character:
                             'dmgBonus'
                         ]
 
-        # 防止复数效果
-        with_trans_effect: List[str] = []
-        without_trans_effect: List[str] = []
-        for effect in effect_list:
-            if ';' in effect:
-                effect = effect.split(';')
-            else:
-                effect = [effect]
-
-            for _effect in effect:
-                if _effect == '':
-                    continue
-                else:
-                    if '%' in _effect:
-                        with_trans_effect.append(_effect)
-                    else:
-                        without_trans_effect.append(_effect)
-
-        new_effect_list: List[str] = without_trans_effect + with_trans_effect
-
         # 建立一份基于基础属性的effect_list, 确保hp,atk,def有正确的值
-        base_effect_list: List[List] = []
+        base_effect_list: List[Effect] = []
         # 正式开始计算
-        for effect in new_effect_list:
-            if 'Resist' in effect:
-                self.enemy_debuff.append(effect)
+        for effect in compile_effect_list(effect_list):
+            if effect.is_debuff:
+                self.enemy_debuff.append(effect.raw)
                 continue
             else:
-                self.buff.append(effect)
-            # 分割效果
-            # 例如:Q:dmgBonus+96%27%em
-            # 分割后:
-            # effect_limit = Q
-            effect_limit = ''
-            if ':' in effect:
-                effect_limit = effect.split(':')[0]
-                effect = effect.split(':')[1]
-
-            effect_attr, effect_value = effect.split('+')
-            effect_max = 9999999
-            effect_base: str = ''
-
-            # 判断effect_value中有几个百分号
-            p_count = effect_value.count('%')
-            # 如果有%,则认为是基于值的提升
-            base_check = True
-            if p_count >= 2:
-                effect_max, effect_value, effect_base = effect_value.split('%')
-            elif p_count == 1:
-                effect_value, effect_base = effect_value.split('%')
-            else:
-                base_check = False
-
-            # effect_attr, effect_value, effect_base, effect_max
-            # dmgBonus, 27, em, 96
+                self.buff.append(effect.raw)
 
             # 暂时不处理extraDmg
-            if effect_attr == 'extraDmg':
+            if effect.attr == 'extraDmg':
                 continue
 
-            effect_max = float(effect_max) / 100
-            # 如果要增加的属性不是em元素精通,那么都要除于100
-            if effect_attr not in [
-                'exHp',
-                'exAtk',
-                'exDef',
-                'elementalMastery',
-            ]:
-                # 正常除100
-                effect_value = float(effect_value) / 100
-            # 元素精通则为正常值
-            else:
-                if effect_base in ['hp', 'elementalMastery', 'def']:
-                    effect_value = float(effect_value) / 100
-                else:
-                    effect_value = float(effect_value)
-
+            effect_attr = effect.attr
+            effect_value = effect.value
             # 如果属性是血量,攻击,防御值,并且是按照%增加的,那么增加值应为百分比乘上基础值
-            if base_check:
-                if effect_base in ['hp', 'atk', 'def']:
-                    base_effect_list.append(
-                        [effect_limit, effect_attr, effect_value, effect_base]
-                    )
+            if effect.base:
+                if effect.base in ['hp', 'atk', 'def']:
+                    base_effect_list.append(effect)
                     continue
 
-                if effect_base == 'energyRecharge':
-                    if effect_attr in PERCENT_ATTR:
-                        effect_base_value = prop[effect_base] - 1
-                    else:
-                        effect_base_value = (prop[effect_base] - 1) / 100
-
-                elif effect_base == 'energyrecharge':
-                    effect_base = 'energyRecharge'
-                    if effect_attr in PERCENT_ATTR:
-                        effect_base_value = prop[effect_base]
-                    else:
-                        effect_base_value = prop[effect_base] / 100
-
-                elif effect_base == 'elementalMastery':
-                    # 针对草神的
-                    if char_name == '纳西妲' and effect_attr == 'dmgBonus':
-                        effect_base_value = (prop[effect_base] - 200) / 100
-                    else:
-                        effect_base_value = prop[effect_base]
+                # 针对草神的
+                if (
+                    effect.base == 'elementalMastery'
+                    and char_name == '纳西妲'
+                    and effect_attr == 'dmgBonus'
+                ):
+                    effect_base_value = (prop[effect.base] - 200) / 100
                 else:
-                    effect_base_value = prop[effect_base]
+                    effect_base_value = (
+                        prop[effect.base] - effect.base_offset
+                    ) * effect.base_scale
                 effect_value = effect_value * effect_base_value
 
             # 判断是否超过上限,超过则使用上限值
-            if effect_value >= effect_max:
-                effect_value = effect_max
+            if effect_value >= effect.cap:
+                effect_value = effect.cap
 
             if char_name == '旅行者':
                 char_element = 'Hydro'
             else:
-                char_element = avatarName2Element[char_name]
+                char_element = GS_MAP_PATH.avatarName2Element[char_name]
 
             # 判断是否是自己属性的叠加
             if 'DmgBonus' in effect_attr:
@@ -514,47 +516,38 @@ class Character:
             # 如果效果有限制条件
             prop = await self.get_buff_value(
                 prop,
-                effect_limit,
+                effect.limit,
                 effect_attr,
                 effect_value,
-                effect_base,
+                effect.base,
                 False,
             )
 
         prop = await self.get_base_value(prop)
 
         # 重新计算加成值
-        # base_effect_list = [
-        #   [limit_list, effect_attr, effect_value,effect_base]
-        # ]
         for effect in base_effect_list:
-            prop = await self.get_buff_value(prop, *effect)
+            prop = await self.get_buff_value(
+                prop, effect.limit, effect.attr, effect.value, effect.base
+            )
 
         prop = await self.get_base_value(prop)
         logger.debug(prop)
         return prop
 
-    async def get_base_value(self, prop: Dict) -> Dict:
-        prop['hp'] = (prop['addHp'] + 1) * prop['baseHp'] + prop['exHp']
-        prop['atk'] = (prop['addAtk'] + 1) * prop['baseAtk'] + prop['exAtk']
-        prop['def'] = (prop['addDef'] + 1) * prop['baseDef'] + prop['exDef']
-        for prop_limit in ['A', 'B', 'C', 'E', 'Q']:
-            for attr in ['hp', 'atk', 'def']:
-                attr_up = attr[0].upper() + attr[1:]
-                prop[f'{prop_limit}_{attr}'] = (
-                    prop[f'{prop_limit}_add{attr_up}'] + 1
-                ) * prop[f'base{attr_up}'] + prop[f'ex{attr_up}']
+    async def get_base_value(self, prop: FightProp) -> FightProp:
+        prop.update_base_value()
         return prop
 
     async def get_buff_value(
         self,
-        prop: Dict,
+        prop: FightProp,
         effect_limit: Optional[str],
         effect_attr: str,
         effect_value: float,
         effect_base: Optional[str] = None,
         is_calc_base: Optional[bool] = True,
-    ) -> Dict:
+    ) -> FightProp:
         if effect_base and is_calc_base:
             effect_value = prop[effect_base] * effect_value
         if effect_limit:
@@ -570,21 +563,18 @@ class Character:
             # 如果限制条件为英文,例如Q,则为Q才生效
             else:
                 # 形如ABC:dmgBonus+75,则遍历ABC,增加值
-                for limit in effect_limit:
-                    prop['{}_{}'.format(limit, effect_attr)] += effect_value
+                prop.add_limit(effect_limit, effect_attr, effect_value)
         else:
             if effect_attr in ['a', 'addDmg']:
-                pass
+                prop[effect_attr] += effect_value
             else:
-                for attr in ['A', 'B', 'C', 'E', 'Q']:
-                    prop[f'{attr}_{effect_attr}'] += effect_value
-            prop[f'{effect_attr}'] += effect_value
+                prop.add_all(effect_attr, effect_value)
 
         logger.debug(f'{effect_attr} + {effect_value} 基于[{effect_base}]')
 
         return prop
 
-    async def get_fight_prop(self) -> Dict:
+    async def get_fight_prop(self) -> FightProp:
         '''
         生成角色的倍率表
 
@@ -592,10 +582,10 @@ class Character:
             self.fight_prop
         '''
         # 拿到倍率表
-        if self.s_char_name not in char_action:
+        if self.s_char_name not in MAP_PATH.char_action:
             self.power_list = {}
         else:
-            self.power_list = char_action[self.s_char_name]
+            self.power_list = MAP_PATH.char_action[self.s_char_name]
             # 额外增加钟离倍率
             if self.char_name == '钟离':
                 self.power_list['E总护盾量'] = {
@@ -654,8 +644,8 @@ class Character:
         prop['E_skill_level'] = skillList[1]['skillLevel']
         prop['Q_skill_level'] = skillList[-1]['skillLevel']
 
-        if self.char_name in avatarName2SkillAdd:
-            skill_add = avatarName2SkillAdd[self.char_name]
+        if self.char_name in MAP_PATH.avatarName2SkillAdd:
+            skill_add = MAP_PATH.avatarName2SkillAdd[self.char_name]
         else:
             skill_add = ['E', 'Q']
         for skillAdd_index in range(0, 2):
@@ -0,0 +1,107 @@
+from functools import lru_cache
+from typing import List, Tuple, Iterable, NamedTuple
+
+from ..etc.base_info import PERCENT_ATTR
+
+# 值本身不需要除100的属性
+RAW_VALUE_ATTR = ['exHp', 'exAtk', 'exDef', 'elementalMastery']
+
+
+class Effect(NamedTuple):
+    '''
+    编译后的单条效果
+
+    例如:Q:dmgBonus+96%27%em
+        limit = Q, attr = dmgBonus, value = 0.27,
+        base = em, cap = 0.96
+    '''
+
+    raw: str
+    limit: str = ''
+    attr: str = ''
+    value: float = 0
+    base: str = ''
+    cap: float = 99999.99
+    # 基于属性值的提升, base_value = (prop[base] - offset) * scale
+    base_offset: float = 0
+    base_scale: float = 1
+    # 是否为敌人的抗性削减
+    is_debuff: bool = False
+
+
+@lru_cache(maxsize=4096)
+def compile_effect(effect: str) -> Tuple[Effect, ...]:
+    '''
+    将单个效果字符串(可能由`;`连接)编译为`Effect`元组
+    '''
+    return tuple(_compile_single(i) for i in effect.split(';') if i)
+
+
+def compile_effect_list(effect_list: Iterable[str]) -> List[Effect]:
+    '''
+    编译效果列表, 不含`%`的效果排在前面, 保证基于属性值的提升使用正确的值
+    '''
+    without_trans_effect: List[Effect] = []
+    with_trans_effect: List[Effect] = []
+    for effect in effect_list:
+        for _effect in compile_effect(effect):
+            if '%' in _effect.raw:
+                with_trans_effect.append(_effect)
+            else:
+                without_trans_effect.append(_effect)
+    return without_trans_effect + with_trans_effect
+
+
+def _compile_single(effect: str) -> Effect:
+    if 'Resist' in effect:
+        return Effect(raw=effect, is_debuff=True)
+
+    # 分割效果
+    effect_limit = ''
+    effect_str = effect
+    if ':' in effect_str:
+        effect_limit, effect_str = effect_str.split(':')[:2]
+
+    effect_attr, effect_value = effect_str.split('+')
+    effect_max = '9999999'
+    effect_base = ''
+
+    # 判断effect_value中有几个百分号
+    p_count = effect_value.count('%')
+    if p_count >= 2:
+        effect_max, effect_value, effect_base = effect_value.split('%')
+    elif p_count == 1:
+        effect_value, effect_base = effect_value.split('%')
+
+    # 暂时不处理extraDmg
+    if effect_attr == 'extraDmg':
+        return Effect(raw=effect, limit=effect_limit, attr=effect_attr)
+
+    # 如果要增加的属性不是em元素精通,那么都要除于100
+    value = float(effect_value)
+    if effect_attr not in RAW_VALUE_ATTR:
+        value /= 100
+    elif effect_base in ['hp', 'elementalMastery', 'def']:
+        value /= 100
+
+    base_offset = 0
+    base_scale = 1
+    if effect_base == 'energyRecharge':
+        base_offset = 1
+        if effect_attr not in PERCENT_ATTR:
+            base_scale = 0.01
+    elif effect_base == 'energyrecharge':
+        effect_base = 'energyRecharge'
+        if effect_attr not in PERCENT_ATTR:
+            base_scale = 0.01
+
+    return Effect(
+        raw=effect,
+        limit=effect_limit,
+        attr=effect_attr,
+        value=value,
+        base=effect_base,
+        cap=float(effect_max) / 100,
+        base_offset=base_offset,
+        base_scale=base_scale,
+    )
@@ -51,7 +51,9 @@ class Enemy:
         if char:
             for react in ['蒸发', '融化']:
                 if react in char.power_name:
-                    em = char.real_prop[f'{char.attack_type}_elementalMastery']
+                    em = char.real_prop.get_limit(
+                        char.attack_type, 'elementalMastery'
+                    )
                     k = 0
                     if react == '蒸发':
                         if char.char_element == 'Pyro':
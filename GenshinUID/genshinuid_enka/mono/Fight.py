@@ -1,5 +1,6 @@
 from copy import deepcopy
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, NamedTuple
 
 from gsuid_core.logger import logger
 
@@ -10,6 +11,19 @@ from .Character import Character
 from ..dmg_calc.base_value import base_value_list
 
 
+class Action(NamedTuple):
+    '''
+    单个动作中与角色属性无关的信息
+
+    kind: `Literal['transform', 'heal', 'shield', 'dmg']`
+    '''
+
+    power_name: str
+    attack_type: str
+    kind: str
+    dmg_type: Element
+
+
 class Fight:
     def __init__(
         self,
@@ -80,7 +94,6 @@ class Fight:
     async def get_dmg_dict(
         self, char_name: str, without_talent: bool = False
     ) -> Dict:
-        result = {}
         char = self.char_list[char_name]
         # 获取本次攻击的类型
         if without_talent:
@@ -88,40 +101,79 @@ class Fight:
                 return self.dmg_data
             char.fight_prop = char.without_talent_fight
 
+        action_list = await self.get_action_list(char)
+        result = await self.get_action_dmg(char, action_list)
+        self.dmg_data = result
+        logger.debug(result)
+        return result
+
+    # 一次性计算有命座和无命座两种情况的单人伤害
+    async def get_dmg_dicts(self, char_name: str) -> Tuple[Dict, Dict]:
+        char = self.char_list[char_name]
+        # 动作的类型, 元素等与面板无关, 两种情况共用一份
+        action_list = await self.get_action_list(char)
+        result = await self.get_action_dmg(char, action_list)
+        if char.rarity == '4' and char_name != '香菱':
+            without_talent = result
+        else:
+            char.fight_prop = char.without_talent_fight
+            without_talent = await self.get_action_dmg(char, action_list)
+        self.dmg_data = result
+        logger.debug(result)
+        return result, without_talent
+
+    # 预先计算全部动作中与角色属性无关的信息
+    async def get_action_list(self, char: Character) -> List[Action]:
+        action_list: List[Action] = []
         for power_name in char.power_list:
-            # 更新powername
             char.power_name = power_name
-            await char.get_sp_fight_prop(char.power_name)
-            await char.get_attack_type(char.power_name)
-            # 更新角色的属性
-            await self.get_new_fight_prop(char)
+            attack_type = await char.get_attack_type(power_name)
+            dmg_type = Element.Physical
             # 聚变反应
             for i in ['扩散', '绽放)', '感电', '超载']:
                 if i in power_name:
-                    dmg = await self.get_transform_dmg(char)
+                    kind = 'transform'
                     break
             else:
-                dmg = []
-
-            # 正常伤害
-            if not dmg:
                 if '治疗' in power_name or '回复' in power_name:
-                    dmg = await self.get_heal(char)
+                    kind = 'heal'
                 elif '护盾' in power_name:
-                    dmg = await self.get_shield(char)
+                    kind = 'shield'
                 else:
+                    kind = 'dmg'
                     # 获取本次攻击的元素
                     dmg_type = await self.get_dmg_type(char)
-                    dmg = await self.get_dmg(char, dmg_type, True)
+            action_list.append(Action(power_name, attack_type, kind, dmg_type))
+        return action_list
+
+    # 按当前的角色属性计算全部动作的伤害
+    async def get_action_dmg(
+        self, char: Character, action_list: List[Action]
+    ) -> Dict:
+        result = {}
+        for action in action_list:
+            # 更新powername
+            char.power_name = action.power_name
+            char.attack_type = action.attack_type
+            await char.get_sp_fight_prop(action.power_name)
+            # 更新角色的属性
+            await self.get_new_fight_prop(char)
+
+            if action.kind == 'transform':
+                dmg = await self.get_transform_dmg(char)
+            elif action.kind == 'heal':
+                dmg = await self.get_heal(char)
+            elif action.kind == 'shield':
+                dmg = await self.get_shield(char)
+            else:
+                dmg = await self.get_dmg(char, action.dmg_type, True)
 
             # 得到结果
-            result[power_name] = {
+            result[action.power_name] = {
                 'normal': dmg[0],
                 'avg': dmg[1],
                 'crit': dmg[2],
             }
-        self.dmg_data = result
-        logger.debug(result)
         return result
 
     # 伤害类型
@@ -187,10 +239,13 @@ class Fight:
         if char.char_name == '宵宫' and power_name == 'A一段伤害':
             power_plus = 1
 
-        power_plus += real_prop[f'{power_name[0]}_powerPlus'] - 1
+        power_plus += real_prop.get_limit(power_name[0], 'powerPlus') - 1
 
         # 拿到百分比和固定值,百分比为float,形如2.2 也就是202%
-        power_percent, power_value = await p2v(power, power_plus)
+        first, second, power_value = parse_power(power)
+        power_percent = first * power_plus
+        if second:
+            power_percent += second * power_plus
 
         # 额外加成,目前有雷神和优菈
         if char.extra_effect and power_name in char.extra_effect:
@@ -217,7 +272,9 @@ class Fight:
         effect_list = []
         if '前台' in char.power_list[char.power_name]['name']:
             if char.char_name == '纳西妲':
-                em = char.fight_prop[f'{char.attack_type}_elementalMastery']
+                em = char.fight_prop.get_limit(
+                    char.attack_type, 'elementalMastery'
+                )
                 effect = f'''elementalMastery+
                 {0.25 * em if 0.25 * em <= 250 else 250}
                 '''.strip()
@@ -242,13 +299,13 @@ class Fight:
 
     # 治疗值加成
     async def get_add_heal(self, char: Character) -> float:
-        add_heal: float = char.real_prop[f'{char.attack_type}_addHeal']
+        add_heal: float = char.real_prop.get_limit(char.attack_type, 'addHeal')
         return add_heal
 
     # 增幅反应
     async def get_amplify_dmg(self, char: Character) -> float:
         # 计算元素反应 增幅
-        em_cal = char.real_prop[f'{char.attack_type}_elementalMastery']
+        em_cal = char.real_prop.get_limit(char.attack_type, 'elementalMastery')
         for reaction in ['蒸发', '融化']:
             if reaction in char.power_list[char.power_name]['name']:
                 if reaction == '蒸发':
@@ -274,7 +331,7 @@ class Fight:
         quicken_dmg = 0
         char_level = char.char_level
         power_name = char.power_list[char.power_name]['name']
-        em_cal = char.real_prop[f'{char.attack_type}_elementalMastery']
+        em_cal = char.real_prop.get_limit(char.attack_type, 'elementalMastery')
         for reaction in ['超激化', '蔓激化']:
             if reaction in power_name:
                 if reaction == '超激化':
@@ -299,38 +356,42 @@ class Fight:
         # 根据type计算有效属性
         _type = char.power_list[char.power_name]['type']
         if '攻击' in _type:
-            effect_prop = char.real_prop[f'{char.attack_type}_atk']
+            effect_prop = char.real_prop.get_limit(char.attack_type, 'atk')
         elif '生命值' in _type:
-            effect_prop = char.real_prop[f'{char.attack_type}_hp']
+            effect_prop = char.real_prop.get_limit(char.attack_type, 'hp')
         elif '防御' in _type:
-            effect_prop = char.real_prop[f'{char.attack_type}_def']
+            effect_prop = char.real_prop.get_limit(char.attack_type, 'def')
         else:
-            effect_prop = char.real_prop[f'{char.attack_type}_atk']
+            effect_prop = char.real_prop.get_limit(char.attack_type, 'atk')
 
         return effect_prop
 
     # 伤害值加成
     async def get_add_dmg(self, char: Character) -> float:
         # 计算直接增加的伤害
-        add_dmg: float = char.real_prop[f'{char.attack_type}_addDmg']
+        add_dmg: float = char.real_prop.get_limit(char.attack_type, 'addDmg')
         return add_dmg
 
     # 防御值加成
     async def get_extra_d(self, char: Character) -> float:
         # 计算直接增加的伤害
-        extra_d: float = char.real_prop[f'{char.attack_type}_d']
+        extra_d: float = char.real_prop.get_limit(char.attack_type, 'd')
         return extra_d
 
     # 防御值加成
     async def get_base_area_plus(self, char: Character) -> float:
         # 计算直接增加的伤害
-        base_area_plus: float = char.real_prop[f'{char.attack_type}_baseArea']
+        base_area_plus: float = char.real_prop.get_limit(
+            char.attack_type, 'baseArea'
+        )
         return base_area_plus
 
     # 防御值加成
     async def get_extra_ignoreD(self, char: Character) -> float:
         # 计算直接增加的伤害
-        extra_ignoreD: float = char.real_prop[f'{char.attack_type}_ignoreDef']
+        extra_ignoreD: float = char.real_prop.get_limit(
+            char.attack_type, 'ignoreDef'
+        )
         return extra_ignoreD
 
     async def get_sp_base(self, power: Power, char: Character) -> float:
@@ -338,7 +399,7 @@ class Fight:
         power_sp = [float(x) / 100 for x in power_sp]
         real_prop = char.real_prop
         atk = real_prop['E_atk'] + char.sp.attack
-        em = real_prop[f'{char.attack_type}_elementalMastery']
+        em = real_prop.get_limit(char.attack_type, 'elementalMastery')
         base = (power_sp[0] * atk + power_sp[1] * em) * power.plus
         return base
 
@@ -379,7 +440,7 @@ class Fight:
     async def get_transform_dmg(
         self, char: Character
     ) -> Tuple[float, float, float]:
-        em = char.real_prop[f'{char.attack_type}_elementalMastery']
+        em = char.real_prop.get_limit(char.attack_type, 'elementalMastery')
         is_crit = False
         if '绽放)' in char.power_name:
             # 获取激变反应基数
@@ -462,11 +523,13 @@ class Fight:
         reactio = await self.enemy.get_dmg_reaction(dmg_type, _char)
 
         if dmg_type == Element.Physical:
-            _dmgBonus = char.real_prop[f'{char.attack_type}_physicalDmgBonus']
+            _dmgBonus = char.real_prop.get_limit(
+                char.attack_type, 'physicalDmgBonus'
+            )
         else:
-            _dmgBonus = char.real_prop[f'{char.attack_type}_dmgBonus']
-        critrate = char.real_prop[f'{char.attack_type}_critRate']
-        critdmg = char.real_prop[f'{char.attack_type}_critDmg']
+            _dmgBonus = char.real_prop.get_limit(char.attack_type, 'dmgBonus')
+        critrate = char.real_prop.get_limit(char.attack_type, 'critRate')
+        critdmg = char.real_prop.get_limit(char.attack_type, 'critDmg')
         dmgBonus = _dmgBonus + char.sp.dmgBonus
 
         # 基础乘区 = 攻击*倍率+激化
@@ -490,27 +553,31 @@ class Fight:
         return normal_dmg, avg_dmg, crit_dmg
 
 
+@lru_cache(maxsize=None)
+def parse_power(power: str) -> Tuple[float, float, float]:
+    '''
+    解析倍率字符串, 结果与命座等级无关, 因此可以缓存
+
+    例如:`80%+120%`
+        返回(0.8, 1.2, 0), 前两项为百分比倍率, 最后一项为固定值
+    '''
+    if '+' in power:
+        first, second = power.split('+')[:2]
+        first_percent = float(first.replace('%', '')) / 100
+        if '%' in second:
+            return first_percent, float(second.replace('%', '')) / 100, 0
+        return first_percent, 0, float(second)
+    elif '%' in power:
+        return float(power.replace('%', '')) / 100, 0, 0
+    return 0, 0, float(power)
+
+
 async def p2v(power: str, power_plus: float) -> Tuple[float, float]:
     """
     将power转换为value
     """
-    if '+' in power:
-        power_percent = (
-            float(power.split('+')[0].replace('%', '')) / 100
-        ) * power_plus
-        power_value = power.split('+')[1]
-        if '%' in power_value:
-            power_percent += (
-                float(power_value.replace('%', '')) / 100 * power_plus
-            )
-            power_value = 0
-        else:
-            power_value = float(power_value)
-    elif '%' in power:
-        power_percent = float(power.replace('%', '')) / 100 * power_plus
-        power_value = 0
-    else:
-        power_percent = 0
-        power_value = float(power)
-
+    first, second, power_value = parse_power(power)
+    power_percent = first * power_plus
+    if second:
+        power_percent += second * power_plus
     return power_percent, power_value
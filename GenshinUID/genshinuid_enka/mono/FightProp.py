@@ -0,0 +1,188 @@
+from typing import Any, Dict, List, Iterator
+
+from ..etc.base_info import baseFightProp
+
+# 技能限定类型, 分别为普攻/重击/下落/战技/爆发
+LIMIT_LIST = ['A', 'B', 'C', 'E', 'Q']
+
+# 战斗属性默认值, 顺序即为存储布局
+PROP_DEFAULT: Dict[str, float] = {
+    **baseFightProp,
+    'shieldBonus': 0,
+    'addDmg': 0,
+    'addHeal': 0,
+    'ignoreDef': 0,
+    'd': 0,
+    'g': 0,
+    'a': 0,
+    'k': 1,
+    'baseArea': 1,
+    'powerPlus': 1,
+}
+PROP_LIST = list(PROP_DEFAULT)
+PROP_NUM = len(PROP_LIST)
+
+PROP_INDEX = {attr: index for index, attr in enumerate(PROP_LIST)}
+LIMIT_INDEX = {limit: index for index, limit in enumerate(LIMIT_LIST)}
+# 形如`A_atk`的键对应的位置, 避免每次访问都拼接/分割字符串
+LIMIT_PROP_INDEX = {
+    f'{limit}_{attr}': LIMIT_INDEX[limit] * PROP_NUM + PROP_INDEX[attr]
+    for limit in LIMIT_LIST
+    for attr in PROP_LIST
+}
+
+# hp, atk, def 及其对应的基础值, 百分比加成和固定加成的位置
+BASE_VALUE_INDEX = [
+    (
+        PROP_INDEX[attr],
+        PROP_INDEX[f'base{attr_up}'],
+        PROP_INDEX[f'add{attr_up}'],
+        PROP_INDEX[f'ex{attr_up}'],
+    )
+    for attr, attr_up in [('hp', 'Hp'), ('atk', 'Atk'), ('def', 'Def')]
+]
+
+
+class FightProp:
+    '''
+    角色战斗属性
+
+    全局属性和ABCEQ五种技能限定的属性分别按固定布局存放在列表中,
+    同时兼容原先`prop['atk']`, `prop['A_atk']`形式的访问,
+    其余键(例如`sp`, `A_skill_level`)存放于`extra`
+    '''
+
+    __slots__ = ('value', 'limit_value', 'extra')
+
+    def __init__(
+        self,
+        value: List[float],
+        limit_value: List[float],
+        extra: Dict[str, Any],
+    ):
+        self.value = value
+        self.limit_value = limit_value
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, prop: Dict) -> 'FightProp':
+        value = [prop.get(attr, PROP_DEFAULT[attr]) for attr in PROP_LIST]
+        if 'A_d' in prop:
+            limit_value = [
+                prop.get(key, value[index % PROP_NUM])
+                for key, index in LIMIT_PROP_INDEX.items()
+            ]
+        else:
+            limit_value = value * len(LIMIT_LIST)
+        extra = {
+            key: prop[key]
+            for key in prop
+            if key not in PROP_INDEX and key not in LIMIT_PROP_INDEX
+        }
+        extra.setdefault('sp', [])
+        return cls(value, limit_value, extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = dict(zip(PROP_LIST, self.value))
+        for key, index in LIMIT_PROP_INDEX.items():
+            result[key] = self.limit_value[index]
+        result.update(self.extra)
+        return result
+
+    def get_limit(self, limit: str, attr: str) -> float:
+        return self.limit_value[
+            LIMIT_INDEX[limit] * PROP_NUM + PROP_INDEX[attr]
+        ]
+
+    def set_limit(self, limit: str, attr: str, value: float):
+        self.limit_value[
+            LIMIT_INDEX[limit] * PROP_NUM + PROP_INDEX[attr]
+        ] = value
+
+    def add_limit(self, limit: str, attr: str, value: float):
+        '''
+        为限定的技能增加属性, 形如ABC:dmgBonus+75则为ABC分别增加
+        '''
+        index = PROP_INDEX[attr]
+        for _limit in limit:
+            if _limit in LIMIT_INDEX:
+                offset = LIMIT_INDEX[_limit] * PROP_NUM
+                self.limit_value[offset + index] += value
+            else:
+                self[f'{_limit}_{attr}'] += value
+
+    def add_all(self, attr: str, value: float):
+        '''
+        为全局和全部技能增加属性
+        '''
+        index = PROP_INDEX[attr]
+        self.value[index] += value
+        for offset in range(index, len(self.limit_value), PROP_NUM):
+            self.limit_value[offset] += value
+
+    def update_base_value(self):
+        '''
+        根据基础值, 百分比加成和固定加成重新计算生命值, 攻击力, 防御力,
+        技能限定的属性只有百分比加成是独立的, 基础值和固定加成使用全局值
+        '''
+        value = self.value
+        limit_value = self.limit_value
+        for hp, base, add, ex in BASE_VALUE_INDEX:
+            base_value = value[base]
+            ex_value = value[ex]
+            value[hp] = (value[add] + 1) * base_value + ex_value
+            for offset in range(0, len(limit_value), PROP_NUM):
+                limit_value[offset + hp] = (
+                    limit_value[offset + add] + 1
+                ) * base_value + ex_value
+
+    def copy(self) -> 'FightProp':
+        extra = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in self.extra.items()
+        }
+        return FightProp(self.value[:], self.limit_value[:], extra)
+
+    def __copy__(self) -> 'FightProp':
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict) -> 'FightProp':
+        return self.copy()
+
+    def __getitem__(self, key: str) -> Any:
+        index = PROP_INDEX.get(key)
+        if index is not None:
+            return self.value[index]
+        index = LIMIT_PROP_INDEX.get(key)
+        if index is not None:
+            return self.limit_value[index]
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        index = PROP_INDEX.get(key)
+        if index is not None:
+            self.value[index] = value
+            return
+        index = LIMIT_PROP_INDEX.get(key)
+        if index is not None:
+            self.limit_value[index] = value
+            return
+        self.extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            key in PROP_INDEX or key in LIMIT_PROP_INDEX or key in self.extra
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        yield from PROP_LIST
+        yield from LIMIT_PROP_INDEX
+        yield from self.extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def __repr__(self) -> str:
+        return f'FightProp({self.to_dict()})'
@@ -1,43 +1,48 @@
 import re
 import json
-import asyncio
+from typing import Dict
+from pathlib import Path
 from copy import deepcopy
 
 import aiofiles
 from gsuid_core.logger import logger
 
-from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
-from .to_data import ARTIFACT_DATA, input_artifacts_data
+from .to_data import input_artifacts_data
+from ..utils.resource.RESOURCE_PATH import DATA_PATH, PLAYER_PATH
+from ..utils.player_store import (
+    STORE_NAME,
+    EMPTY_ARTIFACTS,
+    get_store_lock,
+    load_player_store,
+    save_player_store,
+)
 
 pattern = r'^[\u4e00-\u9fa5]'
+# 记录上次检查时每个玩家角色数据的最后修改时间
+CHECK_PATH = DATA_PATH / 'artifacts_check.json'
 
 
 async def refresh_player_list(uid: str, is_force: bool = False) -> str:
-    player = PLAYER_PATH / uid
-    path = player / 'artifacts.json'
-    all_artifacts = deepcopy(ARTIFACT_DATA)
-    if not path.exists():
-        logger.info(f'UID{uid} 不存在圣遗物列表,开始生成中...')
-    else:
-        async with aiofiles.open(path, 'r', encoding='UTF-8') as file:
-            all_artifacts = json.loads(await file.read())
+    async with get_store_lock(uid):
+        store = await load_player_store(uid, True)
+        if store is None or not store['chars']:
+            return '你还没有已缓存的角色！\n请先使用【强制刷新】进行刷新！'
+        all_artifacts = store['artifacts']
+        all_list = [x for v in all_artifacts['data'].values() for x in v]
 
-    all_list = [x for v in all_artifacts['data'].values() for x in v]
-
-    if len(all_list) >= 1 and 'cv_score' not in all_list[0]:
-        path.unlink()
-    elif not is_force and len(all_list) >= 1:
-        return '无需刷新圣遗物列表'
-        # return '删除旧数据中...请重新刷新!'
-
-    logger.info(f'开始刷新UID{uid}圣遗物列表...')
-    num = 0
-    for char in player.iterdir():
-        match = re.match(pattern, char.name)
-        if match:
-            async with aiofiles.open(char, 'r', encoding='UTF-8') as file:
-                char_data = json.loads(await file.read())
+        if not all_list:
+            logger.info(f'UID{uid} 不存在圣遗物列表,开始生成中...')
+        elif 'cv_score' not in all_list[0]:
+            all_artifacts = deepcopy(EMPTY_ARTIFACTS)
+        elif not is_force:
+            return '无需刷新圣遗物列表'
+            # return '删除旧数据中...请重新刷新!'
 
+        logger.info(f'开始刷新UID{uid}圣遗物列表...')
+        num = 0
+        for char_data in store['chars'].values():
+            # 评分时会修改角色数据, 不能影响保存的角色数据
+            char_data = deepcopy(char_data)
             for artifact in char_data['equipList']:
                 all_artifacts = await input_artifacts_data(
                     artifact,
@@ -47,18 +52,48 @@ async def refresh_player_list(uid: str, is_force: bool = False) -> str:
                 )
                 num += 1
 
-    await asyncio.sleep(0.15)
-    # 保存原始数据
-    async with aiofiles.open(path, 'w', encoding='UTF-8') as file:
-        await file.write(
-            json.dumps(all_artifacts, indent=4, ensure_ascii=False)
-        )
+        # 保存原始数据
+        store['artifacts'] = all_artifacts
+        await save_player_store(uid, store)
 
     return f'刷新成功, 本次刷新 {num} 个圣遗物!'
 
 
+async def get_player_mtime(player: Path) -> int:
+    store_path = player / STORE_NAME
+    if store_path.exists():
+        return store_path.stat().st_mtime_ns
+    # 尚未迁移的旧版本数据
+    return max(
+        (
+            char.stat().st_mtime_ns
+            for char in player.iterdir()
+            if re.match(pattern, char.name)
+        ),
+        default=0,
+    )
+
+
 async def check_artifacts_list():
     logger.info('开始检查是否创建圣遗物列表...')
+    check_data: Dict[str, int] = {}
+    if CHECK_PATH.exists():
+        async with aiofiles.open(CHECK_PATH, 'r', encoding='UTF-8') as file:
+            check_data = json.loads(await file.read())
+
+    num = 0
     for player in PLAYER_PATH.iterdir():
+        if not player.is_dir():
+            continue
+        # 角色数据自上次检查后没有变化, 则跳过
+        mtime = await get_player_mtime(player)
+        if check_data.get(player.name) == mtime:
+            continue
         await refresh_player_list(player.name)
-    logger.info('圣遗物列表检查完成!')
+        # 刷新后数据文件会发生变化, 因此重新获取
+        check_data[player.name] = await get_player_mtime(player)
+        num += 1
+
+    async with aiofiles.open(CHECK_PATH, 'w', encoding='UTF-8') as file:
+        await file.write(json.dumps(check_data))
+    logger.info(f'圣遗物列表检查完成! 本次检查{num}个玩家!')
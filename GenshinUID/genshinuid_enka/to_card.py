@@ -6,7 +6,9 @@ from PIL import Image, ImageDraw
 from gsuid_core.utils.api.enka.models import EnkaData
 
 from .to_data import enka_to_dict
+from ..utils.image.render import run_render
 from ..utils.image.convert import convert_img
+from ..utils.image.texture import get_texture
 from ..utils.resource.download_url import download
 from ..utils.fonts.genshin_fonts import gs_font_18, gs_font_58
 from ..utils.resource.RESOURCE_PATH import CHAR_PATH, ICON_PATH
@@ -50,11 +52,21 @@ async def draw_enka_card(
     char_data_list: Optional[List] = None,
     char_list: Optional[List] = None,
 ):
+    return await run_render(
+        '角色展柜', _draw_enka_card, uid, char_data_list, char_list
+    )
+
+
+async def _draw_enka_card(
+    uid: str,
+    char_data_list: Optional[List] = None,
+    char_list: Optional[List] = None,
+) -> bytes:
     if char_list:
         char_data_list = []
         for char in char_list:
             char_data_list.append(
-                {'avatarName': char, 'avatarId': await name_to_avatar_id(char)}
+                {'avatarName': char, 'avatarId': name_to_avatar_id(char)}
             )
         line1 = f'展柜内有 {len(char_data_list)} 个角色!'
     else:
@@ -102,12 +114,10 @@ async def draw_enka_card(
 
 
 async def draw_char_card(char_id: str) -> Image.Image:
-    char_star = await avatar_id_to_char_star(str(char_id))
-    char_card = Image.open(TEXT_PATH / f'char_card_{char_star}.png')
-    char_img = (
-        Image.open(CHAR_PATH / f'{char_id}.png')
-        .convert('RGBA')
-        .resize((204, 204))
+    char_star = avatar_id_to_char_star(str(char_id))
+    char_card = get_texture(TEXT_PATH / f'char_card_{char_star}.png')
+    char_img = get_texture(
+        CHAR_PATH / f'{char_id}.png', (204, 204), 'RGBA', copy=False
     )
     char_temp = Image.new('RGBA', (220, 220))
     char_temp.paste(char_img, (8, 8), char_img)
@@ -116,12 +126,12 @@ async def draw_char_card(char_id: str) -> Image.Image:
 
 
 async def draw_weapon_card(icon_url: str, rarity: str) -> Image.Image:
-    weapon_card = Image.open(TEXT_PATH / f'char_card_{rarity}.png')
+    weapon_card = get_texture(TEXT_PATH / f'char_card_{rarity}.png')
     weapon_icon_name = icon_url.split('/')[-1]
     path = ICON_PATH / weapon_icon_name
     if not path.exists():
         await download(icon_url, 8, weapon_icon_name)
-    weapon_img = Image.open(path).convert('RGBA').resize((204, 204))
+    weapon_img = get_texture(path, (204, 204), 'RGBA', copy=False)
     weapon_temp = Image.new('RGBA', (220, 220))
     weapon_temp.paste(weapon_img, (8, 8), weapon_img)
     weapon_card.paste(weapon_temp, (0, 0), char_mask)
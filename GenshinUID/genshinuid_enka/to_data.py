@@ -1,34 +1,31 @@
 import json
 import time
 import asyncio
-import threading
+import hashlib
 from copy import deepcopy
-from typing import Dict, List, Union, Literal, Optional
+from typing import Set, Dict, List, Tuple, Union, Literal, Optional
 
 import aiofiles
+from gsuid_core.logger import logger
 from httpx import ReadTimeout, ConnectTimeout
 from gsuid_core.utils.error_reply import UID_HINT
 from gsuid_core.utils.api.enka.models import EnkaData
 from gsuid_core.utils.api.enka.request import get_enka_info
 from gsuid_core.utils.api.minigg.request import get_weapon_info
 
+from ..utils.map import GS_MAP_PATH
 from .mono.Character import Character
 from ..utils.api.cv.request import _CvApi
 from .draw_normal import get_artifact_score_data
 from ..genshinuid_config.gs_config import gsconfig
 from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
 from ..utils.ambr_to_minigg import convert_ambr_to_weapon
-from ..utils.map.GS_MAP_PATH import (
-    icon2Name,
-    propId2Name,
-    skillId2Name,
-    artifact2attr,
-    avatarId2Name,
-    talentId2Name,
-    weaponHash2Name,
-    weaponHash2Type,
-    artifactId2Piece,
-    avatarName2Element,
+from ..utils.player_store import (
+    STORE_VERSION,
+    get_store_lock,
+    new_player_store,
+    load_player_store,
+    save_player_store,
 )
 
 PROP_ATTR_MAP = {
@@ -43,22 +40,17 @@ PROP_ATTR_MAP = {
 
 ENKA_API: List[Literal['enka', 'microgg']] = ['enka', 'microgg']
 is_enable_akasha = gsconfig.get_config('EnableAkasha').data
-ARTIFACT_DATA = {
-    'data': {
-        'flower': [],
-        'plume': [],
-        'sands': [],
-        'goblet': [],
-        'circlet': [],
-    },
-    'tag': {
-        'flower': [],
-        'plume': [],
-        'sands': [],
-        'goblet': [],
-        'circlet': [],
-    },
-}
+
+# 圣遗物评分队列, 固定数量的worker处理, 每次刷新只写入一次文件
+ARTIFACTS_WORKER_NUM = 2
+ARTIFACTS_QUEUE_SIZE = 100
+ARTIFACTS_QUEUE: Optional[asyncio.Queue] = None
+BACKGROUND_TASKS: Set[asyncio.Task] = set()
+
+# enka数据缓存, uid -> (过期时间, 数据)
+ENKA_CACHE: Dict[str, Tuple[float, EnkaData]] = {}
+# 正在进行的enka请求, 用于合并同一UID的并发刷新
+ENKA_REQUEST: Dict[str, asyncio.Task] = {}
 
 
 async def switch_api():
@@ -70,6 +62,27 @@ async def switch_api():
     return f'切换成功!当前api为{ENKA_API[0]}!'
 
 
+def get_equip_sets(equip_list: List[Dict]) -> Dict[str, str]:
+    '''
+    统计圣遗物套装, 有四件套时type为`4`,
+    否则每个两件套在type中记一个`2`, set中的套装名以`|`分隔
+    '''
+    artifact_set_list = [i['aritifactSetsName'] for i in equip_list]
+    equip_sets = {'type': '', 'set': ''}
+    for equip in set(artifact_set_list):
+        if artifact_set_list.count(equip) >= 4:
+            equip_sets['type'] = '4'
+            equip_sets['set'] = equip
+            break
+        elif artifact_set_list.count(equip) >= 2:
+            equip_sets['type'] += '2'
+            equip_sets['set'] += '|' + equip
+
+    if equip_sets['set'].startswith('|'):
+        equip_sets['set'] = equip_sets['set'][1:]
+    return equip_sets
+
+
 async def enka_to_dict(
     uid: str, enka_data: Optional[EnkaData] = None
 ) -> Union[List[dict], str]:
@@ -88,7 +101,7 @@ async def enka_to_dict(
         pass
     else:
         try:
-            enka_data = await get_enka_info(uid, ENKA_API[0])
+            enka_data = await get_enka_data(uid)
         except ReadTimeout:
             return '网络不太稳定...'
     if isinstance(enka_data, str):
@@ -106,54 +119,46 @@ async def enka_to_dict(
 
     now = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time()))
     playerInfo = enka_data['playerInfo']
-    path = PLAYER_PATH / str(uid)
-    path.mkdir(parents=True, exist_ok=True)
-
-    # 保存基本玩家信息
-    async with aiofiles.open(
-        path / f'{uid}.json', 'w', encoding='UTF-8'
-    ) as file:
-        await file.write(json.dumps(playerInfo, indent=4, ensure_ascii=False))
-
-    # 保存原始数据
-    async with aiofiles.open(
-        path / 'rawData.json', 'w', encoding='UTF-8'
-    ) as file:
-        await file.write(json.dumps(enka_data, indent=4, ensure_ascii=False))
 
     if 'avatarInfoList' not in enka_data:
+        # 保存基本玩家信息和原始数据
+        await save_player_data(str(uid), playerInfo, enka_data, [])
         return f'UID{uid}刷新失败！未打开角色展柜!'
 
-    char_dict_list = []
+    # 角色展柜与上次完全相同时, 直接使用已保存的角色数据
+    char_dict_list = await get_unchanged_char_list(str(uid), enka_data)
+    if char_dict_list is not None:
+        restore_cv_data(uid, now)
+        return char_dict_list
 
-    # 确认是否存在圣遗物列表
-    all_artifacts_path = path / 'artifacts.json'
-    if not all_artifacts_path.exists():
-        all_artifacts_data = deepcopy(ARTIFACT_DATA)
-    else:
-        async with aiofiles.open(
-            all_artifacts_path, 'r', encoding='UTF-8'
-        ) as file:
-            all_artifacts_data = json.loads(await file.read())
+    char_dict_list = []
+    # 本次刷新需要录入圣遗物仓库的数据, 统一交给评分队列处理
+    artifacts_job = []
 
-    for char in enka_data['avatarInfoList']:
+    # 处理过程中会修改圣遗物数据, 保证保存的原始数据不被修改
+    for char in deepcopy(enka_data['avatarInfoList']):
         # 处理基本信息
         char_data = {}
         avatarId = char['avatarId']
         char_data['playerUid'] = str(uid)
         char_data['playerName'] = enka_data['playerInfo']['nickname']
         char_data['avatarId'] = avatarId
-        avatarName = avatarId2Name[str(char['avatarId'])]
-        char_data['avatarName'] = avatarId2Name[str(char['avatarId'])]
+        char_data['avatarName'] = GS_MAP_PATH.avatarId2Name[
+            str(char['avatarId'])
+        ]
         char_data['avatarFetter'] = char['fetterInfo']['expLevel']
         char_data['avatarLevel'] = char['propMap']['4001']['val']
+        # 突破等级, 未突破时enka不返回该字段
+        char_data['avatarPromoteLevel'] = int(
+            char['propMap'].get('1002', {}).get('val', 0)
+        )
 
         try:
-            char_data['avatarElement'] = avatarName2Element[
+            char_data['avatarElement'] = GS_MAP_PATH.avatarName2Element[
                 char_data['avatarName']
             ]
         except KeyError:
-            check = skillId2Name['Name'][
+            check = GS_MAP_PATH.skillId2Name['Name'][
                 str(list(char['skillLevelMap'].keys())[2])
             ]
             if '风' in check:
@@ -178,11 +183,11 @@ async def enka_to_dict(
         for skill in char['skillLevelMap']:
             skill_temp = {}
             skill_temp['skillId'] = skill
-            skill_temp['skillName'] = skillId2Name['Name'][
+            skill_temp['skillName'] = GS_MAP_PATH.skillId2Name['Name'][
                 skill_temp['skillId']
             ]
             skill_temp['skillLevel'] = char['skillLevelMap'][skill]
-            skill_temp['skillIcon'] = skillId2Name['Icon'][
+            skill_temp['skillIcon'] = GS_MAP_PATH.skillId2Name['Icon'][
                 skill_temp['skillId']
             ]
             char_data['avatarSkill'].append(skill_temp)
@@ -220,8 +225,9 @@ async def enka_to_dict(
             for index, talent in enumerate(char['talentIdList']):
                 talentTemp = {}
                 talentTemp['talentId'] = char['talentIdList'][index]
-                talentTemp['talentName'] = talentId2Name['Name'][str(talent)]
-                talentTemp['talentIcon'] = talentId2Name['Icon'][str(talent)]
+                talent_map = GS_MAP_PATH.talentId2Name
+                talentTemp['talentName'] = talent_map['Name'][str(talent)]
+                talentTemp['talentIcon'] = talent_map['Icon'][str(talent)]
                 talent_temp.append(talentTemp)
         char_data['talentList'] = talent_temp
 
@@ -272,10 +278,10 @@ async def enka_to_dict(
         weapon_info['itemId'] = weapon_data['itemId']
         weapon_info['nameTextMapHash'] = weapon_data['flat']['nameTextMapHash']
         weapon_info['weaponIcon'] = weapon_data['flat']['icon']
-        weapon_info['weaponType'] = weaponHash2Type[
+        weapon_info['weaponType'] = GS_MAP_PATH.weaponHash2Type[
             weapon_info['nameTextMapHash']
         ]
-        weapon_info['weaponName'] = weaponHash2Name[
+        weapon_info['weaponName'] = GS_MAP_PATH.weaponHash2Name[
             weapon_info['nameTextMapHash']
         ]
         weapon_info['weaponStar'] = weapon_data['flat']['rankLevel']
@@ -295,7 +301,9 @@ async def enka_to_dict(
         for k in weapon_data['flat']['weaponStats']:
             weapon_prop_temp = {}
             weapon_prop_temp['appendPropId'] = k['appendPropId']
-            weapon_prop_temp['statName'] = propId2Name[k['appendPropId']]
+            weapon_prop_temp['statName'] = GS_MAP_PATH.propId2Name[
+                k['appendPropId']
+            ]
             weapon_prop_temp['statValue'] = k['statValue']
             weapon_info['weaponStats'].append(weapon_prop_temp)
         # 武器特效，须请求API
@@ -319,7 +327,6 @@ async def enka_to_dict(
         # 处理圣遗物
         artifacts_info = []
         artifacts_data = char['equipList'][:-1]
-        artifact_set_list = []
 
         for artifact in artifacts_data:
             artifact_temp = {}
@@ -328,18 +335,17 @@ async def enka_to_dict(
                 'nameTextMapHash'
             ]
             artifact_temp['icon'] = artifact['flat']['icon']
-            artifact_temp['aritifactName'] = icon2Name[
+            artifact_temp['aritifactName'] = GS_MAP_PATH.icon2Name[
                 artifact['flat']['icon']
             ]
-            artifact_temp['aritifactSetsName'] = artifact2attr[
+            artifact_temp['aritifactSetsName'] = GS_MAP_PATH.artifact2attr[
                 artifact_temp['aritifactName']
             ]
-            artifact_set_list.append(artifact_temp['aritifactSetsName'])
-            artifact_temp['aritifactSetPiece'] = artifactId2Piece[
+            artifact_temp['aritifactSetPiece'] = GS_MAP_PATH.artifactId2Piece[
                 artifact_temp['icon'].split('_')[-1]
             ][0]
 
-            artifact_temp['aritifactPieceName'] = artifactId2Piece[
+            artifact_temp['aritifactPieceName'] = GS_MAP_PATH.artifactId2Piece[
                 artifact_temp['icon'].split('_')[-1]
             ][1]
 
@@ -351,8 +357,9 @@ async def enka_to_dict(
             artifact_temp['reliquaryMainstat'] = artifact['flat'][
                 'reliquaryMainstat'
             ]
-            artifact_temp['reliquaryMainstat']['statName'] = propId2Name[
-                artifact_temp['reliquaryMainstat']['mainPropId']
+            main_stat = artifact_temp['reliquaryMainstat']
+            main_stat['statName'] = GS_MAP_PATH.propId2Name[
+                main_stat['mainPropId']
             ]
 
             if 'reliquarySubstats' in artifact['flat']:
@@ -362,65 +369,34 @@ async def enka_to_dict(
             else:
                 artifact_temp['reliquarySubstats'] = []
             for sub in artifact_temp['reliquarySubstats']:
-                sub['statName'] = propId2Name[sub['appendPropId']]
+                sub['statName'] = GS_MAP_PATH.propId2Name[sub['appendPropId']]
 
             # 加入单个圣遗物部件
             artifacts_info.append(artifact_temp)
 
-        # 保存原始数据
-        async with aiofiles.open(
-            path / 'artifacts.json', 'w', encoding='UTF-8'
-        ) as file:
-            await file.write(
-                json.dumps(all_artifacts_data, indent=4, ensure_ascii=False)
-            )
-
-        equipSetList = set(artifact_set_list)
-        char_data['equipSets'] = {'type': '', 'set': ''}
+        char_data['equipSets'] = get_equip_sets(artifacts_info)
         char_data['equipList'] = artifacts_info
-        for equip in equipSetList:
-            if artifact_set_list.count(equip) >= 4:
-                char_data['equipSets']['type'] = '4'
-                char_data['equipSets']['set'] = equip
-                break
-            elif artifact_set_list.count(equip) == 1:
-                pass
-            elif artifact_set_list.count(equip) >= 2:
-                char_data['equipSets']['type'] += '2'
-                char_data['equipSets']['set'] += '|' + equip
-
-        if char_data['equipSets']['set'].startswith('|'):
-            char_data['equipSets']['set'] = char_data['equipSets']['set'][1:]
-
-        threading.Thread(
-            target=lambda: asyncio.run(
-                _get_data(
-                    artifacts_info,
-                    all_artifacts_data,
-                    avatarId,
-                    char_data,
-                )
-            ),
-            daemon=True,
-        ).start()
+
+        # 评分时会修改角色数据, 因此放入副本
+        artifacts_job.append((avatarId, deepcopy(char_data)))
 
         char_dict_list.append(char_data)
-        async with aiofiles.open(
-            path / '{}.json'.format(avatarName), 'w', encoding='UTF-8'
-        ) as file:
-            await file.write(
-                json.dumps(char_data, indent=4, ensure_ascii=False)
-            )
 
-    if is_enable_akasha:
-        threading.Thread(
-            target=lambda: asyncio.run(_restore_cv_data(uid, now)),
-            daemon=True,
-        ).start()
+    # 保存基本玩家信息, 原始数据和角色数据
+    await save_player_data(str(uid), playerInfo, enka_data, char_dict_list)
+    await put_artifacts_job(str(uid), artifacts_job)
+    restore_cv_data(uid, now)
 
     return char_dict_list
 
 
+def restore_cv_data(uid: str, now: str):
+    if is_enable_akasha:
+        task = asyncio.create_task(_restore_cv_data(uid, now))
+        BACKGROUND_TASKS.add(task)
+        task.add_done_callback(BACKGROUND_TASKS.discard)
+
+
 async def _restore_cv_data(uid: str, now: str):
     cv_api = _CvApi()
     data = await cv_api.get_rank_data(uid)
@@ -456,16 +432,167 @@ async def enka_to_data(
     return f'UID{uid}刷新完成！\n本次缓存：{char_name_list_str}'
 
 
-async def _get_data(
-    artifacts_info: List,
-    all_artifacts_data: Dict,
-    avatarId: int,
-    char_data: Dict,
+async def get_enka_data(uid: str) -> Union[EnkaData, str, None]:
+    '''
+    获取enka数据, 在enka返回的ttl内重复刷新直接使用缓存,
+    同一UID的并发请求只会实际请求一次
+    '''
+    cache = ENKA_CACHE.get(uid)
+    if cache and cache[0] > time.time():
+        logger.info(f'[enka] UID{uid}使用缓存数据')
+        return cache[1]
+
+    if uid not in ENKA_REQUEST:
+        task = asyncio.create_task(_request_enka_data(uid))
+        ENKA_REQUEST[uid] = task
+        task.add_done_callback(lambda _: ENKA_REQUEST.pop(uid, None))
+    return await asyncio.shield(ENKA_REQUEST[uid])
+
+
+async def _request_enka_data(uid: str) -> Union[EnkaData, str, None]:
+    enka_data = await get_enka_info(uid, ENKA_API[0])
+    if isinstance(enka_data, dict) and 'playerInfo' in enka_data:
+        now = time.time()
+        # 移除已过期的缓存
+        for _uid in [k for k, v in ENKA_CACHE.items() if v[0] <= now]:
+            del ENKA_CACHE[_uid]
+        ttl = enka_data.get('ttl', 0)
+        if ttl:
+            ENKA_CACHE[uid] = (now + ttl, enka_data)
+    return enka_data
+
+
+async def get_unchanged_char_list(
+    uid: str, enka_data: EnkaData
+) -> Optional[List[Dict]]:
+    '''
+    角色展柜与已保存的原始数据相同且角色数据齐全时, 返回已保存的角色数据
+    '''
+    store = await load_player_store(uid)
+    if store is None:
+        return None
+    # 角色数据由旧版本生成时需要重新处理
+    if store['version'] != STORE_VERSION:
+        return None
+    if store['raw'].get('avatarInfoList') != enka_data['avatarInfoList']:
+        return None
+
+    char_dict_list = []
+    for char in enka_data['avatarInfoList']:
+        char_name = GS_MAP_PATH.avatarId2Name.get(str(char['avatarId']))
+        if char_name not in store['chars']:
+            return None
+        char_dict_list.append(store['chars'][char_name])
+
+    if store['raw'] != enka_data:
+        # 仅玩家信息发生变化
+        await save_player_data(uid, enka_data['playerInfo'], enka_data, [])
+    logger.info(f'[enka] UID{uid}角色展柜未发生变化, 跳过处理')
+    return char_dict_list
+
+
+async def save_player_data(
+    uid: str, player_info: Dict, raw_data: Dict, char_dict_list: List[Dict]
 ):
-    for _artifact in artifacts_info:
-        await input_artifacts_data(
-            deepcopy(_artifact), all_artifacts_data, avatarId, char_data
-        )
+    async with get_store_lock(uid):
+        store = await load_player_store(uid, True)
+        if store is None:
+            store = new_player_store()
+        store['player'] = player_info
+        store['raw'] = raw_data
+        for char_data in char_dict_list:
+            store['chars'][char_data['avatarName']] = char_data
+        if char_dict_list:
+            store['version'] = STORE_VERSION
+        await save_player_store(uid, store)
+
+
+async def put_artifacts_job(uid: str, job: List[Tuple[int, Dict]]):
+    '''
+    将一次刷新的全部角色放入评分队列, 队列已满时等待
+    '''
+    global ARTIFACTS_QUEUE
+    if ARTIFACTS_QUEUE is None:
+        ARTIFACTS_QUEUE = asyncio.Queue(ARTIFACTS_QUEUE_SIZE)
+        for _ in range(ARTIFACTS_WORKER_NUM):
+            task = asyncio.create_task(_artifacts_worker(ARTIFACTS_QUEUE))
+            BACKGROUND_TASKS.add(task)
+    await ARTIFACTS_QUEUE.put((uid, job))
+    logger.debug(f'[圣遗物评分] 当前队列长度: {get_artifacts_queue_size()}')
+
+
+def get_artifacts_queue_size() -> int:
+    '''
+    圣遗物评分队列中等待处理的刷新数量
+    '''
+    if ARTIFACTS_QUEUE is None:
+        return 0
+    return ARTIFACTS_QUEUE.qsize()
+
+
+async def _artifacts_worker(queue: asyncio.Queue):
+    while True:
+        uid, job = await queue.get()
+        try:
+            await _get_data(uid, job)
+        except Exception as e:
+            logger.exception(f'[圣遗物评分] UID{uid}处理失败: {e}')
+        finally:
+            queue.task_done()
+
+
+async def _get_data(uid: str, job: List[Tuple[int, Dict]]):
+    # 同一UID的刷新依次处理, 防止互相覆盖
+    async with get_store_lock(uid):
+        store = await load_player_store(uid, True)
+        if store is None:
+            store = new_player_store()
+        all_artifacts_data = store['artifacts']
+
+        for avatarId, char_data in job:
+            for _artifact in char_data['equipList']:
+                await input_artifacts_data(
+                    deepcopy(_artifact),
+                    all_artifacts_data,
+                    avatarId,
+                    char_data,
+                )
+        await save_player_store(uid, store)
+
+
+def get_artifact_fingerprint(artifact: Dict) -> str:
+    '''
+    圣遗物的稳定指纹, 只由圣遗物本身的属性决定, 与佩戴的角色和评分无关
+    '''
+    main = artifact['reliquaryMainstat']
+    key = [
+        artifact.get('aritifactName'),
+        artifact['aritifactSetPiece'],
+        artifact.get('aritifactLevel'),
+        main['statName'],
+        main['statValue'],
+        [
+            [i['statName'], i['statValue']]
+            for i in artifact['reliquarySubstats']
+        ],
+    ]
+    return hashlib.md5(
+        json.dumps(key, ensure_ascii=False).encode('UTF-8')
+    ).hexdigest()
+
+
+def get_artifacts_index(all_artifacts_data: Dict) -> Dict[str, List]:
+    '''
+    获取圣遗物指纹索引, 旧版本的圣遗物列表没有索引时重新建立
+    '''
+    if 'index' not in all_artifacts_data:
+        index = {}
+        for piece, artifact_list in all_artifacts_data['data'].items():
+            for i, artifact in enumerate(artifact_list):
+                fingerprint = get_artifact_fingerprint(artifact)
+                index.setdefault(fingerprint, [piece, i])
+        all_artifacts_data['index'] = index
+    return all_artifacts_data['index']
 
 
 async def input_artifacts_data(
@@ -474,31 +601,22 @@ async def input_artifacts_data(
     avatarId: int,
     char_data: Dict,
 ):
+    index = get_artifacts_index(all_artifacts_data)
+    fingerprint = get_artifact_fingerprint(artifact_temp)
+    # 已存在的圣遗物只更新佩戴过的角色, 无需重新评分
+    if fingerprint in index:
+        piece, i = index[fingerprint]
+        tag = all_artifacts_data['tag'][piece][i]
+        if avatarId not in tag:
+            tag.append(avatarId)
+        return all_artifacts_data
+
     artifact_temp = await get_artifact_score_data(
         artifact_temp, Character(char_data)
     )
     # 加入圣遗物数据列表
-    if (
-        artifact_temp
-        not in all_artifacts_data['data'][artifact_temp['aritifactSetPiece']]
-    ):
-        all_artifacts_data['data'][artifact_temp['aritifactSetPiece']].append(
-            artifact_temp
-        )
-        all_artifacts_data['tag'][artifact_temp['aritifactSetPiece']].append(
-            [avatarId]
-        )
-    elif (
-        avatarId
-        not in all_artifacts_data['tag'][artifact_temp['aritifactSetPiece']][
-            all_artifacts_data['data'][
-                artifact_temp['aritifactSetPiece']
-            ].index(artifact_temp)
-        ]
-    ):
-        all_artifacts_data['tag'][artifact_temp['aritifactSetPiece']][
-            all_artifacts_data['data'][
-                artifact_temp['aritifactSetPiece']
-            ].index(artifact_temp)
-        ].append(avatarId)
+    piece = artifact_temp['aritifactSetPiece']
+    index[fingerprint] = [piece, len(all_artifacts_data['data'][piece])]
+    all_artifacts_data['data'][piece].append(artifact_temp)
+    all_artifacts_data['tag'][piece].append([avatarId])
     return all_artifacts_data
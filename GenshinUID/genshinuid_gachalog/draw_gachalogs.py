@@ -1,21 +1,18 @@
-import json
 import random
 import asyncio
-import datetime
 from pathlib import Path
 from typing import List, Tuple, Union
 
 from PIL import Image, ImageDraw
 from gsuid_core.logger import logger
 
+from .gacha_store import load_gacha_stat
+from .gacha_stat import get_gacha_summary
 from ..utils.image.convert import convert_img
+from ..utils.image.texture import get_texture
 from ..utils.map.name_covert import name_to_avatar_id
-from ..utils.resource.RESOURCE_PATH import CHAR_PATH, PLAYER_PATH, WEAPON_PATH
-from ..utils.image.image_tools import (
-    get_color_bg,
-    get_qq_avatar,
-    draw_pic_with_ring,
-)
+from ..utils.resource.RESOURCE_PATH import CHAR_PATH, WEAPON_PATH
+from ..utils.image.image_tools import get_color_bg, get_ring_avatar
 from ..utils.fonts.genshin_fonts import (
     gs_font_24,
     gs_font_28,
@@ -33,30 +30,7 @@ brown_color = (41, 25, 0)
 red_color = (255, 66, 66)
 green_color = (74, 189, 119)
 
-CHANGE_MAP = {'常驻祈愿': 'normal', '角色祈愿': 'char', '武器祈愿': 'weapon'}
 HOMO_TAG = ['非到极致', '运气不好', '平稳保底', '小欧一把', '欧狗在此']
-NORMAL_LIST = [
-    '莫娜',
-    '迪卢克',
-    '七七',
-    '琴',
-    '阿莫斯之弓',
-    '天空之翼',
-    '四风原典',
-    '天空之卷',
-    '和璞鸢',
-    '天空之脊',
-    '狼的末路',
-    '天空之傲',
-    '风鹰剑',
-    '天空之刃',
-]
-
-UP_LIST = {
-    '刻晴': [(2021, 2, 17, 18, 0, 0), (2021, 3, 2, 15, 59, 59)],
-    '提纳里': [(2022, 8, 24, 11, 0, 0), (2022, 9, 9, 17, 59, 59)],
-    '迪希雅': [(2023, 3, 1, 11, 0, 0), (2023, 3, 21, 17, 59, 59)],
-}
 
 
 async def _draw_card(
@@ -67,23 +41,16 @@ async def _draw_card(
     gacha_num: int,
     is_up: bool,
 ):
-    card_img = Image.open(TEXT_PATH / 'item_bg.png')
+    card_img = get_texture(TEXT_PATH / 'item_bg.png')
     card_img_draw = ImageDraw.Draw(card_img)
     point = (1, 0)
     text_point = (55, 124)
     if type == '角色':
-        _id = await name_to_avatar_id(name)
-        item_pic = (
-            Image.open(CHAR_PATH / f'{_id}.png')
-            .convert('RGBA')
-            .resize((108, 108))
-        )
+        _id = name_to_avatar_id(name)
+        item_path = CHAR_PATH / f'{_id}.png'
     else:
-        item_pic = (
-            Image.open(WEAPON_PATH / f'{name}.png')
-            .convert('RGBA')
-            .resize((108, 108))
-        )
+        item_path = WEAPON_PATH / f'{name}.png'
+    item_pic = get_texture(item_path, (108, 108), 'RGBA', copy=False)
     card_img.paste(item_pic, point, item_pic)
     if gacha_num >= 81:
         text_color = red_color
@@ -117,180 +84,13 @@ async def get_level_from_list(ast: int, lst: List) -> int:
     return level
 
 
-def check_up(name: str, _time: str) -> bool:
-    for char in UP_LIST:
-        if char == name:
-            time = UP_LIST[char]
-            s_time = datetime.datetime(*time[0])
-            e_time = datetime.datetime(*time[1])
-            gacha_time = datetime.datetime.strptime(_time, '%Y-%m-%d %H:%M:%S')
-            if gacha_time < s_time or gacha_time > e_time:
-                return False
-            else:
-                return True
-    else:
-        return False
-
-
 async def draw_gachalogs_img(uid: str, user_id: str) -> Union[bytes, str]:
-    path = PLAYER_PATH / str(uid) / 'gacha_logs.json'
-    if not path.exists():
+    gacha_stat = await load_gacha_stat(uid)
+    if gacha_stat is None:
         return '你还没有祈愿数据噢~\n请添加Stoken后使用命令`刷新抽卡记录`更新祈愿数据~'
-    with open(path, 'r', encoding='UTF-8') as f:
-        gacha_data = json.load(f)
-
-    # 数据初始化
-    total_data = {}
-    for i in ['常驻祈愿', '角色祈愿', '武器祈愿']:
-        total_data[i] = {
-            'total': 0,  # 五星总数
-            'avg': 0,  # 抽卡平均数
-            'avg_up': 0,  # up平均数
-            'remain': 0,  # 已xx抽未出金
-            'r_num': [],  # 不包含首位的抽卡数量
-            'e_num': [],  # 包含首位的up抽卡数量
-            'up_list': [],  # 抽到的UP列表(不包含首位)
-            'normal_list': [],  # 抽到的五星列表(不包含首位)
-            'list': [],  # 抽到的五星列表
-            'time_range': '',  # 抽卡时间
-            'all_time': 0,  # 抽卡总计秒数
-            'type': '一般型',  # 抽卡类型: 随缘型, 氪金型, 规划型, 仓鼠型, 佛系型
-            'short_gacha_data': {'time': 0, 'num': 0},
-            'long_gacha_data': {'time': 0, 'num': 0},
-        }
-        # 拿到数据列表
-        data_list = gacha_data['data'][i]
-        # 初始化开关
-        is_not_first = False
-        # 开始初始化抽卡数
-        num = 1
-        # 从后面开始循环
-        temp_time = datetime.datetime(2020, 9, 15, 18, 0, 0)
-        for index, data in enumerate(data_list[::-1]):
-            # 计算抽卡时间跨度
-            if index == 0:
-                total_data[i]['time_range'] = data['time']
-            if index == len(data_list) - 1:
-                total_data[i]['all_time'] = (
-                    datetime.datetime.strptime(
-                        data['time'], '%Y-%m-%d %H:%M:%S'
-                    )
-                    - datetime.datetime.strptime(
-                        total_data[i]['time_range'], '%Y-%m-%d %H:%M:%S'
-                    )
-                ).total_seconds()
-                total_data[i]['time_range'] += '~' + data['time']
-
-            # 计算时间间隔
-            if index != 0:
-                now_time = datetime.datetime.strptime(
-                    data['time'], '%Y-%m-%d %H:%M:%S'
-                )
-                dis = (now_time - temp_time).total_seconds()
-                temp_time = now_time
-                if dis <= 5000:
-                    total_data[i]['short_gacha_data']['num'] += 1
-                    total_data[i]['short_gacha_data']['time'] += dis
-                elif dis >= 86400:
-                    total_data[i]['long_gacha_data']['num'] += 1
-                    total_data[i]['long_gacha_data']['time'] += dis
-            else:
-                temp_time = datetime.datetime.strptime(
-                    data['time'], '%Y-%m-%d %H:%M:%S'
-                )
-
-            # 如果这是个五星
-            if data['rank_type'] == '5':
-                # 抽到这个五星花了多少抽
-                data['gacha_num'] = num
-
-                # 判断是否是UP
-                if data['name'] in NORMAL_LIST:
-                    data['is_up'] = False
-                elif data['name'] in UP_LIST:
-                    data['is_up'] = check_up(data['name'], data['time'])
-                else:
-                    data['is_up'] = True
 
-                # 往里加东西
-                if is_not_first:
-                    total_data[i]['r_num'].append(num)
-                    total_data[i]['normal_list'].append(data)
-                    if data['is_up']:
-                        total_data[i]['up_list'].append(data)
-
-                # 把这个数据扔到抽到的五星列表内
-                total_data[i]['list'].append(data)
-
-                # 判断经过了第一个
-                if total_data[i]['list']:
-                    is_not_first = True
-
-                num = 1
-                # 五星总数增加1
-                total_data[i]['total'] += 1
-            else:
-                num += 1
-
-        # 计算已多少抽
-        total_data[i]['remain'] = num - 1
-
-        # 计算平均抽卡数
-        if len(total_data[i]['normal_list']) == 0:
-            total_data[i]['avg'] = 0
-        else:
-            total_data[i]['avg'] = float(
-                '{:.2f}'.format(
-                    sum(total_data[i]['r_num']) / len(total_data[i]['r_num'])
-                )
-            )
-        # 计算平均up数量
-        if len(total_data[i]['up_list']) == 0:
-            total_data[i]['avg_up'] = 0
-        else:
-            total_data[i]['avg_up'] = float(
-                '{:.2f}'.format(
-                    sum(total_data[i]['r_num']) / len(total_data[i]['up_list'])
-                )
-            )
-
-        # 计算抽卡类型
-        # 如果抽卡总数小于40
-        if gacha_data[f'{CHANGE_MAP[i]}_gacha_num'] <= 40:
-            total_data[i]['type'] = '佛系型'
-        # 如果长时抽卡总数占据了总抽卡数的70%
-        elif (
-            total_data[i]['long_gacha_data']['num']
-            / gacha_data[f'{CHANGE_MAP[i]}_gacha_num']
-            >= 0.7
-        ):
-            total_data[i]['type'] = '随缘型'
-        # 如果短时抽卡总数占据了总抽卡数的70%
-        elif (
-            total_data[i]['short_gacha_data']['num']
-            / gacha_data[f'{CHANGE_MAP[i]}_gacha_num']
-            >= 0.7
-        ):
-            total_data[i]['type'] = '规划型'
-        # 如果抽卡数量远远大于标称抽卡数量
-        elif (
-            total_data[i]['all_time'] / 30000
-            <= gacha_data[f'{CHANGE_MAP[i]}_gacha_num']
-        ):
-            # 如果长时抽卡数量大于短时抽卡数量
-            if (
-                total_data[i]['long_gacha_data']['num']
-                >= total_data[i]['short_gacha_data']['num']
-            ):
-                total_data[i]['type'] = '规划型'
-            else:
-                total_data[i]['type'] = '氪金型'
-        # 如果抽卡数量远远小于标称抽卡数量
-        elif (
-            total_data[i]['all_time'] / 32000
-            >= gacha_data[f'{CHANGE_MAP[i]}_gacha_num'] * 2
-        ):
-            total_data[i]['type'] = '仓鼠型'
+    # 统计数据在写入抽卡记录时已经增量计算完成
+    total_data = {i: get_gacha_summary(gacha_stat[i]) for i in gacha_stat}
 
     # 常量偏移数据
     single_y = 150
@@ -301,12 +101,7 @@ async def draw_gachalogs_img(uid: str, user_id: str) -> Union[bytes, str]:
     weapon_y = (1 + ((total_data['武器祈愿']['total'] - 1) // 6)) * single_y
 
     # 获取背景图片各项参数
-    _id = str(user_id)
-    if _id.startswith('http'):
-        char_pic = await get_qq_avatar(avatar_url=_id)
-    else:
-        char_pic = await get_qq_avatar(qid=user_id)
-    char_pic = await draw_pic_with_ring(char_pic, 320)
+    char_pic = await get_ring_avatar(user_id, 320)
 
     avatar_title = Image.open(TEXT_PATH / 'avatar_title.png')
     img = await get_color_bg(950, 530 + 900 + normal_y + char_y + weapon_y)
@@ -371,7 +166,7 @@ async def draw_gachalogs_img(uid: str, user_id: str) -> Union[bytes, str]:
         # 抽卡总数
         title_draw.text(
             (424, 176),
-            str(gacha_data[f'{CHANGE_MAP[i]}_gacha_num']),
+            str(total_data[i]['count']),
             first_color,
             gs_font_40,
             'mm',
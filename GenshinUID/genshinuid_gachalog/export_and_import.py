@@ -5,6 +5,7 @@ from datetime import datetime
 from httpx import get
 
 from .get_gachalogs import save_gachalogs
+from .gacha_store import export_uigf, has_gachalogs
 from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
 
 INT_TO_TYPE = {
@@ -58,33 +59,18 @@ async def export_gachalogs(uid: str) -> dict:
     now = datetime.now()
     current_time = now.strftime('%Y-%m-%d %H:%M:%S')
 
-    # 抽卡记录json路径
-    gachalogs_path = path / 'gacha_logs.json'
-    if gachalogs_path.exists():
-        with open(gachalogs_path, "r", encoding='UTF-8') as f:
-            raw_data = json.load(f)
-        result = {
-            'info': {
-                'uid': uid,
-                'lang': 'zh-cn',
-                'export_time': current_time,
-                'export_app': 'GenshinUID',
-                'export_app_version': '4.0',
-                'export_timestamp': round(now.timestamp()),
-                'uigf_version': 'v2.2',
-            },
-            'list': [],
+    if has_gachalogs(uid):
+        info = {
+            'uid': uid,
+            'lang': 'zh-cn',
+            'export_time': current_time,
+            'export_app': 'GenshinUID',
+            'export_app_version': '4.0',
+            'export_timestamp': round(now.timestamp()),
+            'uigf_version': 'v2.2',
         }
-        for i in ['新手祈愿', '常驻祈愿', '角色祈愿', '武器祈愿']:
-            for item in raw_data['data'][i]:
-                if item['gacha_type'] == '400':
-                    item['uigf_gacha_type'] = '301'
-                else:
-                    item['uigf_gacha_type'] = item['gacha_type']
-                result['list'].append(item)
-        # 保存文件
-        with open(path / f'UIGF_{uid}.json', 'w', encoding='UTF-8') as file:
-            json.dump(result, file, ensure_ascii=False)
+        # 逐条写入文件, 不需要读取全部记录
+        await export_uigf(uid, path / f'UIGF_{uid}.json', info)
         im = {
             'retcode': 'ok',
             'data': '导出成功!',
@@ -0,0 +1,209 @@
+import time
+import calendar
+from typing import Dict, List, Tuple, TypedDict
+
+# 统计方式或下方的列表变化时需要增加版本号, 已保存的统计数据会重新计算
+STAT_VERSION = 1
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+NORMAL_LIST = [
+    '莫娜',
+    '迪卢克',
+    '七七',
+    '琴',
+    '阿莫斯之弓',
+    '天空之翼',
+    '四风原典',
+    '天空之卷',
+    '和璞鸢',
+    '天空之脊',
+    '狼的末路',
+    '天空之傲',
+    '风鹰剑',
+    '天空之刃',
+]
+
+UP_LIST = {
+    '刻晴': [(2021, 2, 17, 18, 0, 0), (2021, 3, 2, 15, 59, 59)],
+    '提纳里': [(2022, 8, 24, 11, 0, 0), (2022, 9, 9, 17, 59, 59)],
+    '迪希雅': [(2023, 3, 1, 11, 0, 0), (2023, 3, 21, 17, 59, 59)],
+}
+
+
+class GachaItem(TypedDict):
+    name: str
+    item_type: str
+    gacha_num: int
+    is_up: bool
+
+
+class GachaStat(TypedDict):
+    version: int
+    # 已统计的最后一条记录的id
+    last_id: int
+    # 抽卡总数
+    count: int
+    # 五星总数
+    total: int
+    # 已xx抽未出金
+    remain: int
+    # 不包含首位五星的抽卡数量之和
+    r_sum: int
+    # 不包含首位五星的up数量
+    up_num: int
+    # 抽到的五星列表
+    list: List[GachaItem]
+    # 第一条和最后一条记录的时间
+    first_time: int
+    last_time: int
+    # 间隔较短/较长的抽卡次数和总间隔秒数
+    short_num: int
+    short_time: int
+    long_num: int
+    long_time: int
+
+
+def time_to_epoch(_time: str) -> int:
+    '''
+    抽卡记录的时间不带时区, 统一按UTC换算, 只用于比较和计算间隔
+    '''
+    return calendar.timegm(time.strptime(_time, TIME_FORMAT))
+
+
+def epoch_to_time(epoch: int) -> str:
+    return time.strftime(TIME_FORMAT, time.gmtime(epoch))
+
+
+UP_TIME: Dict[str, Tuple[int, int]] = {
+    name: (calendar.timegm(value[0]), calendar.timegm(value[1]))
+    for name, value in UP_LIST.items()
+}
+
+
+def check_up(name: str, gacha_time: int) -> bool:
+    if name in NORMAL_LIST:
+        return False
+    if name in UP_TIME:
+        start, end = UP_TIME[name]
+        return start <= gacha_time <= end
+    return True
+
+
+def new_gacha_stat() -> GachaStat:
+    return {
+        'version': STAT_VERSION,
+        'last_id': 0,
+        'count': 0,
+        'total': 0,
+        'remain': 0,
+        'r_sum': 0,
+        'up_num': 0,
+        'list': [],
+        'first_time': 0,
+        'last_time': 0,
+        'short_num': 0,
+        'short_time': 0,
+        'long_num': 0,
+        'long_time': 0,
+    }
+
+
+def add_gacha_record(
+    stat: GachaStat, gacha_id: int, gacha_time: int, data: Dict
+):
+    '''
+    按时间顺序将一条抽卡记录计入统计数据
+    '''
+    # 计算时间间隔
+    if stat['count'] == 0:
+        stat['first_time'] = gacha_time
+    else:
+        dis = gacha_time - stat['last_time']
+        if dis <= 5000:
+            stat['short_num'] += 1
+            stat['short_time'] += dis
+        elif dis >= 86400:
+            stat['long_num'] += 1
+            stat['long_time'] += dis
+    stat['last_time'] = gacha_time
+    stat['last_id'] = gacha_id
+    stat['count'] += 1
+
+    if data['rank_type'] != '5':
+        stat['remain'] += 1
+        return
+
+    # 抽到这个五星花了多少抽
+    gacha_num = stat['remain'] + 1
+    is_up = check_up(data['name'], gacha_time)
+    # 第一个五星不计入平均数
+    if stat['list']:
+        stat['r_sum'] += gacha_num
+        if is_up:
+            stat['up_num'] += 1
+    stat['list'].append(
+        {
+            'name': data['name'],
+            'item_type': data['item_type'],
+            'gacha_num': gacha_num,
+            'is_up': is_up,
+        }
+    )
+    stat['total'] += 1
+    stat['remain'] = 0
+
+
+def get_gacha_type(stat: GachaStat) -> str:
+    '''
+    抽卡类型: 一般型, 随缘型, 氪金型, 规划型, 仓鼠型, 佛系型
+    '''
+    count = stat['count']
+    all_time = stat['last_time'] - stat['first_time']
+    # 如果抽卡总数小于40
+    if count <= 40:
+        return '佛系型'
+    # 如果长时抽卡总数占据了总抽卡数的70%
+    if stat['long_num'] / count >= 0.7:
+        return '随缘型'
+    # 如果短时抽卡总数占据了总抽卡数的70%
+    if stat['short_num'] / count >= 0.7:
+        return '规划型'
+    # 如果抽卡数量远远大于标称抽卡数量
+    if all_time / 30000 <= count:
+        # 如果长时抽卡数量大于短时抽卡数量
+        if stat['long_num'] >= stat['short_num']:
+            return '规划型'
+        return '氪金型'
+    # 如果抽卡数量远远小于标称抽卡数量
+    if all_time / 32000 >= count * 2:
+        return '仓鼠型'
+    return '一般型'
+
+
+def get_gacha_summary(stat: GachaStat) -> Dict:
+    '''
+    由统计数据计算绘图需要的平均抽数, 时间范围和抽卡类型
+    '''
+    r_num = stat['total'] - 1
+    avg = float('{:.2f}'.format(stat['r_sum'] / r_num)) if r_num > 0 else 0
+    if stat['up_num']:
+        avg_up = float('{:.2f}'.format(stat['r_sum'] / stat['up_num']))
+    else:
+        avg_up = 0
+    if stat['count']:
+        time_range = (
+            f'{epoch_to_time(stat["first_time"])}'
+            f'~{epoch_to_time(stat["last_time"])}'
+        )
+    else:
+        time_range = ''
+    return {
+        'count': stat['count'],
+        'total': stat['total'],
+        'avg': avg,
+        'avg_up': avg_up,
+        'remain': stat['remain'],
+        'list': stat['list'],
+        'time_range': time_range,
+        'type': get_gacha_type(stat),
+    }
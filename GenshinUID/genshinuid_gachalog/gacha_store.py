@@ -0,0 +1,296 @@
+import os
+import json
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from functools import partial
+from typing import Any, Set, Dict, List, Iterator, Optional
+
+from gsuid_core.logger import logger
+
+from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+from .gacha_stat import (
+    STAT_VERSION,
+    GachaStat,
+    time_to_epoch,
+    new_gacha_stat,
+    add_gacha_record,
+)
+
+GACHA_NAME_LIST = ['新手祈愿', '常驻祈愿', '角色祈愿', '武器祈愿']
+# 绘制抽卡记录时需要统计的卡池
+STAT_NAME_LIST = ['常驻祈愿', '角色祈愿', '武器祈愿']
+
+STORE_NAME = 'gacha_logs.db'
+# 数据库结构的版本, 保存在user_version中
+STORE_VERSION = 1
+# 旧版本将全部抽卡记录存放在一个json中, 首次打开时迁移
+OLD_STORE_NAME = 'gacha_logs.json'
+
+CREATE_SQL = '''
+CREATE TABLE IF NOT EXISTS gacha_log (
+    id INTEGER PRIMARY KEY,
+    gacha_name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    time INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS gacha_log_name ON gacha_log (gacha_name, id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS gacha_stat (
+    gacha_name TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+'''
+INSERT_SQL = (
+    'INSERT OR IGNORE INTO gacha_log (id, gacha_name, data, time) '
+    'VALUES (?, ?, ?, ?)'
+)
+
+# 已完成建表, 升级和迁移的数据库, 每个UID只需在首次打开时检查
+INIT_PATH: Set[Path] = set()
+INIT_LOCK = threading.Lock()
+
+
+def get_gacha_path(uid: str) -> Path:
+    return PLAYER_PATH / str(uid) / STORE_NAME
+
+
+def has_gachalogs(uid: str) -> bool:
+    path = get_gacha_path(uid)
+    return path.exists() or path.with_name(OLD_STORE_NAME).exists()
+
+
+def _insert(
+    conn: sqlite3.Connection, data: Dict[str, List[Dict]]
+) -> Dict[str, int]:
+    '''
+    按记录id去重写入, 已存在的记录直接跳过, 返回各卡池新增的数量
+    '''
+    add_num: Dict[str, int] = {}
+    for gacha_name in GACHA_NAME_LIST:
+        changes = conn.total_changes
+        conn.executemany(
+            INSERT_SQL,
+            (
+                (
+                    int(item['id']),
+                    gacha_name,
+                    json.dumps(item, ensure_ascii=False),
+                    time_to_epoch(item['time']),
+                )
+                for item in data.get(gacha_name, [])
+            ),
+        )
+        add_num[gacha_name] = conn.total_changes - changes
+    return add_num
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: str):
+    conn.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute('SELECT value FROM meta WHERE key = ?', (key,))
+    result = row.fetchone()
+    return result[0] if result else None
+
+
+def _add_gachalogs(
+    conn: sqlite3.Connection, data: Dict[str, List[Dict]], data_time: str
+) -> Dict[str, int]:
+    with conn:
+        add_num = _insert(conn, data)
+        _set_meta(conn, 'data_time', data_time)
+        for gacha_name in STAT_NAME_LIST:
+            _update_stat(conn, gacha_name, add_num[gacha_name])
+    return add_num
+
+
+def _update_stat(
+    conn: sqlite3.Connection, gacha_name: str, add_num: int = 0
+) -> GachaStat:
+    '''
+    将新增的记录计入统计数据, 新增的记录早于已统计的记录时
+    (如导入了更早的抽卡记录)重新统计该卡池的全部记录
+    '''
+    row = conn.execute(
+        'SELECT data FROM gacha_stat WHERE gacha_name = ?', (gacha_name,)
+    ).fetchone()
+    stat: GachaStat = json.loads(row[0]) if row else new_gacha_stat()
+    if stat['version'] != STAT_VERSION:
+        stat = new_gacha_stat()
+
+    sql = 'FROM gacha_log WHERE gacha_name = ? AND id > ?'
+    (new_num,) = conn.execute(
+        f'SELECT COUNT(*) {sql}', (gacha_name, stat['last_id'])
+    ).fetchone()
+    if new_num != add_num and row is not None:
+        stat = new_gacha_stat()
+    elif new_num == 0:
+        return stat
+
+    cursor = conn.execute(
+        f'SELECT id, time, data {sql} ORDER BY id',
+        (gacha_name, stat['last_id']),
+    )
+    for gacha_id, gacha_time, data in cursor:
+        add_gacha_record(stat, gacha_id, gacha_time, json.loads(data))
+    conn.execute(
+        'INSERT OR REPLACE INTO gacha_stat VALUES (?, ?)',
+        (gacha_name, json.dumps(stat, ensure_ascii=False)),
+    )
+    return stat
+
+
+def _migrate(conn: sqlite3.Connection, path: Path):
+    try:
+        with open(path, 'r', encoding='UTF-8') as f:
+            old_data = json.load(f)
+    except FileNotFoundError:
+        # 已经被同时打开的其他连接迁移
+        return
+    except json.JSONDecodeError as e:
+        logger.warning(f'[抽卡记录迁移] {path}已损坏: {e}')
+        return
+    add_num = _add_gachalogs(conn, old_data['data'], old_data['data_time'])
+    path.unlink(missing_ok=True)
+    logger.info(f'[抽卡记录迁移] {path}迁移完成, 共{sum(add_num.values())}条记录!')
+
+
+def _upgrade(conn: sqlite3.Connection):
+    (version,) = conn.execute('PRAGMA user_version').fetchone()
+    if version >= STORE_VERSION:
+        return
+    columns = [i[1] for i in conn.execute('PRAGMA table_info(gacha_log)')]
+    with conn:
+        # 补充抽卡时间, 之后只在写入时解析一次
+        if 'time' not in columns:
+            conn.execute(
+                'ALTER TABLE gacha_log '
+                'ADD COLUMN time INTEGER NOT NULL DEFAULT 0'
+            )
+            rows = conn.execute('SELECT id, data FROM gacha_log').fetchall()
+            conn.executemany(
+                'UPDATE gacha_log SET time = ? WHERE id = ?',
+                (
+                    (time_to_epoch(json.loads(data)['time']), gacha_id)
+                    for gacha_id, data in rows
+                ),
+            )
+        conn.execute(f'PRAGMA user_version = {STORE_VERSION}')
+
+
+def _connect(uid: str) -> sqlite3.Connection:
+    path = get_gacha_path(uid)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 数据库文件被删除后需要重新建表
+    need_init = path not in INIT_PATH or not path.exists()
+    conn = sqlite3.connect(path)
+    if need_init:
+        with INIT_LOCK:
+            conn.executescript(CREATE_SQL)
+            _upgrade(conn)
+            old_path = path.with_name(OLD_STORE_NAME)
+            if old_path.exists():
+                _migrate(conn, old_path)
+            INIT_PATH.add(path)
+    return conn
+
+
+def _run_sync(func: Any, uid: str, *args) -> Any:
+    conn = _connect(uid)
+    try:
+        return func(conn, *args)
+    finally:
+        conn.close()
+
+
+async def _run(func: Any, uid: str, *args) -> Any:
+    '''
+    在线程池中打开数据库执行`func(conn, *args)`, 避免阻塞事件循环
+    '''
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, partial(_run_sync, func, uid, *args)
+    )
+
+
+def _iter_gachalogs(
+    conn: sqlite3.Connection, gacha_name: str
+) -> Iterator[Dict]:
+    cursor = conn.execute(
+        'SELECT data FROM gacha_log WHERE gacha_name = ? ORDER BY id DESC',
+        (gacha_name,),
+    )
+    for (data,) in cursor:
+        yield json.loads(data)
+
+
+def _get_ids(conn: sqlite3.Connection) -> Set[str]:
+    return {str(i) for (i,) in conn.execute('SELECT id FROM gacha_log')}
+
+
+def _load_gacha_stat(conn: sqlite3.Connection) -> Dict[str, GachaStat]:
+    with conn:
+        return {i: _update_stat(conn, i) for i in STAT_NAME_LIST}
+
+
+def _export_uigf(conn: sqlite3.Connection, path: Path, info: Dict) -> int:
+    '''
+    逐条写入UIGF文件, 不需要把全部记录同时放在内存中
+    '''
+    num = 0
+    temp_path = path.with_suffix('.tmp')
+    with open(temp_path, 'w', encoding='UTF-8') as file:
+        file.write(f'{{"info": {json.dumps(info, ensure_ascii=False)}, ')
+        file.write('"list": [')
+        for gacha_name in GACHA_NAME_LIST:
+            for item in _iter_gachalogs(conn, gacha_name):
+                if item['gacha_type'] == '400':
+                    item['uigf_gacha_type'] = '301'
+                else:
+                    item['uigf_gacha_type'] = item['gacha_type']
+                if num:
+                    file.write(', ')
+                file.write(json.dumps(item, ensure_ascii=False))
+                num += 1
+        file.write(']}')
+    os.replace(temp_path, path)
+    return num
+
+
+async def get_gacha_ids(uid: str) -> Set[str]:
+    return await _run(_get_ids, uid)
+
+
+async def add_gachalogs(
+    uid: str, data: Dict[str, List[Dict]], data_time: str
+) -> Dict[str, int]:
+    '''
+    写入抽卡记录, 返回各卡池新增的数量
+
+    参数:
+        data: `Dict[str, List[Dict]]`
+            卡池名 -> 抽卡记录, 记录可以重复或已存在
+    '''
+    return await _run(_add_gachalogs, uid, data, data_time)
+
+
+async def load_gacha_stat(uid: str) -> Optional[Dict[str, GachaStat]]:
+    '''
+    读取写入时维护的各卡池统计数据, 不存在抽卡记录时返回None
+    '''
+    if not has_gachalogs(uid):
+        return None
+    return await _run(_load_gacha_stat, uid)
+
+
+async def export_uigf(uid: str, path: Path, info: Dict) -> int:
+    '''
+    导出UIGF格式的抽卡记录, 返回导出的记录数量
+    '''
+    return await _run(_export_uigf, uid, path, info)
@@ -11,11 +11,7 @@ from ..utils.resource.download_url import download
 from ..utils.resource.RESOURCE_PATH import CARD_PATH
 from ..utils.colors import sec_color, first_color, light_color
 from ..utils.fonts.genshin_fonts import gs_font_20, gs_font_36
-from ..utils.image.image_tools import (
-    get_color_bg,
-    get_qq_avatar,
-    draw_pic_with_ring,
-)
+from ..utils.image.image_tools import get_color_bg, get_ring_avatar
 
 TEXT_PATH = Path(__file__).parent / 'texture2d'
 
@@ -32,12 +28,7 @@ async def draw_deck_img(
     raw_data = raw_data['deck_list'][deck_id - 1]
     deck_name = raw_data['name']
     # 获取背景图片各项参数
-    _id = str(user_id)
-    if _id.startswith('http'):
-        char_pic = await get_qq_avatar(avatar_url=_id)
-    else:
-        char_pic = await get_qq_avatar(qid=user_id)
-    char_pic = await draw_pic_with_ring(char_pic, 320)
+    char_pic = await get_ring_avatar(user_id, 320)
 
     # 初始化图片
     img = await get_color_bg(950, 2300)
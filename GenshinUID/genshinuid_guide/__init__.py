@@ -35,7 +35,7 @@ async def send_bluekun_pic(bot: Bot, ev: Event):
     if ev.text in ['冰', '水', '火', '草', '雷', '风', '岩']:
         name = ev.text
     else:
-        name = await alias_to_char_name(ev.text)
+        name = alias_to_char_name(ev.text)
     img = REF_PATH / '{}.jpg'.format(name)
     if img.exists():
         img = await convert_img(img)
@@ -12,7 +12,7 @@ CARD_DATA = {}
 async def get_gs_card(msg: str) -> Optional[bytes]:
     if not msg:
         return None
-    msg = await alias_to_char_name(msg)
+    msg = alias_to_char_name(msg)
     if msg in CARD_DATA:
         img = CARD_DATA[msg]
     else:
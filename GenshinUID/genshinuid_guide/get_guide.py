@@ -7,7 +7,7 @@ from ..utils.map.name_covert import alias_to_char_name
 async def get_gs_guide(msg: str) -> Optional[bytes]:
     if not msg:
         return None
-    name = await alias_to_char_name(msg)
+    name = alias_to_char_name(msg)
     if name.startswith('旅行者'):
         name = f'{name[:3]}-{name[-1]}'
     img = GUIDE_PATH / f'{name}.png'
@@ -8,10 +8,10 @@ from gsuid_core.utils.image.convert import convert_img
 from gsuid_core.utils.api.ambr.request import get_ambr_icon
 from gsuid_core.utils.image.image_tools import get_color_bg
 
+from ..utils.map import GS_MAP_PATH
 from ..version import Genshin_version
 from .abyss_new_history import history_data
 from ..utils.resource.RESOURCE_PATH import TEXT2D_PATH, MONSTER_ICON_PATH
-from ..utils.map.GS_MAP_PATH import abyss_data, monster_data, ex_monster_data
 from ..utils.fonts.genshin_fonts import (
     gs_font_24,
     gs_font_26,
@@ -70,12 +70,12 @@ async def get_half_img(data: List, half: Literal['Upper', 'Lower']):
             real_id = '2' + real_id + '01'
             monster_num = monster['Num']
 
-            if real_id not in monster_data:
-                monster_name = ex_monster_data[real_id]['name']
-                icon_name = ex_monster_data[real_id]['icon']
+            if real_id not in GS_MAP_PATH.monster_data:
+                monster_name = GS_MAP_PATH.ex_monster_data[real_id]['name']
+                icon_name = GS_MAP_PATH.ex_monster_data[real_id]['icon']
             else:
-                monster_name = monster_data[real_id]['name']
-                icon_name = monster_data[real_id]['icon']
+                monster_name = GS_MAP_PATH.monster_data[real_id]['name']
+                icon_name = GS_MAP_PATH.monster_data[real_id]['icon']
 
             if 'Mark' in monster:
                 if monster['Mark']:
@@ -123,7 +123,7 @@ async def get_review_data(
     version: str = Genshin_version[:3], floor: str = '12'
 ):
     floor_data = history_data[version][floor]
-    data = abyss_data[floor_data]
+    data = GS_MAP_PATH.abyss_data[floor_data]
     floor_buff = data['Disorder']['CH'].replace('<b>', '').replace('</b>', '')
     floor_monster = data['Chambers']
 
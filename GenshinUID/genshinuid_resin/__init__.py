@@ -33,12 +33,13 @@ async def send_daily_info(bot: Bot, ev: Event):
 @sv_get_resin_admin.on_fullmatch(('强制推送体力提醒'))
 async def force_notice_job(bot: Bot, ev: Event):
     await bot.logger.info('开始执行[强制推送体力信息]')
-    await notice_job()
+    await notice_job(True)
 
 
-@scheduler.scheduled_job('cron', minute='*/30')
-async def notice_job():
-    result = await get_notice_list()
+# 每次只查询预计到达提醒阈值的用户, 见`notice.get_notice_list`
+@scheduler.scheduled_job('cron', minute='*/5')
+async def notice_job(force: bool = False):
+    result = await get_notice_list(force)
     logger.info('[推送检查]完成!等待消息推送中...')
     logger.debug(result)
 
@@ -1,7 +1,6 @@
-import json
 import asyncio
 from pathlib import Path
-from typing import Union
+from typing import Dict, List, Union
 
 from PIL import Image, ImageDraw
 from gsuid_core.logger import logger
@@ -10,14 +9,16 @@ from gsuid_core.utils.error_reply import get_error_img
 from gsuid_core.utils.database.models import GsBind, GsUser
 
 from ..utils.mys_api import mys_api
+from ..utils.image.render import run_render
 from ..utils.api.mys.models import FakeResin
 from ..utils.image.convert import convert_img
+from ..utils.player_store import get_player_raw
 from ..genshinuid_config.gs_config import gsconfig
-from ..genshinuid_enka.to_data import get_enka_info
+from ..genshinuid_enka.to_data import get_enka_data
 from ..utils.resource.download_url import download_file
+from ..utils.resource.RESOURCE_PATH import CHAR_SIDE_TEMP_PATH
 from ..utils.api.mys.models import Expedition as WidgetExpedition
 from ..utils.api.mys.models import Transformer, WidgetResin, RecoveryTime
-from ..utils.resource.RESOURCE_PATH import PLAYER_PATH, CHAR_SIDE_TEMP_PATH
 from ..utils.fonts.genshin_fonts import (
     gs_font_20,
     gs_font_26,
@@ -57,7 +58,7 @@ async def _draw_task_img(
             13,
             char_temp,
         )
-    # avatar_id = await enName_to_avatarId(char_en_name)
+    # avatar_id = enName_to_avatarId(char_en_name)
     char_pic = (
         Image.open(side_path)
         .convert('RGBA')
@@ -99,15 +100,13 @@ async def get_resin_img(bot_id: str, user_id: str):
         logger.info('[每日信息]可用UID: {}'.format(useable_uid_list))
         if len(useable_uid_list) == 0:
             return '请先绑定一个可用CK & UID再来查询哦~'
-        # 开始绘图任务
-        task = []
-        img = Image.new(
-            'RGBA', (700 * len(useable_uid_list), 1200), (0, 0, 0, 0)
+        # 获取数据后再开始绘图任务
+        data_list = await asyncio.gather(
+            *[get_resin_data(uid) for uid in useable_uid_list]
+        )
+        res = await run_render(
+            '每日信息', _draw_resin_card, useable_uid_list, data_list
         )
-        for uid_index, uid in enumerate(useable_uid_list):
-            task.append(_draw_all_resin_img(img, uid, uid_index))
-        await asyncio.gather(*task)
-        res = await convert_img(img)
         logger.info('[查询每日信息]绘图已完成,等待发送!')
     except TypeError:
         logger.exception('[查询每日信息]绘图失败!')
@@ -116,8 +115,22 @@ async def get_resin_img(bot_id: str, user_id: str):
     return res
 
 
-async def _draw_all_resin_img(img: Image.Image, uid: str, index: int):
-    resin_img = await draw_resin_img(uid)
+async def _draw_resin_card(
+    uid_list: List[str], data_list: List[Union[Dict, int]]
+) -> bytes:
+    task = []
+    img = Image.new('RGBA', (700 * len(uid_list), 1200), (0, 0, 0, 0))
+    for uid_index, uid in enumerate(uid_list):
+        data = data_list[uid_index]
+        task.append(_draw_all_resin_img(img, uid, data, uid_index))
+    await asyncio.gather(*task)
+    return await convert_img(img)
+
+
+async def _draw_all_resin_img(
+    img: Image.Image, uid: str, data: Union[Dict, int], index: int
+):
+    resin_img = await draw_resin_img(uid, data)
     img.paste(resin_img, (700 * index, 0), resin_img)
 
 
@@ -160,14 +173,14 @@ async def draw_bar(
     return bar
 
 
-async def draw_resin_img(uid: str) -> Image.Image:
-    img = Image.open(TEXT_PATH / 'bg.png')
-
-    # 获取数据
+async def get_resin_data(uid: str) -> Union[Dict, int]:
+    '''
+    获取绘制单个UID每日信息所需的数据, 失败时返回错误码
+    '''
     if use_widget and int(str(uid)[0]) <= 5:
         _daily_data = await mys_api.get_widget_resin_data(uid)
         if isinstance(_daily_data, int):
-            return Image.open(await get_error_img(_daily_data))
+            return _daily_data
         daily_data = transform_fake_resin(_daily_data)
         data_res = '当前数据源：小组件 （可能存在数据不准、数据缺失）'
         warn = '数据未知...'
@@ -176,7 +189,7 @@ async def draw_resin_img(uid: str) -> Image.Image:
     else:
         daily_data = await mys_api.get_daily_data(uid)
         if isinstance(daily_data, int):
-            return Image.open(await get_error_img(daily_data))
+            return daily_data
         data_res = '当前数据源：战绩'
         warn = '未知情况'
 
@@ -186,16 +199,33 @@ async def draw_resin_img(uid: str) -> Image.Image:
         else:
             is_sign = 'ok' if sign_info['is_sign'] else 'no'
 
-    enta_data_path = PLAYER_PATH / uid / 'rawData.json'
-    if enta_data_path.exists():
-        with open(enta_data_path, 'r', encoding='utf-8') as f:
-            player_data = json.load(f)
-    else:
+    player_data = await get_player_raw(uid)
+    if player_data is None:
         try:
-            player_data = await get_enka_info(uid)
+            player_data = await get_enka_data(uid)
         except Exception:
             player_data = {}
 
+    return {
+        'daily_data': daily_data,
+        'player_data': player_data,
+        'is_sign': is_sign,
+        'data_res': data_res,
+        'warn': warn,
+    }
+
+
+async def draw_resin_img(uid: str, data: Union[Dict, int]) -> Image.Image:
+    if isinstance(data, int):
+        return Image.open(await get_error_img(data))
+
+    img = Image.open(TEXT_PATH / 'bg.png')
+    daily_data = data['daily_data']
+    player_data = data['player_data']
+    is_sign = data['is_sign']
+    data_res = data['data_res']
+    warn = data['warn']
+
     # 处理数据
     if player_data and 'playerInfo' in player_data:
         name = player_data['playerInfo']['nickname']
@@ -1,4 +1,7 @@
-from typing import Dict
+import time
+import heapq
+import asyncio
+from typing import Dict, List, Tuple
 
 from gsuid_core.gss import gss
 from gsuid_core.logger import logger
@@ -17,30 +20,154 @@ NOTICE = {
     'transform': f'你的质变仪即将可使用！{MR_NOTICE}',
 }
 
+# 恢复一点树脂需要的秒数
+RESIN_SECOND = 480
+# 两次查询的最短和最长间隔, 消耗树脂、重新派遣等无法预测的变化最迟在一小时后发现
+MIN_INTERVAL = 300
+MAX_INTERVAL = 3600
+# 查询失败后的重试间隔
+RETRY_INTERVAL = 1800
+# 同时查询便笺的用户数量
+NOTICE_WORKERS = 4
 
-async def get_notice_list() -> Dict[str, Dict[str, Dict]]:
+# 按预计到达提醒阈值的时间排序的(时间戳, uid)
+NOTICE_QUEUE: List[Tuple[float, str]] = []
+# uid -> 下次查询时间, 与之不一致的队列条目已经失效
+NOTICE_DUE: Dict[str, float] = {}
+
+
+def schedule(uid: str, due: float):
+    NOTICE_DUE[uid] = due
+    heapq.heappush(NOTICE_QUEUE, (due, uid))
+
+
+def pop_due_uid(now: float) -> List[str]:
+    uid_list = []
+    while NOTICE_QUEUE and NOTICE_QUEUE[0][0] <= now:
+        due, uid = heapq.heappop(NOTICE_QUEUE)
+        if NOTICE_DUE.get(uid) == due:
+            uid_list.append(uid)
+    return uid_list
+
+
+async def get_notice_list(force: bool = False) -> Dict[str, Dict[str, Dict]]:
+    '''
+    只查询预计已经到达提醒阈值的用户, `force`为True时查询全部用户
+    '''
     msg_dict: Dict[str, Dict[str, Dict]] = {}
-    for bot_id in gss.active_bot:
-        user_list = await GsUser.get_all_push_user_list()
-        for user in user_list:
-            if user.uid is None:
-                continue
-            raw_data = await mys_api.get_daily_data(user.uid)
+    if not gss.active_bot:
+        return msg_dict
+
+    now = time.time()
+    user_dict: Dict[str, List[GsUser]] = {}
+    for user in await GsUser.get_all_push_user_list():
+        if user.uid is None:
+            continue
+        if user.uid not in user_dict:
+            user_dict[user.uid] = []
+        user_dict[user.uid].append(user)
+    for uid in list(NOTICE_DUE):
+        if uid not in user_dict:
+            del NOTICE_DUE[uid]
+    for uid in user_dict:
+        if force or uid not in NOTICE_DUE:
+            schedule(uid, now)
+
+    uid_list = pop_due_uid(now)
+    logger.info(f'[推送检查] 本次查询{len(uid_list)}/{len(user_dict)}个用户')
+    # (uid, bot_id) -> 需要更新的推送状态, 全部查询完成后统一写入
+    updates: Dict[Tuple[str, str], Dict[str, str]] = {}
+    semaphore = asyncio.Semaphore(NOTICE_WORKERS)
+
+    async def _poll_uid(uid: str):
+        async with semaphore:
+            raw_data = await mys_api.get_daily_data(uid)
             if isinstance(raw_data, int):
-                logger.error(f'[推送提醒]获取{user.uid}的数据失败!')
-                continue
-            push_data = await GsPush.select_data_by_uid(user.uid)
-            msg_dict = await all_check(
+                logger.error(f'[推送提醒]获取{uid}的数据失败!')
+                schedule(uid, time.time() + RETRY_INTERVAL)
+                return
+            push_data = (await GsPush.select_data_by_uid(uid)).__dict__
+        for user in user_dict[uid]:
+            await all_check(
                 user.bot_id,
                 raw_data,
-                push_data.__dict__,
+                push_data,
                 msg_dict,
                 user.user_id,
-                user.uid,
+                uid,
+                updates,
             )
+        schedule(uid, time.time() + get_next_interval(raw_data, push_data))
+
+    async def _check_uid(uid: str):
+        try:
+            await _poll_uid(uid)
+        except Exception as e:
+            # 该uid的队列条目已经取出, 出错时也要重新加入队列
+            logger.exception(f'[推送提醒]检查{uid}时出错: {e}')
+            schedule(uid, time.time() + RETRY_INTERVAL)
+
+    # 单个用户出错不影响其他用户的推送状态写入
+    await asyncio.gather(
+        *[_check_uid(uid) for uid in uid_list], return_exceptions=True
+    )
+    for (uid, bot_id), data in updates.items():
+        await GsPush.update_data_by_uid(uid, bot_id, None, **data)
     return msg_dict
 
 
+def get_next_interval(raw_data: DailyNoteData, push_data: Dict) -> float:
+    '''
+    计算距离下一个需要提醒的阈值还有多少秒
+    '''
+    interval = MAX_INTERVAL
+    for mode in NOTICE:
+        # 已经提醒过或不需要提醒的项目, 只需按最长间隔检查状态变化
+        if push_data[f'{mode}_is_push'] == 'on':
+            continue
+        if push_data[f'{mode}_push'] == 'off':
+            continue
+        remain = predict(mode, raw_data, push_data[f'{mode}_value'])
+        interval = min(interval, remain)
+    return max(interval, MIN_INTERVAL)
+
+
+def predict(mode: str, data: DailyNoteData, limit: int) -> float:
+    '''
+    由本次查询的数据推算`check`在多少秒后成立, 无法推算时返回最长间隔
+    '''
+    if mode == 'coin':
+        current = data['current_home_coin']
+        max_coin = data['max_home_coin']
+        recovery_time = int(data['home_coin_recovery_time'])
+        if current >= min(limit, max_coin):
+            return 0
+        if recovery_time <= 0:
+            return MAX_INTERVAL
+        # 按当前洞天的产出速度线性推算
+        speed = (max_coin - current) / recovery_time
+        return (min(limit, max_coin) - current) / speed
+    if mode == 'resin':
+        max_resin = data['max_resin']
+        recovery_time = int(data['resin_recovery_time'])
+        remain = max_resin - min(limit, max_resin)
+        return max(recovery_time - remain * RESIN_SECOND, 0)
+    if mode == 'go':
+        remain_list = []
+        for i in data['expeditions']:
+            if i['status'] != 'Ongoing':
+                return 0
+            remain_list.append(int(i['remained_time']) - limit * 60)
+        return max(min(remain_list, default=MAX_INTERVAL), 0)
+    if mode == 'transform':
+        if not data['transformer']['obtained']:
+            return MAX_INTERVAL
+        recovery = data['transformer']['recovery_time']
+        time_min = (recovery['Day'] * 24 + recovery['Hour']) * 60
+        return max(time_min + recovery['Minute'] - limit, 0) * 60
+    return MAX_INTERVAL
+
+
 async def all_check(
     bot_id: str,
     raw_data: DailyNoteData,
@@ -48,15 +175,25 @@ async def all_check(
     msg_dict: Dict[str, Dict[str, Dict]],
     user_id: str,
     uid: str,
+    updates: Dict[Tuple[str, str], Dict[str, str]],
 ) -> Dict[str, Dict[str, Dict]]:
+    '''
+    检查各项是否需要提醒, 推送状态的变化同时写入`push_data`和`updates`
+    '''
+
+    def _update(mode: str, value: str):
+        push_data[f'{mode}_is_push'] = value
+        key = (uid, bot_id)
+        if key not in updates:
+            updates[key] = {}
+        updates[key][f'{mode}_is_push'] = value
+
     for mode in NOTICE.keys():
         # 检查条件
         if push_data[f'{mode}_is_push'] == 'on':
             if not gsconfig.get_config('CrazyNotice').data:
                 if not await check(mode, raw_data, push_data[f'{mode}_value']):
-                    await GsPush.update_data_by_uid(
-                        uid, bot_id, None, **{f'{mode}_is_push': 'off'}
-                    )
+                    _update(mode, 'off')
             continue
         # 准备推送
         if await check(mode, raw_data, push_data[f'{mode}_value']):
@@ -74,9 +211,7 @@ async def all_check(
                         msg_dict[bot_id]['direct'][user_id] = NOTICE[mode]
                     else:
                         msg_dict[bot_id]['direct'][user_id] += NOTICE[mode]
-                    await GsPush.update_data_by_uid(
-                        uid, bot_id, None, **{f'{mode}_is_push': 'on'}
-                    )
+                    _update(mode, 'on')
                 # 群号推送到群聊
                 else:
                     # 初始化
@@ -88,9 +223,7 @@ async def all_check(
                         msg_dict[bot_id]['group'][gid][user_id] = NOTICE[mode]
                     else:
                         msg_dict[bot_id]['group'][gid][user_id] += NOTICE[mode]
-                    await GsPush.update_data_by_uid(
-                        uid, bot_id, None, **{f'{mode}_is_push': 'on'}
-                    )
+                    _update(mode, 'on')
     return msg_dict
 
 
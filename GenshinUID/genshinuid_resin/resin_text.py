@@ -55,8 +55,8 @@ async def get_resin_text(uid: str) -> Union[str, bytes]:
         for expedition in dailydata['expeditions']:
             avatar: str = expedition['avatar_side_icon'][89:-4]
             try:
-                avatar_name: str = await enName_to_avatarId(avatar)
-                avatar_name: str = await avatar_id_to_name(avatar_name)
+                avatar_name: str = enName_to_avatarId(avatar)
+                avatar_name: str = avatar_id_to_name(avatar_name)
             except KeyError:
                 avatar_name: str = avatar
 
@@ -1,6 +1,6 @@
 import asyncio
 from pathlib import Path
-from typing import Union
+from typing import Dict, List, Union
 
 from PIL import Image, ImageDraw
 from gsuid_core.logger import logger
@@ -8,6 +8,7 @@ from gsuid_core.utils.error_reply import get_error_img
 from gsuid_core.utils.api.mys.models import MihoyoAvatar
 
 from ..utils.mys_api import mys_api
+from ..utils.image.render import run_render
 from ..utils.image.convert import convert_img
 from ..utils.resource.download_url import download_file
 from ..utils.fonts.genshin_fonts import genshin_font_origin
@@ -158,6 +159,10 @@ async def draw_pic(uid: str) -> Union[str, bytes]:
         )
     )
 
+    return await run_render('查询角色信息', _draw_pic, uid, raw_data, char_datas)
+
+
+async def _draw_pic(uid: str, raw_data: Dict, char_datas: List[Dict]) -> bytes:
     # 确定角色占用行数
     char_num = len(char_datas)
     char_hang = (
@@ -11,6 +11,7 @@ from gsuid_core.utils.error_reply import UID_HINT
 from gsuid_core.utils.database.models import GsBind
 
 from .sign import sign_in, daily_sign
+from .sign_pool import get_sign_progress
 from ..genshinuid_config.gs_config import gsconfig
 
 SIGN_TIME = gsconfig.get_config('SignTime').data
@@ -45,6 +46,11 @@ async def recheck(bot: Bot, ev: Event):
     await bot.send('执行完成')
 
 
+@sv_sign_config.on_fullmatch('签到进度')
+async def get_sign_progress_func(bot: Bot, ev: Event):
+    await bot.send(get_sign_progress())
+
+
 async def send_daily_sign():
     logger.info('开始执行[每日全部签到]')
     # 执行签到 并获得推送消息
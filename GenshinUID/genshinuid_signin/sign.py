@@ -1,5 +1,6 @@
 import random
 import asyncio
+from typing import Tuple
 from copy import deepcopy
 
 from gsuid_core.gss import gss
@@ -10,25 +11,38 @@ from gsuid_core.utils.plugins_config.gs_config import core_plugins_config
 
 from ..utils.mys_api import mys_api
 from ..genshinuid_config.gs_config import gsconfig
+from .sign_pool import SignRiskError, limit, run_sign_pool
 
 private_msg_list = {}
 group_msg_list = {}
-already = 0
+# 需要验证码等风控相关的错误码, 全部签到时稍后重试
+RISK_RETCODE = [1034, 10035]
 
 
 # 签到函数
-async def sign_in(uid: str) -> str:
+async def sign_in(
+    uid: str, raise_risk: bool = False, rate_limit: bool = False
+) -> str:
+    '''
+    `raise_risk`为True时, 触发风控不直接返回失败消息, 而是抛出`SignRiskError`
+
+    `rate_limit`为True时, 请求前按接口限速, 仅用于全部签到队列
+    '''
+
+    async def _limit(endpoint: str):
+        if rate_limit:
+            await limit(endpoint)
+
     logger.info(f'[签到] {uid} 开始执行签到')
     # 获得签到信息
+    await _limit('sign_info')
     sign_info = await mys_api.get_sign_info(uid)
     # 初步校验数据
     if isinstance(sign_info, int):
-        return await sign_error(uid, sign_info)
+        return await sign_error(uid, sign_info, raise_risk)
     # 检测是否已签到
     if sign_info['is_sign']:
         logger.info(f'[签到] {uid} 该用户今日已签到,跳过...')
-        global already
-        already += 1
         day_of_month = int(sign_info['today'].split('-')[-1])
         signed_count = int(sign_info['total_sign_day'])
         sign_missed = day_of_month - signed_count
@@ -38,10 +52,11 @@ async def sign_in(uid: str) -> str:
     Header = {}
     for index in range(4):
         # 进行一次签到
+        await _limit('sign')
         sign_data = await mys_api.mys_sign(uid=uid, header=Header)
         # 检测数据
         if isinstance(sign_data, int):
-            return await sign_error(uid, sign_data)
+            return await sign_error(uid, sign_data, raise_risk)
         if 'risk_code' in sign_data:
             # 出现校验码
             if sign_data['risk_code'] == 375:
@@ -63,7 +78,10 @@ async def sign_in(uid: str) -> str:
                     continue
                 else:
                     logger.info('配置文件暂未开启[跳过无感验证],结束本次任务...')
-                return '签到失败...出现验证码!'
+                im = '签到失败...出现验证码!'
+                if raise_risk:
+                    raise SignRiskError(im)
+                return im
             # 成功签到!
             else:
                 if index == 0:
@@ -78,14 +96,19 @@ async def sign_in(uid: str) -> str:
         else:
             # 重试超过阈值
             logger.warning('[签到] 超过请求阈值...')
-            return '签到失败...出现验证码!\n请过段时间使用[签到]或由管理员[全部重签]或手动至米游社进行签到！'
+            im = '签到失败...出现验证码!\n请过段时间使用[签到]或由管理员[全部重签]或手动至米游社进行签到！'
+            if raise_risk:
+                raise SignRiskError(im)
+            return im
     # 签到失败
     else:
         im = '签到失败!'
         logger.warning(f'[签到] {uid} 签到失败, 结果: {im}')
         return im
     # 获取签到列表
+    await _limit('sign_list')
     sign_list = await mys_api.get_sign_list(uid)
+    await _limit('sign_info')
     new_sign_info = await mys_api.get_sign_info(uid)
 
     if isinstance(sign_list, int):
@@ -110,18 +133,27 @@ async def sign_in(uid: str) -> str:
     return im
 
 
-async def sign_error(uid: str, retcode: int) -> str:
+async def sign_error(uid: str, retcode: int, raise_risk: bool = False) -> str:
     error_msg = get_error(retcode)
     logger.warning(f'[签到] {uid} 出错, 错误码{retcode}, 错误消息{error_msg}!')
     if retcode == 10001 or retcode == -100:
         ck = await GsUser.get_user_cookie_by_uid(uid)
         if ck:
             await GsUser.update_data_by_uid_without_bot_id(uid, status='error')
+    if raise_risk and retcode in RISK_RETCODE:
+        raise SignRiskError(f'签到失败!{error_msg}')
     return f'签到失败!{error_msg}'
 
 
-async def single_daily_sign(bot_id: str, uid: str, gid: str, qid: str):
-    im = await sign_in(uid)
+def is_sign_failed(im: str) -> bool:
+    return im.startswith(('签到失败', '网络有点忙', 'OK', 'ok'))
+
+
+async def add_sign_result(task: Tuple[str, str, str, str], im: str) -> bool:
+    '''
+    将签到结果加入推送列表, 返回是否签到成功
+    '''
+    bot_id, uid, gid, qid = task
     if gid == 'on':
         if qid not in private_msg_list:
             private_msg_list[qid] = []
@@ -138,7 +170,7 @@ async def single_daily_sign(bot_id: str, uid: str, gid: str, qid: str):
         # 检查是否开启简洁签到
         if gsconfig.get_config('SignReportSimple').data:
             # 如果失败, 则添加到推送列表
-            if im.startswith(('签到失败', '网络有点忙', 'OK', 'ok')):
+            if is_sign_failed(im):
                 message = f'[CQ:at,qq={qid}] {im}'
                 group_msg_list[gid]['failed'] += 1
                 group_msg_list[gid]['push_message'] += '\n' + message
@@ -150,38 +182,26 @@ async def single_daily_sign(bot_id: str, uid: str, gid: str, qid: str):
             message = f'[CQ:at,qq={qid}] {im}'
             group_msg_list[gid]['push_message'] += '\n' + message
             group_msg_list[gid]['success'] -= 1
+    return not is_sign_failed(im)
+
+
+async def single_daily_sign(task: Tuple[str, str, str, str]) -> bool:
+    im = await sign_in(task[1], raise_risk=True, rate_limit=True)
+    return await add_sign_result(task, im)
 
 
 async def daily_sign():
-    global already
-    tasks = []
-    for BOT_ID in gss.active_bot:
+    # 同一用户只签到一次, 不再按在线的Bot重复读取和签到
+    task_list = []
+    if gss.active_bot:
         user_list = await GsUser.get_all_user()
-        uid_list = [
-            user.uid
+        task_list = [
+            (user.bot_id, user.uid, user.sign_switch, user.user_id)
             for user in user_list
             if user.sign_switch != 'off' and not user.status and user.uid
         ]
-        logger.info(f'[全部重签][UID列表] {uid_list}')
-        for user in user_list:
-            if user.sign_switch != 'off' and not user.status and user.uid:
-                tasks.append(
-                    single_daily_sign(
-                        user.bot_id, user.uid, user.sign_switch, user.user_id
-                    )
-                )
-            if len(tasks) >= 1:
-                await asyncio.gather(*tasks)
-                if already >= 1:
-                    delay = 1
-                else:
-                    delay = 50 + random.randint(3, 45)
-                logger.info(f'[签到] 已签到{len(tasks)}个用户, 等待{delay}秒进行下一次签到')
-                tasks.clear()
-                already = 0
-                await asyncio.sleep(delay)
-    await asyncio.gather(*tasks)
-    tasks.clear()
+    logger.info(f'[全部重签][UID列表] {[task[1] for task in task_list]}')
+    await run_sign_pool(task_list, single_daily_sign, add_sign_result)
     result = {
         'private_msg_list': deepcopy(private_msg_list),
         'group_msg_list': deepcopy(group_msg_list),
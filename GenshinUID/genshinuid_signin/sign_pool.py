@@ -0,0 +1,217 @@
+import time
+import random
+import asyncio
+from typing import Any, Set, Dict, List, Callable, Optional, Awaitable
+
+from gsuid_core.logger import logger
+
+from ..genshinuid_config.gs_config import gsconfig
+
+# 触发风控后的重试次数和基础等待秒数, 每次重试等待时间翻倍并加上随机抖动
+MAX_RETRY = 3
+RETRY_DELAY = 120
+
+
+class SignRiskError(Exception):
+    '''
+    签到触发风控(验证码等), 由签到队列稍后重试
+    '''
+
+    def __init__(self, msg: str):
+        super().__init__(msg)
+        self.msg = msg
+
+
+class TokenBucket:
+    '''
+    令牌桶, 限制对同一接口的请求频率
+
+    参数:
+        rate: `float`
+            每秒补充的令牌数
+        capacity: `float`
+            最多累积的令牌数, 即允许的突发请求数
+    '''
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        # 在事件循环中首次使用时创建, 兼容py3.8
+        self.lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self):
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate,
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _get_int_config(name: str, default: int) -> int:
+    try:
+        return max(int(gsconfig.get_config(name).data), 1)
+    except ValueError:
+        return default
+
+
+# 接口名 -> 令牌桶
+SIGN_BUCKETS: Dict[str, TokenBucket] = {}
+
+
+def get_bucket(endpoint: str) -> TokenBucket:
+    if endpoint not in SIGN_BUCKETS:
+        if endpoint == 'sign':
+            # 实际签到接口最容易触发风控, 按配置限速
+            rate = _get_int_config('SignRate', 4) / 60
+        else:
+            rate = 1
+        SIGN_BUCKETS[endpoint] = TokenBucket(rate)
+    return SIGN_BUCKETS[endpoint]
+
+
+async def limit(endpoint: str):
+    await get_bucket(endpoint).acquire()
+
+
+class SignProgress:
+    def __init__(self, total: int):
+        self.total = total
+        self.success = 0
+        self.failed = 0
+        self.retry = 0
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+
+    @property
+    def done(self) -> int:
+        return self.success + self.failed
+
+    @property
+    def remain(self) -> int:
+        return self.total - self.done
+
+    def get_eta(self) -> Optional[float]:
+        if self.end_time is not None:
+            return 0
+        if self.done == 0:
+            return None
+        cost = time.time() - self.start_time
+        return cost / self.done * self.remain
+
+    def to_msg(self) -> str:
+        start = time.strftime('%H:%M:%S', time.localtime(self.start_time))
+        if self.end_time is None:
+            state = '进行中'
+            eta = self.get_eta()
+            eta_msg = '计算中' if eta is None else f'{int(eta // 60)}分钟'
+        else:
+            state = '已完成'
+            cost = self.end_time - self.start_time
+            eta_msg = f'无, 共耗时{int(cost // 60)}分钟'
+        return (
+            f'[每日全部签到] {state}, 开始于{start}\n'
+            f'总数: {self.total}\n'
+            f'完成: {self.done} (成功{self.success}, 失败{self.failed})\n'
+            f'剩余: {self.remain}\n'
+            f'风控重试: {self.retry}次\n'
+            f'预计剩余时间: {eta_msg}'
+        )
+
+
+SIGN_PROGRESS: Optional[SignProgress] = None
+# 保存等待重试的任务, 避免被垃圾回收
+RETRY_TASKS: Set[asyncio.Task] = set()
+
+
+def get_sign_progress() -> str:
+    if SIGN_PROGRESS is None:
+        return '今日还没有执行过全部签到任务~'
+    return SIGN_PROGRESS.to_msg()
+
+
+async def run_sign_pool(
+    task_list: List[Any],
+    func: Callable[[Any], Awaitable[bool]],
+    on_fail: Callable[[Any, str], Awaitable[Any]],
+):
+    '''
+    以配置的并发数执行全部签到任务
+
+    参数:
+        task_list: `List[Any]`
+            任务参数列表, 依次传给`func`
+        func: `Callable[[Any], Awaitable[bool]]`
+            执行单个任务, 返回是否成功, 触发风控时抛出`SignRiskError`
+        on_fail: `Callable[[Any, str], Awaitable[Any]]`
+            重试次数用尽时调用, 传入任务参数和失败消息
+    '''
+    global SIGN_PROGRESS
+    progress = SIGN_PROGRESS = SignProgress(len(task_list))
+    queue: asyncio.Queue = asyncio.Queue()
+    for task in task_list:
+        queue.put_nowait((task, 0))
+
+    async def _retry(task: Any, retry: int, delay: float):
+        await asyncio.sleep(delay)
+        queue.put_nowait((task, retry))
+        # 重新入队后才标记完成, 保证queue.join()等待重试
+        queue.task_done()
+
+    async def _on_fail(task: Any, msg: str):
+        try:
+            await on_fail(task, msg)
+        except Exception as e:
+            logger.exception(f'[每日全部签到] 处理签到失败出错: {e}')
+
+    async def _worker():
+        while True:
+            task, retry = await queue.get()
+            # 重试的任务由_retry在重新入队后标记完成
+            done = True
+            try:
+                if await func(task):
+                    progress.success += 1
+                else:
+                    progress.failed += 1
+            except SignRiskError as e:
+                if retry < MAX_RETRY:
+                    delay = RETRY_DELAY * 2**retry + random.uniform(0, 60)
+                    logger.info(
+                        f'[每日全部签到] 触发风控, ' f'{delay:.0f}秒后第{retry + 1}次重试'
+                    )
+                    progress.retry += 1
+                    retry_task = asyncio.create_task(
+                        _retry(task, retry + 1, delay)
+                    )
+                    RETRY_TASKS.add(retry_task)
+                    retry_task.add_done_callback(RETRY_TASKS.discard)
+                    done = False
+                else:
+                    progress.failed += 1
+                    await _on_fail(task, e.msg)
+            except Exception as e:
+                logger.exception(f'[每日全部签到] 签到出错: {e}')
+                progress.failed += 1
+            finally:
+                if done:
+                    queue.task_done()
+
+    workers = [
+        asyncio.create_task(_worker())
+        for _ in range(_get_int_config('SignWorkers', 4))
+    ]
+    await queue.join()
+    for worker in workers:
+        worker.cancel()
+    progress.end_time = time.time()
@@ -72,7 +72,7 @@ async def send_weapon(bot: Bot, ev: Event):
 @sv_wiki_text.on_prefix(('角色天赋', '查天赋'))
 async def send_talents(bot: Bot, ev: Event):
     name = ''.join(re.findall('[\u4e00-\u9fa5]', ev.text))
-    name = await alias_to_char_name(name)
+    name = alias_to_char_name(name)
     num = re.findall(r'\d+', ev.text)
     if len(num) == 1:
         im = await talent_wiki(name, int(num[0]))
@@ -86,7 +86,7 @@ async def send_talents(bot: Bot, ev: Event):
 @sv_wiki_text.on_prefix(('角色介绍', '角色资料', '查角色'))
 async def send_char(bot: Bot, ev: Event):
     name = ''.join(re.findall('[\u4e00-\u9fa5]', ev.text))
-    name = await alias_to_char_name(name)
+    name = alias_to_char_name(name)
     level = re.findall(r'\d+', ev.text)
     if len(level) == 1:
         im = await char_stats_wiki(name, int(level[0]))
@@ -97,7 +97,7 @@ async def send_char(bot: Bot, ev: Event):
 
 @sv_wiki_text.on_prefix(('角色材料'))
 async def send_char_cost(bot: Bot, ev: Event):
-    name = await alias_to_char_name(ev.text)
+    name = alias_to_char_name(ev.text)
     if gsconfig.get_config('PicWiki').data:
         im = await get_char_cost_wiki_img(name)
     else:
@@ -119,7 +119,7 @@ async def send_polar(bot: Bot, ev: Event):
     m = ''.join(re.findall('[\u4e00-\u9fa5]', ev.text))
     num_re = re.findall(r'\d+', ev.text)
 
-    m = await alias_to_char_name(m)
+    m = alias_to_char_name(m)
 
     if num_re:
         num = int(num_re[0])
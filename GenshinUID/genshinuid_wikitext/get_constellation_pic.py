@@ -172,7 +172,7 @@ async def draw_constellation_wiki_img(
 
     desc = await str_lenth(char_data['description'], 18, 350)
 
-    avatar_id = await name_to_avatar_id(data['name'])
+    avatar_id = name_to_avatar_id(data['name'])
     char_img = Image.open(CHAR_PATH / f'{avatar_id}.png')
     icon = await draw_pic_with_ring(char_img, 148)
     img.paste(icon, (40, 77), icon)
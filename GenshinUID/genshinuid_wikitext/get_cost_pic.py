@@ -130,7 +130,7 @@ async def draw_char_cost_img(data: Character, talent_data: CharacterTalents):
 
     desc = await str_lenth(data['description'], 18, 341)
 
-    avatar_id = await name_to_avatar_id(data['name'])
+    avatar_id = name_to_avatar_id(data['name'])
     char_img = Image.open(CHAR_PATH / f'{avatar_id}.png')
     icon = await draw_pic_with_ring(char_img, 222)
     img.paste(icon, (80, 90), icon)
@@ -3,8 +3,8 @@ from typing import Union
 
 from PIL import Image, ImageDraw
 
+from ..utils.map import GS_MAP_PATH
 from ..utils.image.convert import convert_img
-from ..utils.map.GS_MAP_PATH import artifact2attr
 from ..utils.image.image_tools import get_color_bg, draw_pic_with_ring
 from ..utils.resource.generate_char_card import create_single_item_card
 from .get_all_char_data import get_abyssinfo_data, get_akasha_char_data
@@ -36,8 +36,8 @@ rank_dict = {
 
 
 async def draw_char_abyss_info(char_name: str) -> Union[bytes, str]:
-    char_name = await alias_to_char_name(char_name)
-    char_id = await name_to_avatar_id(char_name)
+    char_name = alias_to_char_name(char_name)
+    char_id = name_to_avatar_id(char_name)
     abyss_info = await get_abyssinfo_data()
 
     # _char_id = char_id[1:].lstrip('0')
@@ -159,8 +159,8 @@ async def draw_char_abyss_info(char_name: str) -> Union[bytes, str]:
         item_list = []
         item_type = 0
         for set in equip['set_list']:
-            for part in artifact2attr:
-                if artifact2attr[part] == set['name']:
+            for part in GS_MAP_PATH.artifact2attr:
+                if GS_MAP_PATH.artifact2attr[part] == set['name']:
                     part_name = part
                     break
             else:
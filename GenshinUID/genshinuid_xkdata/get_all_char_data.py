@@ -64,8 +64,8 @@ async def get_akasha_char_data(
         abyss_rank: AKaShaRank = json.loads(await f.read())
         useage_rank = abyss_rank['usage_list']
 
-    char_name = await alias_to_char_name(char_name)
-    char_id = await name_to_avatar_id(char_name)
+    char_name = alias_to_char_name(char_name)
+    char_id = name_to_avatar_id(char_name)
 
     if not char_id:
         return None
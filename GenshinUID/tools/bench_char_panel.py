@@ -0,0 +1,104 @@
+'''
+对比原先每次绘制角色面板时重新合成背景、遮罩和char_info_2,
+与现在按(颜色, 高度)预先合成静态图层后只粘贴立绘的耗时,
+并检查两种方式的结果逐像素一致
+
+python bench_char_panel.py
+'''
+
+import sys
+import math
+import time
+import random
+import asyncio
+from pathlib import Path
+from typing import Any, Callable, Awaitable
+
+from PIL import Image, ImageChops
+
+sys.path.append(str(Path(__file__).parents[5]))
+sys.path.append(str(Path(__file__).parents[2]))
+__package__ = 'GenshinUID.tools'
+from ..genshinuid_enka import draw_normal  # noqa: E402
+from ..utils.image.texture import clear_texture_cache  # noqa: E402
+
+R_PATH = Path(__file__).parents[1]
+TEXT_PATH = R_PATH / 'genshinuid_enka' / 'texture2D'
+BG_PATH = R_PATH / 'utils' / 'image' / 'bg' / 'nm_bg' / 'zy.jpg'
+# 伤害行数, 决定面板高度
+DMG_LEN_LIST = [4, 6, 8]
+ROUND = 20
+
+
+def get_char_img() -> Image.Image:
+    '''
+    生成带半透明边缘的立绘, 尺寸与get_char_img的结果相同
+    '''
+    random.seed(0)
+    img = Image.open(BG_PATH).convert('RGBA').resize((600, 1200))
+    mask = Image.new('L', img.size)
+    mask.putdata([random.randint(0, 255) for _ in range(600 * 1200)])
+    char_img = Image.new('RGBA', img.size, (0, 0, 0, 0))
+    char_img.paste(img, (0, 0), mask)
+    return char_img
+
+
+def old_panel_bg(
+    char_element: str, ex_len: int, char_img: Image.Image
+) -> Image.Image:
+    img_w, img_h = 950, 1085 + ex_len
+    overlay = Image.open(TEXT_PATH / 'overlay.png')
+    overlay_w, overlay_h = overlay.size
+    if overlay_h < img_h:
+        new_overlay_h = img_h
+        new_overlay_w = math.ceil(new_overlay_h * overlay_w / overlay_h)
+    elif overlay_h > img_h:
+        new_overlay_w = img_w
+        new_overlay_h = math.ceil(overlay_w / new_overlay_w * overlay_h)
+    if overlay_h != img_h:
+        overlay = overlay.resize(
+            (new_overlay_w, new_overlay_h), Image.Resampling.LANCZOS
+        ).crop((0, 0, img_w, img_h))
+    bg_color = draw_normal.COLOR_MAP[char_element]
+    color_img = Image.new('RGBA', overlay.size, bg_color)
+    img = ImageChops.overlay(color_img, overlay)
+    img.paste(char_img, (0, 0), char_img)
+    char_info_2 = Image.open(TEXT_PATH / 'char_info_2.png')
+    img.paste(char_info_2, (0, 1085), char_info_2)
+    return img
+
+
+async def measure(func: Callable[[int], Awaitable[Any]]) -> str:
+    start = time.perf_counter()
+    for i in range(ROUND):
+        await func(i)
+    cost = (time.perf_counter() - start) / ROUND
+    return f'{cost * 1000:.1f}ms/张'
+
+
+async def main():
+    char_img = get_char_img()
+    for dmg_len in DMG_LEN_LIST:
+        ex_len = dmg_len * 40 + 765
+        old = old_panel_bg('Pyro', ex_len, char_img)
+        clear_texture_cache()
+        new = await draw_normal.get_panel_bg('Pyro', ex_len, char_img)
+        if old.tobytes() != new.tobytes():
+            print(f'伤害行数{dmg_len}: 合成结果不一致!')
+            return
+
+    async def _old(i: int):
+        ex_len = DMG_LEN_LIST[i % len(DMG_LEN_LIST)] * 40 + 765
+        old_panel_bg('Pyro', ex_len, char_img)
+
+    async def _new(i: int):
+        ex_len = DMG_LEN_LIST[i % len(DMG_LEN_LIST)] * 40 + 765
+        await draw_normal.get_panel_bg('Pyro', ex_len, char_img)
+
+    print(f'面板高度: {[i * 40 + 765 + 1085 for i in DMG_LEN_LIST]}')
+    print(f'每次重新合成静态图层(原方式): {await measure(_old)}')
+    print(f'预先合成静态图层: {await measure(_new)}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,155 @@
+'''
+对比原先导入插件时一次性读取全部数据表, 与现在按需加载的耗时和内存占用,
+导入插件在新的子进程中进行, 并统计导入完成时已经加载的数据表,
+正常情况下导入插件不会加载任何数据表, 只有首次访问时才会加载对应的表,
+导入时加载了数据表或导入失败时以非零状态退出
+
+python bench_map_load.py
+'''
+
+import sys
+import json
+import time
+import subprocess
+import tracemalloc
+from pathlib import Path
+from typing import Any, List, Tuple, Callable
+
+sys.path.append(str(Path(__file__).parents[5]))
+sys.path.append(str(Path(__file__).parents[2]))
+__package__ = 'GenshinUID.tools'
+from ..utils.map import map_bundle  # noqa: E402
+from ..utils.map import GS_MAP_PATH  # noqa: E402
+from ..utils.map import name_covert  # noqa: E402
+from ..genshinuid_enka.etc import MAP_PATH  # noqa: E402
+from ..genshinuid_achievement import template  # noqa: E402
+from ..genshinuid_enka.curve_calc import curve_calc  # noqa: E402
+
+R_PATH = Path(__file__).parents[1]
+JSON_PATH_LIST: List[Path] = [
+    *(R_PATH / 'utils' / 'map' / 'data').glob('*.json'),
+    *(R_PATH / 'genshinuid_enka' / 'effect').glob('*.json'),
+    *(R_PATH / 'genshinuid_achievement').glob('*.json'),
+    *(R_PATH / 'genshinuid_enka' / 'curve_calc').glob('*.json'),
+]
+LAZY_MODULES = [GS_MAP_PATH, MAP_PATH, template]
+NAME_INDEX = [
+    name_covert.get_name2AvatarId,
+    name_covert.get_avatarId2EnName,
+    name_covert.get_alias_index,
+    name_covert.get_alias_list,
+]
+
+# 在子进程中按gsuid_core的方式导入插件的全部模块, 输出耗时和已经加载的数据表
+IMPORT_CODE = '''
+import sys, json, time, pkgutil, importlib
+sys.path[:0] = {path}
+import GenshinUID
+start = time.perf_counter()
+failed = []
+for info in pkgutil.iter_modules(GenshinUID.__path__):
+    if info.name.startswith('genshinuid_'):
+        try:
+            importlib.import_module(f'GenshinUID.{{info.name}}')
+        except Exception as e:
+            failed.append(f'{{info.name}}({{e!r}})')
+cost = time.perf_counter() - start
+loaded = []
+for name in {modules}:
+    module = sys.modules.get(name)
+    if module is None:
+        continue
+    for table in module.__annotations__:
+        if table in module.__dict__:
+            loaded.append(f'{{name}}.{{table}}')
+print(json.dumps({{'cost': cost, 'loaded': loaded, 'failed': failed}}))
+'''
+
+
+def measure(func: Callable[[], Any], reset: Callable[[], Any]) -> str:
+    reset()
+    start = time.perf_counter()
+    func()
+    cost = time.perf_counter() - start
+    # tracemalloc会明显拖慢解码, 内存单独统计
+    reset()
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return f'{cost * 1000:.1f}ms, 常驻内存{size / 1024 / 1024:.2f}MB'
+
+
+def measure_import() -> Tuple[str, bool]:
+    code = IMPORT_CODE.format(
+        path=[str(Path(__file__).parents[5]), str(Path(__file__).parents[2])],
+        modules=[i.__name__ for i in LAZY_MODULES],
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parents[5],
+    )
+    if result.returncode != 0:
+        return f'导入失败: {result.stderr.strip().splitlines()[-1]}', False
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    loaded = '无' if not data['loaded'] else ', '.join(data['loaded'])
+    msg = f'{data["cost"] * 1000:.1f}ms, 导入时加载的数据表: {loaded}'
+    if data['failed']:
+        msg += f'\n  导入失败的模块: {", ".join(data["failed"])}'
+    return msg, not data['loaded'] and not data['failed']
+
+
+def load_all_json() -> List[Any]:
+    result = []
+    for path in JSON_PATH_LIST:
+        with open(path, 'r', encoding='UTF-8') as f:
+            result.append(json.load(f))
+    return result
+
+
+def reset_lazy_data():
+    for module in LAZY_MODULES:
+        for name in module.__annotations__:
+            module.__dict__.pop(name, None)
+    for func in NAME_INDEX:
+        func.cache_clear()
+    curve_calc.get_char_curve.cache_clear()
+    curve_calc.get_curve.cache_clear()
+    map_bundle.MAP_BUNDLE = None
+
+
+def remove_bundle():
+    map_bundle.MAP_BUNDLE_PATH.unlink(missing_ok=True)
+    reset_lazy_data()
+
+
+def load_all_lazy() -> List[Any]:
+    result: List[Any] = []
+    for module in LAZY_MODULES:
+        for name in module.__annotations__:
+            result.append(getattr(module, name))
+    result.extend(func() for func in NAME_INDEX)
+    result.append(curve_calc.get_char_curve())
+    result.append(curve_calc.get_curve())
+    # 打包数据原本延迟写入, 这里立即写入以便下一项读取
+    map_bundle.flush_bundle()
+    return result
+
+
+def main() -> int:
+    print(f'数据表数量: {len(JSON_PATH_LIST)}')
+    print(f'启动时读取全部JSON(原方式): {measure(load_all_json, list)}')
+    import_msg, import_ok = measure_import()
+    print(f'导入插件(现方式): {import_msg}')
+    json_msg = measure(load_all_lazy, remove_bundle)
+    print(f'首次访问全部数据(读取JSON并打包): {json_msg}')
+    bundle_msg = measure(load_all_lazy, reset_lazy_data)
+    print(f'首次访问全部数据(读取打包数据): {bundle_msg}')
+    return 0 if import_ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+'''
+对比本地突破数据(avatarId2Promote/weaponName2Promote)计算出的基础属性,
+与minigg返回的数据是否一致, 抽取部分角色和武器, 在各突破前后的等级逐一比对,
+存在不一致时以非零状态退出
+
+python check_promote_map.py
+'''
+
+import sys
+import asyncio
+from pathlib import Path
+from typing import List, Tuple, Union
+
+sys.path.append(str(Path(__file__).parents[5]))
+sys.path.append(str(Path(__file__).parents[2]))
+__package__ = 'GenshinUID.tools'
+from gsuid_core.utils.api.minigg.request import (  # noqa: E402
+    get_weapon_stats,
+    get_character_stats,
+)
+
+from ..utils.map import GS_MAP_PATH  # noqa: E402
+from ..utils.map.name_covert import name_to_avatar_id  # noqa: E402
+from ..utils.local_to_minigg import (  # noqa: E402
+    PROMOTE_LEVEL,
+    level_to_promote,
+    get_local_char_stats,
+    get_local_weapon_stats,
+)
+
+# 覆盖四星/五星, 各类突破属性(含元素充能效率、治疗加成、元素精通)
+CHAR_LIST = [
+    '胡桃',
+    '琴',
+    '七七',
+    '凯亚',
+    '班尼特',
+    '提纳里',
+    '纳西妲',
+    '芙宁娜',
+    '雷电将军',
+    '枫原万叶',
+    '那维莱特',
+]
+# 覆盖一至五星, 各类攻击力成长曲线和副属性
+WEAPON_LIST = [
+    '信使',
+    '西风剑',
+    '祭礼剑',
+    '黎明神剑',
+    '冷刃',
+    '无锋剑',
+    '护摩之杖',
+    '雾切之回光',
+    '薙草之稻光',
+    '千岩古剑',
+    '流浪乐章',
+]
+# 属性名, 允许误差, 面板上基础属性取整显示, 百分比属性保留一位小数
+STAT_LIST = [('hp', 1), ('attack', 1), ('defense', 1)]
+SP_DIFF = 0.001
+EM_DIFF = 1
+
+
+def level_list(max_promote: int) -> List[Tuple[int, int]]:
+    '''各突破阶段的等级上限在突破前后各取一次, 以及1级和满级'''
+    result = [(1, 0)]
+    for promote, level in enumerate(PROMOTE_LEVEL[:max_promote]):
+        result.append((level, promote))
+        result.append((level, promote + 1))
+    max_level = 90 if max_promote >= len(PROMOTE_LEVEL) else 70
+    result.append((max_level, max_promote))
+    return result
+
+
+def to_stats(level: int, promote: int) -> Union[int, str]:
+    '''minigg以"80+"表示已突破的80级'''
+    if promote > level_to_promote(level):
+        return f'{level}+'
+    return level
+
+
+def compare(
+    name: str, level: int, promote: int, local, remote, stat_list
+) -> List[str]:
+    if isinstance(remote, (int, list)):
+        return [f'{name} {level}级/{promote}阶: minigg请求失败({remote})']
+    error = []
+    for stat, diff in stat_list:
+        if abs(local[stat] - remote[stat]) > diff:
+            error.append(
+                f'{name} {level}级/{promote}阶 {stat}: '
+                f'本地{local[stat]:.4f}, minigg{remote[stat]:.4f}'
+            )
+    return error
+
+
+def sp_diff(substat: str) -> float:
+    return EM_DIFF if substat == '元素精通' else SP_DIFF
+
+
+async def check_char(name: str) -> List[str]:
+    char_id = name_to_avatar_id(name)
+    if char_id not in GS_MAP_PATH.avatarId2Promote:
+        return [f'{name}: 本地无突破数据']
+    error = []
+    for level, promote in level_list(len(PROMOTE_LEVEL)):
+        local = get_local_char_stats(char_id, level, promote)
+        remote = await get_character_stats(name, to_stats(level, promote))
+        if local is None:
+            error.append(f'{name} {level}级/{promote}阶: 本地计算失败')
+            continue
+        stat_list = [
+            *STAT_LIST,
+            ('specialized', sp_diff(local['substat'])),
+        ]
+        error.extend(compare(name, level, promote, local, remote, stat_list))
+    return error
+
+
+async def check_weapon(name: str) -> List[str]:
+    if name not in GS_MAP_PATH.weaponName2Promote:
+        return [f'{name}: 本地无突破数据']
+    data = GS_MAP_PATH.weaponName2Promote[name]
+    error = []
+    for level, promote in level_list(len(data['promote']) - 1):
+        local = get_local_weapon_stats(name, level, promote)
+        remote = await get_weapon_stats(name, to_stats(level, promote))
+        if local is None:
+            error.append(f'{name} {level}级/{promote}阶: 本地计算失败')
+            continue
+        stat_list = [('attack', 1)]
+        if local['substat']:
+            stat_list.append(('specialized', sp_diff(local['substat'])))
+        error.extend(compare(name, level, promote, local, remote, stat_list))
+    return error
+
+
+async def main() -> int:
+    error = []
+    for name in CHAR_LIST:
+        error.extend(await check_char(name))
+    for name in WEAPON_LIST:
+        error.extend(await check_weapon(name))
+    print(f'检查角色{len(CHAR_LIST)}个, 武器{len(WEAPON_LIST)}把')
+    for msg in error:
+        print(f'  {msg}')
+    print('全部一致' if not error else f'不一致{len(error)}项')
+    return 1 if error else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
@@ -1,6 +1,8 @@
+import re
 import sys
 import json
 import asyncio
+from typing import List
 from pathlib import Path
 
 import httpx
@@ -9,6 +11,7 @@ sys.path.append(str(Path(__file__).parents[5]))
 sys.path.append(str(Path(__file__).parents[2]))
 __package__ = 'GenshinUID.tools'
 from ..version import Genshin_version  # noqa: E402
+from ..utils.ambr_to_minigg import PROP_MAP  # noqa: E402
 from ..utils.ambr_to_minigg import convert_ambr_to_minigg  # noqa: E402
 
 R_PATH = Path(__file__).parents[0]
@@ -37,6 +40,8 @@ avatarName2Weapon_fileName = f'avatarName2Weapon_mapping_{version}.json'
 
 artifact2attr_fileName = f'artifact2attr_mapping_{version}.json'
 icon2Name_fileName = f'icon2Name_mapping_{version}.json'
+avatarId2Promote_fileName = f'avatarId2Promote_mapping_{version}.json'
+weaponName2Promote_fileName = f'weaponName2Promote_mapping_{version}.json'
 
 
 BETA_CHAR = {
@@ -57,17 +62,27 @@ BETA_CHAR = {
 }
 
 
-async def download_new_file():
+# 生成突破数据只需要的文件
+PROMOTE_FILE_LIST = [
+    'ExcelBinOutput/AvatarExcelConfigData.json',
+    'ExcelBinOutput/WeaponExcelConfigData.json',
+    'ExcelBinOutput/AvatarPromoteExcelConfigData.json',
+    'ExcelBinOutput/WeaponPromoteExcelConfigData.json',
+    'ExcelBinOutput/EquipAffixExcelConfigData.json',
+    'TextMap/TextMapCHS.json',
+]
+FILE_LIST = [
+    *PROMOTE_FILE_LIST,
+    'ExcelBinOutput/AvatarSkillExcelConfigData.json',
+    'ExcelBinOutput/AvatarTalentExcelConfigData.json',
+    'ExcelBinOutput/ReliquaryExcelConfigData.json',
+    'ExcelBinOutput/DisplayItemExcelConfigData.json',
+]
+
+
+async def download_new_file(file_list: List[str] = FILE_LIST):
     base_url = 'https://gitlab.com/Dimbreath/AnimeGameData/-/raw/master'
-    url_list = [
-        f'{base_url}/ExcelBinOutput/AvatarExcelConfigData.json',
-        f'{base_url}/ExcelBinOutput/WeaponExcelConfigData.json',
-        f'{base_url}/ExcelBinOutput/AvatarSkillExcelConfigData.json',
-        f'{base_url}/ExcelBinOutput/AvatarTalentExcelConfigData.json',
-        f'{base_url}/ExcelBinOutput/ReliquaryExcelConfigData.json',
-        f'{base_url}/ExcelBinOutput/DisplayItemExcelConfigData.json',
-        f'{base_url}/TextMap/TextMapCHS.json',
-    ]
+    url_list = [f'{base_url}/{file}' for file in file_list]
 
     async with httpx.AsyncClient() as client:
         for url in url_list:
@@ -292,14 +307,142 @@ async def artifact2attrJson() -> None:
         json.dump(temp3, file, ensure_ascii=False)
 
 
+def _get_promote_list(promote_data: list, key: str) -> dict:
+    result = {}
+    for i in promote_data:
+        promote = result.setdefault(str(i[key]), {})
+        promote[i.get('promoteLevel', 0)] = {
+            prop['propType']: prop.get('value', 0)
+            for prop in i['addProps']
+            if 'propType' in prop
+        }
+    return {
+        _id: [promote[level] for level in sorted(promote)]
+        for _id, promote in result.items()
+    }
+
+
+async def avatarId2PromoteJson() -> None:
+    with open(
+        DATA_PATH / 'AvatarExcelConfigData.json', 'r', encoding='UTF-8'
+    ) as f:
+        avatar_data = json.load(f)
+
+    with open(
+        DATA_PATH / 'AvatarPromoteExcelConfigData.json', 'r', encoding='UTF-8'
+    ) as f:
+        promote_data = _get_promote_list(json.load(f), 'avatarPromoteId')
+
+    result = {}
+    for i in avatar_data:
+        if i['id'] >= 11000000:
+            continue
+        promote = promote_data.get(str(i['avatarPromoteId']))
+        if not promote:
+            continue
+        curve = {j['type']: j['growCurve'] for j in i['propGrowCurves']}
+        result[str(i['id'])] = {
+            'hpBase': i['hpBase'],
+            'attackBase': i['attackBase'],
+            'defenseBase': i['defenseBase'],
+            'hpCurve': curve['FIGHT_PROP_BASE_HP'],
+            'attackCurve': curve['FIGHT_PROP_BASE_ATTACK'],
+            'defenseCurve': curve['FIGHT_PROP_BASE_DEFENSE'],
+            'specialProp': list(promote[-1].keys())[-1],
+            'promote': promote,
+        }
+
+    with open(
+        MAP_PATH / avatarId2Promote_fileName, 'w', encoding='UTF-8'
+    ) as file:
+        json.dump(result, file, ensure_ascii=False)
+
+
+async def weaponName2PromoteJson() -> None:
+    with open(
+        DATA_PATH / 'WeaponExcelConfigData.json', 'r', encoding='UTF-8'
+    ) as f:
+        weapon_data = json.load(f)
+
+    with open(
+        DATA_PATH / 'WeaponPromoteExcelConfigData.json', 'r', encoding='UTF-8'
+    ) as f:
+        promote_data = _get_promote_list(json.load(f), 'weaponPromoteId')
+
+    with open(
+        DATA_PATH / 'EquipAffixExcelConfigData.json', 'r', encoding='UTF-8'
+    ) as f:
+        affix_data = {}
+        for i in json.load(f):
+            affix_data.setdefault(i['id'], []).append(i)
+
+    result = {}
+    for i in weapon_data:
+        name = raw_data.get(str(i['nameTextMapHash']))
+        promote = promote_data.get(str(i['weaponPromoteId']))
+        if not name or not promote or i['weaponType'] not in WEAPON_TYPE:
+            continue
+
+        effect_name = '无特效'
+        effect = ''
+        affix_list = []
+        affix = affix_data.get(i['skillAffix'][0], [])
+        for level in sorted(affix, key=lambda x: x.get('level', 0)):
+            effect_name = raw_data.get(str(level['nameTextMapHash']), '')
+            desc = raw_data.get(str(level['descTextMapHash']), '')
+            values = re.findall(r'<color=[^>]+>(.*?)</color>', desc)
+            if not effect:
+                for index, value in enumerate(values):
+                    desc = re.sub(
+                        rf'<color=[^>]+>{re.escape(value)}</color>',
+                        f'{{{index}}}',
+                        desc,
+                        count=1,
+                    )
+                effect = re.sub(r'<[^>]+>', '', desc)
+            affix_list.append(values)
+
+        result[name] = {
+            'rarity': i['rankLevel'],
+            'weaponType': WEAPON_TYPE[i['weaponType']],
+            'props': [
+                {
+                    'propType': prop['propType'],
+                    'initValue': prop['initValue'],
+                    'curve': prop['type'],
+                }
+                for prop in i['weaponProp']
+                if prop.get('propType') in PROP_MAP
+            ],
+            'promote': promote,
+            'effectName': effect_name,
+            'effect': effect,
+            'affix': affix_list,
+        }
+
+    with open(
+        MAP_PATH / weaponName2Promote_fileName, 'w', encoding='UTF-8'
+    ) as file:
+        json.dump(result, file, ensure_ascii=False)
+
+
 async def main():
-    await download_new_file()
+    '''
+    python data_to_map.py: 重新生成全部映射
+    python data_to_map.py promote: 只重新生成角色和武器的突破数据
+    '''
+    only_promote = 'promote' in sys.argv[1:]
+    await download_new_file(PROMOTE_FILE_LIST if only_promote else FILE_LIST)
     global raw_data
     try:
         with open(DATA_PATH / 'TextMapCHS.json', 'r', encoding='UTF-8') as f:
             raw_data = json.load(f)
     except FileNotFoundError:
         pass
+    if only_promote:
+        await avatarId2PromoteJson()
+        await weaponName2PromoteJson()
+        return
     await avatarId2NameJson()
     await avatarName2ElementJson()
     await weaponHash2NameJson()
@@ -307,6 +450,8 @@ async def main():
     await talentId2NameJson()
     await weaponHash2TypeJson()
     await artifact2attrJson()
+    await avatarId2PromoteJson()
+    await weaponName2PromoteJson()
 
 
 asyncio.run(main())
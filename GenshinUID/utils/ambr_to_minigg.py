@@ -7,7 +7,7 @@ from gsuid_core.utils.api.ambr.request import (
     get_ambr_weapon_data,
 )
 
-from .map.grow_curve import GROW_CURVE_LIST, WEAPON_GROW_CURVE
+from .map import GS_MAP_PATH
 
 PROP_MAP = {
     'FIGHT_PROP_BASE_HP': '基础生命值',
@@ -166,8 +166,9 @@ async def convert_ambr_to_weapon(
         result[f'r{index+1}'] = attr_list
     atk_curve_type = upgrade['prop'][0]['type']
     sp_curve_type = upgrade['prop'][1]['type']
-    atk_curve = WEAPON_GROW_CURVE['90']['curveInfos'][atk_curve_type]
-    sp_curve = WEAPON_GROW_CURVE['90']['curveInfos'][sp_curve_type]
+    curve_infos = GS_MAP_PATH.WEAPON_GROW_CURVE['90']['curveInfos']
+    atk_curve = curve_infos[atk_curve_type]
+    sp_curve = curve_infos[sp_curve_type]
     atk_promoto = upgrade['promote'][-1]['addProps']['FIGHT_PROP_BASE_ATTACK']
     result['attack'] = atk_curve * baseatk + atk_promoto
     result['specialized'] = sp_curve * basesp
@@ -191,19 +192,19 @@ async def convert_ambr_to_minigg(
             list(raw_data['upgrade']['promote'][-1]['addProps'].keys())[-1]
         ],
         'hp': raw_data['upgrade']['prop'][0]['initValue']
-        * GROW_CURVE_LIST[89]['curveInfos'][
+        * GS_MAP_PATH.GROW_CURVE_LIST[89]['curveInfos'][
             TYPE_TO_INT[raw_data['upgrade']['prop'][0]['type']]
         ]['value']
         + raw_data['upgrade']['promote'][-1]['addProps']['FIGHT_PROP_BASE_HP'],
         'attack': raw_data['upgrade']['prop'][1]['initValue']
-        * GROW_CURVE_LIST[89]['curveInfos'][
+        * GS_MAP_PATH.GROW_CURVE_LIST[89]['curveInfos'][
             TYPE_TO_INT[raw_data['upgrade']['prop'][1]['type']]
         ]['value']
         + raw_data['upgrade']['promote'][-1]['addProps'][
             'FIGHT_PROP_BASE_ATTACK'
         ],
         'defense': raw_data['upgrade']['prop'][2]['initValue']
-        * GROW_CURVE_LIST[89]['curveInfos'][
+        * GS_MAP_PATH.GROW_CURVE_LIST[89]['curveInfos'][
             TYPE_TO_INT[raw_data['upgrade']['prop'][2]['type']]
         ]['value']
         + raw_data['upgrade']['promote'][-1]['addProps'][
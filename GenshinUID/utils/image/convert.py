@@ -1,10 +1,25 @@
+import time
+import asyncio
+import threading
 from io import BytesIO
 from pathlib import Path
 from base64 import b64encode
-from typing import Union, overload
+from functools import partial
+from typing import Dict, Union, overload
 
 import aiofiles
 from PIL import Image
+from gsuid_core.logger import logger
+
+from ...genshinuid_config.gs_config import gsconfig
+
+# 每个线程复用一个编码缓冲区
+ENCODE_LOCAL = threading.local()
+# 命令 -> 编码统计
+ENCODE_STAT: Dict[str, Dict[str, float]] = {}
+# 超出大小限制时逐步降低的质量, 仍然超出时再缩小尺寸
+QUALITY_STEP = 10
+MIN_QUALITY = 50
 
 
 @overload
@@ -27,6 +42,89 @@ async def convert_img(img: Path, is_base64: bool = False) -> str:
     ...
 
 
+def _get_buffer() -> BytesIO:
+    buffer = getattr(ENCODE_LOCAL, 'buffer', None)
+    if buffer is None:
+        buffer = ENCODE_LOCAL.buffer = BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+
+def _get_int_config(name: str, default: int) -> int:
+    try:
+        return int(gsconfig.get_config(name).data)
+    except ValueError:
+        return default
+
+
+def _save(img: Image.Image, fmt: str, quality: int) -> BytesIO:
+    buffer = _get_buffer()
+    optimize = gsconfig.get_config('PicOptimize').data
+    if fmt == 'PNG':
+        img.save(buffer, format='PNG', optimize=optimize)
+    elif fmt == 'WEBP':
+        img.save(buffer, format='WEBP', quality=quality, method=4)
+    else:
+        img.save(
+            buffer,
+            format='JPEG',
+            quality=quality,
+            optimize=optimize,
+            subsampling=0 if quality >= 90 else 2,
+        )
+    return buffer
+
+
+def encode_img(img: Image.Image, is_base64: bool = False) -> Union[bytes, str]:
+    '''
+    按设置的格式和质量编码图片, 设置了大小限制时依次降低质量和缩小尺寸,
+    PNG超出限制时改用JPEG
+    '''
+    fmt = str(gsconfig.get_config('PicFormat').data).upper()
+    if fmt not in ('PNG', 'JPEG', 'WEBP'):
+        fmt = 'PNG'
+    quality = _get_int_config('PicQuality', 90)
+    max_size = _get_int_config('PicMaxSize', 0) * 1024
+
+    img = img.convert('RGB')
+    buffer = _save(img, fmt, quality)
+    if max_size > 0 and buffer.tell() > max_size:
+        if fmt == 'PNG':
+            # 先按设置的质量尝试JPEG, 仍超出限制再降低质量
+            fmt = 'JPEG'
+            buffer = _save(img, fmt, quality)
+        while buffer.tell() > max_size and quality > MIN_QUALITY:
+            quality = max(quality - QUALITY_STEP, MIN_QUALITY)
+            buffer = _save(img, fmt, quality)
+        while buffer.tell() > max_size and min(img.size) > 100:
+            # 文件大小约与像素数量成正比
+            scale = max(min((max_size / buffer.tell()) ** 0.5, 0.9), 0.5)
+            img = img.resize(
+                (int(img.width * scale), int(img.height * scale)),
+                Image.Resampling.LANCZOS,
+            )
+            buffer = _save(img, fmt, quality)
+
+    if is_base64:
+        # 直接编码缓冲区的内容, 不再复制一份bytes
+        with buffer.getbuffer() as view:
+            return 'base64://' + b64encode(view).decode()
+    return buffer.getvalue()
+
+
+def _record_encode(command: str, cost: float, size: int):
+    if command not in ENCODE_STAT:
+        ENCODE_STAT[command] = {'count': 0, 'cost': 0, 'size': 0}
+    stat = ENCODE_STAT[command]
+    stat['count'] += 1
+    stat['cost'] += cost
+    stat['size'] += size
+    logger.debug(
+        f'[编码] {command} 耗时{cost * 1000:.0f}ms, 大小{size / 1024:.0f}KB'
+    )
+
+
 async def convert_img(
     img: Union[Image.Image, str, Path, bytes], is_base64: bool = False
 ):
@@ -40,12 +138,21 @@ async def convert_img(
       * res: bytes对象或base64编码图片。
     """
     if isinstance(img, Image.Image):
-        img = img.convert('RGB')
-        result_buffer = BytesIO()
-        img.save(result_buffer, format='PNG', quality=80, subsampling=0)
-        res = result_buffer.getvalue()
-        if is_base64:
-            res = 'base64://' + b64encode(res).decode()
+        # render导入时会读取gs_config, 在此导入以避免循环导入
+        from .render import RENDER_LOCAL, RENDER_COMMAND
+
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        if getattr(RENDER_LOCAL, 'loop', None) is loop:
+            # 已经在渲染线程中, 直接编码
+            res = encode_img(img, is_base64)
+        else:
+            res = await loop.run_in_executor(
+                None, partial(encode_img, img, is_base64)
+            )
+        _record_encode(
+            RENDER_COMMAND.get(), time.perf_counter() - start, len(res)
+        )
         return res
     elif isinstance(img, bytes):
         pass
@@ -55,6 +162,18 @@ async def convert_img(
     return f'base64://{b64encode(img).decode()}'
 
 
+def get_encode_stat_text() -> str:
+    im = []
+    for command, stat in ENCODE_STAT.items():
+        count = stat['count'] or 1
+        im.append(
+            f'[{command}] 编码{stat["count"]:.0f}次 '
+            f'平均耗时{stat["cost"] / count * 1000:.0f}ms '
+            f'平均大小{stat["size"] / count / 1024:.0f}KB'
+        )
+    return '\n'.join(im)
+
+
 async def str_lenth(r: str, size: int, limit: int = 540) -> str:
     result = ''
     temp = 0
@@ -0,0 +1,135 @@
+import os
+import time
+import asyncio
+import hashlib
+import threading
+from io import BytesIO
+from pathlib import Path
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from weakref import WeakKeyDictionary
+
+import httpx
+import aiofiles
+from PIL import Image
+
+from ..resource.RESOURCE_PATH import URL_CACHE_PATH
+
+# 网络图片缓存的默认有效期(秒)
+URL_CACHE_TTL = 6 * 3600
+# 内存中最多缓存的图片数量
+URL_CACHE_NUM = 128
+# 硬盘中最多缓存的图片大小(字节)
+URL_CACHE_DISK = 256 * 1024 * 1024
+
+# 每个事件循环(主循环和各渲染线程)各自持有一个连接池
+CLIENTS: WeakKeyDictionary = WeakKeyDictionary()
+
+URL_CACHE: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+FETCH_STAT: Dict[str, int] = {'memory': 0, 'disk': 0, 'request': 0}
+# 硬盘缓存大小, 在首次写入时统计
+CACHE_SIZE: Dict[str, int] = {'disk': -1}
+FETCH_LOCK = threading.Lock()
+
+
+def get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10, connect=5),
+            follow_redirects=True,
+        )
+        CLIENTS[loop] = client
+    return client
+
+
+async def request_url(url: str) -> httpx.Response:
+    '''
+    使用连接池请求URL, 不做缓存
+    '''
+    with FETCH_LOCK:
+        FETCH_STAT['request'] += 1
+    return await get_client().get(url)
+
+
+def _put_memory_cache(url: str, expire: float, content: bytes):
+    with FETCH_LOCK:
+        URL_CACHE[url] = (expire, content)
+        URL_CACHE.move_to_end(url)
+        while len(URL_CACHE) > URL_CACHE_NUM:
+            URL_CACHE.popitem(last=False)
+
+
+def _get_disk_cache_list() -> List[Path]:
+    # 跳过正在写入的临时文件
+    return [i for i in URL_CACHE_PATH.iterdir() if i.suffix != '.tmp']
+
+
+def _evict_disk_cache(add_size: int):
+    with FETCH_LOCK:
+        CACHE_SIZE['disk'] += add_size
+        if CACHE_SIZE['disk'] <= URL_CACHE_DISK:
+            return
+        # 按获取时间淘汰, 直到剩下八成容量
+        path_list = sorted(
+            _get_disk_cache_list(), key=lambda i: i.stat().st_mtime
+        )
+        for path in path_list:
+            if CACHE_SIZE['disk'] <= URL_CACHE_DISK * 0.8:
+                break
+            size = path.stat().st_size
+            path.unlink(missing_ok=True)
+            CACHE_SIZE['disk'] -= size
+
+
+async def get_url_bytes(url: str, ttl: float = URL_CACHE_TTL) -> bytes:
+    '''
+    获取URL的内容, 在`ttl`秒内依次使用内存缓存和硬盘缓存
+    '''
+    now = time.time()
+    with FETCH_LOCK:
+        cache = URL_CACHE.get(url)
+        if cache and cache[0] > now:
+            URL_CACHE.move_to_end(url)
+            FETCH_STAT['memory'] += 1
+            return cache[1]
+
+    path = URL_CACHE_PATH / hashlib.md5(url.encode()).hexdigest()
+    if path.exists() and path.stat().st_mtime + ttl > now:
+        async with aiofiles.open(path, 'rb') as f:
+            content = await f.read()
+        with FETCH_LOCK:
+            FETCH_STAT['disk'] += 1
+        _put_memory_cache(url, path.stat().st_mtime + ttl, content)
+        return content
+
+    resp = await request_url(url)
+    resp.raise_for_status()
+    content = resp.content
+    with FETCH_LOCK:
+        if CACHE_SIZE['disk'] < 0:
+            CACHE_SIZE['disk'] = sum(
+                i.stat().st_size for i in _get_disk_cache_list()
+            )
+    # 先写入临时文件再替换, 避免读到只写入一半的文件
+    temp_path = path.with_suffix('.tmp')
+    async with aiofiles.open(temp_path, 'wb') as f:
+        await f.write(content)
+    old_size = path.stat().st_size if path.exists() else 0
+    os.replace(temp_path, path)
+    _evict_disk_cache(len(content) - old_size)
+    _put_memory_cache(url, now + ttl, content)
+    return content
+
+
+async def get_url_image(url: str, ttl: float = URL_CACHE_TTL) -> Image.Image:
+    return Image.open(BytesIO(await get_url_bytes(url, ttl))).convert('RGBA')
+
+
+def get_fetch_stat_text() -> str:
+    return (
+        f'图片缓存: 内存命中{FETCH_STAT["memory"]}次 '
+        f'硬盘命中{FETCH_STAT["disk"]}次 '
+        f'网络请求{FETCH_STAT["request"]}次'
+    )
@@ -1,16 +1,19 @@
 import math
+import time
 import random
+import threading
 from io import BytesIO
 from pathlib import Path
-from typing import Tuple, Union, Optional
+from collections import OrderedDict
+from typing import Dict, Tuple, Union, Optional
 
-import httpx
-from httpx import get
 from PIL import Image, ImageDraw, ImageFont
 
+from .texture import get_texture
 from ..fonts.genshin_fonts import gs_font_32
 from ...genshinuid_config.gs_config import gsconfig
 from ..resource.RESOURCE_PATH import CU_BG_PATH, TEXT2D_PATH
+from .fetch import URL_CACHE_TTL, request_url, get_url_image
 
 FETTER_PATH = TEXT2D_PATH / 'fetter'
 TALENT_PATH = TEXT2D_PATH / 'talent'
@@ -25,6 +28,16 @@ mask_pic = Image.open(TEXT_PATH / 'mask.png')
 NM_BG_PATH = BG_PATH / 'nm_bg'
 SP_BG_PATH = BG_PATH / 'sp_bg'
 
+# 计算背景主色时使用的缩略图尺寸
+PALETTE_THUMB_SIZE = (128, 128)
+# (路径, 修改时间, 是否为亮色) -> 背景主色
+PALETTE_CACHE: Dict[Tuple[str, float, bool], Tuple[int, int, int]] = {}
+
+# 带圆环的头像, (头像链接, 尺寸, 背景色) -> (过期时间, 图片)
+RING_CACHE: OrderedDict = OrderedDict()
+RING_CACHE_NUM = 64
+RING_LOCK = threading.Lock()
+
 if list(CU_BG_PATH.iterdir()) != []:
     bg_path = CU_BG_PATH
 else:
@@ -35,17 +48,16 @@ async def get_pic(url, size: Optional[Tuple[int, int]] = None) -> Image.Image:
     """
     从网络获取图片, 格式化为RGBA格式的指定尺寸
     """
-    async with httpx.AsyncClient(timeout=None) as client:
-        resp = await client.get(url=url)
-        if resp.status_code != 200:
-            if size is None:
-                size = (960, 600)
-            return Image.new('RGBA', size)
-        pic = Image.open(BytesIO(resp.read()))
-        pic = pic.convert("RGBA")
-        if size is not None:
-            pic = pic.resize(size, Image.Resampling.LANCZOS)
-        return pic
+    resp = await request_url(url)
+    if resp.status_code != 200:
+        if size is None:
+            size = (960, 600)
+        return Image.new('RGBA', size)
+    pic = Image.open(BytesIO(resp.read()))
+    pic = pic.convert("RGBA")
+    if size is not None:
+        pic = pic.resize(size, Image.Resampling.LANCZOS)
+    return pic
 
 
 def draw_text_by_line(
@@ -183,28 +195,72 @@ async def get_level_pic(level: int) -> Image.Image:
     return Image.open(LEVEL_PATH / f'level_{level}.png')
 
 
-def get_star_png(star: Union[int, str]) -> Image.Image:
+def get_star_png(
+    star: Union[int, str], size: Optional[Tuple[int, int]] = None
+) -> Image.Image:
     path = TEXT2D_PATH / 'weapon_star' / f's-{star}.png'
-    if path.exists():
-        png = Image.open(path)
-    else:
-        png = Image.open(TEXT2D_PATH / 'weapon_star' / 's-1.png')
-    return png
+    if not path.exists():
+        path = TEXT2D_PATH / 'weapon_star' / 's-1.png'
+    return get_texture(path, size, copy=False)
 
 
 def get_unknown_png() -> Image.Image:
     return Image.open(TEXT_PATH / 'unknown.png')
 
 
-async def get_qq_avatar(
+def get_avatar_url(
     qid: Optional[Union[int, str]] = None, avatar_url: Optional[str] = None
-) -> Image.Image:
+) -> str:
     if qid:
-        avatar_url = f'http://q1.qlogo.cn/g?b=qq&nk={qid}&s=640'
+        return f'http://q1.qlogo.cn/g?b=qq&nk={qid}&s=640'
     elif avatar_url is None:
-        avatar_url = 'https://q1.qlogo.cn/g?b=qq&nk=3399214199&s=640'
-    char_pic = Image.open(BytesIO(get(avatar_url).content)).convert('RGBA')
-    return char_pic
+        return 'https://q1.qlogo.cn/g?b=qq&nk=3399214199&s=640'
+    return avatar_url
+
+
+async def get_qq_avatar(
+    qid: Optional[Union[int, str]] = None, avatar_url: Optional[str] = None
+) -> Image.Image:
+    return await get_url_image(get_avatar_url(qid, avatar_url))
+
+
+async def get_ring_avatar(
+    qid: Union[int, str], size: int, bg_color: Optional[Tuple] = None
+) -> Image.Image:
+    '''
+    :说明:
+      获取带白色圆环的头像, 同一头像同一尺寸在缓存有效期内只绘制一次。
+      返回的图片为共享对象, 只能作为粘贴来源使用。
+
+    :参数:
+      * qid: `Union[int, str]`: QQ号, 或以http开头的头像链接。
+      * size: `int`: 最后传出图片的大小(1:1)。
+
+    :返回:
+      * img: `Image.Image`: 图片对象
+    '''
+    _id = str(qid)
+    if _id.startswith('http'):
+        avatar_url = get_avatar_url(avatar_url=_id)
+    else:
+        avatar_url = get_avatar_url(qid=qid)
+
+    key = (avatar_url, size, bg_color)
+    now = time.time()
+    with RING_LOCK:
+        cache = RING_CACHE.get(key)
+        if cache and cache[0] > now:
+            RING_CACHE.move_to_end(key)
+            return cache[1]
+
+    img = await draw_pic_with_ring(
+        await get_url_image(avatar_url), size, bg_color
+    )
+    with RING_LOCK:
+        RING_CACHE[key] = (now + URL_CACHE_TTL, img)
+        while len(RING_CACHE) > RING_CACHE_NUM:
+            RING_CACHE.popitem(last=False)
+    return img
 
 
 async def draw_pic_with_ring(
@@ -269,21 +325,21 @@ async def get_color_bg(
     bg: Optional[str] = None,
     without_mask: bool = False,
 ) -> Image.Image:
-    image = ''
+    image: Union[str, Path] = ''
     if bg and gsconfig.get_config('DefaultBaseBG').data:
         path = SP_BG_PATH / f'{bg}.jpg'
         path2 = CU_BG_PATH / f'{bg}.jpg'
         if path2.exists():
-            image = Image.open(path2)
+            image = path2
         elif path.exists():
-            image = Image.open(path)
-    CI_img = CustomizeImage(image, based_w, based_h)
+            image = path
+    CI_img = await CustomizeImage.create(image, based_w, based_h)
     img = CI_img.bg_img
     color = CI_img.bg_color
     if not without_mask:
         color_mask = Image.new('RGBA', (based_w, based_h), color)
-        enka_mask = Image.open(TEXT2D_PATH / 'mask.png').resize(
-            (based_w, based_h)
+        enka_mask = get_texture(
+            TEXT2D_PATH / 'mask.png', (based_w, based_h), copy=False
         )
         img.paste(color_mask, (0, 0), enka_mask)
     return img
@@ -294,7 +350,7 @@ async def get_simple_bg(
 ) -> Image.Image:
     if image:
         if isinstance(image, str):
-            edit_bg = Image.open(BytesIO(get(image).content)).convert('RGBA')
+            edit_bg = await get_url_image(image)
         elif isinstance(image, Image.Image):
             edit_bg = image.convert('RGBA')
     else:
@@ -308,25 +364,51 @@ async def get_simple_bg(
 
 class CustomizeImage:
     def __init__(
-        self, image: Union[str, Image.Image], based_w: int, based_h: int
+        self,
+        image: Union[str, Path, Image.Image],
+        based_w: int,
+        based_h: int,
     ) -> None:
+        if not image:
+            image = random.choice(list(bg_path.iterdir()))
         self.bg_img = self.get_image(image, based_w, based_h)
-        self.bg_color = self.get_bg_color(self.bg_img, is_light=True)
+        if isinstance(image, Path):
+            # 背景来自固定的图片, 主色按文件缓存
+            self.bg_color = self.get_path_bg_color(image, is_light=True)
+        else:
+            self.bg_color = self.get_thumb_bg_color(self.bg_img, True)
         self.text_color = self.get_text_color(self.bg_color)
         self.highlight_color = self.get_highlight_color(self.bg_color)
         self.char_color = self.get_char_color(self.bg_color)
         self.bg_detail_color = self.get_bg_detail_color(self.bg_color)
         self.char_high_color = self.get_char_high_color(self.bg_color)
 
+    @classmethod
+    async def create(
+        cls,
+        image: Union[str, Path, Image.Image],
+        based_w: int,
+        based_h: int,
+    ) -> 'CustomizeImage':
+        '''
+        图片为URL时先异步获取, 避免在构造时阻塞
+        '''
+        if isinstance(image, str) and image:
+            image = await get_url_image(image)
+        return cls(image, based_w, based_h)
+
     @staticmethod
     def get_image(
-        image: Union[str, Image.Image], based_w: int, based_h: int
+        image: Union[str, Path, Image.Image], based_w: int, based_h: int
     ) -> Image.Image:
         # 获取背景图片
         if isinstance(image, Image.Image):
             edit_bg = image
+        elif isinstance(image, Path):
+            edit_bg = Image.open(image).convert('RGBA')
         elif image:
-            edit_bg = Image.open(BytesIO(get(image).content)).convert('RGBA')
+            # 同步获取URL会阻塞事件循环
+            raise TypeError('图片为URL时请使用CustomizeImage.create获取')
         else:
             path = random.choice(list(bg_path.iterdir()))
             edit_bg = Image.open(path).convert('RGBA')
@@ -343,6 +425,34 @@ class CustomizeImage:
         dominant_color = img.getpixel((0, 0))
         return dominant_color
 
+    @staticmethod
+    def get_thumb_bg_color(
+        edit_bg: Image.Image, is_light: Optional[bool] = False
+    ) -> Tuple[int, int, int]:
+        '''
+        在缩略图上计算背景主色, 结果与原图基本一致
+        '''
+        thumb = edit_bg.copy()
+        thumb.thumbnail(PALETTE_THUMB_SIZE)
+        return CustomizeImage.get_bg_color(thumb, is_light)
+
+    @staticmethod
+    def get_path_bg_color(
+        path: Path, is_light: Optional[bool] = False
+    ) -> Tuple[int, int, int]:
+        '''
+        按(路径, 修改时间)缓存图片文件的背景主色
+        '''
+        key = (str(path), path.stat().st_mtime, bool(is_light))
+        if key not in PALETTE_CACHE:
+            with Image.open(path) as img:
+                # JPEG可以直接按缩小的尺寸解码
+                img.draft('RGB', PALETTE_THUMB_SIZE)
+                PALETTE_CACHE[key] = CustomizeImage.get_thumb_bg_color(
+                    img.convert('RGBA'), is_light
+                )
+        return PALETTE_CACHE[key]
+
     @staticmethod
     def get_bg_color(
         edit_bg: Image.Image, is_light: Optional[bool] = False
@@ -0,0 +1,124 @@
+import time
+import asyncio
+import threading
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, TypeVar, Callable, Optional, Awaitable
+
+from gsuid_core.logger import logger
+
+from ...genshinuid_config.gs_config import gsconfig
+
+T = TypeVar('T')
+
+RENDER_EXECUTOR: Optional[ThreadPoolExecutor] = None
+# 当前正在执行的绘图命令, 用于按命令统计编码耗时
+RENDER_COMMAND: 'ContextVar[str]' = ContextVar('RENDER_COMMAND', default='其他')
+# 每个渲染线程各自持有一个事件循环, 用于执行原有的异步绘图函数
+RENDER_LOCAL = threading.local()
+
+# 命令 -> 渲染统计
+RENDER_STAT: Dict[str, Dict[str, float]] = {}
+
+
+def get_render_executor() -> ThreadPoolExecutor:
+    global RENDER_EXECUTOR
+    if RENDER_EXECUTOR is None:
+        try:
+            worker_num = int(gsconfig.get_config('RenderWorkers').data)
+        except ValueError:
+            worker_num = 4
+        RENDER_EXECUTOR = ThreadPoolExecutor(
+            max(worker_num, 1), thread_name_prefix='GenshinUIDRender'
+        )
+    return RENDER_EXECUTOR
+
+
+def _get_stat(command: str) -> Dict[str, float]:
+    if command not in RENDER_STAT:
+        RENDER_STAT[command] = {
+            'count': 0,
+            'pending': 0,
+            'wait': 0,
+            'cost': 0,
+            'max_cost': 0,
+        }
+    return RENDER_STAT[command]
+
+
+def _run_in_thread(
+    command: str,
+    submit_time: float,
+    func: Callable[..., Awaitable[T]],
+    args: Any,
+    kwargs: Any,
+):
+    start = time.perf_counter()
+    loop = getattr(RENDER_LOCAL, 'loop', None)
+    if loop is None:
+        loop = RENDER_LOCAL.loop = asyncio.new_event_loop()
+    RENDER_COMMAND.set(command)
+    result = loop.run_until_complete(func(*args, **kwargs))
+    return result, start - submit_time, time.perf_counter() - start
+
+
+async def run_render(
+    command: str,
+    func: Callable[..., Awaitable[T]],
+    *args,
+    **kwargs,
+) -> T:
+    '''
+    将绘图函数放到渲染线程池中执行, 避免PIL的阻塞操作卡住事件循环
+
+    绘图函数不能使用数据库, 网络会话等绑定了主事件循环的对象,
+    需要的数据应提前获取后作为参数传入
+
+    参数:
+        command: `str`
+            命令名称, 用于统计渲染耗时与排队数量
+    '''
+    stat = _get_stat(command)
+    stat['pending'] += 1
+    loop = asyncio.get_running_loop()
+    try:
+        result, wait, cost = await loop.run_in_executor(
+            get_render_executor(),
+            _run_in_thread,
+            command,
+            time.perf_counter(),
+            func,
+            args,
+            kwargs,
+        )
+    finally:
+        stat['pending'] -= 1
+    stat['count'] += 1
+    stat['wait'] += wait
+    stat['cost'] += cost
+    stat['max_cost'] = max(stat['max_cost'], cost)
+    logger.debug(
+        f'[渲染] {command} 排队{wait * 1000:.0f}ms, 绘图{cost * 1000:.0f}ms'
+    )
+    return result
+
+
+def get_render_queue_size() -> int:
+    '''
+    当前正在排队或渲染中的任务数量
+    '''
+    return int(sum(stat['pending'] for stat in RENDER_STAT.values()))
+
+
+async def get_render_stat_text() -> str:
+    im: List[str] = [f'当前渲染队列长度: {get_render_queue_size()}']
+    for command, stat in RENDER_STAT.items():
+        count = stat['count'] or 1
+        im.append(
+            f'[{command}] 次数{stat["count"]:.0f} '
+            f'排队中{stat["pending"]:.0f} '
+            f'平均排队{stat["wait"] / count * 1000:.0f}ms '
+            f'平均绘图{stat["cost"] / count * 1000:.0f}ms '
+            f'最长绘图{stat["max_cost"] * 1000:.0f}ms'
+        )
+    return '\n'.join(im)
@@ -0,0 +1,194 @@
+import os
+import json
+import uuid
+import asyncio
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import aiofiles
+from gsuid_core.logger import logger
+
+from ..resource.RESOURCE_PATH import RENDER_CACHE_PATH
+from ...version import Genshin_version, GenshinUID_version
+
+# 内存和硬盘中最多缓存的绘图结果大小(字节)
+RENDER_CACHE_MEMORY = 64 * 1024 * 1024
+RENDER_CACHE_DISK = 512 * 1024 * 1024
+# 消息id -> 原图的对应关系最多保存的数量
+REPLY_NUM = 2000
+REPLY_MAP_PATH = RENDER_CACHE_PATH / 'reply_map.json'
+
+RENDER_CACHE: 'OrderedDict[str, bytes]' = OrderedDict()
+RENDER_CACHE_STAT: Dict[str, int] = {'memory': 0, 'disk': 0, 'miss': 0}
+# 内存缓存大小, 硬盘缓存大小在首次写入时统计
+CACHE_SIZE: Dict[str, int] = {'memory': 0, 'disk': -1}
+REPLY_MAP: 'Optional[OrderedDict[str, str]]' = None
+CACHE_LOCK = threading.Lock()
+# 在事件循环中首次使用时创建, 兼容py3.8
+REPLY_LOCK: Optional[asyncio.Lock] = None
+
+
+def get_render_key(*args: Any) -> str:
+    '''
+    由绘图的全部输入计算缓存键, 插件或数据版本变化后缓存自动失效
+    '''
+    raw = json.dumps(
+        [GenshinUID_version, Genshin_version, *args],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _get_temp_path(path: Path) -> Path:
+    '''
+    每次写入使用不同的临时文件, 避免同时写入同一文件时互相覆盖
+    '''
+    return path.with_name(f'{path.name}.{uuid.uuid4().hex}.tmp')
+
+
+def _put_memory_cache(key: str, data: bytes):
+    with CACHE_LOCK:
+        if key in RENDER_CACHE:
+            CACHE_SIZE['memory'] -= len(RENDER_CACHE[key])
+        RENDER_CACHE[key] = data
+        RENDER_CACHE.move_to_end(key)
+        CACHE_SIZE['memory'] += len(data)
+        while CACHE_SIZE['memory'] > RENDER_CACHE_MEMORY:
+            _, old_data = RENDER_CACHE.popitem(last=False)
+            CACHE_SIZE['memory'] -= len(old_data)
+
+
+def _get_disk_cache_list() -> List[Path]:
+    # 跳过消息记录文件和正在写入的临时文件
+    return [
+        i
+        for i in RENDER_CACHE_PATH.iterdir()
+        if i != REPLY_MAP_PATH and i.suffix != '.tmp'
+    ]
+
+
+def _evict_disk_cache(add_size: int):
+    CACHE_SIZE['disk'] += add_size
+    if CACHE_SIZE['disk'] <= RENDER_CACHE_DISK:
+        return
+    # 按最后访问时间淘汰, 直到剩下八成容量
+    path_list = sorted(_get_disk_cache_list(), key=lambda i: i.stat().st_mtime)
+    for path in path_list:
+        if CACHE_SIZE['disk'] <= RENDER_CACHE_DISK * 0.8:
+            break
+        size = path.stat().st_size
+        path.unlink(missing_ok=True)
+        CACHE_SIZE['disk'] -= size
+
+
+async def get_render_cache(key: str) -> Optional[bytes]:
+    '''
+    依次从内存和硬盘中读取绘图结果, 不存在时返回None
+    '''
+    with CACHE_LOCK:
+        data = RENDER_CACHE.get(key)
+        if data is not None:
+            RENDER_CACHE.move_to_end(key)
+            RENDER_CACHE_STAT['memory'] += 1
+            return data
+
+    path = RENDER_CACHE_PATH / key
+    try:
+        async with aiofiles.open(path, 'rb') as f:
+            data = await f.read()
+        # 刷新修改时间, 作为硬盘缓存淘汰的依据
+        os.utime(path)
+    except FileNotFoundError:
+        RENDER_CACHE_STAT['miss'] += 1
+        return None
+    RENDER_CACHE_STAT['disk'] += 1
+    _put_memory_cache(key, data)
+    return data
+
+
+async def put_render_cache(key: str, data: bytes):
+    _put_memory_cache(key, data)
+    if CACHE_SIZE['disk'] < 0:
+        CACHE_SIZE['disk'] = sum(
+            i.stat().st_size for i in _get_disk_cache_list()
+        )
+    path = RENDER_CACHE_PATH / key
+    # 先写入临时文件再替换, 避免读到只写入一半的文件
+    temp_path = _get_temp_path(path)
+    async with aiofiles.open(temp_path, 'wb') as f:
+        await f.write(data)
+    old_size = path.stat().st_size if path.exists() else 0
+    os.replace(temp_path, path)
+    _evict_disk_cache(len(data) - old_size)
+
+
+async def put_content_cache(data: bytes) -> str:
+    '''
+    按内容的哈希缓存数据, 相同的内容只保存一份, 返回缓存键
+    '''
+    key = hashlib.sha256(data).hexdigest()
+    if key not in RENDER_CACHE and not (RENDER_CACHE_PATH / key).exists():
+        await put_render_cache(key, data)
+    return key
+
+
+def _load_reply_map() -> 'OrderedDict[str, str]':
+    global REPLY_MAP
+    if REPLY_MAP is None:
+        REPLY_MAP = OrderedDict()
+        if REPLY_MAP_PATH.exists():
+            try:
+                with open(REPLY_MAP_PATH, 'r', encoding='UTF-8') as f:
+                    REPLY_MAP.update(json.load(f))
+            except json.JSONDecodeError:
+                logger.warning('[原图] 消息记录文件损坏, 已重新记录')
+    return REPLY_MAP
+
+
+async def bind_reply_cache(msg_id: str, key: str):
+    '''
+    记录消息对应的原图, 供回复[原图]时读取
+    '''
+    global REPLY_LOCK
+    if REPLY_LOCK is None:
+        REPLY_LOCK = asyncio.Lock()
+    reply_map = _load_reply_map()
+    reply_map[msg_id] = key
+    while len(reply_map) > REPLY_NUM:
+        reply_map.popitem(last=False)
+    # 串行写入, 保证最后写入的是最新的记录
+    async with REPLY_LOCK:
+        temp_path = _get_temp_path(REPLY_MAP_PATH)
+        async with aiofiles.open(temp_path, 'w', encoding='UTF-8') as f:
+            await f.write(json.dumps(reply_map))
+        os.replace(temp_path, REPLY_MAP_PATH)
+
+
+async def get_reply_cache(msg_id: str) -> Optional[bytes]:
+    key = _load_reply_map().get(msg_id)
+    if key is None:
+        return None
+    return await get_render_cache(key)
+
+
+def clear_render_cache():
+    with CACHE_LOCK:
+        RENDER_CACHE.clear()
+        CACHE_SIZE['memory'] = 0
+    for path in RENDER_CACHE_PATH.iterdir():
+        if path != REPLY_MAP_PATH:
+            path.unlink(missing_ok=True)
+    CACHE_SIZE['disk'] = -1
+
+
+def get_render_cache_text() -> str:
+    return (
+        f'面板缓存: 内存命中{RENDER_CACHE_STAT["memory"]}次 '
+        f'硬盘命中{RENDER_CACHE_STAT["disk"]}次 '
+        f'未命中{RENDER_CACHE_STAT["miss"]}次'
+    )
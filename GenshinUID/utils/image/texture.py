@@ -0,0 +1,113 @@
+import threading
+from pathlib import Path
+from functools import partial
+from collections import OrderedDict
+from typing import Dict, Tuple, Union, Callable, Optional
+
+from PIL import Image
+
+# 纹理缓存占用内存的上限(字节)
+TEXTURE_CACHE_LIMIT = 256 * 1024 * 1024
+
+TextureKey = Tuple[str, Optional[Tuple[int, int]], Optional[str], int]
+
+TEXTURE_CACHE: 'OrderedDict[Tuple, Image.Image]' = OrderedDict()
+TEXTURE_STAT: Dict[str, int] = {'hit': 0, 'miss': 0, 'evict': 0, 'size': 0}
+# 渲染线程会同时访问缓存
+TEXTURE_LOCK = threading.Lock()
+
+
+def _get_image_size(img: Image.Image) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+def _load_texture(key: TextureKey) -> Image.Image:
+    path, size, mode, resample = key
+    with Image.open(path) as img:
+        img.load()
+        if mode is not None and img.mode != mode:
+            result = img.convert(mode)
+        else:
+            result = img.copy()
+    if size is not None and result.size != size:
+        result = result.resize(size, resample)
+    return result
+
+
+def get_texture(
+    path: Union[str, Path],
+    size: Optional[Tuple[int, int]] = None,
+    mode: Optional[str] = None,
+    resample: int = Image.Resampling.BICUBIC,
+    copy: bool = True,
+) -> Image.Image:
+    '''
+    读取解码后的纹理, 相同的(路径, 尺寸, 模式)只会解码和缩放一次,
+    超出内存上限时按最近最少使用淘汰
+
+    参数:
+        size: `Optional[Tuple[int, int]]`
+            需要缩放到的尺寸, 先转换模式再缩放
+        copy: `bool`
+            返回副本, 仅作为粘贴来源而不会被修改时可以传入False
+    '''
+    key = (str(path), size, mode, int(resample))
+    return _get_cached(key, partial(_load_texture, key), copy)
+
+
+def get_layer(
+    key: Tuple, factory: Callable[[], Image.Image], copy: bool = True
+) -> Image.Image:
+    '''
+    缓存由纹理预先合成的静态图层, 与纹理共用内存上限和淘汰策略
+
+    参数:
+        key: `Tuple`
+            图层名称和影响合成结果的参数
+        factory: `Callable[[], Image.Image]`
+            缓存不存在时调用, 合成图层
+    '''
+    return _get_cached(('layer', *key), factory, copy)
+
+
+def _get_cached(
+    key: Tuple, factory: Callable[[], Image.Image], copy: bool
+) -> Image.Image:
+    with TEXTURE_LOCK:
+        img = TEXTURE_CACHE.get(key)
+        if img is not None:
+            TEXTURE_CACHE.move_to_end(key)
+            TEXTURE_STAT['hit'] += 1
+    if img is None:
+        img = factory()
+        with TEXTURE_LOCK:
+            TEXTURE_STAT['miss'] += 1
+            if key not in TEXTURE_CACHE:
+                TEXTURE_CACHE[key] = img
+                TEXTURE_STAT['size'] += _get_image_size(img)
+                _evict_texture()
+    return img.copy() if copy else img
+
+
+def _evict_texture():
+    while TEXTURE_STAT['size'] > TEXTURE_CACHE_LIMIT and TEXTURE_CACHE:
+        _, img = TEXTURE_CACHE.popitem(last=False)
+        TEXTURE_STAT['size'] -= _get_image_size(img)
+        TEXTURE_STAT['evict'] += 1
+
+
+def clear_texture_cache():
+    with TEXTURE_LOCK:
+        TEXTURE_CACHE.clear()
+        TEXTURE_STAT['size'] = 0
+
+
+def get_texture_stat_text() -> str:
+    hit, miss = TEXTURE_STAT['hit'], TEXTURE_STAT['miss']
+    rate = hit / (hit + miss) * 100 if hit + miss else 0
+    return (
+        f'纹理缓存: {len(TEXTURE_CACHE)}张 '
+        f'{TEXTURE_STAT["size"] / 1024 / 1024:.1f}MB, '
+        f'命中{hit}次 未命中{miss}次 命中率{rate:.1f}% '
+        f'淘汰{TEXTURE_STAT["evict"]}次'
+    )
@@ -0,0 +1,108 @@
+from functools import lru_cache
+from typing import Dict, Optional, cast
+
+from .map import GS_MAP_PATH
+from .ambr_to_minigg import PROP_MAP, ConvertWeapon, ConvertCharacter
+
+# 各突破阶段的等级上限, 等级超过上限即视为已突破
+PROMOTE_LEVEL = [20, 40, 50, 60, 70, 80]
+
+# 暴击类属性在minigg中包含角色自带的基础值
+BASE_SPECIAL = {
+    'FIGHT_PROP_CRITICAL': 0.05,
+    'FIGHT_PROP_CRITICAL_HURT': 0.5,
+}
+
+
+@lru_cache(maxsize=None)
+def get_char_grow_curve() -> Dict[int, Dict[str, float]]:
+    return {
+        curve['level']: {i['type']: i['value'] for i in curve['curveInfos']}
+        for curve in GS_MAP_PATH.GROW_CURVE_LIST
+    }
+
+
+def level_to_promote(level: int) -> int:
+    return sum(1 for i in PROMOTE_LEVEL if level > i)
+
+
+def get_local_char_stats(
+    char_id: str, level: int, promote_level: Optional[int] = None
+) -> Optional[ConvertCharacter]:
+    '''
+    根据本地突破数据计算角色在指定等级的基础属性,
+    返回与minigg相同结构的数据, 本地数据不存在时返回None
+    '''
+    char_grow_curve = get_char_grow_curve()
+    if char_id not in GS_MAP_PATH.avatarId2Promote:
+        return None
+    if level not in char_grow_curve:
+        return None
+    data = GS_MAP_PATH.avatarId2Promote[char_id]
+    if promote_level is None:
+        promote_level = level_to_promote(level)
+    promote = data['promote'][min(promote_level, len(data['promote']) - 1)]
+    curve = char_grow_curve[level]
+
+    sp_prop = data['specialProp']
+    result = {
+        'substat': PROP_MAP.get(sp_prop, ''),
+        'level': level,
+        'ascension': promote_level,
+        'hp': data['hpBase'] * curve[data['hpCurve']]
+        + promote.get('FIGHT_PROP_BASE_HP', 0),
+        'attack': data['attackBase'] * curve[data['attackCurve']]
+        + promote.get('FIGHT_PROP_BASE_ATTACK', 0),
+        'defense': data['defenseBase'] * curve[data['defenseCurve']]
+        + promote.get('FIGHT_PROP_BASE_DEFENSE', 0),
+        'specialized': promote.get(sp_prop, 0) + BASE_SPECIAL.get(sp_prop, 0),
+    }
+    return cast(ConvertCharacter, result)
+
+
+def get_local_weapon_stats(
+    weapon_name: str,
+    level: Optional[int] = None,
+    promote_level: Optional[int] = None,
+) -> Optional[ConvertWeapon]:
+    '''
+    根据本地突破数据计算武器在指定等级的基础属性,
+    不指定等级时, 三星及以上武器按90级计算, 其余按70级计算
+    '''
+    if weapon_name not in GS_MAP_PATH.weaponName2Promote:
+        return None
+    data = GS_MAP_PATH.weaponName2Promote[weapon_name]
+    if level is None:
+        level = 90 if data['rarity'] >= 3 else 70
+    if str(level) not in GS_MAP_PATH.WEAPON_GROW_CURVE:
+        return None
+    if promote_level is None:
+        promote_level = level_to_promote(level)
+    promote = data['promote'][min(promote_level, len(data['promote']) - 1)]
+    curve = GS_MAP_PATH.WEAPON_GROW_CURVE[str(level)]['curveInfos']
+
+    atk_prop = data['props'][0]
+    result = {
+        'name': weapon_name,
+        'weapontype': data['weaponType'],
+        'rarity': str(data['rarity']),
+        'baseatk': atk_prop['initValue'],
+        'substat': '',
+        'effectname': data['effectName'],
+        'level': level,
+        'ascension': promote_level,
+        'attack': atk_prop['initValue'] * curve[atk_prop['curve']]
+        + promote.get('FIGHT_PROP_BASE_ATTACK', 0),
+        'specialized': 0,
+    }
+    if len(data['props']) > 1:
+        sub_prop = data['props'][1]
+        result['substat'] = PROP_MAP.get(sub_prop['propType'], '')
+        result['specialized'] = (
+            sub_prop['initValue'] * curve[sub_prop['curve']]
+        )
+    if data['effect']:
+        result['effect'] = data['effect']
+    for index, affix in enumerate(data['affix']):
+        result[f'r{index + 1}'] = affix
+    return cast(ConvertWeapon, result)
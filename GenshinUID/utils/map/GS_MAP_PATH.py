@@ -1,9 +1,9 @@
 from pathlib import Path
-from typing import Dict, List, TypedDict
-
-from msgspec import json as msgjson
+from functools import partial
+from typing import Any, Dict, List, TypedDict
 
 from ...version import Genshin_version
+from .map_bundle import load_json, lazy_getattr
 
 MAP = Path(__file__).parent / 'data'
 
@@ -21,8 +21,12 @@ enName2Id_fileName = f'enName2AvatarID_mapping_{version}.json'
 icon2Name_fileName = f'icon2Name_mapping_{version}.json'
 avatarName2Weapon_fileName = f'avatarName2Weapon_mapping_{version}.json'
 monster_fileName = f'monster_{version}.json'
+avatarId2Promote_fileName = f'avatarId2Promote_mapping_{version}.json'
+weaponName2Promote_fileName = f'weaponName2Promote_mapping_{version}.json'
 SAConfig_fileName = 'SpiralAbyssFloorConfig.json'
 EXMonster_fileName = 'ExtraMonster.json'
+charGrowCurve_fileName = 'charGrowCurve_mapping.json'
+weaponGrowCurve_fileName = 'weaponGrowCurve_mapping.json'
 
 
 class TS(TypedDict):
@@ -30,56 +34,106 @@ class TS(TypedDict):
     Icon: Dict[str, str]
 
 
-with open(MAP / avatarId2Name_fileName, 'r', encoding='UTF-8') as f:
-    avatarId2Name = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / icon2Name_fileName, 'r', encoding='UTF-8') as f:
-    icon2Name = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / artifact2attr_fileName, 'r', encoding='UTF-8') as f:
-    artifact2attr = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / 'propId2Name_mapping.json', 'r', encoding='UTF-8') as f:
-    propId2Name = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / weaponHash2Name_fileName, 'r', encoding='UTF-8') as f:
-    weaponHash2Name = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / weaponHash2Type_fileName, 'r', encoding='UTF-8') as f:
-    weaponHash2Type = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / 'artifactId2Piece_mapping.json', 'r', encoding='UTF-8') as f:
-    artifactId2Piece = msgjson.decode(f.read(), type=Dict[str, List[str]])
-
-with open(MAP / skillId2Name_fileName, 'r', encoding='UTF-8') as f:
-    skillId2Name = msgjson.decode(f.read(), type=TS)
-
-with open(MAP / talentId2Name_fileName, 'r', encoding='UTF-8') as f:
-    talentId2Name = msgjson.decode(f.read(), type=TS)
-
-with open(MAP / avatarName2Element_fileName, 'r', encoding='UTF-8') as f:
-    avatarName2Element = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / avatarName2Weapon_fileName, 'r', encoding='UTF-8') as f:
-    avatarName2Weapon = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / 'char_alias.json', 'r', encoding='UTF-8') as f:
-    alias_data = msgjson.decode(f.read(), type=Dict[str, List[str]])
-
-with open(MAP / avatarId2Star_fileName, 'r', encoding='utf8') as f:
-    avatarId2Star_data = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / avatarId2Star_fileName, 'r', encoding='utf8') as f:
-    avatarId2Star_data = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / enName2Id_fileName, 'r', encoding='utf8') as f:
-    enName_to_avatarId_data = msgjson.decode(f.read(), type=Dict[str, str])
-
-with open(MAP / monster_fileName, 'r', encoding='utf8') as f:
-    monster_data = msgjson.decode(f.read(), type=Dict[str, Dict])
-
-with open(MAP / SAConfig_fileName, 'r', encoding='utf8') as f:
-    abyss_data = msgjson.decode(f.read(), type=Dict[str, Dict])
-
-with open(MAP / EXMonster_fileName, 'r', encoding='utf8') as f:
-    ex_monster_data = msgjson.decode(f.read(), type=Dict[str, Dict])
+class CharPromote(TypedDict):
+    hpBase: float
+    attackBase: float
+    defenseBase: float
+    hpCurve: str
+    attackCurve: str
+    defenseCurve: str
+    specialProp: str
+    promote: List[Dict[str, float]]
+
+
+class WeaponProp(TypedDict):
+    propType: str
+    initValue: float
+    curve: str
+
+
+class WeaponPromote(TypedDict):
+    rarity: int
+    weaponType: str
+    props: List[WeaponProp]
+    promote: List[Dict[str, float]]
+    effectName: str
+    effect: str
+    affix: List[List[str]]
+
+
+def load_map(file_name: str, type: Any = Dict[str, str]) -> Any:
+    return load_json(MAP / file_name, type)
+
+
+def load_promote_map(file_name: str, type: Any) -> Any:
+    # 本地突破数据, 由tools/data_to_map.py生成, 缺失时回退到网络请求
+    if (MAP / file_name).exists():
+        return load_map(file_name, type)
+    return {}
+
+
+# 以下数据均在首次访问时加载, 见`map_bundle.lazy_getattr`
+avatarId2Name: Dict[str, str]
+icon2Name: Dict[str, str]
+artifact2attr: Dict[str, str]
+propId2Name: Dict[str, str]
+weaponHash2Name: Dict[str, str]
+weaponHash2Type: Dict[str, str]
+artifactId2Piece: Dict[str, List[str]]
+skillId2Name: TS
+talentId2Name: TS
+avatarName2Element: Dict[str, str]
+avatarName2Weapon: Dict[str, str]
+alias_data: Dict[str, List[str]]
+avatarId2Star_data: Dict[str, str]
+enName_to_avatarId_data: Dict[str, str]
+monster_data: Dict[str, Dict]
+abyss_data: Dict[str, Dict]
+ex_monster_data: Dict[str, Dict]
+avatarId2Promote: Dict[str, CharPromote]
+weaponName2Promote: Dict[str, WeaponPromote]
+GROW_CURVE_LIST: List[Dict]
+WEAPON_GROW_CURVE: Dict[str, Dict]
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'avatarId2Name': partial(load_map, avatarId2Name_fileName),
+        'icon2Name': partial(load_map, icon2Name_fileName),
+        'artifact2attr': partial(load_map, artifact2attr_fileName),
+        'propId2Name': partial(load_map, 'propId2Name_mapping.json'),
+        'weaponHash2Name': partial(load_map, weaponHash2Name_fileName),
+        'weaponHash2Type': partial(load_map, weaponHash2Type_fileName),
+        'artifactId2Piece': partial(
+            load_map, 'artifactId2Piece_mapping.json', Dict[str, List[str]]
+        ),
+        'skillId2Name': partial(load_map, skillId2Name_fileName, TS),
+        'talentId2Name': partial(load_map, talentId2Name_fileName, TS),
+        'avatarName2Element': partial(load_map, avatarName2Element_fileName),
+        'avatarName2Weapon': partial(load_map, avatarName2Weapon_fileName),
+        'alias_data': partial(
+            load_map, 'char_alias.json', Dict[str, List[str]]
+        ),
+        'avatarId2Star_data': partial(load_map, avatarId2Star_fileName),
+        'enName_to_avatarId_data': partial(load_map, enName2Id_fileName),
+        'monster_data': partial(load_map, monster_fileName, Dict[str, Dict]),
+        'abyss_data': partial(load_map, SAConfig_fileName, Dict[str, Dict]),
+        'ex_monster_data': partial(
+            load_map, EXMonster_fileName, Dict[str, Dict]
+        ),
+        'avatarId2Promote': partial(
+            load_promote_map, avatarId2Promote_fileName, Dict[str, CharPromote]
+        ),
+        'weaponName2Promote': partial(
+            load_promote_map,
+            weaponName2Promote_fileName,
+            Dict[str, WeaponPromote],
+        ),
+        'GROW_CURVE_LIST': partial(
+            load_map, charGrowCurve_fileName, List[Dict]
+        ),
+        'WEAPON_GROW_CURVE': partial(
+            load_map, weaponGrowCurve_fileName, Dict[str, Dict]
+        ),
+    },
+)
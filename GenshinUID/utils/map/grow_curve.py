@@ -1,4693 +0,0 @@
-GROW_CURVE_LIST = [
-    {
-        'level': 1,
-        'curveInfos': [
-            {'type': 'GROW_CURVE_HP_S4', 'arith': 'ARITH_MULTI', 'value': 1.0},
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.0,
-            },
-            {'type': 'GROW_CURVE_HP_S5', 'arith': 'ARITH_MULTI', 'value': 1.0},
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.0,
-            },
-        ],
-    },
-    {
-        'level': 2,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.0829999446868896,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.0829999446868896,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.0829999446868896,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.0829999446868896,
-            },
-        ],
-    },
-    {
-        'level': 3,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.1649999618530273,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.1649999618530273,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.1660000085830688,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.1660000085830688,
-            },
-        ],
-    },
-    {
-        'level': 4,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.2480000257492065,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.2480000257492065,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.25,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.25,
-            },
-        ],
-    },
-    {
-        'level': 5,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.3300000429153442,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.3300000429153442,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.3329999446868896,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.3329999446868896,
-            },
-        ],
-    },
-    {
-        'level': 6,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.4129999876022339,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.4129999876022339,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.4170000553131104,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.4170000553131104,
-            },
-        ],
-    },
-    {
-        'level': 7,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.4950000047683716,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.4950000047683716,
-            },
-            {'type': 'GROW_CURVE_HP_S5', 'arith': 'ARITH_MULTI', 'value': 1.5},
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.5,
-            },
-        ],
-    },
-    {
-        'level': 8,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.5779999494552612,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.5779999494552612,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.5839999914169312,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.5839999914169312,
-            },
-        ],
-    },
-    {
-        'level': 9,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.6610000133514404,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.6610000133514404,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.6679999828338623,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.6679999828338623,
-            },
-        ],
-    },
-    {
-        'level': 10,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.7430000305175781,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.7430000305175781,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.7510000467300415,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.7510000467300415,
-            },
-        ],
-    },
-    {
-        'level': 11,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.8259999752044678,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.8259999752044678,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.8350000381469727,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.8350000381469727,
-            },
-        ],
-    },
-    {
-        'level': 12,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.9079999923706055,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.9079999923706055,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.9190000295639038,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 1.9190000295639038,
-            },
-        ],
-    },
-    {
-        'level': 13,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.9910000562667847,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 1.9910000562667847,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.003000020980835,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.003000020980835,
-            },
-        ],
-    },
-    {
-        'level': 14,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.072999954223633,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.072999954223633,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.0880000591278076,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.0880000591278076,
-            },
-        ],
-    },
-    {
-        'level': 15,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.1559998989105225,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.1559998989105225,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.171999931335449,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.171999931335449,
-            },
-        ],
-    },
-    {
-        'level': 16,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.239000082015991,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.239000082015991,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.25600004196167,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.25600004196167,
-            },
-        ],
-    },
-    {
-        'level': 17,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.321000099182129,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.321000099182129,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.3410000801086426,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.3410000801086426,
-            },
-        ],
-    },
-    {
-        'level': 18,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.4040000438690186,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.4040000438690186,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.424999952316284,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.424999952316284,
-            },
-        ],
-    },
-    {
-        'level': 19,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.4860000610351562,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.4860000610351562,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.509999990463257,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.509999990463257,
-            },
-        ],
-    },
-    {
-        'level': 20,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.569000005722046,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.569000005722046,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.5940001010894775,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.5940001010894775,
-            },
-        ],
-    },
-    {
-        'level': 21,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.6510000228881836,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.6510000228881836,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.678999900817871,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.678999900817871,
-            },
-        ],
-    },
-    {
-        'level': 22,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.7339999675750732,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.7339999675750732,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.7639999389648438,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.7639999389648438,
-            },
-        ],
-    },
-    {
-        'level': 23,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.816999912261963,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.816999912261963,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.8489999771118164,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.8489999771118164,
-            },
-        ],
-    },
-    {
-        'level': 24,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.8989999294281006,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.8989999294281006,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.934000015258789,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 2.934000015258789,
-            },
-        ],
-    },
-    {
-        'level': 25,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.9820001125335693,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 2.9820001125335693,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.0190000534057617,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.0190000534057617,
-            },
-        ],
-    },
-    {
-        'level': 26,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.063999891281128,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.063999891281128,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.1050000190734863,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.1050000190734863,
-            },
-        ],
-    },
-    {
-        'level': 27,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.1470000743865967,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.1470000743865967,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.190000057220459,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.190000057220459,
-            },
-        ],
-    },
-    {
-        'level': 28,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.2290000915527344,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.2290000915527344,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.2750000953674316,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.2750000953674316,
-            },
-        ],
-    },
-    {
-        'level': 29,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.312000036239624,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.312000036239624,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.3610000610351562,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.3610000610351562,
-            },
-        ],
-    },
-    {
-        'level': 30,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.3940000534057617,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.3940000534057617,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.446000099182129,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.446000099182129,
-            },
-        ],
-    },
-    {
-        'level': 31,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.4769999980926514,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.4769999980926514,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.5320000648498535,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.5320000648498535,
-            },
-        ],
-    },
-    {
-        'level': 32,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.559999942779541,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.559999942779541,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.618000030517578,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.618000030517578,
-            },
-        ],
-    },
-    {
-        'level': 33,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.6419999599456787,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.6419999599456787,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.7039999961853027,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.7039999961853027,
-            },
-        ],
-    },
-    {
-        'level': 34,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.7249999046325684,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.7249999046325684,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.7890000343322754,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.7890000343322754,
-            },
-        ],
-    },
-    {
-        'level': 35,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.806999921798706,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.806999921798706,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.875,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.875,
-            },
-        ],
-    },
-    {
-        'level': 36,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.890000104904175,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.890000104904175,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.9619998931884766,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 3.9619998931884766,
-            },
-        ],
-    },
-    {
-        'level': 37,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.9719998836517334,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 3.9719998836517334,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.047999858856201,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.047999858856201,
-            },
-        ],
-    },
-    {
-        'level': 38,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.054999828338623,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.054999828338623,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.133999824523926,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.133999824523926,
-            },
-        ],
-    },
-    {
-        'level': 39,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.138000011444092,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.138000011444092,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.21999979019165,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.21999979019165,
-            },
-        ],
-    },
-    {
-        'level': 40,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.21999979019165,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.21999979019165,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.307000160217285,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.307000160217285,
-            },
-        ],
-    },
-    {
-        'level': 41,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.302999973297119,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.302999973297119,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.39300012588501,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.39300012588501,
-            },
-        ],
-    },
-    {
-        'level': 42,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.385000228881836,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.385000228881836,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.480000019073486,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.480000019073486,
-            },
-        ],
-    },
-    {
-        'level': 43,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.4679999351501465,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.4679999351501465,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.566999912261963,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.566999912261963,
-            },
-        ],
-    },
-    {
-        'level': 44,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.550000190734863,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.550000190734863,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.6529998779296875,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.6529998779296875,
-            },
-        ],
-    },
-    {
-        'level': 45,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.632999897003174,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.632999897003174,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.739999771118164,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.739999771118164,
-            },
-        ],
-    },
-    {
-        'level': 46,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.716000080108643,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.716000080108643,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.827000141143799,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.827000141143799,
-            },
-        ],
-    },
-    {
-        'level': 47,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.797999858856201,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.797999858856201,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.914000034332275,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 4.914000034332275,
-            },
-        ],
-    },
-    {
-        'level': 48,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.88100004196167,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.88100004196167,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.000999927520752,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.000999927520752,
-            },
-        ],
-    },
-    {
-        'level': 49,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.9629998207092285,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 4.9629998207092285,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.089000225067139,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.089000225067139,
-            },
-        ],
-    },
-    {
-        'level': 50,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.046000003814697,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.046000003814697,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.176000118255615,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.176000118255615,
-            },
-        ],
-    },
-    {
-        'level': 51,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.127999782562256,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.127999782562256,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.263000011444092,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.263000011444092,
-            },
-        ],
-    },
-    {
-        'level': 52,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.210999965667725,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.210999965667725,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.35099983215332,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.35099983215332,
-            },
-        ],
-    },
-    {
-        'level': 53,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.294000148773193,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.294000148773193,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.438000202178955,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.438000202178955,
-            },
-        ],
-    },
-    {
-        'level': 54,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.375999927520752,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.375999927520752,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.526000022888184,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.526000022888184,
-            },
-        ],
-    },
-    {
-        'level': 55,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.459000110626221,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.459000110626221,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.613999843597412,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.613999843597412,
-            },
-        ],
-    },
-    {
-        'level': 56,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.540999889373779,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.540999889373779,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.702000141143799,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.702000141143799,
-            },
-        ],
-    },
-    {
-        'level': 57,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.624000072479248,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.624000072479248,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.789999961853027,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.789999961853027,
-            },
-        ],
-    },
-    {
-        'level': 58,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.705999851226807,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.705999851226807,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.877999782562256,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.877999782562256,
-            },
-        ],
-    },
-    {
-        'level': 59,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.789000034332275,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.789000034332275,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.966000080108643,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 5.966000080108643,
-            },
-        ],
-    },
-    {
-        'level': 60,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.872000217437744,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.872000217437744,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.053999900817871,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.053999900817871,
-            },
-        ],
-    },
-    {
-        'level': 61,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.953999996185303,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 5.953999996185303,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.142000198364258,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.142000198364258,
-            },
-        ],
-    },
-    {
-        'level': 62,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.0370001792907715,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.0370001792907715,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.230000019073486,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.230000019073486,
-            },
-        ],
-    },
-    {
-        'level': 63,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.11899995803833,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.11899995803833,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.318999767303467,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.318999767303467,
-            },
-        ],
-    },
-    {
-        'level': 64,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.202000141143799,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.202000141143799,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.4070000648498535,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.4070000648498535,
-            },
-        ],
-    },
-    {
-        'level': 65,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.283999919891357,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.283999919891357,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.495999813079834,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.495999813079834,
-            },
-        ],
-    },
-    {
-        'level': 66,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.367000102996826,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.367000102996826,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.585000038146973,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.585000038146973,
-            },
-        ],
-    },
-    {
-        'level': 67,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.449999809265137,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.449999809265137,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.672999858856201,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.672999858856201,
-            },
-        ],
-    },
-    {
-        'level': 68,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.5320000648498535,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.5320000648498535,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.76200008392334,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.76200008392334,
-            },
-        ],
-    },
-    {
-        'level': 69,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.614999771118164,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.614999771118164,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.85099983215332,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.85099983215332,
-            },
-        ],
-    },
-    {
-        'level': 70,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.697000026702881,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.697000026702881,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.940000057220459,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 6.940000057220459,
-            },
-        ],
-    },
-    {
-        'level': 71,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.78000020980835,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.78000020980835,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.0289998054504395,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.0289998054504395,
-            },
-        ],
-    },
-    {
-        'level': 72,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.861999988555908,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.861999988555908,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.11899995803833,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.11899995803833,
-            },
-        ],
-    },
-    {
-        'level': 73,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.945000171661377,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 6.945000171661377,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.208000183105469,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.208000183105469,
-            },
-        ],
-    },
-    {
-        'level': 74,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.0279998779296875,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.0279998779296875,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.296999931335449,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.296999931335449,
-            },
-        ],
-    },
-    {
-        'level': 75,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.110000133514404,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.110000133514404,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.38700008392334,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.38700008392334,
-            },
-        ],
-    },
-    {
-        'level': 76,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.192999839782715,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.192999839782715,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.47599983215332,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.47599983215332,
-            },
-        ],
-    },
-    {
-        'level': 77,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.275000095367432,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.275000095367432,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.565999984741211,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.565999984741211,
-            },
-        ],
-    },
-    {
-        'level': 78,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.357999801635742,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.357999801635742,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.656000137329102,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.656000137329102,
-            },
-        ],
-    },
-    {
-        'level': 79,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.440000057220459,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.440000057220459,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.745999813079834,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.745999813079834,
-            },
-        ],
-    },
-    {
-        'level': 80,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.5229997634887695,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.5229997634887695,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.835999965667725,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.835999965667725,
-            },
-        ],
-    },
-    {
-        'level': 81,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.605999946594238,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.605999946594238,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.926000118255615,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 7.926000118255615,
-            },
-        ],
-    },
-    {
-        'level': 82,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.688000202178955,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.688000202178955,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.015999794006348,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.015999794006348,
-            },
-        ],
-    },
-    {
-        'level': 83,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.770999908447266,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.770999908447266,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.105999946594238,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.105999946594238,
-            },
-        ],
-    },
-    {
-        'level': 84,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.853000164031982,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.853000164031982,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.196000099182129,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.196000099182129,
-            },
-        ],
-    },
-    {
-        'level': 85,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.935999870300293,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 7.935999870300293,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.28600025177002,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.28600025177002,
-            },
-        ],
-    },
-    {
-        'level': 86,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.017999649047852,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.017999649047852,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.376999855041504,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.376999855041504,
-            },
-        ],
-    },
-    {
-        'level': 87,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.10099983215332,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.10099983215332,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.467000007629395,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.467000007629395,
-            },
-        ],
-    },
-    {
-        'level': 88,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.182999610900879,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.182999610900879,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.557999610900879,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.557999610900879,
-            },
-        ],
-    },
-    {
-        'level': 89,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.265999794006348,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.265999794006348,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.64900016784668,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.64900016784668,
-            },
-        ],
-    },
-    {
-        'level': 90,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.348999977111816,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.348999977111816,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.73900032043457,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.73900032043457,
-            },
-        ],
-    },
-    {
-        'level': 91,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.430999755859375,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.430999755859375,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.829999923706055,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.829999923706055,
-            },
-        ],
-    },
-    {
-        'level': 92,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.513999938964844,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.513999938964844,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.920999526977539,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 8.920999526977539,
-            },
-        ],
-    },
-    {
-        'level': 93,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.595999717712402,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.595999717712402,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.01200008392334,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.01200008392334,
-            },
-        ],
-    },
-    {
-        'level': 94,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.678999900817871,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.678999900817871,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.102999687194824,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.102999687194824,
-            },
-        ],
-    },
-    {
-        'level': 95,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.76099967956543,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.76099967956543,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.194999694824219,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.194999694824219,
-            },
-        ],
-    },
-    {
-        'level': 96,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.843999862670898,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.843999862670898,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.28600025177002,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.28600025177002,
-            },
-        ],
-    },
-    {
-        'level': 97,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.927000045776367,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 8.927000045776367,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.376999855041504,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.376999855041504,
-            },
-        ],
-    },
-    {
-        'level': 98,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 9.008999824523926,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 9.008999824523926,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.468999862670898,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.468999862670898,
-            },
-        ],
-    },
-    {
-        'level': 99,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 9.092000007629395,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 9.092000007629395,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.5600004196167,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.5600004196167,
-            },
-        ],
-    },
-    {
-        'level': 100,
-        'curveInfos': [
-            {
-                'type': 'GROW_CURVE_HP_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 9.173999786376953,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S4',
-                'arith': 'ARITH_MULTI',
-                'value': 9.173999786376953,
-            },
-            {
-                'type': 'GROW_CURVE_HP_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.652000427246094,
-            },
-            {
-                'type': 'GROW_CURVE_ATTACK_S5',
-                'arith': 'ARITH_MULTI',
-                'value': 9.652000427246094,
-            },
-        ],
-    },
-]
-
-WEAPON_GROW_CURVE = {
-    "1": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1,
-            "GROW_CURVE_ATTACK_102": 1,
-            "GROW_CURVE_ATTACK_103": 1,
-            "GROW_CURVE_ATTACK_104": 1,
-            "GROW_CURVE_ATTACK_105": 1,
-            "GROW_CURVE_CRITICAL_101": 1,
-            "GROW_CURVE_ATTACK_201": 1,
-            "GROW_CURVE_ATTACK_202": 1,
-            "GROW_CURVE_ATTACK_203": 1,
-            "GROW_CURVE_ATTACK_204": 1,
-            "GROW_CURVE_ATTACK_205": 1,
-            "GROW_CURVE_CRITICAL_201": 1,
-            "GROW_CURVE_ATTACK_301": 1,
-            "GROW_CURVE_ATTACK_302": 1,
-            "GROW_CURVE_ATTACK_303": 1,
-            "GROW_CURVE_ATTACK_304": 1,
-            "GROW_CURVE_ATTACK_305": 1,
-            "GROW_CURVE_CRITICAL_301": 1,
-        }
-    },
-    "2": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.076,
-            "GROW_CURVE_ATTACK_102": 1.081,
-            "GROW_CURVE_ATTACK_103": 1.086,
-            "GROW_CURVE_ATTACK_104": 1.071,
-            "GROW_CURVE_ATTACK_105": 1.065,
-            "GROW_CURVE_CRITICAL_101": 1,
-            "GROW_CURVE_ATTACK_201": 1.083,
-            "GROW_CURVE_ATTACK_202": 1.088,
-            "GROW_CURVE_ATTACK_203": 1.093,
-            "GROW_CURVE_ATTACK_204": 1.077,
-            "GROW_CURVE_ATTACK_205": 1.071,
-            "GROW_CURVE_CRITICAL_201": 1,
-            "GROW_CURVE_ATTACK_301": 1.086,
-            "GROW_CURVE_ATTACK_302": 1.091,
-            "GROW_CURVE_ATTACK_303": 1.097,
-            "GROW_CURVE_ATTACK_304": 1.079,
-            "GROW_CURVE_ATTACK_305": 1.073,
-            "GROW_CURVE_CRITICAL_301": 1,
-        }
-    },
-    "3": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.152,
-            "GROW_CURVE_ATTACK_102": 1.162,
-            "GROW_CURVE_ATTACK_103": 1.172,
-            "GROW_CURVE_ATTACK_104": 1.141,
-            "GROW_CURVE_ATTACK_105": 1.129,
-            "GROW_CURVE_CRITICAL_101": 1,
-            "GROW_CURVE_ATTACK_201": 1.165,
-            "GROW_CURVE_ATTACK_202": 1.176,
-            "GROW_CURVE_ATTACK_203": 1.186,
-            "GROW_CURVE_ATTACK_204": 1.154,
-            "GROW_CURVE_ATTACK_205": 1.141,
-            "GROW_CURVE_CRITICAL_201": 1,
-            "GROW_CURVE_ATTACK_301": 1.171,
-            "GROW_CURVE_ATTACK_302": 1.183,
-            "GROW_CURVE_ATTACK_303": 1.194,
-            "GROW_CURVE_ATTACK_304": 1.159,
-            "GROW_CURVE_ATTACK_305": 1.145,
-            "GROW_CURVE_CRITICAL_301": 1,
-        }
-    },
-    "4": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.228,
-            "GROW_CURVE_ATTACK_102": 1.244,
-            "GROW_CURVE_ATTACK_103": 1.259,
-            "GROW_CURVE_ATTACK_104": 1.211,
-            "GROW_CURVE_ATTACK_105": 1.193,
-            "GROW_CURVE_CRITICAL_101": 1,
-            "GROW_CURVE_ATTACK_201": 1.248,
-            "GROW_CURVE_ATTACK_202": 1.264,
-            "GROW_CURVE_ATTACK_203": 1.28,
-            "GROW_CURVE_ATTACK_204": 1.23,
-            "GROW_CURVE_ATTACK_205": 1.211,
-            "GROW_CURVE_CRITICAL_201": 1,
-            "GROW_CURVE_ATTACK_301": 1.257,
-            "GROW_CURVE_ATTACK_302": 1.275,
-            "GROW_CURVE_ATTACK_303": 1.292,
-            "GROW_CURVE_ATTACK_304": 1.238,
-            "GROW_CURVE_ATTACK_305": 1.217,
-            "GROW_CURVE_CRITICAL_301": 1,
-        }
-    },
-    "5": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.303,
-            "GROW_CURVE_ATTACK_102": 1.325,
-            "GROW_CURVE_ATTACK_103": 1.346,
-            "GROW_CURVE_ATTACK_104": 1.28,
-            "GROW_CURVE_ATTACK_105": 1.255,
-            "GROW_CURVE_CRITICAL_101": 1.162,
-            "GROW_CURVE_ATTACK_201": 1.33,
-            "GROW_CURVE_ATTACK_202": 1.353,
-            "GROW_CURVE_ATTACK_203": 1.374,
-            "GROW_CURVE_ATTACK_204": 1.306,
-            "GROW_CURVE_ATTACK_205": 1.28,
-            "GROW_CURVE_CRITICAL_201": 1.162,
-            "GROW_CURVE_ATTACK_301": 1.343,
-            "GROW_CURVE_ATTACK_302": 1.368,
-            "GROW_CURVE_ATTACK_303": 1.391,
-            "GROW_CURVE_ATTACK_304": 1.317,
-            "GROW_CURVE_ATTACK_305": 1.288,
-            "GROW_CURVE_CRITICAL_301": 1.162,
-        }
-    },
-    "6": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.379,
-            "GROW_CURVE_ATTACK_102": 1.407,
-            "GROW_CURVE_ATTACK_103": 1.433,
-            "GROW_CURVE_ATTACK_104": 1.349,
-            "GROW_CURVE_ATTACK_105": 1.317,
-            "GROW_CURVE_CRITICAL_101": 1.162,
-            "GROW_CURVE_ATTACK_201": 1.413,
-            "GROW_CURVE_ATTACK_202": 1.442,
-            "GROW_CURVE_ATTACK_203": 1.469,
-            "GROW_CURVE_ATTACK_204": 1.382,
-            "GROW_CURVE_ATTACK_205": 1.349,
-            "GROW_CURVE_CRITICAL_201": 1.162,
-            "GROW_CURVE_ATTACK_301": 1.429,
-            "GROW_CURVE_ATTACK_302": 1.461,
-            "GROW_CURVE_ATTACK_303": 1.49,
-            "GROW_CURVE_ATTACK_304": 1.395,
-            "GROW_CURVE_ATTACK_305": 1.359,
-            "GROW_CURVE_CRITICAL_301": 1.162,
-        }
-    },
-    "7": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.454,
-            "GROW_CURVE_ATTACK_102": 1.489,
-            "GROW_CURVE_ATTACK_103": 1.521,
-            "GROW_CURVE_ATTACK_104": 1.417,
-            "GROW_CURVE_ATTACK_105": 1.379,
-            "GROW_CURVE_CRITICAL_101": 1.162,
-            "GROW_CURVE_ATTACK_201": 1.495,
-            "GROW_CURVE_ATTACK_202": 1.531,
-            "GROW_CURVE_ATTACK_203": 1.565,
-            "GROW_CURVE_ATTACK_204": 1.457,
-            "GROW_CURVE_ATTACK_205": 1.417,
-            "GROW_CURVE_CRITICAL_201": 1.162,
-            "GROW_CURVE_ATTACK_301": 1.516,
-            "GROW_CURVE_ATTACK_302": 1.554,
-            "GROW_CURVE_ATTACK_303": 1.591,
-            "GROW_CURVE_ATTACK_304": 1.474,
-            "GROW_CURVE_ATTACK_305": 1.429,
-            "GROW_CURVE_CRITICAL_301": 1.162,
-        }
-    },
-    "8": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.529,
-            "GROW_CURVE_ATTACK_102": 1.57,
-            "GROW_CURVE_ATTACK_103": 1.609,
-            "GROW_CURVE_ATTACK_104": 1.486,
-            "GROW_CURVE_ATTACK_105": 1.439,
-            "GROW_CURVE_CRITICAL_101": 1.162,
-            "GROW_CURVE_ATTACK_201": 1.578,
-            "GROW_CURVE_ATTACK_202": 1.621,
-            "GROW_CURVE_ATTACK_203": 1.661,
-            "GROW_CURVE_ATTACK_204": 1.533,
-            "GROW_CURVE_ATTACK_205": 1.484,
-            "GROW_CURVE_CRITICAL_201": 1.162,
-            "GROW_CURVE_ATTACK_301": 1.602,
-            "GROW_CURVE_ATTACK_302": 1.648,
-            "GROW_CURVE_ATTACK_303": 1.692,
-            "GROW_CURVE_ATTACK_304": 1.552,
-            "GROW_CURVE_ATTACK_305": 1.499,
-            "GROW_CURVE_CRITICAL_301": 1.162,
-        }
-    },
-    "9": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.604,
-            "GROW_CURVE_ATTACK_102": 1.652,
-            "GROW_CURVE_ATTACK_103": 1.698,
-            "GROW_CURVE_ATTACK_104": 1.553,
-            "GROW_CURVE_ATTACK_105": 1.499,
-            "GROW_CURVE_CRITICAL_101": 1.162,
-            "GROW_CURVE_ATTACK_201": 1.661,
-            "GROW_CURVE_ATTACK_202": 1.71,
-            "GROW_CURVE_ATTACK_203": 1.757,
-            "GROW_CURVE_ATTACK_204": 1.607,
-            "GROW_CURVE_ATTACK_205": 1.551,
-            "GROW_CURVE_CRITICAL_201": 1.162,
-            "GROW_CURVE_ATTACK_301": 1.689,
-            "GROW_CURVE_ATTACK_302": 1.743,
-            "GROW_CURVE_ATTACK_303": 1.793,
-            "GROW_CURVE_ATTACK_304": 1.631,
-            "GROW_CURVE_ATTACK_305": 1.568,
-            "GROW_CURVE_CRITICAL_301": 1.162,
-        }
-    },
-    "10": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.679,
-            "GROW_CURVE_ATTACK_102": 1.734,
-            "GROW_CURVE_ATTACK_103": 1.786,
-            "GROW_CURVE_ATTACK_104": 1.621,
-            "GROW_CURVE_ATTACK_105": 1.558,
-            "GROW_CURVE_CRITICAL_101": 1.363,
-            "GROW_CURVE_ATTACK_201": 1.743,
-            "GROW_CURVE_ATTACK_202": 1.8,
-            "GROW_CURVE_ATTACK_203": 1.854,
-            "GROW_CURVE_ATTACK_204": 1.682,
-            "GROW_CURVE_ATTACK_205": 1.617,
-            "GROW_CURVE_CRITICAL_201": 1.363,
-            "GROW_CURVE_ATTACK_301": 1.775,
-            "GROW_CURVE_ATTACK_302": 1.837,
-            "GROW_CURVE_ATTACK_303": 1.895,
-            "GROW_CURVE_ATTACK_304": 1.709,
-            "GROW_CURVE_ATTACK_305": 1.637,
-            "GROW_CURVE_CRITICAL_301": 1.363,
-        }
-    },
-    "11": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.754,
-            "GROW_CURVE_ATTACK_102": 1.816,
-            "GROW_CURVE_ATTACK_103": 1.875,
-            "GROW_CURVE_ATTACK_104": 1.688,
-            "GROW_CURVE_ATTACK_105": 1.617,
-            "GROW_CURVE_CRITICAL_101": 1.363,
-            "GROW_CURVE_ATTACK_201": 1.826,
-            "GROW_CURVE_ATTACK_202": 1.891,
-            "GROW_CURVE_ATTACK_203": 1.952,
-            "GROW_CURVE_ATTACK_204": 1.757,
-            "GROW_CURVE_ATTACK_205": 1.683,
-            "GROW_CURVE_CRITICAL_201": 1.363,
-            "GROW_CURVE_ATTACK_301": 1.862,
-            "GROW_CURVE_ATTACK_302": 1.933,
-            "GROW_CURVE_ATTACK_303": 1.998,
-            "GROW_CURVE_ATTACK_304": 1.787,
-            "GROW_CURVE_ATTACK_305": 1.706,
-            "GROW_CURVE_CRITICAL_301": 1.363,
-        }
-    },
-    "12": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.828,
-            "GROW_CURVE_ATTACK_102": 1.898,
-            "GROW_CURVE_ATTACK_103": 1.965,
-            "GROW_CURVE_ATTACK_104": 1.754,
-            "GROW_CURVE_ATTACK_105": 1.675,
-            "GROW_CURVE_CRITICAL_101": 1.363,
-            "GROW_CURVE_ATTACK_201": 1.908,
-            "GROW_CURVE_ATTACK_202": 1.981,
-            "GROW_CURVE_ATTACK_203": 2.049,
-            "GROW_CURVE_ATTACK_204": 1.831,
-            "GROW_CURVE_ATTACK_205": 1.748,
-            "GROW_CURVE_CRITICAL_201": 1.363,
-            "GROW_CURVE_ATTACK_301": 1.949,
-            "GROW_CURVE_ATTACK_302": 2.028,
-            "GROW_CURVE_ATTACK_303": 2.102,
-            "GROW_CURVE_ATTACK_304": 1.865,
-            "GROW_CURVE_ATTACK_305": 1.774,
-            "GROW_CURVE_CRITICAL_301": 1.363,
-        }
-    },
-    "13": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.903,
-            "GROW_CURVE_ATTACK_102": 1.981,
-            "GROW_CURVE_ATTACK_103": 2.054,
-            "GROW_CURVE_ATTACK_104": 1.82,
-            "GROW_CURVE_ATTACK_105": 1.733,
-            "GROW_CURVE_CRITICAL_101": 1.363,
-            "GROW_CURVE_ATTACK_201": 1.991,
-            "GROW_CURVE_ATTACK_202": 2.072,
-            "GROW_CURVE_ATTACK_203": 2.147,
-            "GROW_CURVE_ATTACK_204": 1.905,
-            "GROW_CURVE_ATTACK_205": 1.813,
-            "GROW_CURVE_CRITICAL_201": 1.363,
-            "GROW_CURVE_ATTACK_301": 2.036,
-            "GROW_CURVE_ATTACK_302": 2.124,
-            "GROW_CURVE_ATTACK_303": 2.206,
-            "GROW_CURVE_ATTACK_304": 1.942,
-            "GROW_CURVE_ATTACK_305": 1.841,
-            "GROW_CURVE_CRITICAL_301": 1.363,
-        }
-    },
-    "14": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 1.977,
-            "GROW_CURVE_ATTACK_102": 2.063,
-            "GROW_CURVE_ATTACK_103": 2.144,
-            "GROW_CURVE_ATTACK_104": 1.886,
-            "GROW_CURVE_ATTACK_105": 1.79,
-            "GROW_CURVE_CRITICAL_101": 1.363,
-            "GROW_CURVE_ATTACK_201": 2.073,
-            "GROW_CURVE_ATTACK_202": 2.162,
-            "GROW_CURVE_ATTACK_203": 2.246,
-            "GROW_CURVE_ATTACK_204": 1.979,
-            "GROW_CURVE_ATTACK_205": 1.878,
-            "GROW_CURVE_CRITICAL_201": 1.363,
-            "GROW_CURVE_ATTACK_301": 2.124,
-            "GROW_CURVE_ATTACK_302": 2.22,
-            "GROW_CURVE_ATTACK_303": 2.31,
-            "GROW_CURVE_ATTACK_304": 2.02,
-            "GROW_CURVE_ATTACK_305": 1.909,
-            "GROW_CURVE_CRITICAL_301": 1.363,
-        }
-    },
-    "15": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.051,
-            "GROW_CURVE_ATTACK_102": 2.145,
-            "GROW_CURVE_ATTACK_103": 2.234,
-            "GROW_CURVE_ATTACK_104": 1.952,
-            "GROW_CURVE_ATTACK_105": 1.846,
-            "GROW_CURVE_CRITICAL_101": 1.565,
-            "GROW_CURVE_ATTACK_201": 2.156,
-            "GROW_CURVE_ATTACK_202": 2.253,
-            "GROW_CURVE_ATTACK_203": 2.345,
-            "GROW_CURVE_ATTACK_204": 2.052,
-            "GROW_CURVE_ATTACK_205": 1.942,
-            "GROW_CURVE_CRITICAL_201": 1.565,
-            "GROW_CURVE_ATTACK_301": 2.211,
-            "GROW_CURVE_ATTACK_302": 2.317,
-            "GROW_CURVE_ATTACK_303": 2.415,
-            "GROW_CURVE_ATTACK_304": 2.098,
-            "GROW_CURVE_ATTACK_305": 1.976,
-            "GROW_CURVE_CRITICAL_301": 1.565,
-        }
-    },
-    "16": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.125,
-            "GROW_CURVE_ATTACK_102": 2.227,
-            "GROW_CURVE_ATTACK_103": 2.324,
-            "GROW_CURVE_ATTACK_104": 2.017,
-            "GROW_CURVE_ATTACK_105": 1.902,
-            "GROW_CURVE_CRITICAL_101": 1.565,
-            "GROW_CURVE_ATTACK_201": 2.239,
-            "GROW_CURVE_ATTACK_202": 2.345,
-            "GROW_CURVE_ATTACK_203": 2.444,
-            "GROW_CURVE_ATTACK_204": 2.126,
-            "GROW_CURVE_ATTACK_205": 2.005,
-            "GROW_CURVE_CRITICAL_201": 1.565,
-            "GROW_CURVE_ATTACK_301": 2.299,
-            "GROW_CURVE_ATTACK_302": 2.414,
-            "GROW_CURVE_ATTACK_303": 2.521,
-            "GROW_CURVE_ATTACK_304": 2.175,
-            "GROW_CURVE_ATTACK_305": 2.043,
-            "GROW_CURVE_CRITICAL_301": 1.565,
-        }
-    },
-    "17": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.199,
-            "GROW_CURVE_ATTACK_102": 2.31,
-            "GROW_CURVE_ATTACK_103": 2.414,
-            "GROW_CURVE_ATTACK_104": 2.082,
-            "GROW_CURVE_ATTACK_105": 1.958,
-            "GROW_CURVE_CRITICAL_101": 1.565,
-            "GROW_CURVE_ATTACK_201": 2.321,
-            "GROW_CURVE_ATTACK_202": 2.436,
-            "GROW_CURVE_ATTACK_203": 2.544,
-            "GROW_CURVE_ATTACK_204": 2.199,
-            "GROW_CURVE_ATTACK_205": 2.068,
-            "GROW_CURVE_CRITICAL_201": 1.565,
-            "GROW_CURVE_ATTACK_301": 2.386,
-            "GROW_CURVE_ATTACK_302": 2.511,
-            "GROW_CURVE_ATTACK_303": 2.627,
-            "GROW_CURVE_ATTACK_304": 2.253,
-            "GROW_CURVE_ATTACK_305": 2.109,
-            "GROW_CURVE_CRITICAL_301": 1.565,
-        }
-    },
-    "18": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.273,
-            "GROW_CURVE_ATTACK_102": 2.392,
-            "GROW_CURVE_ATTACK_103": 2.505,
-            "GROW_CURVE_ATTACK_104": 2.147,
-            "GROW_CURVE_ATTACK_105": 2.013,
-            "GROW_CURVE_CRITICAL_101": 1.565,
-            "GROW_CURVE_ATTACK_201": 2.404,
-            "GROW_CURVE_ATTACK_202": 2.527,
-            "GROW_CURVE_ATTACK_203": 2.644,
-            "GROW_CURVE_ATTACK_204": 2.272,
-            "GROW_CURVE_ATTACK_205": 2.131,
-            "GROW_CURVE_CRITICAL_201": 1.565,
-            "GROW_CURVE_ATTACK_301": 2.474,
-            "GROW_CURVE_ATTACK_302": 2.608,
-            "GROW_CURVE_ATTACK_303": 2.734,
-            "GROW_CURVE_ATTACK_304": 2.33,
-            "GROW_CURVE_ATTACK_305": 2.175,
-            "GROW_CURVE_CRITICAL_301": 1.565,
-        }
-    },
-    "19": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.347,
-            "GROW_CURVE_ATTACK_102": 2.474,
-            "GROW_CURVE_ATTACK_103": 2.595,
-            "GROW_CURVE_ATTACK_104": 2.211,
-            "GROW_CURVE_ATTACK_105": 2.067,
-            "GROW_CURVE_CRITICAL_101": 1.565,
-            "GROW_CURVE_ATTACK_201": 2.486,
-            "GROW_CURVE_ATTACK_202": 2.619,
-            "GROW_CURVE_ATTACK_203": 2.744,
-            "GROW_CURVE_ATTACK_204": 2.345,
-            "GROW_CURVE_ATTACK_205": 2.194,
-            "GROW_CURVE_CRITICAL_201": 1.565,
-            "GROW_CURVE_ATTACK_301": 2.562,
-            "GROW_CURVE_ATTACK_302": 2.706,
-            "GROW_CURVE_ATTACK_303": 2.841,
-            "GROW_CURVE_ATTACK_304": 2.408,
-            "GROW_CURVE_ATTACK_305": 2.241,
-            "GROW_CURVE_CRITICAL_301": 1.565,
-        }
-    },
-    "20": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.42,
-            "GROW_CURVE_ATTACK_102": 2.557,
-            "GROW_CURVE_ATTACK_103": 2.686,
-            "GROW_CURVE_ATTACK_104": 2.275,
-            "GROW_CURVE_ATTACK_105": 2.121,
-            "GROW_CURVE_CRITICAL_101": 1.767,
-            "GROW_CURVE_ATTACK_201": 2.569,
-            "GROW_CURVE_ATTACK_202": 2.711,
-            "GROW_CURVE_ATTACK_203": 2.845,
-            "GROW_CURVE_ATTACK_204": 2.417,
-            "GROW_CURVE_ATTACK_205": 2.256,
-            "GROW_CURVE_CRITICAL_201": 1.767,
-            "GROW_CURVE_ATTACK_301": 2.65,
-            "GROW_CURVE_ATTACK_302": 2.804,
-            "GROW_CURVE_ATTACK_303": 2.949,
-            "GROW_CURVE_ATTACK_304": 2.485,
-            "GROW_CURVE_ATTACK_305": 2.307,
-            "GROW_CURVE_CRITICAL_301": 1.767,
-        }
-    },
-    "21": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.493,
-            "GROW_CURVE_ATTACK_102": 2.639,
-            "GROW_CURVE_ATTACK_103": 2.777,
-            "GROW_CURVE_ATTACK_104": 2.339,
-            "GROW_CURVE_ATTACK_105": 2.175,
-            "GROW_CURVE_CRITICAL_101": 1.767,
-            "GROW_CURVE_ATTACK_201": 2.651,
-            "GROW_CURVE_ATTACK_202": 2.803,
-            "GROW_CURVE_ATTACK_203": 2.946,
-            "GROW_CURVE_ATTACK_204": 2.49,
-            "GROW_CURVE_ATTACK_205": 2.318,
-            "GROW_CURVE_CRITICAL_201": 1.767,
-            "GROW_CURVE_ATTACK_301": 2.738,
-            "GROW_CURVE_ATTACK_302": 2.903,
-            "GROW_CURVE_ATTACK_303": 3.057,
-            "GROW_CURVE_ATTACK_304": 2.562,
-            "GROW_CURVE_ATTACK_305": 2.373,
-            "GROW_CURVE_CRITICAL_301": 1.767,
-        }
-    },
-    "22": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.567,
-            "GROW_CURVE_ATTACK_102": 2.722,
-            "GROW_CURVE_ATTACK_103": 2.868,
-            "GROW_CURVE_ATTACK_104": 2.402,
-            "GROW_CURVE_ATTACK_105": 2.228,
-            "GROW_CURVE_CRITICAL_101": 1.767,
-            "GROW_CURVE_ATTACK_201": 2.734,
-            "GROW_CURVE_ATTACK_202": 2.895,
-            "GROW_CURVE_ATTACK_203": 3.047,
-            "GROW_CURVE_ATTACK_204": 2.562,
-            "GROW_CURVE_ATTACK_205": 2.379,
-            "GROW_CURVE_CRITICAL_201": 1.767,
-            "GROW_CURVE_ATTACK_301": 2.827,
-            "GROW_CURVE_ATTACK_302": 3.002,
-            "GROW_CURVE_ATTACK_303": 3.165,
-            "GROW_CURVE_ATTACK_304": 2.639,
-            "GROW_CURVE_ATTACK_305": 2.438,
-            "GROW_CURVE_CRITICAL_301": 1.767,
-        }
-    },
-    "23": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.64,
-            "GROW_CURVE_ATTACK_102": 2.804,
-            "GROW_CURVE_ATTACK_103": 2.96,
-            "GROW_CURVE_ATTACK_104": 2.466,
-            "GROW_CURVE_ATTACK_105": 2.28,
-            "GROW_CURVE_CRITICAL_101": 1.767,
-            "GROW_CURVE_ATTACK_201": 2.817,
-            "GROW_CURVE_ATTACK_202": 2.987,
-            "GROW_CURVE_ATTACK_203": 3.148,
-            "GROW_CURVE_ATTACK_204": 2.634,
-            "GROW_CURVE_ATTACK_205": 2.44,
-            "GROW_CURVE_CRITICAL_201": 1.767,
-            "GROW_CURVE_ATTACK_301": 2.915,
-            "GROW_CURVE_ATTACK_302": 3.101,
-            "GROW_CURVE_ATTACK_303": 3.274,
-            "GROW_CURVE_ATTACK_304": 2.717,
-            "GROW_CURVE_ATTACK_305": 2.503,
-            "GROW_CURVE_CRITICAL_301": 1.767,
-        }
-    },
-    "24": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.713,
-            "GROW_CURVE_ATTACK_102": 2.887,
-            "GROW_CURVE_ATTACK_103": 3.051,
-            "GROW_CURVE_ATTACK_104": 2.529,
-            "GROW_CURVE_ATTACK_105": 2.333,
-            "GROW_CURVE_CRITICAL_101": 1.767,
-            "GROW_CURVE_ATTACK_201": 2.899,
-            "GROW_CURVE_ATTACK_202": 3.08,
-            "GROW_CURVE_ATTACK_203": 3.25,
-            "GROW_CURVE_ATTACK_204": 2.707,
-            "GROW_CURVE_ATTACK_205": 2.501,
-            "GROW_CURVE_CRITICAL_201": 1.767,
-            "GROW_CURVE_ATTACK_301": 3.004,
-            "GROW_CURVE_ATTACK_302": 3.2,
-            "GROW_CURVE_ATTACK_303": 3.384,
-            "GROW_CURVE_ATTACK_304": 2.794,
-            "GROW_CURVE_ATTACK_305": 2.568,
-            "GROW_CURVE_CRITICAL_301": 1.767,
-        }
-    },
-    "25": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.786,
-            "GROW_CURVE_ATTACK_102": 2.969,
-            "GROW_CURVE_ATTACK_103": 3.143,
-            "GROW_CURVE_ATTACK_104": 2.591,
-            "GROW_CURVE_ATTACK_105": 2.385,
-            "GROW_CURVE_CRITICAL_101": 1.969,
-            "GROW_CURVE_ATTACK_201": 2.982,
-            "GROW_CURVE_ATTACK_202": 3.172,
-            "GROW_CURVE_ATTACK_203": 3.352,
-            "GROW_CURVE_ATTACK_204": 2.778,
-            "GROW_CURVE_ATTACK_205": 2.562,
-            "GROW_CURVE_CRITICAL_201": 1.969,
-            "GROW_CURVE_ATTACK_301": 3.093,
-            "GROW_CURVE_ATTACK_302": 3.3,
-            "GROW_CURVE_ATTACK_303": 3.493,
-            "GROW_CURVE_ATTACK_304": 2.871,
-            "GROW_CURVE_ATTACK_305": 2.633,
-            "GROW_CURVE_CRITICAL_301": 1.969,
-        }
-    },
-    "26": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.859,
-            "GROW_CURVE_ATTACK_102": 3.052,
-            "GROW_CURVE_ATTACK_103": 3.234,
-            "GROW_CURVE_ATTACK_104": 2.654,
-            "GROW_CURVE_ATTACK_105": 2.436,
-            "GROW_CURVE_CRITICAL_101": 1.969,
-            "GROW_CURVE_ATTACK_201": 3.064,
-            "GROW_CURVE_ATTACK_202": 3.265,
-            "GROW_CURVE_ATTACK_203": 3.454,
-            "GROW_CURVE_ATTACK_204": 2.85,
-            "GROW_CURVE_ATTACK_205": 2.622,
-            "GROW_CURVE_CRITICAL_201": 1.969,
-            "GROW_CURVE_ATTACK_301": 3.182,
-            "GROW_CURVE_ATTACK_302": 3.4,
-            "GROW_CURVE_ATTACK_303": 3.604,
-            "GROW_CURVE_ATTACK_304": 2.948,
-            "GROW_CURVE_ATTACK_305": 2.697,
-            "GROW_CURVE_CRITICAL_301": 1.969,
-        }
-    },
-    "27": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 2.931,
-            "GROW_CURVE_ATTACK_102": 3.134,
-            "GROW_CURVE_ATTACK_103": 3.326,
-            "GROW_CURVE_ATTACK_104": 2.716,
-            "GROW_CURVE_ATTACK_105": 2.487,
-            "GROW_CURVE_CRITICAL_101": 1.969,
-            "GROW_CURVE_ATTACK_201": 3.147,
-            "GROW_CURVE_ATTACK_202": 3.358,
-            "GROW_CURVE_ATTACK_203": 3.557,
-            "GROW_CURVE_ATTACK_204": 2.922,
-            "GROW_CURVE_ATTACK_205": 2.682,
-            "GROW_CURVE_CRITICAL_201": 1.969,
-            "GROW_CURVE_ATTACK_301": 3.271,
-            "GROW_CURVE_ATTACK_302": 3.5,
-            "GROW_CURVE_ATTACK_303": 3.714,
-            "GROW_CURVE_ATTACK_304": 3.026,
-            "GROW_CURVE_ATTACK_305": 2.762,
-            "GROW_CURVE_CRITICAL_301": 1.969,
-        }
-    },
-    "28": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.004,
-            "GROW_CURVE_ATTACK_102": 3.217,
-            "GROW_CURVE_ATTACK_103": 3.418,
-            "GROW_CURVE_ATTACK_104": 2.778,
-            "GROW_CURVE_ATTACK_105": 2.538,
-            "GROW_CURVE_CRITICAL_101": 1.969,
-            "GROW_CURVE_ATTACK_201": 3.229,
-            "GROW_CURVE_ATTACK_202": 3.451,
-            "GROW_CURVE_ATTACK_203": 3.66,
-            "GROW_CURVE_ATTACK_204": 2.993,
-            "GROW_CURVE_ATTACK_205": 2.741,
-            "GROW_CURVE_CRITICAL_201": 1.969,
-            "GROW_CURVE_ATTACK_301": 3.36,
-            "GROW_CURVE_ATTACK_302": 3.601,
-            "GROW_CURVE_ATTACK_303": 3.825,
-            "GROW_CURVE_ATTACK_304": 3.103,
-            "GROW_CURVE_ATTACK_305": 2.826,
-            "GROW_CURVE_CRITICAL_301": 1.969,
-        }
-    },
-    "29": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.076,
-            "GROW_CURVE_ATTACK_102": 3.299,
-            "GROW_CURVE_ATTACK_103": 3.51,
-            "GROW_CURVE_ATTACK_104": 2.84,
-            "GROW_CURVE_ATTACK_105": 2.588,
-            "GROW_CURVE_CRITICAL_101": 1.969,
-            "GROW_CURVE_ATTACK_201": 3.312,
-            "GROW_CURVE_ATTACK_202": 3.544,
-            "GROW_CURVE_ATTACK_203": 3.762,
-            "GROW_CURVE_ATTACK_204": 3.065,
-            "GROW_CURVE_ATTACK_205": 2.801,
-            "GROW_CURVE_CRITICAL_201": 1.969,
-            "GROW_CURVE_ATTACK_301": 3.45,
-            "GROW_CURVE_ATTACK_302": 3.701,
-            "GROW_CURVE_ATTACK_303": 3.937,
-            "GROW_CURVE_ATTACK_304": 3.18,
-            "GROW_CURVE_ATTACK_305": 2.89,
-            "GROW_CURVE_CRITICAL_301": 1.969,
-        }
-    },
-    "30": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.148,
-            "GROW_CURVE_ATTACK_102": 3.382,
-            "GROW_CURVE_ATTACK_103": 3.602,
-            "GROW_CURVE_ATTACK_104": 2.901,
-            "GROW_CURVE_ATTACK_105": 2.638,
-            "GROW_CURVE_CRITICAL_101": 2.171,
-            "GROW_CURVE_ATTACK_201": 3.394,
-            "GROW_CURVE_ATTACK_202": 3.637,
-            "GROW_CURVE_ATTACK_203": 3.866,
-            "GROW_CURVE_ATTACK_204": 3.136,
-            "GROW_CURVE_ATTACK_205": 2.86,
-            "GROW_CURVE_CRITICAL_201": 2.171,
-            "GROW_CURVE_ATTACK_301": 3.539,
-            "GROW_CURVE_ATTACK_302": 3.803,
-            "GROW_CURVE_ATTACK_303": 4.049,
-            "GROW_CURVE_ATTACK_304": 3.257,
-            "GROW_CURVE_ATTACK_305": 2.954,
-            "GROW_CURVE_CRITICAL_301": 2.171,
-        }
-    },
-    "31": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.221,
-            "GROW_CURVE_ATTACK_102": 3.464,
-            "GROW_CURVE_ATTACK_103": 3.694,
-            "GROW_CURVE_ATTACK_104": 2.962,
-            "GROW_CURVE_ATTACK_105": 2.688,
-            "GROW_CURVE_CRITICAL_101": 2.171,
-            "GROW_CURVE_ATTACK_201": 3.477,
-            "GROW_CURVE_ATTACK_202": 3.731,
-            "GROW_CURVE_ATTACK_203": 3.969,
-            "GROW_CURVE_ATTACK_204": 3.207,
-            "GROW_CURVE_ATTACK_205": 2.919,
-            "GROW_CURVE_CRITICAL_201": 2.171,
-            "GROW_CURVE_ATTACK_301": 3.629,
-            "GROW_CURVE_ATTACK_302": 3.904,
-            "GROW_CURVE_ATTACK_303": 4.161,
-            "GROW_CURVE_ATTACK_304": 3.334,
-            "GROW_CURVE_ATTACK_305": 3.018,
-            "GROW_CURVE_CRITICAL_301": 2.171,
-        }
-    },
-    "32": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.293,
-            "GROW_CURVE_ATTACK_102": 3.547,
-            "GROW_CURVE_ATTACK_103": 3.787,
-            "GROW_CURVE_ATTACK_104": 3.023,
-            "GROW_CURVE_ATTACK_105": 2.737,
-            "GROW_CURVE_CRITICAL_101": 2.171,
-            "GROW_CURVE_ATTACK_201": 3.56,
-            "GROW_CURVE_ATTACK_202": 3.824,
-            "GROW_CURVE_ATTACK_203": 4.073,
-            "GROW_CURVE_ATTACK_204": 3.278,
-            "GROW_CURVE_ATTACK_205": 2.978,
-            "GROW_CURVE_CRITICAL_201": 2.171,
-            "GROW_CURVE_ATTACK_301": 3.719,
-            "GROW_CURVE_ATTACK_302": 4.005,
-            "GROW_CURVE_ATTACK_303": 4.273,
-            "GROW_CURVE_ATTACK_304": 3.412,
-            "GROW_CURVE_ATTACK_305": 3.082,
-            "GROW_CURVE_CRITICAL_301": 2.171,
-        }
-    },
-    "33": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.365,
-            "GROW_CURVE_ATTACK_102": 3.629,
-            "GROW_CURVE_ATTACK_103": 3.879,
-            "GROW_CURVE_ATTACK_104": 3.084,
-            "GROW_CURVE_ATTACK_105": 2.786,
-            "GROW_CURVE_CRITICAL_101": 2.171,
-            "GROW_CURVE_ATTACK_201": 3.642,
-            "GROW_CURVE_ATTACK_202": 3.918,
-            "GROW_CURVE_ATTACK_203": 4.177,
-            "GROW_CURVE_ATTACK_204": 3.349,
-            "GROW_CURVE_ATTACK_205": 3.036,
-            "GROW_CURVE_CRITICAL_201": 2.171,
-            "GROW_CURVE_ATTACK_301": 3.809,
-            "GROW_CURVE_ATTACK_302": 4.107,
-            "GROW_CURVE_ATTACK_303": 4.386,
-            "GROW_CURVE_ATTACK_304": 3.489,
-            "GROW_CURVE_ATTACK_305": 3.145,
-            "GROW_CURVE_CRITICAL_301": 2.171,
-        }
-    },
-    "34": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.437,
-            "GROW_CURVE_ATTACK_102": 3.712,
-            "GROW_CURVE_ATTACK_103": 3.972,
-            "GROW_CURVE_ATTACK_104": 3.145,
-            "GROW_CURVE_ATTACK_105": 2.835,
-            "GROW_CURVE_CRITICAL_101": 2.171,
-            "GROW_CURVE_ATTACK_201": 3.725,
-            "GROW_CURVE_ATTACK_202": 4.011,
-            "GROW_CURVE_ATTACK_203": 4.281,
-            "GROW_CURVE_ATTACK_204": 3.42,
-            "GROW_CURVE_ATTACK_205": 3.094,
-            "GROW_CURVE_CRITICAL_201": 2.171,
-            "GROW_CURVE_ATTACK_301": 3.899,
-            "GROW_CURVE_ATTACK_302": 4.209,
-            "GROW_CURVE_ATTACK_303": 4.499,
-            "GROW_CURVE_ATTACK_304": 3.566,
-            "GROW_CURVE_ATTACK_305": 3.209,
-            "GROW_CURVE_CRITICAL_301": 2.171,
-        }
-    },
-    "35": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.508,
-            "GROW_CURVE_ATTACK_102": 3.794,
-            "GROW_CURVE_ATTACK_103": 4.064,
-            "GROW_CURVE_ATTACK_104": 3.205,
-            "GROW_CURVE_ATTACK_105": 2.883,
-            "GROW_CURVE_CRITICAL_101": 2.373,
-            "GROW_CURVE_ATTACK_201": 3.807,
-            "GROW_CURVE_ATTACK_202": 4.105,
-            "GROW_CURVE_ATTACK_203": 4.385,
-            "GROW_CURVE_ATTACK_204": 3.49,
-            "GROW_CURVE_ATTACK_205": 3.152,
-            "GROW_CURVE_CRITICAL_201": 2.373,
-            "GROW_CURVE_ATTACK_301": 3.989,
-            "GROW_CURVE_ATTACK_302": 4.312,
-            "GROW_CURVE_ATTACK_303": 4.613,
-            "GROW_CURVE_ATTACK_304": 3.644,
-            "GROW_CURVE_ATTACK_305": 3.272,
-            "GROW_CURVE_CRITICAL_301": 2.373,
-        }
-    },
-    "36": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.58,
-            "GROW_CURVE_ATTACK_102": 3.877,
-            "GROW_CURVE_ATTACK_103": 4.157,
-            "GROW_CURVE_ATTACK_104": 3.265,
-            "GROW_CURVE_ATTACK_105": 2.931,
-            "GROW_CURVE_CRITICAL_101": 2.373,
-            "GROW_CURVE_ATTACK_201": 3.89,
-            "GROW_CURVE_ATTACK_202": 4.199,
-            "GROW_CURVE_ATTACK_203": 4.489,
-            "GROW_CURVE_ATTACK_204": 3.561,
-            "GROW_CURVE_ATTACK_205": 3.21,
-            "GROW_CURVE_CRITICAL_201": 2.373,
-            "GROW_CURVE_ATTACK_301": 4.08,
-            "GROW_CURVE_ATTACK_302": 4.414,
-            "GROW_CURVE_ATTACK_303": 4.727,
-            "GROW_CURVE_ATTACK_304": 3.721,
-            "GROW_CURVE_ATTACK_305": 3.336,
-            "GROW_CURVE_CRITICAL_301": 2.373,
-        }
-    },
-    "37": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.652,
-            "GROW_CURVE_ATTACK_102": 3.959,
-            "GROW_CURVE_ATTACK_103": 4.25,
-            "GROW_CURVE_ATTACK_104": 3.325,
-            "GROW_CURVE_ATTACK_105": 2.979,
-            "GROW_CURVE_CRITICAL_101": 2.373,
-            "GROW_CURVE_ATTACK_201": 3.972,
-            "GROW_CURVE_ATTACK_202": 4.293,
-            "GROW_CURVE_ATTACK_203": 4.594,
-            "GROW_CURVE_ATTACK_204": 3.632,
-            "GROW_CURVE_ATTACK_205": 3.268,
-            "GROW_CURVE_CRITICAL_201": 2.373,
-            "GROW_CURVE_ATTACK_301": 4.17,
-            "GROW_CURVE_ATTACK_302": 4.517,
-            "GROW_CURVE_ATTACK_303": 4.841,
-            "GROW_CURVE_ATTACK_304": 3.798,
-            "GROW_CURVE_ATTACK_305": 3.399,
-            "GROW_CURVE_CRITICAL_301": 2.373,
-        }
-    },
-    "38": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.723,
-            "GROW_CURVE_ATTACK_102": 4.042,
-            "GROW_CURVE_ATTACK_103": 4.342,
-            "GROW_CURVE_ATTACK_104": 3.385,
-            "GROW_CURVE_ATTACK_105": 3.027,
-            "GROW_CURVE_CRITICAL_101": 2.373,
-            "GROW_CURVE_ATTACK_201": 4.055,
-            "GROW_CURVE_ATTACK_202": 4.387,
-            "GROW_CURVE_ATTACK_203": 4.699,
-            "GROW_CURVE_ATTACK_204": 3.702,
-            "GROW_CURVE_ATTACK_205": 3.325,
-            "GROW_CURVE_CRITICAL_201": 2.373,
-            "GROW_CURVE_ATTACK_301": 4.261,
-            "GROW_CURVE_ATTACK_302": 4.62,
-            "GROW_CURVE_ATTACK_303": 4.956,
-            "GROW_CURVE_ATTACK_304": 3.876,
-            "GROW_CURVE_ATTACK_305": 3.462,
-            "GROW_CURVE_CRITICAL_301": 2.373,
-        }
-    },
-    "39": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.794,
-            "GROW_CURVE_ATTACK_102": 4.124,
-            "GROW_CURVE_ATTACK_103": 4.435,
-            "GROW_CURVE_ATTACK_104": 3.445,
-            "GROW_CURVE_ATTACK_105": 3.074,
-            "GROW_CURVE_CRITICAL_101": 2.373,
-            "GROW_CURVE_ATTACK_201": 4.138,
-            "GROW_CURVE_ATTACK_202": 4.481,
-            "GROW_CURVE_ATTACK_203": 4.803,
-            "GROW_CURVE_ATTACK_204": 3.772,
-            "GROW_CURVE_ATTACK_205": 3.382,
-            "GROW_CURVE_CRITICAL_201": 2.373,
-            "GROW_CURVE_ATTACK_301": 4.352,
-            "GROW_CURVE_ATTACK_302": 4.723,
-            "GROW_CURVE_ATTACK_303": 5.071,
-            "GROW_CURVE_ATTACK_304": 3.953,
-            "GROW_CURVE_ATTACK_305": 3.525,
-            "GROW_CURVE_CRITICAL_301": 2.373,
-        }
-    },
-    "40": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.866,
-            "GROW_CURVE_ATTACK_102": 4.206,
-            "GROW_CURVE_ATTACK_103": 4.528,
-            "GROW_CURVE_ATTACK_104": 3.504,
-            "GROW_CURVE_ATTACK_105": 3.121,
-            "GROW_CURVE_CRITICAL_101": 2.575,
-            "GROW_CURVE_ATTACK_201": 4.22,
-            "GROW_CURVE_ATTACK_202": 4.575,
-            "GROW_CURVE_ATTACK_203": 4.909,
-            "GROW_CURVE_ATTACK_204": 3.842,
-            "GROW_CURVE_ATTACK_205": 3.439,
-            "GROW_CURVE_CRITICAL_201": 2.575,
-            "GROW_CURVE_ATTACK_301": 4.443,
-            "GROW_CURVE_ATTACK_302": 4.827,
-            "GROW_CURVE_ATTACK_303": 5.186,
-            "GROW_CURVE_ATTACK_304": 4.031,
-            "GROW_CURVE_ATTACK_305": 3.588,
-            "GROW_CURVE_CRITICAL_301": 2.575,
-        }
-    },
-    "41": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 3.937,
-            "GROW_CURVE_ATTACK_102": 4.289,
-            "GROW_CURVE_ATTACK_103": 4.621,
-            "GROW_CURVE_ATTACK_104": 3.564,
-            "GROW_CURVE_ATTACK_105": 3.167,
-            "GROW_CURVE_CRITICAL_101": 2.575,
-            "GROW_CURVE_ATTACK_201": 4.303,
-            "GROW_CURVE_ATTACK_202": 4.669,
-            "GROW_CURVE_ATTACK_203": 5.014,
-            "GROW_CURVE_ATTACK_204": 3.913,
-            "GROW_CURVE_ATTACK_205": 3.496,
-            "GROW_CURVE_CRITICAL_201": 2.575,
-            "GROW_CURVE_ATTACK_301": 4.534,
-            "GROW_CURVE_ATTACK_302": 4.931,
-            "GROW_CURVE_ATTACK_303": 5.301,
-            "GROW_CURVE_ATTACK_304": 4.109,
-            "GROW_CURVE_ATTACK_305": 3.651,
-            "GROW_CURVE_CRITICAL_301": 2.575,
-        }
-    },
-    "42": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.008,
-            "GROW_CURVE_ATTACK_102": 4.371,
-            "GROW_CURVE_ATTACK_103": 4.714,
-            "GROW_CURVE_ATTACK_104": 3.623,
-            "GROW_CURVE_ATTACK_105": 3.214,
-            "GROW_CURVE_CRITICAL_101": 2.575,
-            "GROW_CURVE_ATTACK_201": 4.385,
-            "GROW_CURVE_ATTACK_202": 4.763,
-            "GROW_CURVE_ATTACK_203": 5.119,
-            "GROW_CURVE_ATTACK_204": 3.983,
-            "GROW_CURVE_ATTACK_205": 3.553,
-            "GROW_CURVE_CRITICAL_201": 2.575,
-            "GROW_CURVE_ATTACK_301": 4.625,
-            "GROW_CURVE_ATTACK_302": 5.035,
-            "GROW_CURVE_ATTACK_303": 5.417,
-            "GROW_CURVE_ATTACK_304": 4.186,
-            "GROW_CURVE_ATTACK_305": 3.714,
-            "GROW_CURVE_CRITICAL_301": 2.575,
-        }
-    },
-    "43": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.079,
-            "GROW_CURVE_ATTACK_102": 4.454,
-            "GROW_CURVE_ATTACK_103": 4.808,
-            "GROW_CURVE_ATTACK_104": 3.682,
-            "GROW_CURVE_ATTACK_105": 3.26,
-            "GROW_CURVE_CRITICAL_101": 2.575,
-            "GROW_CURVE_ATTACK_201": 4.468,
-            "GROW_CURVE_ATTACK_202": 4.858,
-            "GROW_CURVE_ATTACK_203": 5.225,
-            "GROW_CURVE_ATTACK_204": 4.053,
-            "GROW_CURVE_ATTACK_205": 3.609,
-            "GROW_CURVE_CRITICAL_201": 2.575,
-            "GROW_CURVE_ATTACK_301": 4.717,
-            "GROW_CURVE_ATTACK_302": 5.139,
-            "GROW_CURVE_ATTACK_303": 5.533,
-            "GROW_CURVE_ATTACK_304": 4.264,
-            "GROW_CURVE_ATTACK_305": 3.777,
-            "GROW_CURVE_CRITICAL_301": 2.575,
-        }
-    },
-    "44": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.15,
-            "GROW_CURVE_ATTACK_102": 4.536,
-            "GROW_CURVE_ATTACK_103": 4.901,
-            "GROW_CURVE_ATTACK_104": 3.741,
-            "GROW_CURVE_ATTACK_105": 3.306,
-            "GROW_CURVE_CRITICAL_101": 2.575,
-            "GROW_CURVE_ATTACK_201": 4.55,
-            "GROW_CURVE_ATTACK_202": 4.952,
-            "GROW_CURVE_ATTACK_203": 5.33,
-            "GROW_CURVE_ATTACK_204": 4.122,
-            "GROW_CURVE_ATTACK_205": 3.666,
-            "GROW_CURVE_CRITICAL_201": 2.575,
-            "GROW_CURVE_ATTACK_301": 4.808,
-            "GROW_CURVE_ATTACK_302": 5.243,
-            "GROW_CURVE_ATTACK_303": 5.65,
-            "GROW_CURVE_ATTACK_304": 4.342,
-            "GROW_CURVE_ATTACK_305": 3.84,
-            "GROW_CURVE_CRITICAL_301": 2.575,
-        }
-    },
-    "45": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.221,
-            "GROW_CURVE_ATTACK_102": 4.618,
-            "GROW_CURVE_ATTACK_103": 4.994,
-            "GROW_CURVE_ATTACK_104": 3.799,
-            "GROW_CURVE_ATTACK_105": 3.351,
-            "GROW_CURVE_CRITICAL_101": 2.777,
-            "GROW_CURVE_ATTACK_201": 4.633,
-            "GROW_CURVE_ATTACK_202": 5.047,
-            "GROW_CURVE_ATTACK_203": 5.436,
-            "GROW_CURVE_ATTACK_204": 4.192,
-            "GROW_CURVE_ATTACK_205": 3.722,
-            "GROW_CURVE_CRITICAL_201": 2.777,
-            "GROW_CURVE_ATTACK_301": 4.9,
-            "GROW_CURVE_ATTACK_302": 5.348,
-            "GROW_CURVE_ATTACK_303": 5.767,
-            "GROW_CURVE_ATTACK_304": 4.419,
-            "GROW_CURVE_ATTACK_305": 3.903,
-            "GROW_CURVE_CRITICAL_301": 2.777,
-        }
-    },
-    "46": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.291,
-            "GROW_CURVE_ATTACK_102": 4.701,
-            "GROW_CURVE_ATTACK_103": 5.087,
-            "GROW_CURVE_ATTACK_104": 3.858,
-            "GROW_CURVE_ATTACK_105": 3.397,
-            "GROW_CURVE_CRITICAL_101": 2.777,
-            "GROW_CURVE_ATTACK_201": 4.716,
-            "GROW_CURVE_ATTACK_202": 5.142,
-            "GROW_CURVE_ATTACK_203": 5.542,
-            "GROW_CURVE_ATTACK_204": 4.262,
-            "GROW_CURVE_ATTACK_205": 3.778,
-            "GROW_CURVE_CRITICAL_201": 2.777,
-            "GROW_CURVE_ATTACK_301": 4.992,
-            "GROW_CURVE_ATTACK_302": 5.453,
-            "GROW_CURVE_ATTACK_303": 5.884,
-            "GROW_CURVE_ATTACK_304": 4.497,
-            "GROW_CURVE_ATTACK_305": 3.966,
-            "GROW_CURVE_CRITICAL_301": 2.777,
-        }
-    },
-    "47": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.362,
-            "GROW_CURVE_ATTACK_102": 4.783,
-            "GROW_CURVE_ATTACK_103": 5.181,
-            "GROW_CURVE_ATTACK_104": 3.916,
-            "GROW_CURVE_ATTACK_105": 3.442,
-            "GROW_CURVE_CRITICAL_101": 2.777,
-            "GROW_CURVE_ATTACK_201": 4.798,
-            "GROW_CURVE_ATTACK_202": 5.236,
-            "GROW_CURVE_ATTACK_203": 5.648,
-            "GROW_CURVE_ATTACK_204": 4.332,
-            "GROW_CURVE_ATTACK_205": 3.834,
-            "GROW_CURVE_CRITICAL_201": 2.777,
-            "GROW_CURVE_ATTACK_301": 5.084,
-            "GROW_CURVE_ATTACK_302": 5.558,
-            "GROW_CURVE_ATTACK_303": 6.001,
-            "GROW_CURVE_ATTACK_304": 4.575,
-            "GROW_CURVE_ATTACK_305": 4.029,
-            "GROW_CURVE_CRITICAL_301": 2.777,
-        }
-    },
-    "48": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.433,
-            "GROW_CURVE_ATTACK_102": 4.865,
-            "GROW_CURVE_ATTACK_103": 5.274,
-            "GROW_CURVE_ATTACK_104": 3.974,
-            "GROW_CURVE_ATTACK_105": 3.487,
-            "GROW_CURVE_CRITICAL_101": 2.777,
-            "GROW_CURVE_ATTACK_201": 4.881,
-            "GROW_CURVE_ATTACK_202": 5.331,
-            "GROW_CURVE_ATTACK_203": 5.755,
-            "GROW_CURVE_ATTACK_204": 4.401,
-            "GROW_CURVE_ATTACK_205": 3.889,
-            "GROW_CURVE_CRITICAL_201": 2.777,
-            "GROW_CURVE_ATTACK_301": 5.176,
-            "GROW_CURVE_ATTACK_302": 5.663,
-            "GROW_CURVE_ATTACK_303": 6.118,
-            "GROW_CURVE_ATTACK_304": 4.653,
-            "GROW_CURVE_ATTACK_305": 4.092,
-            "GROW_CURVE_CRITICAL_301": 2.777,
-        }
-    },
-    "49": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.503,
-            "GROW_CURVE_ATTACK_102": 4.948,
-            "GROW_CURVE_ATTACK_103": 5.367,
-            "GROW_CURVE_ATTACK_104": 4.032,
-            "GROW_CURVE_ATTACK_105": 3.532,
-            "GROW_CURVE_CRITICAL_101": 2.777,
-            "GROW_CURVE_ATTACK_201": 4.963,
-            "GROW_CURVE_ATTACK_202": 5.426,
-            "GROW_CURVE_ATTACK_203": 5.861,
-            "GROW_CURVE_ATTACK_204": 4.471,
-            "GROW_CURVE_ATTACK_205": 3.945,
-            "GROW_CURVE_CRITICAL_201": 2.777,
-            "GROW_CURVE_ATTACK_301": 5.268,
-            "GROW_CURVE_ATTACK_302": 5.768,
-            "GROW_CURVE_ATTACK_303": 6.236,
-            "GROW_CURVE_ATTACK_304": 4.731,
-            "GROW_CURVE_ATTACK_305": 4.155,
-            "GROW_CURVE_CRITICAL_301": 2.777,
-        }
-    },
-    "50": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.574,
-            "GROW_CURVE_ATTACK_102": 5.03,
-            "GROW_CURVE_ATTACK_103": 5.461,
-            "GROW_CURVE_ATTACK_104": 4.09,
-            "GROW_CURVE_ATTACK_105": 3.576,
-            "GROW_CURVE_CRITICAL_101": 2.979,
-            "GROW_CURVE_ATTACK_201": 5.046,
-            "GROW_CURVE_ATTACK_202": 5.521,
-            "GROW_CURVE_ATTACK_203": 5.968,
-            "GROW_CURVE_ATTACK_204": 4.54,
-            "GROW_CURVE_ATTACK_205": 4,
-            "GROW_CURVE_CRITICAL_201": 2.979,
-            "GROW_CURVE_ATTACK_301": 5.36,
-            "GROW_CURVE_ATTACK_302": 5.874,
-            "GROW_CURVE_ATTACK_303": 6.354,
-            "GROW_CURVE_ATTACK_304": 4.81,
-            "GROW_CURVE_ATTACK_305": 4.217,
-            "GROW_CURVE_CRITICAL_301": 2.979,
-        }
-    },
-    "51": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.644,
-            "GROW_CURVE_ATTACK_102": 5.112,
-            "GROW_CURVE_ATTACK_103": 5.554,
-            "GROW_CURVE_ATTACK_104": 4.148,
-            "GROW_CURVE_ATTACK_105": 3.62,
-            "GROW_CURVE_CRITICAL_101": 2.979,
-            "GROW_CURVE_ATTACK_201": 5.128,
-            "GROW_CURVE_ATTACK_202": 5.616,
-            "GROW_CURVE_ATTACK_203": 6.074,
-            "GROW_CURVE_ATTACK_204": 4.609,
-            "GROW_CURVE_ATTACK_205": 4.056,
-            "GROW_CURVE_CRITICAL_201": 2.979,
-            "GROW_CURVE_ATTACK_301": 5.453,
-            "GROW_CURVE_ATTACK_302": 5.98,
-            "GROW_CURVE_ATTACK_303": 6.473,
-            "GROW_CURVE_ATTACK_304": 4.888,
-            "GROW_CURVE_ATTACK_305": 4.28,
-            "GROW_CURVE_CRITICAL_301": 2.979,
-        }
-    },
-    "52": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.714,
-            "GROW_CURVE_ATTACK_102": 5.194,
-            "GROW_CURVE_ATTACK_103": 5.648,
-            "GROW_CURVE_ATTACK_104": 4.205,
-            "GROW_CURVE_ATTACK_105": 3.665,
-            "GROW_CURVE_CRITICAL_101": 2.979,
-            "GROW_CURVE_ATTACK_201": 5.211,
-            "GROW_CURVE_ATTACK_202": 5.711,
-            "GROW_CURVE_ATTACK_203": 6.181,
-            "GROW_CURVE_ATTACK_204": 4.679,
-            "GROW_CURVE_ATTACK_205": 4.111,
-            "GROW_CURVE_CRITICAL_201": 2.979,
-            "GROW_CURVE_ATTACK_301": 5.546,
-            "GROW_CURVE_ATTACK_302": 6.086,
-            "GROW_CURVE_ATTACK_303": 6.592,
-            "GROW_CURVE_ATTACK_304": 4.966,
-            "GROW_CURVE_ATTACK_305": 4.343,
-            "GROW_CURVE_CRITICAL_301": 2.979,
-        }
-    },
-    "53": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.784,
-            "GROW_CURVE_ATTACK_102": 5.277,
-            "GROW_CURVE_ATTACK_103": 5.742,
-            "GROW_CURVE_ATTACK_104": 4.263,
-            "GROW_CURVE_ATTACK_105": 3.708,
-            "GROW_CURVE_CRITICAL_101": 2.979,
-            "GROW_CURVE_ATTACK_201": 5.294,
-            "GROW_CURVE_ATTACK_202": 5.806,
-            "GROW_CURVE_ATTACK_203": 6.288,
-            "GROW_CURVE_ATTACK_204": 4.748,
-            "GROW_CURVE_ATTACK_205": 4.166,
-            "GROW_CURVE_CRITICAL_201": 2.979,
-            "GROW_CURVE_ATTACK_301": 5.638,
-            "GROW_CURVE_ATTACK_302": 6.192,
-            "GROW_CURVE_ATTACK_303": 6.71,
-            "GROW_CURVE_ATTACK_304": 5.044,
-            "GROW_CURVE_ATTACK_305": 4.406,
-            "GROW_CURVE_CRITICAL_301": 2.979,
-        }
-    },
-    "54": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.855,
-            "GROW_CURVE_ATTACK_102": 5.359,
-            "GROW_CURVE_ATTACK_103": 5.835,
-            "GROW_CURVE_ATTACK_104": 4.32,
-            "GROW_CURVE_ATTACK_105": 3.752,
-            "GROW_CURVE_CRITICAL_101": 2.979,
-            "GROW_CURVE_ATTACK_201": 5.376,
-            "GROW_CURVE_ATTACK_202": 5.901,
-            "GROW_CURVE_ATTACK_203": 6.395,
-            "GROW_CURVE_ATTACK_204": 4.817,
-            "GROW_CURVE_ATTACK_205": 4.221,
-            "GROW_CURVE_CRITICAL_201": 2.979,
-            "GROW_CURVE_ATTACK_301": 5.731,
-            "GROW_CURVE_ATTACK_302": 6.299,
-            "GROW_CURVE_ATTACK_303": 6.83,
-            "GROW_CURVE_ATTACK_304": 5.123,
-            "GROW_CURVE_ATTACK_305": 4.469,
-            "GROW_CURVE_CRITICAL_301": 2.979,
-        }
-    },
-    "55": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.925,
-            "GROW_CURVE_ATTACK_102": 5.441,
-            "GROW_CURVE_ATTACK_103": 5.929,
-            "GROW_CURVE_ATTACK_104": 4.377,
-            "GROW_CURVE_ATTACK_105": 3.796,
-            "GROW_CURVE_CRITICAL_101": 3.181,
-            "GROW_CURVE_ATTACK_201": 5.459,
-            "GROW_CURVE_ATTACK_202": 5.996,
-            "GROW_CURVE_ATTACK_203": 6.502,
-            "GROW_CURVE_ATTACK_204": 4.886,
-            "GROW_CURVE_ATTACK_205": 4.275,
-            "GROW_CURVE_CRITICAL_201": 3.181,
-            "GROW_CURVE_ATTACK_301": 5.825,
-            "GROW_CURVE_ATTACK_302": 6.406,
-            "GROW_CURVE_ATTACK_303": 6.949,
-            "GROW_CURVE_ATTACK_304": 5.201,
-            "GROW_CURVE_ATTACK_305": 4.532,
-            "GROW_CURVE_CRITICAL_301": 3.181,
-        }
-    },
-    "56": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 4.995,
-            "GROW_CURVE_ATTACK_102": 5.523,
-            "GROW_CURVE_ATTACK_103": 6.023,
-            "GROW_CURVE_ATTACK_104": 4.434,
-            "GROW_CURVE_ATTACK_105": 3.839,
-            "GROW_CURVE_CRITICAL_101": 3.181,
-            "GROW_CURVE_ATTACK_201": 5.541,
-            "GROW_CURVE_ATTACK_202": 6.092,
-            "GROW_CURVE_ATTACK_203": 6.609,
-            "GROW_CURVE_ATTACK_204": 4.955,
-            "GROW_CURVE_ATTACK_205": 4.33,
-            "GROW_CURVE_CRITICAL_201": 3.181,
-            "GROW_CURVE_ATTACK_301": 5.918,
-            "GROW_CURVE_ATTACK_302": 6.513,
-            "GROW_CURVE_ATTACK_303": 7.069,
-            "GROW_CURVE_ATTACK_304": 5.28,
-            "GROW_CURVE_ATTACK_305": 4.594,
-            "GROW_CURVE_CRITICAL_301": 3.181,
-        }
-    },
-    "57": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.065,
-            "GROW_CURVE_ATTACK_102": 5.605,
-            "GROW_CURVE_ATTACK_103": 6.116,
-            "GROW_CURVE_ATTACK_104": 4.491,
-            "GROW_CURVE_ATTACK_105": 3.882,
-            "GROW_CURVE_CRITICAL_101": 3.181,
-            "GROW_CURVE_ATTACK_201": 5.624,
-            "GROW_CURVE_ATTACK_202": 6.187,
-            "GROW_CURVE_ATTACK_203": 6.717,
-            "GROW_CURVE_ATTACK_204": 5.024,
-            "GROW_CURVE_ATTACK_205": 4.384,
-            "GROW_CURVE_CRITICAL_201": 3.181,
-            "GROW_CURVE_ATTACK_301": 6.011,
-            "GROW_CURVE_ATTACK_302": 6.62,
-            "GROW_CURVE_ATTACK_303": 7.189,
-            "GROW_CURVE_ATTACK_304": 5.359,
-            "GROW_CURVE_ATTACK_305": 4.657,
-            "GROW_CURVE_CRITICAL_301": 3.181,
-        }
-    },
-    "58": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.134,
-            "GROW_CURVE_ATTACK_102": 5.688,
-            "GROW_CURVE_ATTACK_103": 6.21,
-            "GROW_CURVE_ATTACK_104": 4.548,
-            "GROW_CURVE_ATTACK_105": 3.925,
-            "GROW_CURVE_CRITICAL_101": 3.181,
-            "GROW_CURVE_ATTACK_201": 5.706,
-            "GROW_CURVE_ATTACK_202": 6.282,
-            "GROW_CURVE_ATTACK_203": 6.824,
-            "GROW_CURVE_ATTACK_204": 5.093,
-            "GROW_CURVE_ATTACK_205": 4.439,
-            "GROW_CURVE_CRITICAL_201": 3.181,
-            "GROW_CURVE_ATTACK_301": 6.105,
-            "GROW_CURVE_ATTACK_302": 6.727,
-            "GROW_CURVE_ATTACK_303": 7.309,
-            "GROW_CURVE_ATTACK_304": 5.437,
-            "GROW_CURVE_ATTACK_305": 4.72,
-            "GROW_CURVE_CRITICAL_301": 3.181,
-        }
-    },
-    "59": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.204,
-            "GROW_CURVE_ATTACK_102": 5.77,
-            "GROW_CURVE_ATTACK_103": 6.304,
-            "GROW_CURVE_ATTACK_104": 4.605,
-            "GROW_CURVE_ATTACK_105": 3.968,
-            "GROW_CURVE_CRITICAL_101": 3.181,
-            "GROW_CURVE_ATTACK_201": 5.789,
-            "GROW_CURVE_ATTACK_202": 6.378,
-            "GROW_CURVE_ATTACK_203": 6.932,
-            "GROW_CURVE_ATTACK_204": 5.162,
-            "GROW_CURVE_ATTACK_205": 4.493,
-            "GROW_CURVE_CRITICAL_201": 3.181,
-            "GROW_CURVE_ATTACK_301": 6.198,
-            "GROW_CURVE_ATTACK_302": 6.835,
-            "GROW_CURVE_ATTACK_303": 7.429,
-            "GROW_CURVE_ATTACK_304": 5.516,
-            "GROW_CURVE_ATTACK_305": 4.783,
-            "GROW_CURVE_CRITICAL_301": 3.181,
-        }
-    },
-    "60": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.274,
-            "GROW_CURVE_ATTACK_102": 5.852,
-            "GROW_CURVE_ATTACK_103": 6.398,
-            "GROW_CURVE_ATTACK_104": 4.661,
-            "GROW_CURVE_ATTACK_105": 4.01,
-            "GROW_CURVE_CRITICAL_101": 3.383,
-            "GROW_CURVE_ATTACK_201": 5.872,
-            "GROW_CURVE_ATTACK_202": 6.473,
-            "GROW_CURVE_ATTACK_203": 7.039,
-            "GROW_CURVE_ATTACK_204": 5.231,
-            "GROW_CURVE_ATTACK_205": 4.547,
-            "GROW_CURVE_CRITICAL_201": 3.383,
-            "GROW_CURVE_ATTACK_301": 6.292,
-            "GROW_CURVE_ATTACK_302": 6.942,
-            "GROW_CURVE_ATTACK_303": 7.55,
-            "GROW_CURVE_ATTACK_304": 5.595,
-            "GROW_CURVE_ATTACK_305": 4.846,
-            "GROW_CURVE_CRITICAL_301": 3.383,
-        }
-    },
-    "61": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.344,
-            "GROW_CURVE_ATTACK_102": 5.934,
-            "GROW_CURVE_ATTACK_103": 6.492,
-            "GROW_CURVE_ATTACK_104": 4.718,
-            "GROW_CURVE_ATTACK_105": 4.053,
-            "GROW_CURVE_CRITICAL_101": 3.383,
-            "GROW_CURVE_ATTACK_201": 5.954,
-            "GROW_CURVE_ATTACK_202": 6.569,
-            "GROW_CURVE_ATTACK_203": 7.147,
-            "GROW_CURVE_ATTACK_204": 5.3,
-            "GROW_CURVE_ATTACK_205": 4.601,
-            "GROW_CURVE_CRITICAL_201": 3.383,
-            "GROW_CURVE_ATTACK_301": 6.386,
-            "GROW_CURVE_ATTACK_302": 7.05,
-            "GROW_CURVE_ATTACK_303": 7.671,
-            "GROW_CURVE_ATTACK_304": 5.674,
-            "GROW_CURVE_ATTACK_305": 4.909,
-            "GROW_CURVE_CRITICAL_301": 3.383,
-        }
-    },
-    "62": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.413,
-            "GROW_CURVE_ATTACK_102": 6.016,
-            "GROW_CURVE_ATTACK_103": 6.586,
-            "GROW_CURVE_ATTACK_104": 4.774,
-            "GROW_CURVE_ATTACK_105": 4.095,
-            "GROW_CURVE_CRITICAL_101": 3.383,
-            "GROW_CURVE_ATTACK_201": 6.037,
-            "GROW_CURVE_ATTACK_202": 6.664,
-            "GROW_CURVE_ATTACK_203": 7.255,
-            "GROW_CURVE_ATTACK_204": 5.368,
-            "GROW_CURVE_ATTACK_205": 4.655,
-            "GROW_CURVE_CRITICAL_201": 3.383,
-            "GROW_CURVE_ATTACK_301": 6.48,
-            "GROW_CURVE_ATTACK_302": 7.158,
-            "GROW_CURVE_ATTACK_303": 7.792,
-            "GROW_CURVE_ATTACK_304": 5.753,
-            "GROW_CURVE_ATTACK_305": 4.972,
-            "GROW_CURVE_CRITICAL_301": 3.383,
-        }
-    },
-    "63": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.483,
-            "GROW_CURVE_ATTACK_102": 6.098,
-            "GROW_CURVE_ATTACK_103": 6.68,
-            "GROW_CURVE_ATTACK_104": 4.83,
-            "GROW_CURVE_ATTACK_105": 4.137,
-            "GROW_CURVE_CRITICAL_101": 3.383,
-            "GROW_CURVE_ATTACK_201": 6.119,
-            "GROW_CURVE_ATTACK_202": 6.76,
-            "GROW_CURVE_ATTACK_203": 7.363,
-            "GROW_CURVE_ATTACK_204": 5.437,
-            "GROW_CURVE_ATTACK_205": 4.709,
-            "GROW_CURVE_CRITICAL_201": 3.383,
-            "GROW_CURVE_ATTACK_301": 6.575,
-            "GROW_CURVE_ATTACK_302": 7.267,
-            "GROW_CURVE_ATTACK_303": 7.913,
-            "GROW_CURVE_ATTACK_304": 5.833,
-            "GROW_CURVE_ATTACK_305": 5.035,
-            "GROW_CURVE_CRITICAL_301": 3.383,
-        }
-    },
-    "64": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.552,
-            "GROW_CURVE_ATTACK_102": 6.18,
-            "GROW_CURVE_ATTACK_103": 6.774,
-            "GROW_CURVE_ATTACK_104": 4.887,
-            "GROW_CURVE_ATTACK_105": 4.179,
-            "GROW_CURVE_CRITICAL_101": 3.383,
-            "GROW_CURVE_ATTACK_201": 6.202,
-            "GROW_CURVE_ATTACK_202": 6.856,
-            "GROW_CURVE_ATTACK_203": 7.471,
-            "GROW_CURVE_ATTACK_204": 5.506,
-            "GROW_CURVE_ATTACK_205": 4.763,
-            "GROW_CURVE_CRITICAL_201": 3.383,
-            "GROW_CURVE_ATTACK_301": 6.669,
-            "GROW_CURVE_ATTACK_302": 7.375,
-            "GROW_CURVE_ATTACK_303": 8.035,
-            "GROW_CURVE_ATTACK_304": 5.912,
-            "GROW_CURVE_ATTACK_305": 5.098,
-            "GROW_CURVE_CRITICAL_301": 3.383,
-        }
-    },
-    "65": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.622,
-            "GROW_CURVE_ATTACK_102": 6.262,
-            "GROW_CURVE_ATTACK_103": 6.868,
-            "GROW_CURVE_ATTACK_104": 4.943,
-            "GROW_CURVE_ATTACK_105": 4.221,
-            "GROW_CURVE_CRITICAL_101": 3.585,
-            "GROW_CURVE_ATTACK_201": 6.284,
-            "GROW_CURVE_ATTACK_202": 6.951,
-            "GROW_CURVE_ATTACK_203": 7.579,
-            "GROW_CURVE_ATTACK_204": 5.574,
-            "GROW_CURVE_ATTACK_205": 4.816,
-            "GROW_CURVE_CRITICAL_201": 3.585,
-            "GROW_CURVE_ATTACK_301": 6.763,
-            "GROW_CURVE_ATTACK_302": 7.484,
-            "GROW_CURVE_ATTACK_303": 8.157,
-            "GROW_CURVE_ATTACK_304": 5.991,
-            "GROW_CURVE_ATTACK_305": 5.161,
-            "GROW_CURVE_CRITICAL_301": 3.585,
-        }
-    },
-    "66": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.691,
-            "GROW_CURVE_ATTACK_102": 6.344,
-            "GROW_CURVE_ATTACK_103": 6.962,
-            "GROW_CURVE_ATTACK_104": 4.999,
-            "GROW_CURVE_ATTACK_105": 4.263,
-            "GROW_CURVE_CRITICAL_101": 3.585,
-            "GROW_CURVE_ATTACK_201": 6.367,
-            "GROW_CURVE_ATTACK_202": 7.047,
-            "GROW_CURVE_ATTACK_203": 7.687,
-            "GROW_CURVE_ATTACK_204": 5.643,
-            "GROW_CURVE_ATTACK_205": 4.87,
-            "GROW_CURVE_CRITICAL_201": 3.585,
-            "GROW_CURVE_ATTACK_301": 6.858,
-            "GROW_CURVE_ATTACK_302": 7.592,
-            "GROW_CURVE_ATTACK_303": 8.279,
-            "GROW_CURVE_ATTACK_304": 6.071,
-            "GROW_CURVE_ATTACK_305": 5.225,
-            "GROW_CURVE_CRITICAL_301": 3.585,
-        }
-    },
-    "67": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.761,
-            "GROW_CURVE_ATTACK_102": 6.427,
-            "GROW_CURVE_ATTACK_103": 7.056,
-            "GROW_CURVE_ATTACK_104": 5.054,
-            "GROW_CURVE_ATTACK_105": 4.304,
-            "GROW_CURVE_CRITICAL_101": 3.585,
-            "GROW_CURVE_ATTACK_201": 6.45,
-            "GROW_CURVE_ATTACK_202": 7.143,
-            "GROW_CURVE_ATTACK_203": 7.795,
-            "GROW_CURVE_ATTACK_204": 5.711,
-            "GROW_CURVE_ATTACK_205": 4.923,
-            "GROW_CURVE_CRITICAL_201": 3.585,
-            "GROW_CURVE_ATTACK_301": 6.953,
-            "GROW_CURVE_ATTACK_302": 7.701,
-            "GROW_CURVE_ATTACK_303": 8.401,
-            "GROW_CURVE_ATTACK_304": 6.15,
-            "GROW_CURVE_ATTACK_305": 5.288,
-            "GROW_CURVE_CRITICAL_301": 3.585,
-        }
-    },
-    "68": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.83,
-            "GROW_CURVE_ATTACK_102": 6.509,
-            "GROW_CURVE_ATTACK_103": 7.15,
-            "GROW_CURVE_ATTACK_104": 5.11,
-            "GROW_CURVE_ATTACK_105": 4.346,
-            "GROW_CURVE_CRITICAL_101": 3.585,
-            "GROW_CURVE_ATTACK_201": 6.532,
-            "GROW_CURVE_ATTACK_202": 7.239,
-            "GROW_CURVE_ATTACK_203": 7.904,
-            "GROW_CURVE_ATTACK_204": 5.78,
-            "GROW_CURVE_ATTACK_205": 4.977,
-            "GROW_CURVE_CRITICAL_201": 3.585,
-            "GROW_CURVE_ATTACK_301": 7.048,
-            "GROW_CURVE_ATTACK_302": 7.811,
-            "GROW_CURVE_ATTACK_303": 8.524,
-            "GROW_CURVE_ATTACK_304": 6.23,
-            "GROW_CURVE_ATTACK_305": 5.351,
-            "GROW_CURVE_CRITICAL_301": 3.585,
-        }
-    },
-    "69": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.899,
-            "GROW_CURVE_ATTACK_102": 6.591,
-            "GROW_CURVE_ATTACK_103": 7.244,
-            "GROW_CURVE_ATTACK_104": 5.166,
-            "GROW_CURVE_ATTACK_105": 4.387,
-            "GROW_CURVE_CRITICAL_101": 3.585,
-            "GROW_CURVE_ATTACK_201": 6.615,
-            "GROW_CURVE_ATTACK_202": 7.335,
-            "GROW_CURVE_ATTACK_203": 8.012,
-            "GROW_CURVE_ATTACK_204": 5.848,
-            "GROW_CURVE_ATTACK_205": 5.03,
-            "GROW_CURVE_CRITICAL_201": 3.585,
-            "GROW_CURVE_ATTACK_301": 7.143,
-            "GROW_CURVE_ATTACK_302": 7.92,
-            "GROW_CURVE_ATTACK_303": 8.646,
-            "GROW_CURVE_ATTACK_304": 6.31,
-            "GROW_CURVE_ATTACK_305": 5.414,
-            "GROW_CURVE_CRITICAL_301": 3.585,
-        }
-    },
-    "70": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 5.968,
-            "GROW_CURVE_ATTACK_102": 6.673,
-            "GROW_CURVE_ATTACK_103": 7.338,
-            "GROW_CURVE_ATTACK_104": 5.222,
-            "GROW_CURVE_ATTACK_105": 4.428,
-            "GROW_CURVE_CRITICAL_101": 3.786,
-            "GROW_CURVE_ATTACK_201": 6.697,
-            "GROW_CURVE_ATTACK_202": 7.431,
-            "GROW_CURVE_ATTACK_203": 8.12,
-            "GROW_CURVE_ATTACK_204": 5.916,
-            "GROW_CURVE_ATTACK_205": 5.083,
-            "GROW_CURVE_CRITICAL_201": 3.786,
-            "GROW_CURVE_ATTACK_301": 7.238,
-            "GROW_CURVE_ATTACK_302": 8.03,
-            "GROW_CURVE_ATTACK_303": 8.769,
-            "GROW_CURVE_ATTACK_304": 6.39,
-            "GROW_CURVE_ATTACK_305": 5.478,
-            "GROW_CURVE_CRITICAL_301": 3.786,
-        }
-    },
-    "71": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.038,
-            "GROW_CURVE_ATTACK_102": 6.755,
-            "GROW_CURVE_ATTACK_103": 7.432,
-            "GROW_CURVE_ATTACK_104": 5.277,
-            "GROW_CURVE_ATTACK_105": 4.469,
-            "GROW_CURVE_CRITICAL_101": 3.786,
-            "GROW_CURVE_ATTACK_201": 6.78,
-            "GROW_CURVE_ATTACK_202": 7.527,
-            "GROW_CURVE_ATTACK_203": 8.229,
-            "GROW_CURVE_ATTACK_204": 5.985,
-            "GROW_CURVE_ATTACK_205": 5.136,
-            "GROW_CURVE_CRITICAL_201": 3.786,
-            "GROW_CURVE_ATTACK_301": 7.334,
-            "GROW_CURVE_ATTACK_302": 8.139,
-            "GROW_CURVE_ATTACK_303": 8.893,
-            "GROW_CURVE_ATTACK_304": 6.47,
-            "GROW_CURVE_ATTACK_305": 5.541,
-            "GROW_CURVE_CRITICAL_301": 3.786,
-        }
-    },
-    "72": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.107,
-            "GROW_CURVE_ATTACK_102": 6.837,
-            "GROW_CURVE_ATTACK_103": 7.527,
-            "GROW_CURVE_ATTACK_104": 5.333,
-            "GROW_CURVE_ATTACK_105": 4.51,
-            "GROW_CURVE_CRITICAL_101": 3.786,
-            "GROW_CURVE_ATTACK_201": 6.862,
-            "GROW_CURVE_ATTACK_202": 7.623,
-            "GROW_CURVE_ATTACK_203": 8.338,
-            "GROW_CURVE_ATTACK_204": 6.053,
-            "GROW_CURVE_ATTACK_205": 5.189,
-            "GROW_CURVE_CRITICAL_201": 3.786,
-            "GROW_CURVE_ATTACK_301": 7.429,
-            "GROW_CURVE_ATTACK_302": 8.249,
-            "GROW_CURVE_ATTACK_303": 9.016,
-            "GROW_CURVE_ATTACK_304": 6.55,
-            "GROW_CURVE_ATTACK_305": 5.605,
-            "GROW_CURVE_CRITICAL_301": 3.786,
-        }
-    },
-    "73": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.176,
-            "GROW_CURVE_ATTACK_102": 6.919,
-            "GROW_CURVE_ATTACK_103": 7.621,
-            "GROW_CURVE_ATTACK_104": 5.388,
-            "GROW_CURVE_ATTACK_105": 4.551,
-            "GROW_CURVE_CRITICAL_101": 3.786,
-            "GROW_CURVE_ATTACK_201": 6.945,
-            "GROW_CURVE_ATTACK_202": 7.719,
-            "GROW_CURVE_ATTACK_203": 8.446,
-            "GROW_CURVE_ATTACK_204": 6.121,
-            "GROW_CURVE_ATTACK_205": 5.242,
-            "GROW_CURVE_CRITICAL_201": 3.786,
-            "GROW_CURVE_ATTACK_301": 7.525,
-            "GROW_CURVE_ATTACK_302": 8.359,
-            "GROW_CURVE_ATTACK_303": 9.14,
-            "GROW_CURVE_ATTACK_304": 6.63,
-            "GROW_CURVE_ATTACK_305": 5.668,
-            "GROW_CURVE_CRITICAL_301": 3.786,
-        }
-    },
-    "74": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.245,
-            "GROW_CURVE_ATTACK_102": 7.001,
-            "GROW_CURVE_ATTACK_103": 7.715,
-            "GROW_CURVE_ATTACK_104": 5.443,
-            "GROW_CURVE_ATTACK_105": 4.592,
-            "GROW_CURVE_CRITICAL_101": 3.786,
-            "GROW_CURVE_ATTACK_201": 7.028,
-            "GROW_CURVE_ATTACK_202": 7.815,
-            "GROW_CURVE_ATTACK_203": 8.555,
-            "GROW_CURVE_ATTACK_204": 6.189,
-            "GROW_CURVE_ATTACK_205": 5.295,
-            "GROW_CURVE_CRITICAL_201": 3.786,
-            "GROW_CURVE_ATTACK_301": 7.621,
-            "GROW_CURVE_ATTACK_302": 8.47,
-            "GROW_CURVE_ATTACK_303": 9.263,
-            "GROW_CURVE_ATTACK_304": 6.71,
-            "GROW_CURVE_ATTACK_305": 5.732,
-            "GROW_CURVE_CRITICAL_301": 3.786,
-        }
-    },
-    "75": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.314,
-            "GROW_CURVE_ATTACK_102": 7.083,
-            "GROW_CURVE_ATTACK_103": 7.81,
-            "GROW_CURVE_ATTACK_104": 5.498,
-            "GROW_CURVE_ATTACK_105": 4.632,
-            "GROW_CURVE_CRITICAL_101": 3.988,
-            "GROW_CURVE_ATTACK_201": 7.11,
-            "GROW_CURVE_ATTACK_202": 7.911,
-            "GROW_CURVE_ATTACK_203": 8.664,
-            "GROW_CURVE_ATTACK_204": 6.257,
-            "GROW_CURVE_ATTACK_205": 5.347,
-            "GROW_CURVE_CRITICAL_201": 3.988,
-            "GROW_CURVE_ATTACK_301": 7.717,
-            "GROW_CURVE_ATTACK_302": 8.58,
-            "GROW_CURVE_ATTACK_303": 9.387,
-            "GROW_CURVE_ATTACK_304": 6.791,
-            "GROW_CURVE_ATTACK_305": 5.796,
-            "GROW_CURVE_CRITICAL_301": 3.988,
-        }
-    },
-    "76": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.383,
-            "GROW_CURVE_ATTACK_102": 7.165,
-            "GROW_CURVE_ATTACK_103": 7.904,
-            "GROW_CURVE_ATTACK_104": 5.554,
-            "GROW_CURVE_ATTACK_105": 4.673,
-            "GROW_CURVE_CRITICAL_101": 3.988,
-            "GROW_CURVE_ATTACK_201": 7.193,
-            "GROW_CURVE_ATTACK_202": 8.007,
-            "GROW_CURVE_ATTACK_203": 8.773,
-            "GROW_CURVE_ATTACK_204": 6.326,
-            "GROW_CURVE_ATTACK_205": 5.4,
-            "GROW_CURVE_CRITICAL_201": 3.988,
-            "GROW_CURVE_ATTACK_301": 7.813,
-            "GROW_CURVE_ATTACK_302": 8.691,
-            "GROW_CURVE_ATTACK_303": 9.512,
-            "GROW_CURVE_ATTACK_304": 6.871,
-            "GROW_CURVE_ATTACK_305": 5.859,
-            "GROW_CURVE_CRITICAL_301": 3.988,
-        }
-    },
-    "77": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.452,
-            "GROW_CURVE_ATTACK_102": 7.247,
-            "GROW_CURVE_ATTACK_103": 7.998,
-            "GROW_CURVE_ATTACK_104": 5.609,
-            "GROW_CURVE_ATTACK_105": 4.713,
-            "GROW_CURVE_CRITICAL_101": 3.988,
-            "GROW_CURVE_ATTACK_201": 7.275,
-            "GROW_CURVE_ATTACK_202": 8.103,
-            "GROW_CURVE_ATTACK_203": 8.882,
-            "GROW_CURVE_ATTACK_204": 6.394,
-            "GROW_CURVE_ATTACK_205": 5.453,
-            "GROW_CURVE_CRITICAL_201": 3.988,
-            "GROW_CURVE_ATTACK_301": 7.909,
-            "GROW_CURVE_ATTACK_302": 8.802,
-            "GROW_CURVE_ATTACK_303": 9.636,
-            "GROW_CURVE_ATTACK_304": 6.952,
-            "GROW_CURVE_ATTACK_305": 5.923,
-            "GROW_CURVE_CRITICAL_301": 3.988,
-        }
-    },
-    "78": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.521,
-            "GROW_CURVE_ATTACK_102": 7.329,
-            "GROW_CURVE_ATTACK_103": 8.093,
-            "GROW_CURVE_ATTACK_104": 5.664,
-            "GROW_CURVE_ATTACK_105": 4.753,
-            "GROW_CURVE_CRITICAL_101": 3.988,
-            "GROW_CURVE_ATTACK_201": 7.358,
-            "GROW_CURVE_ATTACK_202": 8.199,
-            "GROW_CURVE_ATTACK_203": 8.991,
-            "GROW_CURVE_ATTACK_204": 6.462,
-            "GROW_CURVE_ATTACK_205": 5.505,
-            "GROW_CURVE_CRITICAL_201": 3.988,
-            "GROW_CURVE_ATTACK_301": 8.005,
-            "GROW_CURVE_ATTACK_302": 8.913,
-            "GROW_CURVE_ATTACK_303": 9.761,
-            "GROW_CURVE_ATTACK_304": 7.033,
-            "GROW_CURVE_ATTACK_305": 5.987,
-            "GROW_CURVE_CRITICAL_301": 3.988,
-        }
-    },
-    "79": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.59,
-            "GROW_CURVE_ATTACK_102": 7.411,
-            "GROW_CURVE_ATTACK_103": 8.187,
-            "GROW_CURVE_ATTACK_104": 5.719,
-            "GROW_CURVE_ATTACK_105": 4.793,
-            "GROW_CURVE_CRITICAL_101": 3.988,
-            "GROW_CURVE_ATTACK_201": 7.44,
-            "GROW_CURVE_ATTACK_202": 8.296,
-            "GROW_CURVE_ATTACK_203": 9.1,
-            "GROW_CURVE_ATTACK_204": 6.53,
-            "GROW_CURVE_ATTACK_205": 5.558,
-            "GROW_CURVE_CRITICAL_201": 3.988,
-            "GROW_CURVE_ATTACK_301": 8.102,
-            "GROW_CURVE_ATTACK_302": 9.024,
-            "GROW_CURVE_ATTACK_303": 9.886,
-            "GROW_CURVE_ATTACK_304": 7.113,
-            "GROW_CURVE_ATTACK_305": 6.051,
-            "GROW_CURVE_CRITICAL_301": 3.988,
-        }
-    },
-    "80": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.659,
-            "GROW_CURVE_ATTACK_102": 7.493,
-            "GROW_CURVE_ATTACK_103": 8.282,
-            "GROW_CURVE_ATTACK_104": 5.774,
-            "GROW_CURVE_ATTACK_105": 4.834,
-            "GROW_CURVE_CRITICAL_101": 4.19,
-            "GROW_CURVE_ATTACK_201": 7.523,
-            "GROW_CURVE_ATTACK_202": 8.392,
-            "GROW_CURVE_ATTACK_203": 9.209,
-            "GROW_CURVE_ATTACK_204": 6.598,
-            "GROW_CURVE_ATTACK_205": 5.61,
-            "GROW_CURVE_CRITICAL_201": 4.19,
-            "GROW_CURVE_ATTACK_301": 8.199,
-            "GROW_CURVE_ATTACK_302": 9.135,
-            "GROW_CURVE_ATTACK_303": 10.011,
-            "GROW_CURVE_ATTACK_304": 7.194,
-            "GROW_CURVE_ATTACK_305": 6.115,
-            "GROW_CURVE_CRITICAL_301": 4.19,
-        }
-    },
-    "81": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.727,
-            "GROW_CURVE_ATTACK_102": 7.575,
-            "GROW_CURVE_ATTACK_103": 8.376,
-            "GROW_CURVE_ATTACK_104": 5.828,
-            "GROW_CURVE_ATTACK_105": 4.873,
-            "GROW_CURVE_CRITICAL_101": 4.19,
-            "GROW_CURVE_ATTACK_201": 7.606,
-            "GROW_CURVE_ATTACK_202": 8.488,
-            "GROW_CURVE_ATTACK_203": 9.319,
-            "GROW_CURVE_ATTACK_204": 6.665,
-            "GROW_CURVE_ATTACK_205": 5.662,
-            "GROW_CURVE_CRITICAL_201": 4.19,
-            "GROW_CURVE_ATTACK_301": 8.295,
-            "GROW_CURVE_ATTACK_302": 9.247,
-            "GROW_CURVE_ATTACK_303": 10.136,
-            "GROW_CURVE_ATTACK_304": 7.275,
-            "GROW_CURVE_ATTACK_305": 6.179,
-            "GROW_CURVE_CRITICAL_301": 4.19,
-        }
-    },
-    "82": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.796,
-            "GROW_CURVE_ATTACK_102": 7.657,
-            "GROW_CURVE_ATTACK_103": 8.471,
-            "GROW_CURVE_ATTACK_104": 5.883,
-            "GROW_CURVE_ATTACK_105": 4.913,
-            "GROW_CURVE_CRITICAL_101": 4.19,
-            "GROW_CURVE_ATTACK_201": 7.688,
-            "GROW_CURVE_ATTACK_202": 8.585,
-            "GROW_CURVE_ATTACK_203": 9.428,
-            "GROW_CURVE_ATTACK_204": 6.733,
-            "GROW_CURVE_ATTACK_205": 5.715,
-            "GROW_CURVE_CRITICAL_201": 4.19,
-            "GROW_CURVE_ATTACK_301": 8.392,
-            "GROW_CURVE_ATTACK_302": 9.358,
-            "GROW_CURVE_ATTACK_303": 10.261,
-            "GROW_CURVE_ATTACK_304": 7.357,
-            "GROW_CURVE_ATTACK_305": 6.243,
-            "GROW_CURVE_CRITICAL_301": 4.19,
-        }
-    },
-    "83": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.865,
-            "GROW_CURVE_ATTACK_102": 7.739,
-            "GROW_CURVE_ATTACK_103": 8.565,
-            "GROW_CURVE_ATTACK_104": 5.938,
-            "GROW_CURVE_ATTACK_105": 4.953,
-            "GROW_CURVE_CRITICAL_101": 4.19,
-            "GROW_CURVE_ATTACK_201": 7.771,
-            "GROW_CURVE_ATTACK_202": 8.681,
-            "GROW_CURVE_ATTACK_203": 9.537,
-            "GROW_CURVE_ATTACK_204": 6.801,
-            "GROW_CURVE_ATTACK_205": 5.767,
-            "GROW_CURVE_CRITICAL_201": 4.19,
-            "GROW_CURVE_ATTACK_301": 8.489,
-            "GROW_CURVE_ATTACK_302": 9.47,
-            "GROW_CURVE_ATTACK_303": 10.387,
-            "GROW_CURVE_ATTACK_304": 7.438,
-            "GROW_CURVE_ATTACK_305": 6.308,
-            "GROW_CURVE_CRITICAL_301": 4.19,
-        }
-    },
-    "84": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 6.934,
-            "GROW_CURVE_ATTACK_102": 7.821,
-            "GROW_CURVE_ATTACK_103": 8.66,
-            "GROW_CURVE_ATTACK_104": 5.993,
-            "GROW_CURVE_ATTACK_105": 4.993,
-            "GROW_CURVE_CRITICAL_101": 4.19,
-            "GROW_CURVE_ATTACK_201": 7.853,
-            "GROW_CURVE_ATTACK_202": 8.777,
-            "GROW_CURVE_ATTACK_203": 9.647,
-            "GROW_CURVE_ATTACK_204": 6.869,
-            "GROW_CURVE_ATTACK_205": 5.819,
-            "GROW_CURVE_CRITICAL_201": 4.19,
-            "GROW_CURVE_ATTACK_301": 8.587,
-            "GROW_CURVE_ATTACK_302": 9.582,
-            "GROW_CURVE_ATTACK_303": 10.513,
-            "GROW_CURVE_ATTACK_304": 7.519,
-            "GROW_CURVE_ATTACK_305": 6.372,
-            "GROW_CURVE_CRITICAL_301": 4.19,
-        }
-    },
-    "85": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.003,
-            "GROW_CURVE_ATTACK_102": 7.904,
-            "GROW_CURVE_ATTACK_103": 8.755,
-            "GROW_CURVE_ATTACK_104": 6.047,
-            "GROW_CURVE_ATTACK_105": 5.032,
-            "GROW_CURVE_CRITICAL_101": 4.392,
-            "GROW_CURVE_ATTACK_201": 7.936,
-            "GROW_CURVE_ATTACK_202": 8.874,
-            "GROW_CURVE_ATTACK_203": 9.756,
-            "GROW_CURVE_ATTACK_204": 6.937,
-            "GROW_CURVE_ATTACK_205": 5.871,
-            "GROW_CURVE_CRITICAL_201": 4.392,
-            "GROW_CURVE_ATTACK_301": 8.684,
-            "GROW_CURVE_ATTACK_302": 9.694,
-            "GROW_CURVE_ATTACK_303": 10.639,
-            "GROW_CURVE_ATTACK_304": 7.601,
-            "GROW_CURVE_ATTACK_305": 6.436,
-            "GROW_CURVE_CRITICAL_301": 4.392,
-        }
-    },
-    "86": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.071,
-            "GROW_CURVE_ATTACK_102": 7.986,
-            "GROW_CURVE_ATTACK_103": 8.849,
-            "GROW_CURVE_ATTACK_104": 6.102,
-            "GROW_CURVE_ATTACK_105": 5.072,
-            "GROW_CURVE_CRITICAL_101": 4.392,
-            "GROW_CURVE_ATTACK_201": 8.018,
-            "GROW_CURVE_ATTACK_202": 8.97,
-            "GROW_CURVE_ATTACK_203": 9.866,
-            "GROW_CURVE_ATTACK_204": 7.005,
-            "GROW_CURVE_ATTACK_205": 5.923,
-            "GROW_CURVE_CRITICAL_201": 4.392,
-            "GROW_CURVE_ATTACK_301": 8.782,
-            "GROW_CURVE_ATTACK_302": 9.807,
-            "GROW_CURVE_ATTACK_303": 10.765,
-            "GROW_CURVE_ATTACK_304": 7.682,
-            "GROW_CURVE_ATTACK_305": 6.501,
-            "GROW_CURVE_CRITICAL_301": 4.392,
-        }
-    },
-    "87": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.14,
-            "GROW_CURVE_ATTACK_102": 8.068,
-            "GROW_CURVE_ATTACK_103": 8.944,
-            "GROW_CURVE_ATTACK_104": 6.156,
-            "GROW_CURVE_ATTACK_105": 5.111,
-            "GROW_CURVE_CRITICAL_101": 4.392,
-            "GROW_CURVE_ATTACK_201": 8.101,
-            "GROW_CURVE_ATTACK_202": 9.067,
-            "GROW_CURVE_ATTACK_203": 9.975,
-            "GROW_CURVE_ATTACK_204": 7.072,
-            "GROW_CURVE_ATTACK_205": 5.975,
-            "GROW_CURVE_CRITICAL_201": 4.392,
-            "GROW_CURVE_ATTACK_301": 8.879,
-            "GROW_CURVE_ATTACK_302": 9.919,
-            "GROW_CURVE_ATTACK_303": 10.892,
-            "GROW_CURVE_ATTACK_304": 7.764,
-            "GROW_CURVE_ATTACK_305": 6.565,
-            "GROW_CURVE_CRITICAL_301": 4.392,
-        }
-    },
-    "88": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.209,
-            "GROW_CURVE_ATTACK_102": 8.15,
-            "GROW_CURVE_ATTACK_103": 9.039,
-            "GROW_CURVE_ATTACK_104": 6.211,
-            "GROW_CURVE_ATTACK_105": 5.151,
-            "GROW_CURVE_CRITICAL_101": 4.392,
-            "GROW_CURVE_ATTACK_201": 8.183,
-            "GROW_CURVE_ATTACK_202": 9.163,
-            "GROW_CURVE_ATTACK_203": 10.085,
-            "GROW_CURVE_ATTACK_204": 7.14,
-            "GROW_CURVE_ATTACK_205": 6.027,
-            "GROW_CURVE_CRITICAL_201": 4.392,
-            "GROW_CURVE_ATTACK_301": 8.977,
-            "GROW_CURVE_ATTACK_302": 10.032,
-            "GROW_CURVE_ATTACK_303": 11.018,
-            "GROW_CURVE_ATTACK_304": 7.846,
-            "GROW_CURVE_ATTACK_305": 6.63,
-            "GROW_CURVE_CRITICAL_301": 4.392,
-        }
-    },
-    "89": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.277,
-            "GROW_CURVE_ATTACK_102": 8.232,
-            "GROW_CURVE_ATTACK_103": 9.134,
-            "GROW_CURVE_ATTACK_104": 6.265,
-            "GROW_CURVE_ATTACK_105": 5.19,
-            "GROW_CURVE_CRITICAL_101": 4.392,
-            "GROW_CURVE_ATTACK_201": 8.266,
-            "GROW_CURVE_ATTACK_202": 9.26,
-            "GROW_CURVE_ATTACK_203": 10.195,
-            "GROW_CURVE_ATTACK_204": 7.208,
-            "GROW_CURVE_ATTACK_205": 6.078,
-            "GROW_CURVE_CRITICAL_201": 4.392,
-            "GROW_CURVE_ATTACK_301": 9.075,
-            "GROW_CURVE_ATTACK_302": 10.145,
-            "GROW_CURVE_ATTACK_303": 11.145,
-            "GROW_CURVE_ATTACK_304": 7.928,
-            "GROW_CURVE_ATTACK_305": 6.695,
-            "GROW_CURVE_CRITICAL_301": 4.392,
-        }
-    },
-    "90": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.346,
-            "GROW_CURVE_ATTACK_102": 8.314,
-            "GROW_CURVE_ATTACK_103": 9.229,
-            "GROW_CURVE_ATTACK_104": 6.32,
-            "GROW_CURVE_ATTACK_105": 5.229,
-            "GROW_CURVE_CRITICAL_101": 4.594,
-            "GROW_CURVE_ATTACK_201": 8.349,
-            "GROW_CURVE_ATTACK_202": 9.356,
-            "GROW_CURVE_ATTACK_203": 10.305,
-            "GROW_CURVE_ATTACK_204": 7.275,
-            "GROW_CURVE_ATTACK_205": 6.13,
-            "GROW_CURVE_CRITICAL_201": 4.594,
-            "GROW_CURVE_ATTACK_301": 9.173,
-            "GROW_CURVE_ATTACK_302": 10.258,
-            "GROW_CURVE_ATTACK_303": 11.272,
-            "GROW_CURVE_ATTACK_304": 8.01,
-            "GROW_CURVE_ATTACK_305": 6.76,
-            "GROW_CURVE_CRITICAL_301": 4.594,
-        }
-    },
-    "91": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.415,
-            "GROW_CURVE_ATTACK_102": 8.396,
-            "GROW_CURVE_ATTACK_103": 9.324,
-            "GROW_CURVE_ATTACK_104": 6.374,
-            "GROW_CURVE_ATTACK_105": 5.269,
-            "GROW_CURVE_CRITICAL_101": 4.594,
-            "GROW_CURVE_ATTACK_201": 8.431,
-            "GROW_CURVE_ATTACK_202": 9.453,
-            "GROW_CURVE_ATTACK_203": 10.414,
-            "GROW_CURVE_ATTACK_204": 7.343,
-            "GROW_CURVE_ATTACK_205": 6.182,
-            "GROW_CURVE_CRITICAL_201": 4.594,
-            "GROW_CURVE_ATTACK_301": 9.271,
-            "GROW_CURVE_ATTACK_302": 10.371,
-            "GROW_CURVE_ATTACK_303": 11.399,
-            "GROW_CURVE_ATTACK_304": 8.092,
-            "GROW_CURVE_ATTACK_305": 6.825,
-            "GROW_CURVE_CRITICAL_301": 4.594,
-        }
-    },
-    "92": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.483,
-            "GROW_CURVE_ATTACK_102": 8.478,
-            "GROW_CURVE_ATTACK_103": 9.418,
-            "GROW_CURVE_ATTACK_104": 6.428,
-            "GROW_CURVE_ATTACK_105": 5.308,
-            "GROW_CURVE_CRITICAL_101": 4.594,
-            "GROW_CURVE_ATTACK_201": 8.514,
-            "GROW_CURVE_ATTACK_202": 9.55,
-            "GROW_CURVE_ATTACK_203": 10.524,
-            "GROW_CURVE_ATTACK_204": 7.411,
-            "GROW_CURVE_ATTACK_205": 6.233,
-            "GROW_CURVE_CRITICAL_201": 4.594,
-            "GROW_CURVE_ATTACK_301": 9.37,
-            "GROW_CURVE_ATTACK_302": 10.485,
-            "GROW_CURVE_ATTACK_303": 11.527,
-            "GROW_CURVE_ATTACK_304": 8.174,
-            "GROW_CURVE_ATTACK_305": 6.89,
-            "GROW_CURVE_CRITICAL_301": 4.594,
-        }
-    },
-    "93": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.552,
-            "GROW_CURVE_ATTACK_102": 8.561,
-            "GROW_CURVE_ATTACK_103": 9.513,
-            "GROW_CURVE_ATTACK_104": 6.483,
-            "GROW_CURVE_ATTACK_105": 5.347,
-            "GROW_CURVE_CRITICAL_101": 4.594,
-            "GROW_CURVE_ATTACK_201": 8.596,
-            "GROW_CURVE_ATTACK_202": 9.646,
-            "GROW_CURVE_ATTACK_203": 10.634,
-            "GROW_CURVE_ATTACK_204": 7.478,
-            "GROW_CURVE_ATTACK_205": 6.285,
-            "GROW_CURVE_CRITICAL_201": 4.594,
-            "GROW_CURVE_ATTACK_301": 9.468,
-            "GROW_CURVE_ATTACK_302": 10.598,
-            "GROW_CURVE_ATTACK_303": 11.654,
-            "GROW_CURVE_ATTACK_304": 8.257,
-            "GROW_CURVE_ATTACK_305": 6.955,
-            "GROW_CURVE_CRITICAL_301": 4.594,
-        }
-    },
-    "94": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.621,
-            "GROW_CURVE_ATTACK_102": 8.643,
-            "GROW_CURVE_ATTACK_103": 9.608,
-            "GROW_CURVE_ATTACK_104": 6.537,
-            "GROW_CURVE_ATTACK_105": 5.386,
-            "GROW_CURVE_CRITICAL_101": 4.594,
-            "GROW_CURVE_ATTACK_201": 8.679,
-            "GROW_CURVE_ATTACK_202": 9.743,
-            "GROW_CURVE_ATTACK_203": 10.744,
-            "GROW_CURVE_ATTACK_204": 7.546,
-            "GROW_CURVE_ATTACK_205": 6.336,
-            "GROW_CURVE_CRITICAL_201": 4.594,
-            "GROW_CURVE_ATTACK_301": 9.567,
-            "GROW_CURVE_ATTACK_302": 10.712,
-            "GROW_CURVE_ATTACK_303": 11.782,
-            "GROW_CURVE_ATTACK_304": 8.339,
-            "GROW_CURVE_ATTACK_305": 7.02,
-            "GROW_CURVE_CRITICAL_301": 4.594,
-        }
-    },
-    "95": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.689,
-            "GROW_CURVE_ATTACK_102": 8.725,
-            "GROW_CURVE_ATTACK_103": 9.704,
-            "GROW_CURVE_ATTACK_104": 6.591,
-            "GROW_CURVE_ATTACK_105": 5.425,
-            "GROW_CURVE_CRITICAL_101": 4.796,
-            "GROW_CURVE_ATTACK_201": 8.761,
-            "GROW_CURVE_ATTACK_202": 9.84,
-            "GROW_CURVE_ATTACK_203": 10.854,
-            "GROW_CURVE_ATTACK_204": 7.613,
-            "GROW_CURVE_ATTACK_205": 6.388,
-            "GROW_CURVE_CRITICAL_201": 4.796,
-            "GROW_CURVE_ATTACK_301": 9.666,
-            "GROW_CURVE_ATTACK_302": 10.826,
-            "GROW_CURVE_ATTACK_303": 11.91,
-            "GROW_CURVE_ATTACK_304": 8.422,
-            "GROW_CURVE_ATTACK_305": 7.085,
-            "GROW_CURVE_CRITICAL_301": 4.796,
-        }
-    },
-    "96": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.758,
-            "GROW_CURVE_ATTACK_102": 8.807,
-            "GROW_CURVE_ATTACK_103": 9.799,
-            "GROW_CURVE_ATTACK_104": 6.646,
-            "GROW_CURVE_ATTACK_105": 5.464,
-            "GROW_CURVE_CRITICAL_101": 4.796,
-            "GROW_CURVE_ATTACK_201": 8.844,
-            "GROW_CURVE_ATTACK_202": 9.936,
-            "GROW_CURVE_ATTACK_203": 10.964,
-            "GROW_CURVE_ATTACK_204": 7.681,
-            "GROW_CURVE_ATTACK_205": 6.439,
-            "GROW_CURVE_CRITICAL_201": 4.796,
-            "GROW_CURVE_ATTACK_301": 9.765,
-            "GROW_CURVE_ATTACK_302": 10.94,
-            "GROW_CURVE_ATTACK_303": 12.038,
-            "GROW_CURVE_ATTACK_304": 8.505,
-            "GROW_CURVE_ATTACK_305": 7.151,
-            "GROW_CURVE_CRITICAL_301": 4.796,
-        }
-    },
-    "97": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.827,
-            "GROW_CURVE_ATTACK_102": 8.89,
-            "GROW_CURVE_ATTACK_103": 9.894,
-            "GROW_CURVE_ATTACK_104": 6.7,
-            "GROW_CURVE_ATTACK_105": 5.503,
-            "GROW_CURVE_CRITICAL_101": 4.796,
-            "GROW_CURVE_ATTACK_201": 8.927,
-            "GROW_CURVE_ATTACK_202": 10.033,
-            "GROW_CURVE_ATTACK_203": 11.074,
-            "GROW_CURVE_ATTACK_204": 7.748,
-            "GROW_CURVE_ATTACK_205": 6.491,
-            "GROW_CURVE_CRITICAL_201": 4.796,
-            "GROW_CURVE_ATTACK_301": 9.864,
-            "GROW_CURVE_ATTACK_302": 11.054,
-            "GROW_CURVE_ATTACK_303": 12.166,
-            "GROW_CURVE_ATTACK_304": 8.588,
-            "GROW_CURVE_ATTACK_305": 7.216,
-            "GROW_CURVE_CRITICAL_301": 4.796,
-        }
-    },
-    "98": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.895,
-            "GROW_CURVE_ATTACK_102": 8.972,
-            "GROW_CURVE_ATTACK_103": 9.989,
-            "GROW_CURVE_ATTACK_104": 6.754,
-            "GROW_CURVE_ATTACK_105": 5.542,
-            "GROW_CURVE_CRITICAL_101": 4.796,
-            "GROW_CURVE_ATTACK_201": 9.009,
-            "GROW_CURVE_ATTACK_202": 10.13,
-            "GROW_CURVE_ATTACK_203": 11.184,
-            "GROW_CURVE_ATTACK_204": 7.816,
-            "GROW_CURVE_ATTACK_205": 6.542,
-            "GROW_CURVE_CRITICAL_201": 4.796,
-            "GROW_CURVE_ATTACK_301": 9.963,
-            "GROW_CURVE_ATTACK_302": 11.168,
-            "GROW_CURVE_ATTACK_303": 12.295,
-            "GROW_CURVE_ATTACK_304": 8.671,
-            "GROW_CURVE_ATTACK_305": 7.282,
-            "GROW_CURVE_CRITICAL_301": 4.796,
-        }
-    },
-    "99": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 7.964,
-            "GROW_CURVE_ATTACK_102": 9.054,
-            "GROW_CURVE_ATTACK_103": 10.084,
-            "GROW_CURVE_ATTACK_104": 6.808,
-            "GROW_CURVE_ATTACK_105": 5.58,
-            "GROW_CURVE_CRITICAL_101": 4.796,
-            "GROW_CURVE_ATTACK_201": 9.092,
-            "GROW_CURVE_ATTACK_202": 10.227,
-            "GROW_CURVE_ATTACK_203": 11.295,
-            "GROW_CURVE_ATTACK_204": 7.883,
-            "GROW_CURVE_ATTACK_205": 6.593,
-            "GROW_CURVE_CRITICAL_201": 4.796,
-            "GROW_CURVE_ATTACK_301": 10.062,
-            "GROW_CURVE_ATTACK_302": 11.283,
-            "GROW_CURVE_ATTACK_303": 12.424,
-            "GROW_CURVE_ATTACK_304": 8.754,
-            "GROW_CURVE_ATTACK_305": 7.347,
-            "GROW_CURVE_CRITICAL_301": 4.796,
-        }
-    },
-    "100": {
-        "curveInfos": {
-            "GROW_CURVE_ATTACK_101": 8.033,
-            "GROW_CURVE_ATTACK_102": 9.137,
-            "GROW_CURVE_ATTACK_103": 10.18,
-            "GROW_CURVE_ATTACK_104": 6.862,
-            "GROW_CURVE_ATTACK_105": 5.619,
-            "GROW_CURVE_CRITICAL_101": 4.998,
-            "GROW_CURVE_ATTACK_201": 9.174,
-            "GROW_CURVE_ATTACK_202": 10.324,
-            "GROW_CURVE_ATTACK_203": 11.405,
-            "GROW_CURVE_ATTACK_204": 7.95,
-            "GROW_CURVE_ATTACK_205": 6.644,
-            "GROW_CURVE_CRITICAL_201": 4.998,
-            "GROW_CURVE_ATTACK_301": 10.162,
-            "GROW_CURVE_ATTACK_302": 11.397,
-            "GROW_CURVE_ATTACK_303": 12.552,
-            "GROW_CURVE_ATTACK_304": 8.837,
-            "GROW_CURVE_ATTACK_305": 7.413,
-            "GROW_CURVE_CRITICAL_301": 4.998,
-        }
-    },
-}
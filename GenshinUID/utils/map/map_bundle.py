@@ -0,0 +1,131 @@
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Callable, Optional
+
+import msgspec
+from msgspec import msgpack
+from msgspec import json as msgjson
+from gsuid_core.logger import logger
+
+from ...version import Genshin_version
+from ..resource.RESOURCE_PATH import DATA_PATH
+
+# 插件根目录, 打包数据中以相对该目录的路径作为键
+PLUGIN_PATH = Path(__file__).parents[2]
+MAP_BUNDLE_PATH = DATA_PATH / f'map_bundle_{Genshin_version}.msgpack'
+
+
+class MapEntry(msgspec.Struct, array_like=True):
+    size: int
+    mtime: int
+    data: msgspec.Raw
+
+
+# 路径 -> 数据, 每张表只在首次使用时解码
+MAP_BUNDLE: Optional[Dict[str, MapEntry]] = None
+# 渲染线程也会触发加载, 加载过程中可能嵌套访问其他表
+MAP_LOCK = threading.RLock()
+# 打包数据有变化时延迟写入, 启动时连续加载多张表只写入一次
+SAVE_DELAY = 5
+SAVE_TIMER: Optional[threading.Timer] = None
+
+
+def _load_bundle() -> Dict[str, MapEntry]:
+    global MAP_BUNDLE
+    if MAP_BUNDLE is None:
+        MAP_BUNDLE = {}
+        if MAP_BUNDLE_PATH.exists():
+            try:
+                MAP_BUNDLE = msgpack.decode(
+                    MAP_BUNDLE_PATH.read_bytes(), type=Dict[str, MapEntry]
+                )
+            except (OSError, msgspec.DecodeError):
+                logger.warning(f'[地图数据] {MAP_BUNDLE_PATH.name}已损坏, 将重新生成')
+    return MAP_BUNDLE
+
+
+def _save_bundle(bundle: Dict[str, MapEntry]):
+    try:
+        MAP_BUNDLE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = MAP_BUNDLE_PATH.with_suffix('.tmp')
+        temp_path.write_bytes(msgpack.encode(bundle))
+        os.replace(temp_path, MAP_BUNDLE_PATH)
+        # 删除旧版本的打包数据
+        for path in MAP_BUNDLE_PATH.parent.glob('map_bundle_*.msgpack'):
+            if path != MAP_BUNDLE_PATH:
+                path.unlink()
+    except OSError as e:
+        logger.warning(f'[地图数据] 保存{MAP_BUNDLE_PATH.name}失败: {e}')
+
+
+def flush_bundle():
+    '''
+    立即写入尚未保存的打包数据
+    '''
+    global SAVE_TIMER
+    with MAP_LOCK:
+        if SAVE_TIMER is not None:
+            SAVE_TIMER.cancel()
+            SAVE_TIMER = None
+            if MAP_BUNDLE is not None:
+                _save_bundle(MAP_BUNDLE)
+
+
+def _schedule_save():
+    global SAVE_TIMER
+    if SAVE_TIMER is None:
+        SAVE_TIMER = threading.Timer(SAVE_DELAY, flush_bundle)
+        SAVE_TIMER.daemon = True
+        SAVE_TIMER.start()
+
+
+def load_json(path: Path, type: Any = Any) -> Any:
+    '''
+    读取JSON数据, 优先从按`Genshin_version`打包的msgpack数据中解码,
+    源文件的大小或修改时间变化时重新读取JSON, 稍后统一更新打包数据
+    '''
+    key = path.relative_to(PLUGIN_PATH).as_posix()
+    stat = path.stat()
+    with MAP_LOCK:
+        bundle = _load_bundle()
+        entry = bundle.get(key)
+        if (
+            entry is not None
+            and entry.size == stat.st_size
+            and entry.mtime == stat.st_mtime_ns
+        ):
+            return msgpack.decode(entry.data, type=type)
+
+        data = msgjson.decode(path.read_bytes(), type=type)
+        bundle[key] = MapEntry(
+            stat.st_size, stat.st_mtime_ns, msgspec.Raw(msgpack.encode(data))
+        )
+        _schedule_save()
+        return data
+
+
+def lazy_getattr(
+    module_name: str, loaders: Dict[str, Callable[[], Any]]
+) -> Callable[[str], Any]:
+    '''
+    生成模块级的`__getattr__`, 模块中的数据表在首次访问时才加载,
+    加载后写入模块的全局变量, 之后的访问不再经过该函数
+
+    需要延迟加载的模块应使用`模块.表名`的方式在函数内访问数据,
+    在模块顶层`from ... import 表名`会在导入时立即加载
+    '''
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        if name not in loaders:
+            raise AttributeError(
+                f'module {module_name!r} has no attribute {name!r}'
+            )
+        with MAP_LOCK:
+            if name not in module.__dict__:
+                setattr(module, name, loaders[name]())
+        return module.__dict__[name]
+
+    return __getattr__
@@ -1,45 +1,84 @@
-from .GS_MAP_PATH import (
-    alias_data,
-    avatarId2Name,
-    avatarId2Star_data,
-    enName_to_avatarId_data,
-)
+from typing import Dict, List
+from functools import lru_cache
 
+from . import GS_MAP_PATH
 
-async def avatar_id_to_name(avatar_id: str) -> str:
-    char_name = avatarId2Name[avatar_id]
+
+def _build_reverse_index(data: Dict[str, str]) -> Dict[str, str]:
+    '''
+    构建值到键的反向索引, 存在重复的值时保留最先出现的键
+    '''
+    index: Dict[str, str] = {}
+    for key, value in data.items():
+        index.setdefault(value, key)
+    return index
+
+
+def _build_alias_index() -> Dict[str, int]:
+    '''
+    构建别名索引, 值为角色在`alias_data`中的顺序
+
+    包含每个角色名的全部子串(对应原先的`char_name in i`)
+    以及全部别名(对应原先的`char_name in alias_data[i]`),
+    多个角色匹配时取顺序最靠前的角色, 与逐个遍历的结果一致
+    '''
+    index: Dict[str, int] = {}
+    alias_data = GS_MAP_PATH.alias_data
+    for order, char_name in enumerate(alias_data):
+        for start in range(len(char_name) + 1):
+            for end in range(start, len(char_name) + 1):
+                index.setdefault(char_name[start:end], order)
+        for alias in alias_data[char_name]:
+            index.setdefault(alias, order)
+    return index
+
+
+# 以下索引在首次使用时由对应的数据表构建
+@lru_cache(maxsize=None)
+def get_name2AvatarId() -> Dict[str, str]:
+    return _build_reverse_index(GS_MAP_PATH.avatarId2Name)
+
+
+@lru_cache(maxsize=None)
+def get_avatarId2EnName() -> Dict[str, str]:
+    return _build_reverse_index(GS_MAP_PATH.enName_to_avatarId_data)
+
+
+@lru_cache(maxsize=None)
+def get_alias_index() -> Dict[str, int]:
+    return _build_alias_index()
+
+
+@lru_cache(maxsize=None)
+def get_alias_list() -> List[str]:
+    return list(GS_MAP_PATH.alias_data)
+
+
+def avatar_id_to_name(avatar_id: str) -> str:
+    char_name = GS_MAP_PATH.avatarId2Name[avatar_id]
     return char_name
 
 
-async def name_to_avatar_id(name: str) -> str:
-    avatar_id = ''
-    for i in avatarId2Name:
-        if avatarId2Name[i] == name:
-            avatar_id = i
-            break
-    return avatar_id
+def name_to_avatar_id(name: str) -> str:
+    return get_name2AvatarId().get(name, '')
 
 
-async def avatar_id_to_char_star(char_id: str) -> str:
-    char_star = avatarId2Star_data[str(char_id)]
+def avatar_id_to_char_star(char_id: str) -> str:
+    char_star = GS_MAP_PATH.avatarId2Star_data[str(char_id)]
     return char_star
 
 
-async def alias_to_char_name(char_name: str) -> str:
-    for i in alias_data:
-        if (char_name in i) or (char_name in alias_data[i]):
-            return i
-    return char_name
+def alias_to_char_name(char_name: str) -> str:
+    order = get_alias_index().get(char_name)
+    if order is None:
+        return char_name
+    return get_alias_list()[order]
 
 
-async def enName_to_avatarId(en_name: str) -> str:
-    avatar_id = enName_to_avatarId_data[en_name]
+def enName_to_avatarId(en_name: str) -> str:
+    avatar_id = GS_MAP_PATH.enName_to_avatarId_data[en_name]
     return avatar_id
 
 
-async def avatarId_to_enName(avatarId: str) -> str:
-    for name in enName_to_avatarId_data:
-        if enName_to_avatarId_data[name] == avatarId:
-            return name
-    else:
-        return 'Ayaka'
+def avatarId_to_enName(avatarId: str) -> str:
+    return get_avatarId2EnName().get(avatarId, 'Ayaka')
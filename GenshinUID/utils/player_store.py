@@ -0,0 +1,221 @@
+import os
+import re
+import json
+import asyncio
+from pathlib import Path
+from copy import deepcopy
+from weakref import WeakValueDictionary
+from typing import Any, Dict, List, Optional, TypedDict
+
+import msgspec
+import aiofiles
+from msgspec import msgpack
+from gsuid_core.logger import logger
+
+from .resource.RESOURCE_PATH import PLAYER_PATH
+
+# 每个UID的全部面板数据存放在同一个文件中
+STORE_NAME = 'player.msgpack'
+# 角色数据的格式变化时增加, 版本不同的角色数据在下次刷新时会重新生成
+STORE_VERSION = 2
+
+# 旧版本按文件存放时的角色文件名
+CHAR_PATTERN = r'^[一-龥].*\.json$'
+
+EMPTY_ARTIFACTS = {
+    'data': {
+        'flower': [],
+        'plume': [],
+        'sands': [],
+        'goblet': [],
+        'circlet': [],
+    },
+    'tag': {
+        'flower': [],
+        'plume': [],
+        'sands': [],
+        'goblet': [],
+        'circlet': [],
+    },
+    # 圣遗物指纹 -> [部位, 在data中的序号]
+    'index': {},
+}
+
+# 不再有协程持有或等待时, 锁会被自动回收
+STORE_LOCK: 'WeakValueDictionary[str, asyncio.Lock]' = WeakValueDictionary()
+
+
+class PlayerStore(TypedDict):
+    version: int
+    # enka的playerInfo, 原{uid}.json
+    player: Dict[str, Any]
+    # enka原始数据, 原rawData.json
+    raw: Dict[str, Any]
+    # 角色名 -> 角色数据, 原{角色}.json
+    chars: Dict[str, Dict[str, Any]]
+    # 圣遗物仓库, 原artifacts.json
+    artifacts: Dict[str, Any]
+
+
+class CharsView(TypedDict):
+    # 只读取角色部分, 单个角色的数据在使用时再解码
+    chars: Dict[str, msgspec.Raw]
+
+
+class ArtifactsView(TypedDict):
+    artifacts: Dict[str, Any]
+
+
+def get_store_path(uid: str) -> Path:
+    return PLAYER_PATH / str(uid) / STORE_NAME
+
+
+def get_store_lock(uid: str) -> asyncio.Lock:
+    '''
+    修改同一UID的数据时需要持有该锁, 防止并发写入互相覆盖
+    '''
+    lock = STORE_LOCK.get(str(uid))
+    if lock is None:
+        lock = STORE_LOCK[str(uid)] = asyncio.Lock()
+    return lock
+
+
+def new_player_store() -> PlayerStore:
+    return {
+        'version': STORE_VERSION,
+        'player': {},
+        'raw': {},
+        'chars': {},
+        'artifacts': deepcopy(EMPTY_ARTIFACTS),
+    }
+
+
+async def _read_store(path: Path) -> PlayerStore:
+    async with aiofiles.open(path, 'rb') as file:
+        return msgpack.decode(await file.read(), type=PlayerStore)
+
+
+async def _read_view(uid: str, view: Any) -> Optional[Any]:
+    '''
+    只解码`view`中声明的部分, 其余部分(如enka原始数据)直接跳过,
+    不存在数据或需要迁移时按完整数据读取
+    '''
+    path = get_store_path(uid)
+    if not path.exists():
+        store = await load_player_store(uid)
+        if store is None:
+            return None
+        return {k: store[k] for k in view.__annotations__}
+    async with aiofiles.open(path, 'rb') as file:
+        return msgpack.decode(await file.read(), type=view)
+
+
+async def load_player_store(
+    uid: str, locked: bool = False
+) -> Optional[PlayerStore]:
+    '''
+    读取玩家数据, 旧版本的文件存储会在首次读取时迁移,
+    不存在任何数据时返回None
+
+    参数:
+        locked: `bool`
+            调用方是否已经持有`get_store_lock(uid)`
+    '''
+    path = get_store_path(uid)
+    if path.exists():
+        return await _read_store(path)
+    if locked:
+        return await migrate_player(uid)
+    async with get_store_lock(uid):
+        # 等待锁期间可能已经完成迁移
+        if path.exists():
+            return await _read_store(path)
+        return await migrate_player(uid)
+
+
+async def save_player_store(uid: str, store: PlayerStore):
+    '''
+    先写入临时文件再替换, 保证数据不会只写入一半
+    '''
+    path = get_store_path(uid)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix('.tmp')
+    async with aiofiles.open(temp_path, 'wb') as file:
+        await file.write(msgpack.encode(store))
+    os.replace(temp_path, path)
+
+
+async def get_player_char_list(uid: str) -> List[str]:
+    view = await _read_view(uid, CharsView)
+    if view is None:
+        return []
+    return list(view['chars'])
+
+
+async def get_player_char(uid: str, char_name: str) -> Optional[Dict]:
+    view = await _read_view(uid, CharsView)
+    if view is None or char_name not in view['chars']:
+        return None
+    char = view['chars'][char_name]
+    if isinstance(char, msgspec.Raw):
+        return msgpack.decode(char)
+    return char
+
+
+async def get_player_artifacts(uid: str) -> Optional[Dict]:
+    view = await _read_view(uid, ArtifactsView)
+    if view is None:
+        return None
+    return view['artifacts']
+
+
+async def get_player_raw(uid: str) -> Optional[Dict]:
+    store = await load_player_store(uid)
+    if store is None or not store['raw']:
+        return None
+    return store['raw']
+
+
+async def _load_json(path: Path) -> Any:
+    async with aiofiles.open(path, 'rb') as file:
+        return json.loads(await file.read())
+
+
+async def migrate_player(uid: str) -> Optional[PlayerStore]:
+    '''
+    将旧版本的{uid}.json, rawData.json, artifacts.json和{角色}.json
+    合并为单个文件, 迁移完成后删除旧文件, 调用方需持有该UID的锁
+    '''
+    player_path = PLAYER_PATH / str(uid)
+    if not player_path.is_dir():
+        return None
+
+    store = new_player_store()
+    # 旧文件中的角色数据由旧版本生成
+    store['version'] = 0
+    old_list: List[Path] = []
+    try:
+        for path in player_path.iterdir():
+            if re.match(CHAR_PATTERN, path.name):
+                store['chars'][path.stem] = await _load_json(path)
+            elif path.name == f'{uid}.json':
+                store['player'] = await _load_json(path)
+            elif path.name == 'rawData.json':
+                store['raw'] = await _load_json(path)
+            elif path.name == 'artifacts.json':
+                store['artifacts'] = await _load_json(path)
+            else:
+                continue
+            old_list.append(path)
+    except json.JSONDecodeError as e:
+        logger.warning(f'[玩家数据迁移] UID{uid}存在损坏的文件: {e}')
+        return None
+
+    if not old_list:
+        return None
+    await save_player_store(uid, store)
+    for path in old_list:
+        path.unlink()
+
+    logger.info(f'[玩家数据迁移] UID{uid}迁移完成, 共合并{len(old_list)}个文件!')
+    return store
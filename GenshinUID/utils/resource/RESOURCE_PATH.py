@@ -21,6 +21,8 @@ CHAR_NAMECARD_PATH = RESOURCE_PATH / 'char_namecard'
 REL_PATH = RESOURCE_PATH / 'reliquaries'
 ICON_PATH = RESOURCE_PATH / 'icon'
 TEMP_PATH = RESOURCE_PATH / 'temp'
+URL_CACHE_PATH = TEMP_PATH / 'url_cache'
+RENDER_CACHE_PATH = TEMP_PATH / 'render_cache'
 CARD_PATH = RESOURCE_PATH / 'card'
 MONSTER_ICON_PATH = RESOURCE_PATH / 'monster_icon'
 GUIDE_PATH = WIKI_PATH / 'guide'
@@ -55,6 +57,8 @@ def init_dir():
         TEXT2D_PATH,
         PLAYER_PATH,
         TEMP_PATH,
+        URL_CACHE_PATH,
+        RENDER_CACHE_PATH,
         CARD_PATH,
         GUIDE_PATH,
         CU_BG_PATH,
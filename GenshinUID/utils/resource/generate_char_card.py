@@ -3,7 +3,8 @@ from typing import List, Union
 from PIL import Image
 from gsuid_core.logger import logger
 
-from ..map.GS_MAP_PATH import avatarId2Star_data
+from ..map import GS_MAP_PATH
+from ..image.texture import get_texture
 from .RESOURCE_PATH import CHAR_PATH, TEXT2D_PATH, CHAR_CARD_PATH
 
 texture2d_path = TEXT2D_PATH / 'char_card'
@@ -23,9 +24,9 @@ async def create_single_item_card(
 
     if item_img.size != (256, 256):
         item_img = item_img.resize((256, 256))
-    char_frame = Image.open(texture2d_path / 'frame.png')
-    char_bg = Image.open(texture2d_path / f'star{star}bg.png')
-    mask = Image.open(texture2d_path / 'mask.png')
+    char_frame = get_texture(texture2d_path / 'frame.png', copy=False)
+    char_bg = get_texture(texture2d_path / f'star{star}bg.png', copy=False)
+    mask = get_texture(texture2d_path / 'mask.png', copy=False)
     img = Image.new('RGBA', (256, 310))
     img_mask = Image.new('RGBA', (256, 310))
     img_mask.paste(char_bg, (0, 0), char_bg)
@@ -36,7 +37,7 @@ async def create_single_item_card(
 
 
 async def create_single_char_card(char_id: Union[str, int]) -> Image.Image:
-    if str(char_id) not in avatarId2Star_data:
+    if str(char_id) not in GS_MAP_PATH.avatarId2Star_data:
         logger.warning(f'资源文件夹发现异常图片{char_id}....忽略加载...')
         return Image.new('RGBA', (256, 310))
     path = CHAR_PATH / f'{char_id}.png'
@@ -44,10 +45,12 @@ async def create_single_char_card(char_id: Union[str, int]) -> Image.Image:
         logger.warning(f'资源文件夹未发现图片{char_id}....忽略加载...')
         return Image.new('RGBA', (256, 310))
     char_img = Image.open(path).convert('RGBA')
-    char_star = avatarId2Star_data[str(char_id)]
-    char_frame = Image.open(texture2d_path / 'frame.png')
-    char_bg = Image.open(texture2d_path / f'star{char_star}bg.png')
-    mask = Image.open(texture2d_path / 'mask.png')
+    char_star = GS_MAP_PATH.avatarId2Star_data[str(char_id)]
+    char_frame = get_texture(texture2d_path / 'frame.png', copy=False)
+    char_bg = get_texture(
+        texture2d_path / f'star{char_star}bg.png', copy=False
+    )
+    mask = get_texture(texture2d_path / 'mask.png', copy=False)
     img = Image.new('RGBA', (256, 310))
     img_mask = Image.new('RGBA', (256, 310))
     img_mask.paste(char_bg, (0, 0), char_bg)